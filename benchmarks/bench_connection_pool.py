@@ -0,0 +1,106 @@
+"""Benchmark: per-call latency with and without HTTP connection reuse.
+
+Starts a local stand-in Jira server (stdlib ``http.server`` speaking HTTP/1.1 keep-alive)
+and issues ``get_issue`` calls two ways:
+
+- ``per-call``: a fresh ``httpx.Client`` per request (the pre-pooling behaviour)
+- ``pooled``: a single ``JiraClient`` reusing its connection pool
+
+Each new TCP connection can be charged an artificial setup cost (``--connect-latency-ms``)
+to stand in for the TLS handshake and proxy CONNECT a real deployment pays.
+
+Usage:
+    python benchmarks/bench_connection_pool.py --calls 200 --connect-latency-ms 20
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+import httpx
+
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.jira_client import JiraClient
+
+ISSUE_BODY = json.dumps({"key": "PROJ-1", "id": "10001", "fields": {"summary": "Benchmark issue"}}).encode()
+
+
+def make_handler(connect_latency: float) -> type:
+    """Build a request handler that charges ``connect_latency`` seconds per new connection."""
+
+    class StandInJiraHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            # Runs once per TCP connection, not per request
+            time.sleep(connect_latency)
+            super().setup()
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(ISSUE_BODY)))
+            self.end_headers()
+            self.wfile.write(ISSUE_BODY)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return StandInJiraHandler
+
+
+def measure(calls: int, fn: Callable[[], object]) -> List[float]:
+    """Time ``calls`` invocations of ``fn`` and return per-call latencies in milliseconds."""
+    fn()  # warm-up
+    samples: List[float] = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<10} mean={statistics.mean(samples):7.2f}ms  p50={statistics.median(samples):7.2f}ms  p95={p95:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="Requests per mode (default: 200)")
+    parser.add_argument(
+        "--connect-latency-ms", type=float, default=20.0, help="Simulated cost per new connection (default: 20)"
+    )
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.connect_latency_ms / 1000))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    config = JiraConfig(url=base_url, token="benchmark-token")
+    issue_url = f"{base_url}/rest/api/2/issue/PROJ-1"
+
+    def per_call() -> object:
+        with httpx.Client(timeout=config.timeout) as client:
+            return client.get(issue_url).json()
+
+    try:
+        print(f"{args.calls} calls, {args.connect_latency_ms:.0f}ms simulated connection setup\n")
+        report("per-call", measure(args.calls, per_call))
+        with JiraClient(config) as jira:
+            report("pooled", measure(args.calls, lambda: jira.get_issue("PROJ-1")))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark: JSON decode/encode cost of search pages per codec.
+
+Parses and serializes ``/rest/api/2/search`` response bodies with every installed codec
+(``stdlib``, ``orjson``, ``msgspec``) through ``jira_mcp_server.json_codec``, the same
+path ``JiraClient`` uses.
+
+Pass recorded payloads to measure your own instance's data, e.g. saved with:
+
+    curl -H "Authorization: Bearer $JIRA_MCP_TOKEN" \\
+        "$JIRA_MCP_URL/rest/api/2/search?jql=project=PROJ&maxResults=100&fields=*all&expand=renderedFields" \\
+        > search-page.json
+
+Without ``--payload`` a synthetic page of full issues (descriptions, comments, rendered
+fields and custom fields) is generated instead.
+
+Usage:
+    python benchmarks/bench_json_codec.py --payload search-page.json --rounds 20
+    python benchmarks/bench_json_codec.py --issues 100
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from jira_mcp_server.json_codec import CODECS, JsonCodec, get_codec
+
+WORDS = "jira issue deploy rollback latency cache queue worker timeout retry search filter sprint release".split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def synthetic_issue(rng: random.Random, number: int) -> Dict[str, Any]:
+    """Build an issue shaped like a ``fields=*all&expand=renderedFields`` search hit."""
+    description = "\n\n".join(sentence(rng, 40) for _ in range(6))
+    comments = [
+        {
+            "id": str(10000 + i),
+            "author": {"name": f"user{i}", "displayName": f"User {i}", "emailAddress": f"user{i}@example.com"},
+            "body": sentence(rng, 60),
+            "created": "2026-10-01T12:00:00.000+0000",
+            "updated": "2026-10-01T12:00:00.000+0000",
+        }
+        for i in range(10)
+    ]
+    fields: Dict[str, Any] = {
+        "summary": sentence(rng, 8),
+        "description": description,
+        "status": {"name": "In Progress", "id": "3", "statusCategory": {"key": "indeterminate"}},
+        "priority": {"name": "High", "id": "2"},
+        "issuetype": {"name": "Bug", "id": "1", "subtask": False},
+        "assignee": {"name": "jdoe", "displayName": "J. Doe", "active": True},
+        "reporter": {"name": "asmith", "displayName": "A. Smith", "active": True},
+        "labels": rng.sample(WORDS, 4),
+        "created": "2026-09-01T09:30:00.000+0000",
+        "updated": "2026-10-14T10:00:00.000+0000",
+        "comment": {"comments": comments, "maxResults": 10, "total": 10, "startAt": 0},
+    }
+    fields.update({f"customfield_{10000 + i}": sentence(rng, 5) for i in range(40)})
+    return {
+        "id": str(100000 + number),
+        "key": f"PROJ-{number}",
+        "self": f"https://jira.example.com/rest/api/2/issue/{100000 + number}",
+        "fields": fields,
+        "renderedFields": {"description": f"<p>{description}</p>", "comment": {"comments": comments}},
+    }
+
+
+def synthetic_page(issues: int) -> bytes:
+    rng = random.Random(42)
+    page = {
+        "startAt": 0,
+        "maxResults": issues,
+        "total": issues,
+        "issues": [synthetic_issue(rng, n) for n in range(1, issues + 1)],
+    }
+    return json.dumps(page).encode("utf-8")
+
+
+def available_codecs() -> List[JsonCodec]:
+    codecs = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ValueError:
+            print(f"{name:<8} not installed, skipped")
+    return codecs
+
+
+def measure(rounds: int, fn: Callable[[], object]) -> List[float]:
+    """Time ``rounds`` invocations of ``fn`` and return latencies in milliseconds."""
+    fn()  # warm-up
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: List[float], size: int) -> None:
+    median = statistics.median(samples)
+    throughput = size / (median / 1000) / 1_000_000
+    print(f"{label:<18} median={median:8.2f}ms  min={min(samples):8.2f}ms  {throughput:8.1f} MB/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payload", type=Path, nargs="*", default=[], help="Recorded search response bodies")
+    parser.add_argument("--issues", type=int, default=100, help="Issues in the synthetic page (default: 100)")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed rounds per codec (default: 20)")
+    args = parser.parse_args()
+
+    payloads = {path.name: path.read_bytes() for path in args.payload}
+    if not payloads:
+        payloads = {f"synthetic-{args.issues}": synthetic_page(args.issues)}
+    codecs = available_codecs()
+
+    for name, body in payloads.items():
+        print(f"\n{name}: {len(body) / 1_000_000:.2f} MB, {args.rounds} rounds")
+        decoded = json.loads(body)
+        for codec in codecs:
+            report(f"{codec.name} decode", measure(args.rounds, lambda: codec.loads(body)), len(body))
+            report(f"{codec.name} encode", measure(args.rounds, lambda: codec.dumps(decoded)), len(body))
+
+
+if __name__ == "__main__":
+    main()
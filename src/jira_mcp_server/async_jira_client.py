@@ -0,0 +1,703 @@
+"""Asyncio Jira REST API client"""
+
+import asyncio
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+import httpx
+
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.endpoints import STREAM_EXTENSION
+from jira_mcp_server.jira_client import DEFAULT_PAGE_SIZE, BaseJiraClient
+from jira_mcp_server.metrics import RequestMetrics
+from jira_mcp_server.pipeline import build_async_transport, environment_proxy
+from jira_mcp_server.rate_limit import RateLimiter
+from jira_mcp_server.search_stream import SearchStreamParser
+
+
+class AsyncJiraClient(BaseJiraClient):
+    """Asyncio HTTP client for Jira REST API v2.
+
+    Mirrors every JiraClient method as a coroutine built on ``httpx.AsyncClient`` so many
+    concurrent tool calls can overlap their network waits on a single event loop. Call
+    ``aclose()`` (or use the client as an async context manager) to release connections.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ):
+        """Initialize async Jira client.
+
+        Args:
+            config: JiraConfig with URL and authentication token
+            rate_limiter: RateLimiter shared with other clients (default: a new one built from config)
+            metrics: RequestMetrics shared with other clients (default: a new, client-local one)
+        """
+        super().__init__(config, rate_limiter, metrics)
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client, creating it on first use.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._http_client is None:
+            pool = httpx.AsyncHTTPTransport(
+                verify=self.verify_ssl, limits=self.limits, proxy=environment_proxy(self.base_url)
+            )
+            transport = build_async_transport(self, pool)
+            self._http_client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
+        return self._http_client
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        ok_statuses: Tuple[int, ...] = (200,),
+        not_found_msg: Optional[str] = None,
+        *,
+        timeout_msg: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request through the pooled async client and check that it succeeded.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            ok_statuses: Status codes the endpoint returns on success
+            not_found_msg: Endpoint-specific message for a 404 (None for the generic one)
+            timeout_msg: Message for a request that timed out
+            **kwargs: Further arguments for httpx.AsyncClient.request (params, content, ...)
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            ValueError: If the request failed, timed out or was refused by the pipeline
+        """
+        with self._request_errors(timeout_msg):
+            response = await self._get_http_client().request(method, url, **kwargs)
+        self._check_response(response, ok_statuses, not_found_msg)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._http_client is not None:
+            http_client = self._http_client
+            self._http_client = None
+            await http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Verify connectivity to Jira instance (T019).
+
+        Returns:
+            Dictionary with connection status and server info
+
+        Raises:
+            ValueError: If connection fails or authentication error
+        """
+        url = f"{self.base_url}/rest/api/2/serverInfo"
+        timeout_msg = f"Connection timeout. Could not reach Jira at {self.base_url} within {self.timeout} seconds."
+
+        try:
+            response = await self._request("GET", url, timeout_msg=timeout_msg)
+        except httpx.NetworkError as e:
+            raise ValueError(f"Network error connecting to Jira: {str(e)}")
+
+        return self._health_result(self._decode(response))
+
+    async def get_issue(
+        self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get issue details by key.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            fields: Fields to return (None for all fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+
+        Returns:
+            Issue data dictionary
+
+        Raises:
+            ValueError: If issue not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
+
+        response = await self._request(
+            "GET",
+            url,
+            not_found_msg=f"Issue {issue_key} not found.",
+            timeout_msg=f"Timeout getting issue {issue_key}",
+            params=self._issue_params(fields, expand),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def create_issue(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new issue.
+
+        Args:
+            issue_data: Issue fields and metadata
+
+        Returns:
+            Created issue data with key and ID
+
+        Raises:
+            ValueError: If validation fails or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue"
+
+        response = await self._request(
+            "POST", url, ok_statuses=(200, 201), timeout_msg="Timeout creating issue", content=self._encode(issue_data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def update_issue(self, issue_key: str, update_data: Dict[str, Any]) -> None:
+        """Update an existing issue.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            update_data: Fields to update
+
+        Raises:
+            ValueError: If issue not found or validation fails
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
+
+        await self._request(
+            "PUT",
+            url,
+            ok_statuses=(200, 204),
+            timeout_msg=f"Timeout updating issue {issue_key}",
+            content=self._encode(update_data),
+        )
+
+    async def get_project_schema(self, project_key: str, issue_type: str) -> List[Dict[str, Any]]:
+        """Get field schema for a project and issue type.
+
+        Args:
+            project_key: Project key
+            issue_type: Issue type name
+
+        Returns:
+            List of field definitions
+
+        Raises:
+            ValueError: If project not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/createmeta"
+        params = self._project_schema_params(project_key, issue_type)
+
+        response = await self._request(
+            "GET",
+            url,
+            not_found_msg=self._project_schema_not_found(project_key, issue_type),
+            timeout_msg=f"Timeout getting schema for {project_key}/{issue_type}",
+            params=params,
+        )
+        return self._parse_project_schema(self._decode(response), project_key, issue_type)
+
+    async def get_project_schemas(self, project_key: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get field schemas for every issue type of a project in one request.
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            Field definitions keyed by issue type name
+
+        Raises:
+            ValueError: If project not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/createmeta"
+        params = {"projectKeys": project_key, "expand": "projects.issuetypes.fields"}
+
+        response = await self._request(
+            "GET",
+            url,
+            not_found_msg=f"Project '{project_key}' not found or not accessible",
+            timeout_msg=f"Timeout getting schemas for {project_key}",
+            params=params,
+        )
+        return self._parse_project_schemas(self._decode(response), project_key)
+
+    async def search_issues(
+        self,
+        jql: str,
+        max_results: int = 100,
+        start_at: int = 0,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Search issues using JQL.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum results to return
+            start_at: Starting offset for pagination
+            fields: Fields to return (None for Jira's default of all navigable fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+
+        Returns:
+            Search results with issues and pagination info
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        url = f"{self.base_url}/rest/api/2/search"
+        data = self._search_payload(jql, max_results, start_at, fields, expand)
+
+        response = await self._request(
+            "POST", url, timeout_msg="Timeout executing search query", content=self._encode(data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def iter_search_pages(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily walk JQL search results page by page.
+
+        Each page is requested only when the previous one has been consumed, so at most one
+        page of issues is held in memory at a time.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to fetch overall (None for all matching issues)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
+
+        Yields:
+            Raw search response pages (with total, startAt, maxResults and issues)
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        fetched = 0
+        while limit is None or fetched < limit:
+            page = await self.search_issues(
+                jql,
+                max_results=self._page_size_for(page_size, limit, fetched),
+                start_at=start_at,
+                fields=fields,
+                expand=expand,
+            )
+            yield page
+
+            count = len(page.get("issues", []))
+            fetched += count
+            start_at += count
+            if self._is_last_page(page, start_at):
+                return
+
+    async def iter_search(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        stream: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Lazily yield issues matching a JQL query across all pages.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to yield (None for all matching issues)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
+            stream: Parse each page incrementally (see stream_search) so only one issue,
+                rather than one page, is held in memory at a time
+
+        Yields:
+            Issue dictionaries in search order
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        if not stream:
+            async for page in self.iter_search_pages(
+                jql, page_size=page_size, start_at=start_at, limit=limit, fields=fields, expand=expand
+            ):
+                for issue in page.get("issues", []):
+                    yield issue
+            return
+
+        fetched = 0
+        while limit is None or fetched < limit:
+            meta: Dict[str, Any] = {}
+            count = 0
+            async for issue in self.stream_search(
+                jql,
+                max_results=self._page_size_for(page_size, limit, fetched),
+                start_at=start_at,
+                fields=fields,
+                expand=expand,
+                page=meta,
+            ):
+                count += 1
+                yield issue
+
+            fetched += count
+            start_at += count
+            if not count or start_at >= meta.get("total", 0):
+                return
+
+    async def stream_search(
+        self,
+        jql: str,
+        max_results: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the issues of one search request as they are parsed from the response stream.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum results to return
+            start_at: Starting offset for pagination
+            fields: Fields to return (None for Jira's default of all navigable fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+            page: Optional dictionary updated with the page's total, startAt and maxResults
+                once the response has been read
+
+        Yields:
+            Issue dictionaries in search order
+
+        Raises:
+            ValueError: If JQL invalid, API error or malformed response
+        """
+        url = f"{self.base_url}/rest/api/2/search"
+        data = self._search_payload(jql, max_results, start_at, fields, expand)
+        parser = SearchStreamParser(self.codec.loads)
+
+        with self._request_errors("Timeout executing search query"):
+            async with self._get_http_client().stream(
+                "POST",
+                url,
+                content=self._encode(data),
+                extensions={STREAM_EXTENSION: True},
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._handle_error(response)
+
+                async for chunk in response.aiter_bytes():
+                    for issue in parser.feed(chunk):
+                        yield issue
+
+            meta = parser.close()
+
+        if page is not None:
+            page.update(meta)
+
+    async def search_all(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fan_out: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Collect JQL search results across pages, fetching pages concurrently.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to collect (None for all matching issues)
+            fan_out: Maximum concurrent page requests (defaults to config search_fan_out)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
+
+        Returns:
+            Search result with total, startAt, maxResults and de-duplicated issues; issues that
+            shifted past the requested pages are fetched so duplicates do not shorten it
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        first_page = await self.search_issues(
+            jql, max_results=self._page_size_for(page_size, limit, 0), start_at=start_at, fields=fields, expand=expand
+        )
+        semaphore = asyncio.Semaphore(fan_out or self.search_fan_out)
+
+        async def fetch_page(offset: int, size: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search_issues(jql, max_results=size, start_at=offset, fields=fields, expand=expand)
+
+        pages = [first_page]
+        tasks = [
+            asyncio.ensure_future(fetch_page(offset, size))
+            for offset, size in self._remaining_page_requests(first_page, start_at, limit)
+        ]
+        try:
+            pages.extend(await asyncio.gather(*tasks))
+        except BaseException:
+            # The first failed page fails the search: stop the other page requests rather than
+            # leaving them running (and holding connections) after search_all has returned
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        result = self._merge_search_pages(pages, start_at, limit)
+        tail = self._missing_tail(pages, result, start_at, limit)
+        while tail is not None:
+            page = await fetch_page(*tail)
+            if not page.get("issues"):
+                break
+            pages.append(page)
+            result = self._merge_search_pages(pages, start_at, limit)
+            tail = self._missing_tail(pages, result, start_at, limit)
+        return result
+
+    async def create_filter(
+        self, name: str, jql: str, description: str | None = None, favourite: bool = False
+    ) -> Dict[str, Any]:
+        """Create a new saved filter.
+
+        Args:
+            name: Filter name
+            jql: JQL query string
+            description: Optional filter description
+            favourite: Whether to mark as favorite
+
+        Returns:
+            Created filter data
+
+        Raises:
+            ValueError: If filter creation fails
+        """
+        url = f"{self.base_url}/rest/api/2/filter"
+        data = self._create_filter_payload(name, jql, description, favourite)
+
+        response = await self._request(
+            "POST", url, ok_statuses=(200, 201), timeout_msg="Timeout creating filter", content=self._encode(data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def list_filters(self) -> Dict[str, Any]:
+        """List all accessible filters.
+
+        Returns:
+            List of filter metadata
+
+        Raises:
+            ValueError: If filter listing fails
+        """
+        url = f"{self.base_url}/rest/api/2/filter/my"
+
+        response = await self._request("GET", url, timeout_msg="Timeout listing filters")
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def get_filter(self, filter_id: str) -> Dict[str, Any]:
+        """Get filter details by ID.
+
+        Args:
+            filter_id: Filter ID
+
+        Returns:
+            Filter details
+
+        Raises:
+            ValueError: If filter not found or access denied
+        """
+        url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
+
+        response = await self._request("GET", url, timeout_msg=f"Timeout getting filter {filter_id}")
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def update_filter(
+        self,
+        filter_id: str,
+        name: str | None = None,
+        jql: str | None = None,
+        description: str | None = None,
+        favourite: bool | None = None,
+    ) -> Dict[str, Any]:
+        """Update an existing filter.
+
+        Args:
+            filter_id: Filter ID
+            name: New filter name
+            jql: New JQL query
+            description: New description
+            favourite: Whether to mark as favorite
+
+        Returns:
+            Updated filter data
+
+        Raises:
+            ValueError: If filter update fails
+        """
+        url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
+        data = self._update_filter_payload(name, jql, description, favourite)
+
+        response = await self._request(
+            "PUT", url, timeout_msg=f"Timeout updating filter {filter_id}", content=self._encode(data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def delete_filter(self, filter_id: str) -> None:
+        """Delete a filter.
+
+        Args:
+            filter_id: Filter ID
+
+        Raises:
+            ValueError: If filter deletion fails or permission denied
+        """
+        url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
+
+        await self._request("DELETE", url, ok_statuses=(204,), timeout_msg=f"Timeout deleting filter {filter_id}")
+
+    async def get_transitions(self, issue_key: str) -> Dict[str, Any]:
+        """Get available transitions for an issue.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+
+        Returns:
+            Available transitions with IDs, names, and destination statuses
+
+        Raises:
+            ValueError: If issue not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/transitions"
+
+        response = await self._request("GET", url, timeout_msg=f"Timeout getting transitions for {issue_key}")
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def transition_issue(self, issue_key: str, transition_id: str, fields: Dict[str, Any] | None = None) -> None:
+        """Transition an issue through workflow.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            transition_id: Transition ID to execute
+            fields: Optional fields required by the transition
+
+        Raises:
+            ValueError: If transition invalid or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/transitions"
+        data = self._transition_payload(transition_id, fields)
+
+        await self._request(
+            "POST",
+            url,
+            ok_statuses=(204,),
+            timeout_msg=f"Timeout transitioning issue {issue_key}",
+            content=self._encode(data),
+        )
+
+    async def add_comment(self, issue_key: str, body: str) -> Dict[str, Any]:
+        """Add a comment to an issue.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            body: Comment text
+
+        Returns:
+            Created comment data with ID, author, and timestamp
+
+        Raises:
+            ValueError: If issue not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment"
+        data = {"body": body}
+
+        response = await self._request(
+            "POST",
+            url,
+            ok_statuses=(200, 201),
+            timeout_msg=f"Timeout adding comment to issue {issue_key}",
+            content=self._encode(data),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def list_comments(self, issue_key: str) -> Dict[str, Any]:
+        """List all comments on an issue.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+
+        Returns:
+            Comments list with total count
+
+        Raises:
+            ValueError: If issue not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment"
+
+        response = await self._request("GET", url, timeout_msg=f"Timeout listing comments for issue {issue_key}")
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def update_comment(self, issue_key: str, comment_id: str, body: str) -> Dict[str, Any]:
+        """Update an existing comment.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            comment_id: Comment ID to update
+            body: New comment text
+
+        Returns:
+            Updated comment data
+
+        Raises:
+            ValueError: If comment not found or permission denied
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment/{comment_id}"
+        data = {"body": body}
+
+        response = await self._request(
+            "PUT",
+            url,
+            timeout_msg=f"Timeout updating comment {comment_id} on issue {issue_key}",
+            content=self._encode(data),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    async def delete_comment(self, issue_key: str, comment_id: str) -> None:
+        """Delete a comment.
+
+        Args:
+            issue_key: Issue key (e.g., "PROJ-123")
+            comment_id: Comment ID to delete
+
+        Raises:
+            ValueError: If comment not found or permission denied
+        """
+        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment/{comment_id}"
+
+        await self._request(
+            "DELETE", url, ok_statuses=(204,), timeout_msg=f"Timeout deleting comment {comment_id} on issue {issue_key}"
+        )
@@ -0,0 +1,242 @@
+"""Per-endpoint-class circuit breakers that fail fast while Jira is unavailable"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from jira_mcp_server.deadline import DeadlineExceeded
+from jira_mcp_server.endpoints import ENDPOINT_CLASSES, endpoint_class
+
+# Responses that mean Jira itself is failing, as opposed to rejecting the request
+FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while its endpoint class's circuit is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for one endpoint class.
+
+    After ``failure_threshold`` consecutive failures (5xx responses, timeouts, dropped
+    connections) the circuit opens and requests fail immediately. Once ``reset_timeout``
+    has passed a single probe request is let through: success closes the circuit, failure
+    opens it for another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize breaker.
+
+        Args:
+            name: Endpoint class the breaker guards, used in error messages
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe is allowed
+            clock: Monotonic clock in seconds
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        return self._state
+
+    def before_request(self) -> None:
+        """Admit a request or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe already in flight
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if self._state == OPEN and remaining <= 0:
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self._rejected += 1
+
+        if remaining > 0:
+            detail = f"retrying in {remaining:.0f}s"
+        else:
+            detail = "a probe request is in flight"
+        raise CircuitOpenError(
+            f"Jira {self.name} requests are failing fast after {self.failure_threshold} consecutive failures "
+            f"(circuit open, {detail})"
+        )
+
+    def on_success(self) -> None:
+        """Record a request Jira answered; closes a half-open circuit."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._state = CLOSED
+
+    def on_failure(self) -> None:
+        """Record a failed request; opens the circuit at the threshold or when a probe fails."""
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._trips += 1
+
+    def on_abandoned(self) -> None:
+        """Record a request that ended without an outcome (e.g. cancelled), freeing the probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker statistics.
+
+        Returns:
+            State, consecutive failures, times opened and requests rejected while open
+        """
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "rejected": self._rejected,
+            }
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per endpoint class (search, read, write).
+
+    Classes trip independently, so a struggling search backend does not block issue reads.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize breakers.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds a circuit stays open before a probe is allowed
+            clock: Monotonic clock in seconds
+        """
+        self._breakers = {
+            name: CircuitBreaker(name, failure_threshold, reset_timeout, clock) for name in ENDPOINT_CLASSES
+        }
+
+    def for_request(self, request: httpx.Request) -> CircuitBreaker:
+        """Get the breaker guarding a request's endpoint class.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            CircuitBreaker for the request
+        """
+        return self._breakers[endpoint_class(request)]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics per endpoint class.
+
+        Returns:
+            Breaker statistics keyed by endpoint class
+        """
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+
+
+def _record(breaker: CircuitBreaker, response: Optional[httpx.Response], error: Optional[BaseException]) -> None:
+    """Feed the outcome of one request back into its breaker.
+
+    Args:
+        breaker: Breaker to update
+        response: Response received, if any
+        error: Exception raised, if any
+    """
+    if response is not None:
+        if response.status_code in FAILURE_STATUSES:
+            breaker.on_failure()
+        else:
+            breaker.on_success()
+    elif isinstance(error, httpx.TransportError) and not isinstance(error, (httpx.PoolTimeout, DeadlineExceeded)):
+        # Pool timeouts and spent deadlines are local, not a sign that Jira is struggling
+        breaker.on_failure()
+    else:
+        breaker.on_abandoned()
+
+
+class CircuitBreakerTransport(httpx.BaseTransport):
+    """httpx transport that fails requests fast while their endpoint class's circuit is open."""
+
+    def __init__(self, transport: httpx.BaseTransport, breakers: CircuitBreakers):
+        """Initialize circuit breaker transport.
+
+        Args:
+            transport: Transport that sends the requests
+            breakers: Breakers consulted before and updated after every request
+        """
+        self._transport = transport
+        self._breakers = breakers
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._breakers.for_request(request)
+        breaker.before_request()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as e:
+            _record(breaker, None, e)
+            raise
+        _record(breaker, response, None)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that fails requests fast while their endpoint class's circuit is open."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breakers: CircuitBreakers):
+        """Initialize async circuit breaker transport.
+
+        Args:
+            transport: Transport that sends the requests
+            breakers: Breakers consulted before and updated after every request
+        """
+        self._transport = transport
+        self._breakers = breakers
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._breakers.for_request(request)
+        breaker.before_request()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            _record(breaker, None, e)
+            raise
+        _record(breaker, response, None)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
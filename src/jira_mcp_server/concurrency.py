@@ -0,0 +1,309 @@
+"""Adaptive (AIMD) limit on in-flight Jira API requests"""
+
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Union, cast
+
+import httpx
+
+from jira_mcp_server.deadline import remaining, wait_expired
+from jira_mcp_server.endpoints import is_streamed
+
+# Responses that mean Jira is overloaded and the client should send less
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Multiplier applied to the limit when Jira signals overload
+DEFAULT_BACKOFF = 0.5
+
+# Latency, relative to the best recently observed, above which the limit stops growing
+DEFAULT_LATENCY_TOLERANCE = 2.0
+
+# How quickly the latency baseline follows sustained changes (fraction per sample)
+_BASELINE_DRIFT = 0.01
+
+
+class AIMDLimit:
+    """Thread-safe additive-increase/multiplicative-decrease concurrency limit.
+
+    While latency stays close to its baseline the limit grows by roughly one per round of
+    requests; a 429, 503 or timeout multiplies it by ``backoff``. Failures of requests that
+    started before the latest decrease are ignored, so a burst of rejections shrinks the
+    limit once rather than once per request.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = DEFAULT_BACKOFF,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize limit.
+
+        Args:
+            initial: Starting number of concurrent requests
+            min_limit: Lowest limit after repeated overload
+            max_limit: Highest limit (usually the connection pool size)
+            backoff: Multiplier applied on overload
+            latency_tolerance: Latency multiple of the baseline still considered healthy
+            clock: Monotonic clock in seconds
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._increases = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def now(self) -> float:
+        """Read the limit's clock, to timestamp a request as it starts."""
+        return self._clock()
+
+    def on_success(self, latency: float) -> None:
+        """Record a request that completed without overload signals.
+
+        Args:
+            latency: Seconds until the response arrived
+        """
+        with self._lock:
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                self._baseline += (latency - self._baseline) * _BASELINE_DRIFT
+
+            if latency <= self._baseline * self.latency_tolerance and self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+                self._increases += 1
+
+    def on_overload(self, started: float) -> None:
+        """Record a 429, 503 or timeout.
+
+        Args:
+            started: Clock reading when the failed request was sent
+        """
+        with self._lock:
+            if started < self._last_decrease:
+                return
+            self._limit = max(float(self.min_limit), self._limit * self.backoff)
+            self._last_decrease = self._clock()
+            self._decreases += 1
+
+    def get_stats(self) -> Dict[str, Union[int, Optional[float]]]:
+        """Get limit statistics.
+
+        Returns:
+            Current limit, number of increases and decreases, and latency baseline in seconds
+        """
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "increases": self._increases,
+                "decreases": self._decreases,
+                "baseline_latency": self._baseline,
+            }
+
+
+def _record(limit: AIMDLimit, started: float, response: Optional[httpx.Response], error: Optional[Exception]) -> None:
+    """Feed the outcome of one request back into the limit.
+
+    Args:
+        limit: Limit to update
+        started: Clock reading when the request was sent
+        response: Response received, if any
+        error: Transport error raised, if any
+    """
+    if response is not None:
+        if response.status_code in OVERLOAD_STATUSES:
+            limit.on_overload(started)
+        else:
+            limit.on_success(limit.now() - started)
+    elif isinstance(error, httpx.TimeoutException) and not isinstance(error, httpx.PoolTimeout):
+        # Pool timeouts are local queueing, not a sign that Jira is struggling
+        limit.on_overload(started)
+
+
+class _SlotStream(httpx.SyncByteStream):
+    """Streamed response body that holds its request's slot until it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, finish: Callable[[Optional[Exception]], None]):
+        self._stream = stream
+        self._finish = finish
+        self._error: Optional[Exception] = None
+        self._done = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._stream
+        except httpx.TransportError as e:
+            self._error = e
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._done:
+                self._done = True
+                self._finish(self._error)
+
+
+class _AsyncSlotStream(httpx.AsyncByteStream):
+    """Streamed async response body that holds its request's slot until it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, finish: Callable[[Optional[Exception]], Awaitable[None]]):
+        self._stream = stream
+        self._finish = finish
+        self._error: Optional[Exception] = None
+        self._done = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except httpx.TransportError as e:
+            self._error = e
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._done:
+                self._done = True
+                await self._finish(self._error)
+
+
+class ConcurrencyLimitTransport(httpx.BaseTransport):
+    """httpx transport that holds requests back while the adaptive limit is reached.
+
+    A request keeps its slot until its response has arrived or, for streamed requests,
+    until the response body has been read and closed; latency is measured to that point.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, limit: AIMDLimit):
+        """Initialize concurrency limit transport.
+
+        Args:
+            transport: Transport that sends the requests
+            limit: Adaptive limit consulted before and updated after every request
+        """
+        self._transport = transport
+        self._limit = limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._condition:
+            # Wait no longer than the tool call's deadline allows
+            if not self._condition.wait_for(lambda: self._in_flight < self._limit.limit, timeout=remaining()):
+                raise wait_expired(request, "a request slot")
+            self._in_flight += 1
+
+        started = self._limit.now()
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError as e:
+            self._finish(started, None, e)
+            raise
+        except BaseException:
+            self._finish(started, None, None)
+            raise
+        if is_streamed(request) and not response.is_closed:
+
+            def finish(error: Optional[Exception]) -> None:
+                self._finish(started, None if error else response, error)
+
+            response.stream = _SlotStream(cast(httpx.SyncByteStream, response.stream), finish)
+        else:
+            self._finish(started, response, None)
+        return response
+
+    def _finish(self, started: float, response: Optional[httpx.Response], error: Optional[Exception]) -> None:
+        _record(self._limit, started, response, error)
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncConcurrencyLimitTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that holds requests back while the adaptive limit is reached.
+
+    Streamed requests keep their slot until the response body has been closed.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: AIMDLimit):
+        """Initialize async concurrency limit transport.
+
+        Args:
+            transport: Transport that sends the requests
+            limit: Adaptive limit consulted before and updated after every request
+        """
+        self._transport = transport
+        self._limit = limit
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # Created on first use so it binds to the event loop serving requests
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        condition = self._condition
+
+        async with condition:
+            if self._in_flight >= self._limit.limit:
+                # Wait no longer than the tool call's deadline allows
+                try:
+                    await asyncio.wait_for(condition.wait_for(lambda: self._in_flight < self._limit.limit), remaining())
+                except asyncio.TimeoutError:
+                    raise wait_expired(request, "a request slot") from None
+            self._in_flight += 1
+
+        started = self._limit.now()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError as e:
+            await self._finish(condition, started, None, e)
+            raise
+        except BaseException:
+            await self._finish(condition, started, None, None)
+            raise
+        if is_streamed(request) and not response.is_closed:
+
+            async def finish(error: Optional[Exception]) -> None:
+                await self._finish(condition, started, None if error else response, error)
+
+            response.stream = _AsyncSlotStream(cast(httpx.AsyncByteStream, response.stream), finish)
+        else:
+            await self._finish(condition, started, response, None)
+        return response
+
+    async def _finish(
+        self,
+        condition: asyncio.Condition,
+        started: float,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> None:
+        _record(self._limit, started, response, error)
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
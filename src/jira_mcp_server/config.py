@@ -1,8 +1,29 @@
 """Configuration management for Jira MCP Server (T011)"""
 
+from typing import List, Literal, Optional, Tuple
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Stages of the request pipeline every Jira request passes through, innermost (next to the
+# connection pool) first; see pipeline.py
+MIDDLEWARE_STAGES = (
+    "auth",
+    "metrics",
+    "deadline",
+    "concurrency",
+    "rate_limit",
+    "retry",
+    "circuit_breaker",
+    "hedging",
+    "http_cache",
+    "coalesce",
+    "tracing",
+)
+
+# Stages that cannot be disabled: Jira rejects requests without credentials
+REQUIRED_MIDDLEWARE = frozenset({"auth"})
+
 
 class JiraConfig(BaseSettings):
     """Configuration for Jira MCP Server loaded from environment variables.
@@ -13,15 +34,114 @@ class JiraConfig(BaseSettings):
 
     Optional environment variables:
     - JIRA_MCP_CACHE_TTL: Schema cache TTL in seconds (default: 3600)
+    - JIRA_MCP_CACHE_MAX_STALE: Seconds past TTL an expired schema is still served while it is
+      refreshed in the background, 0 to always block on a fresh fetch (default: 86400)
+    - JIRA_MCP_CACHE_DIR: Directory for a persistent schema cache shared across restarts (default: unset, memory only)
     - JIRA_MCP_TIMEOUT: HTTP request timeout in seconds (default: 30)
     - JIRA_MCP_VERIFY_SSL: Verify SSL certificates (default: true, set to false for self-signed certs)
+    - JIRA_MCP_MAX_CONNECTIONS: Maximum pooled HTTP connections to Jira (default: 20)
+    - JIRA_MCP_MAX_KEEPALIVE_CONNECTIONS: Maximum idle connections kept open for reuse (default: 10)
+    - JIRA_MCP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept before closing (default: 30)
+    - JIRA_MCP_SEARCH_FAN_OUT: Concurrent page requests when collecting multi-page searches (default: 4)
+    - JIRA_MCP_SEARCH_CACHE_TTL: Search result cache TTL in seconds, 0 to disable (default: 60)
+    - JIRA_MCP_SEARCH_CACHE_SIZE: Maximum cached search results (default: 256)
+    - JIRA_MCP_MAX_RETRIES: Retries for transient failures (429, 502-504, timeouts), 0 to disable (default: 3)
+    - JIRA_MCP_RETRY_BACKOFF: Base delay in seconds for jittered exponential backoff (default: 0.5)
+    - JIRA_MCP_RETRY_MAX_DELAY: Longest wait in seconds before a retry; longer Retry-After waits fail fast (default: 30)
+    - JIRA_MCP_RATE_LIMIT: Requests per second to Jira across all tools, 0 for no limit (default: 0)
+    - JIRA_MCP_RATE_LIMIT_BURST: Requests allowed back to back before the rate limit applies (default: 10)
+    - JIRA_MCP_SEARCH_RATE_LIMIT: Requests per second for searches, 0 for no separate limit (default: 0)
+    - JIRA_MCP_WRITE_RATE_LIMIT: Requests per second for creates, updates and deletes, 0 for no separate limit
+      (default: 0)
+    - JIRA_MCP_ADAPTIVE_CONCURRENCY: Adapt in-flight requests to Jira's latency and overload signals (default: false)
+    - JIRA_MCP_ADAPTIVE_CONCURRENCY_INITIAL: Starting in-flight request limit when adaptive (default: 4)
+    - JIRA_MCP_COALESCE_REQUESTS: Merge identical concurrent reads and searches into one request (default: true)
+    - JIRA_MCP_HTTP_CACHE_SIZE: Revalidatable GET responses kept for conditional requests (default: 512, 0 disables)
+    - JIRA_MCP_JSON_CODEC: JSON library for request/response bodies: auto, orjson, msgspec or stdlib (default: auto)
+    - JIRA_MCP_TRACING: Start OpenTelemetry spans for tool calls, validation and Jira requests (default: false)
+    - JIRA_MCP_CIRCUIT_BREAKER_THRESHOLD: Consecutive failures before requests fail fast (default: 5, 0 disables)
+    - JIRA_MCP_CIRCUIT_BREAKER_RESET: Seconds an open circuit waits before probing Jira again (default: 30)
+    - JIRA_MCP_HEDGE_REQUESTS: Re-send issue, transition, comment and filter reads slower than p95 (default: false)
+    - JIRA_MCP_HEDGE_MAX_EXTRA: Largest fraction of those reads that may be sent twice (default: 0.1)
+    - JIRA_MCP_TOOL_DEADLINE: Seconds a tool call may take across all of its Jira requests, 0 for no limit
+      (default: 60)
+    - JIRA_MCP_DISABLED_MIDDLEWARE: Comma-separated request pipeline stages to leave out, e.g. retry,http_cache
+      (default: unset, every stage whose feature is configured runs)
+    - JIRA_MCP_PREFETCH: Comma-separated PROJECT or PROJECT:IssueType schemas to load at startup (default: unset)
     """
 
     url: str = Field(..., description="Jira instance URL")
     token: str = Field(..., description="API authentication token")
     cache_ttl: int = Field(default=3600, description="Schema cache TTL in seconds", gt=0)
+    cache_max_stale: int = Field(
+        default=86400, description="Seconds past TTL a schema is served while refreshing in the background", ge=0
+    )
+    cache_dir: Optional[str] = Field(
+        default=None, description="Directory for a persistent schema cache shared across restarts and processes"
+    )
     timeout: int = Field(default=30, description="HTTP request timeout in seconds", gt=0)
     verify_ssl: bool = Field(default=True, description="Verify SSL certificates (disable for self-signed certs)")
+    max_connections: int = Field(default=20, description="Maximum pooled HTTP connections to Jira", gt=0)
+    max_keepalive_connections: int = Field(default=10, description="Maximum idle connections kept open for reuse", ge=0)
+    keepalive_expiry: float = Field(default=30.0, description="Seconds an idle connection is kept before closing", gt=0)
+    search_fan_out: int = Field(
+        default=4, description="Concurrent page requests when collecting multi-page searches", gt=0
+    )
+    search_cache_ttl: int = Field(default=60, description="Search result cache TTL in seconds (0 disables)", ge=0)
+    search_cache_size: int = Field(default=256, description="Maximum cached search results", ge=0)
+    max_retries: int = Field(default=3, description="Retries for transient failures (0 disables)", ge=0)
+    retry_backoff: float = Field(default=0.5, description="Base delay in seconds for exponential backoff", gt=0)
+    retry_max_delay: float = Field(default=30.0, description="Longest wait in seconds before a retry", gt=0)
+    rate_limit: float = Field(
+        default=0.0, description="Requests per second to Jira across all tools (0 disables)", ge=0
+    )
+    rate_limit_burst: int = Field(default=10, description="Requests allowed back to back before limiting", gt=0)
+    search_rate_limit: float = Field(default=0.0, description="Requests per second for searches (0 disables)", ge=0)
+    write_rate_limit: float = Field(default=0.0, description="Requests per second for writes (0 disables)", ge=0)
+    adaptive_concurrency: bool = Field(
+        default=False, description="Adapt in-flight requests to Jira's latency and overload signals (AIMD)"
+    )
+    adaptive_concurrency_initial: int = Field(
+        default=4, description="Starting in-flight request limit when adaptive concurrency is on", gt=0
+    )
+    coalesce_requests: bool = Field(
+        default=True, description="Merge identical concurrent reads and searches into one request"
+    )
+    http_cache_size: int = Field(
+        default=512, description="GET responses kept for ETag/Last-Modified revalidation (0 disables)", ge=0
+    )
+    json_codec: Literal["auto", "orjson", "msgspec", "stdlib"] = Field(
+        default="auto", description="JSON library for request and response bodies (auto picks the fastest installed)"
+    )
+    tracing: bool = Field(
+        default=False, description="Start OpenTelemetry spans for tool calls, validation and Jira requests"
+    )
+    circuit_breaker_threshold: int = Field(
+        default=5, description="Consecutive failures that open an endpoint class's circuit (0 disables)", ge=0
+    )
+    circuit_breaker_reset: float = Field(
+        default=30.0, description="Seconds an open circuit waits before letting a probe request through", gt=0
+    )
+    hedge_requests: bool = Field(
+        default=False, description="Send a second copy of slow idempotent reads and use whichever answers first"
+    )
+    hedge_max_extra: float = Field(
+        default=0.1, description="Largest fraction of hedgeable reads that may be sent twice", gt=0, le=1
+    )
+    tool_deadline: float = Field(
+        default=60.0, description="Seconds a tool call may take across all of its Jira requests (0 disables)", ge=0
+    )
+    disabled_middleware: str = Field(
+        default="", description="Comma-separated request pipeline stages to leave out (e.g. retry,http_cache)"
+    )
+    prefetch: str = Field(
+        default="", description="Comma-separated PROJECT or PROJECT:IssueType schemas to load at startup"
+    )
+    transport: Literal["stdio", "http", "sse"] = Field(
+        default="stdio", description="MCP transport: stdio, or http/sse to also serve GET /metrics"
+    )
+    host: str = Field(default="127.0.0.1", description="Address the http and sse transports listen on")
+    port: int = Field(default=8000, description="Port the http and sse transports listen on", ge=1, le=65535)
 
     model_config = SettingsConfigDict(
         env_prefix="JIRA_MCP_",
@@ -35,4 +155,53 @@ class JiraConfig(BaseSettings):
         """Remove trailing slash from URL for consistency."""
         return v.rstrip("/")
 
+    @field_validator("disabled_middleware")
+    @classmethod
+    def check_middleware_names(cls, v: str) -> str:
+        """Reject unknown stage names and stages that cannot be disabled."""
+        for name in _split_names(v):
+            if name not in MIDDLEWARE_STAGES:
+                raise ValueError(f"Unknown middleware stage '{name}'. Choose from: {', '.join(MIDDLEWARE_STAGES)}")
+            if name in REQUIRED_MIDDLEWARE:
+                raise ValueError(f"Middleware stage '{name}' cannot be disabled")
+        return v
+
+    def middleware_stages(self) -> Tuple[str, ...]:
+        """Get the request pipeline stages left after JIRA_MCP_DISABLED_MIDDLEWARE.
+
+        Returns:
+            Stage names, innermost first
+
+        Example:
+            >>> config.disabled_middleware = "hedging, http_cache"
+            >>> "http_cache" in config.middleware_stages()
+            False
+        """
+        disabled = set(_split_names(self.disabled_middleware))
+        return tuple(name for name in MIDDLEWARE_STAGES if name not in disabled)
+
+    def prefetch_targets(self) -> List[Tuple[str, Optional[str]]]:
+        """Parse JIRA_MCP_PREFETCH into schema warm-up targets.
+
+        Returns:
+            (project, issue_type) pairs; issue_type is None for every issue type of the project
+
+        Example:
+            >>> config.prefetch = "PROJ:Bug, PROJ:Task, OPS"
+            >>> config.prefetch_targets()
+            [('PROJ', 'Bug'), ('PROJ', 'Task'), ('OPS', None)]
+        """
+        targets: List[Tuple[str, Optional[str]]] = []
+        for entry in self.prefetch.split(","):
+            project, _, issue_type = entry.partition(":")
+            project, issue_type = project.strip(), issue_type.strip()
+            if project and (project, issue_type or None) not in targets:
+                targets.append((project, issue_type or None))
+        return targets
+
     # Note: cache_ttl and timeout validation handled by gt=0 constraint in Field definitions
+
+
+def _split_names(value: str) -> List[str]:
+    """Split a comma-separated setting into its non-empty, trimmed, lower-case entries."""
+    return [name.strip().lower() for name in value.split(",") if name.strip()]
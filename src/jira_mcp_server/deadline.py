@@ -0,0 +1,223 @@
+"""Per-tool-call deadlines propagated to every Jira request the call makes"""
+
+import asyncio
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar, cast
+
+import httpx
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Monotonic time by which the current tool call must finish; None outside a deadline
+_deadline: ContextVar[Optional[float]] = ContextVar("jira_mcp_deadline", default=None)
+
+# Seconds each tool call may take (JIRA_MCP_TOOL_DEADLINE); None disables the deadline
+_budget: Optional[float] = None
+
+# Timeouts httpx applies per request, all shrunk to the remaining budget
+_TIMEOUT_KEYS = ("connect", "read", "write", "pool")
+
+_RAISE_HINT = "raise JIRA_MCP_TOOL_DEADLINE if calls need longer"
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised when a request cannot finish before the tool call's deadline.
+
+    Raised instead of sending a request once the deadline has passed, and in place of the
+    timeout of a request whose time ran out because the deadline had shortened it.
+    """
+
+
+def configure_deadline(seconds: float) -> None:
+    """Set the budget applied to every tool call decorated with ``with_deadline``.
+
+    Args:
+        seconds: Seconds a tool call may take, 0 to disable the deadline
+    """
+    global _budget
+    _budget = seconds if seconds > 0 else None
+
+
+def remaining() -> Optional[float]:
+    """Get the time left before the current deadline.
+
+    Returns:
+        Seconds left (0 or less once it has passed), or None outside a deadline
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Run a block under a deadline; an enclosing, earlier deadline still applies.
+
+    The deadline is carried by a context variable, so it follows the call into asyncio tasks
+    and into threads started with ``contextvars.copy_context().run``.
+
+    Args:
+        seconds: Seconds the block may take, or None to leave the current deadline unchanged
+    """
+    if seconds is None:
+        yield
+        return
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Run a block outside any deadline, for background work that outlives the tool call."""
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _expired_error(name: str, budget: float) -> ValueError:
+    return ValueError(f"{name} did not finish within its {budget:g} second deadline")
+
+
+def with_deadline(fn: F) -> F:
+    """Decorate a tool so each call runs under the configured deadline.
+
+    Requests made by the call get at most the remaining time as their timeout. Coroutine
+    functions are also cancelled when the deadline expires, which cancels their outstanding
+    requests; synchronous functions are bounded by the shrinking request timeouts.
+
+    Args:
+        fn: Tool function or coroutine function
+
+    Returns:
+        Wrapper preserving the function's signature and docstring
+    """
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            budget = _budget
+            if budget is None:
+                return await fn(*args, **kwargs)
+            with deadline(budget):
+                try:
+                    return await asyncio.wait_for(fn(*args, **kwargs), budget)
+                except asyncio.TimeoutError:
+                    raise _expired_error(fn.__name__, budget) from None
+
+        return cast(F, async_wrapper)
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with deadline(_budget):
+            return fn(*args, **kwargs)
+
+    return cast(F, wrapper)
+
+
+def _bound_timeout(request: httpx.Request) -> None:
+    """Shrink a request's timeouts to the time left before the deadline.
+
+    Args:
+        request: HTTP request about to be sent
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    left = remaining()
+    if left is None:
+        return
+    if left <= 0:
+        raise DeadlineExceeded(
+            f"Tool call deadline exceeded before the request was sent; {_RAISE_HINT}", request=request
+        )
+    timeouts: Dict[str, Optional[float]] = request.extensions.get("timeout") or dict.fromkeys(_TIMEOUT_KEYS)
+    request.extensions["timeout"] = {
+        key: left if value is None else min(value, left) for key, value in timeouts.items()
+    }
+
+
+def _expired_timeout(request: httpx.Request, error: httpx.TimeoutException) -> httpx.TimeoutException:
+    """Replace a timeout caused by the deadline with DeadlineExceeded.
+
+    Args:
+        request: HTTP request that timed out
+        error: Timeout raised while sending it
+
+    Returns:
+        DeadlineExceeded if the deadline has passed, otherwise the original timeout
+    """
+    left = remaining()
+    if left is None or left > 0:
+        return error
+    return DeadlineExceeded(f"Tool call deadline exceeded while waiting for Jira; {_RAISE_HINT}", request=request)
+
+
+def wait_expired(request: httpx.Request, waiting_for: str) -> DeadlineExceeded:
+    """Build the error for a request whose deadline runs out while it is held back locally.
+
+    Args:
+        request: HTTP request that was waiting
+        waiting_for: What the request was waiting for
+
+    Returns:
+        DeadlineExceeded naming the wait
+    """
+    return DeadlineExceeded(
+        f"Tool call deadline exceeded while waiting for {waiting_for}; {_RAISE_HINT}", request=request
+    )
+
+
+class DeadlineTransport(httpx.BaseTransport):
+    """httpx transport that gives each attempt no more than the time left before the deadline."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        """Initialize deadline transport.
+
+        Args:
+            transport: Transport that sends the requests
+        """
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _bound_timeout(request)
+        try:
+            return self._transport.handle_request(request)
+        except httpx.TimeoutException as e:
+            raise _expired_timeout(request, e) from e
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncDeadlineTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that gives each attempt no more than the time left before the deadline."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        """Initialize async deadline transport.
+
+        Args:
+            transport: Transport that sends the requests
+        """
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _bound_timeout(request)
+        try:
+            return await self._transport.handle_async_request(request)
+        except httpx.TimeoutException as e:
+            raise _expired_timeout(request, e) from e
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
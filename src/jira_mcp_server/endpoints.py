@@ -0,0 +1,95 @@
+"""Classification of outbound Jira requests by endpoint"""
+
+import httpx
+
+# POST endpoints that only read data
+READ_ONLY_POST_PATHS = ("/rest/api/2/search",)
+
+# HTTP methods that never change data
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Endpoint classes used to group requests for rate limiting and other per-class policy
+SEARCH = "search"
+READ = "read"
+WRITE = "write"
+ENDPOINT_CLASSES = (SEARCH, READ, WRITE)
+
+# Endpoint names used to label per-endpoint metrics
+ISSUE = "issue"
+CREATEMETA = "createmeta"
+FILTER = "filter"
+TRANSITIONS = "transitions"
+COMMENT = "comment"
+SERVER_INFO = "serverinfo"
+OTHER = "other"
+
+# Request extension set on requests whose response body is read incrementally; no layer may buffer it
+STREAM_EXTENSION = "jira_mcp.stream"
+
+
+def is_read_only_post(request: httpx.Request) -> bool:
+    """Check whether a POST request only reads data (such as a JQL search).
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        True for POSTs to read-only endpoints
+    """
+    return request.method == "POST" and request.url.path.endswith(READ_ONLY_POST_PATHS)
+
+
+def endpoint_class(request: httpx.Request) -> str:
+    """Classify a request as a search, a read or a write.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        One of SEARCH, READ or WRITE
+    """
+    if request.url.path.endswith(READ_ONLY_POST_PATHS):
+        return SEARCH
+    if request.method in SAFE_METHODS:
+        return READ
+    return WRITE
+
+
+def is_streamed(request: httpx.Request) -> bool:
+    """Check whether a request's response body must be passed through unbuffered.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        True if the request was sent with the STREAM_EXTENSION extension
+    """
+    return bool(request.extensions.get(STREAM_EXTENSION))
+
+
+def endpoint_name(request: httpx.Request) -> str:
+    """Name the Jira endpoint a request targets, for per-endpoint metrics.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        One of "search", "issue", "createmeta", "filter", "transitions", "comment",
+        "serverinfo" or "other"
+    """
+    path = request.url.path
+    if path.endswith(READ_ONLY_POST_PATHS):
+        return SEARCH
+    if "/issue/createmeta" in path:
+        return CREATEMETA
+    if path.endswith("/transitions"):
+        return TRANSITIONS
+    if "/comment" in path:
+        return COMMENT
+    if "/filter" in path:
+        return FILTER
+    if "/issue" in path:
+        return ISSUE
+    if path.endswith("/serverInfo"):
+        return SERVER_INFO
+    return OTHER
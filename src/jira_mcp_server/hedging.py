@@ -0,0 +1,275 @@
+"""Hedged requests: a second copy of a slow idempotent read, whichever answers first wins"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Optional, Set
+
+import httpx
+
+from jira_mcp_server.endpoints import COMMENT, FILTER, ISSUE, TRANSITIONS, endpoint_name, is_streamed
+
+# Read endpoints whose requests may be sent twice (issue, transitions, comments, filters)
+HEDGED_ENDPOINTS = frozenset({ISSUE, TRANSITIONS, COMMENT, FILTER})
+
+# Latency quantile after which a hedge is sent
+DEFAULT_QUANTILE = 0.95
+
+# Latencies remembered per endpoint to estimate the quantile
+_WINDOW = 200
+
+# Observations needed before an endpoint is hedged at all
+_MIN_SAMPLES = 20
+
+# Most unspent hedges that can accumulate during a quiet period
+_MAX_CREDIT = 10.0
+
+
+def is_hedgeable(request: httpx.Request) -> bool:
+    """Check whether a request may be sent a second time.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        True for non-streamed GETs of issues, transitions, comments and filters
+    """
+    return request.method == "GET" and not is_streamed(request) and endpoint_name(request) in HEDGED_ENDPOINTS
+
+
+class Hedger:
+    """Thread-safe hedging policy: when to send a hedge and how many are allowed.
+
+    The hedge delay is the ``quantile`` of the endpoint's recent latencies, so only the
+    slowest ~5% of requests get a second copy; endpoints are not hedged until enough
+    latencies have been seen. Each eligible request earns ``max_extra`` of a hedge and each
+    hedge spends one, which caps the extra load at that fraction of eligible requests.
+    """
+
+    def __init__(self, max_extra: float = 0.1, quantile: float = DEFAULT_QUANTILE):
+        """Initialize hedger.
+
+        Args:
+            max_extra: Largest fraction of eligible requests that may be hedged
+            quantile: Latency quantile after which a hedge is sent
+        """
+        self.max_extra = max_extra
+        self.quantile = quantile
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._credit = 0.0
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Get how long to wait for a request before hedging it, and count the request.
+
+        Args:
+            endpoint: Endpoint name from endpoints.endpoint_name
+
+        Returns:
+            Seconds to wait, or None while too few latencies have been observed
+        """
+        with self._lock:
+            self._requests += 1
+            self._credit = min(_MAX_CREDIT, self._credit + self.max_extra)
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a request that got a response.
+
+        Args:
+            endpoint: Endpoint name from endpoints.endpoint_name
+            seconds: Time until the response arrived
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=_WINDOW)
+            latencies.append(seconds)
+
+    def try_hedge(self) -> bool:
+        """Spend budget on a hedge.
+
+        Returns:
+            True if the hedge may be sent
+        """
+        with self._lock:
+            if self._credit < 1:
+                self._budget_exhausted += 1
+                return False
+            self._credit -= 1
+            self._hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before the original request."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hedging statistics.
+
+        Returns:
+            Eligible requests, hedges sent, hedges that won, and hedges skipped for lack of budget
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "budget_exhausted": self._budget_exhausted,
+            }
+
+
+def _leg_request(request: httpx.Request) -> httpx.Request:
+    """Copy a request for one leg of a hedge.
+
+    Stages below hedging rewrite a request's headers and extensions (auth, timeouts,
+    trace context), so legs sent concurrently must not share one request object.
+
+    Args:
+        request: Request being hedged
+
+    Returns:
+        Request with the same method, URL, headers and body, and its own extensions
+    """
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers.copy(),
+        content=request.content,
+        extensions=dict(request.extensions),
+    )
+
+
+def _close_loser(future: "Future[httpx.Response]") -> None:
+    """Release the connection of a response nobody is waiting for."""
+    if future.exception() is None:
+        future.result().close()
+
+
+class HedgingTransport(httpx.BaseTransport):
+    """httpx transport that hedges slow idempotent reads from a small thread pool."""
+
+    def __init__(self, transport: httpx.BaseTransport, hedger: Hedger, max_workers: int = 8):
+        """Initialize hedging transport.
+
+        Args:
+            transport: Transport that sends the requests
+            hedger: Policy deciding when to hedge, updated with every latency
+            max_workers: Threads available for requests in flight (usually the pool size)
+        """
+        self._transport = transport
+        self._hedger = hedger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jira-hedge")
+
+    def _send(self, request: httpx.Request, endpoint: str) -> httpx.Response:
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        self._hedger.observe(endpoint, time.perf_counter() - started)
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not is_hedgeable(request):
+            return self._transport.handle_request(request)
+        endpoint = endpoint_name(request)
+        delay = self._hedger.delay(endpoint)
+        if delay is None:
+            return self._send(request, endpoint)
+
+        # Legs run in a copy of the caller's context so they keep its deadline and trace
+        primary = self._executor.submit(contextvars.copy_context().run, self._send, _leg_request(request), endpoint)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._hedger.try_hedge():
+            return primary.result()
+
+        hedge = self._executor.submit(contextvars.copy_context().run, self._send, _leg_request(request), endpoint)
+        legs = [primary, hedge]
+        pending: Set["Future[httpx.Response]"] = set(legs)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # The first response wins; an error only surfaces once both legs have failed
+            winner = next((leg for leg in done if leg.exception() is None), None)
+            if winner is not None:
+                if winner is not primary:
+                    self._hedger.record_win()
+                for leg in legs:
+                    if leg is not winner:
+                        leg.add_done_callback(_close_loser)
+                return winner.result()
+        return primary.result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._transport.close()
+
+
+async def _discard(leg: "asyncio.Task[httpx.Response]") -> None:
+    """Cancel a leg nobody is waiting for, or close the response it already got."""
+    if not leg.done():
+        leg.cancel()
+    elif not leg.cancelled() and leg.exception() is None:
+        await leg.result().aclose()
+
+
+class AsyncHedgingTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that hedges slow idempotent reads with a second task."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, hedger: Hedger):
+        """Initialize async hedging transport.
+
+        Args:
+            transport: Transport that sends the requests
+            hedger: Policy deciding when to hedge, updated with every latency
+        """
+        self._transport = transport
+        self._hedger = hedger
+
+    async def _send(self, request: httpx.Request, endpoint: str) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        self._hedger.observe(endpoint, time.perf_counter() - started)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not is_hedgeable(request):
+            return await self._transport.handle_async_request(request)
+        endpoint = endpoint_name(request)
+        delay = self._hedger.delay(endpoint)
+        if delay is None:
+            return await self._send(request, endpoint)
+
+        primary = asyncio.create_task(self._send(_leg_request(request), endpoint))
+        legs = [primary]
+        try:
+            done, _ = await asyncio.wait(legs, timeout=delay)
+            if not done and self._hedger.try_hedge():
+                legs.append(asyncio.create_task(self._send(_leg_request(request), endpoint)))
+            pending = set(legs)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((leg for leg in done if leg.exception() is None), None)
+                if winner is not None:
+                    if winner is not primary:
+                        self._hedger.record_win()
+                    legs.remove(winner)
+                    return winner.result()
+            legs.remove(primary)
+            return primary.result()
+        finally:
+            # Losing legs, and every leg if the caller was cancelled
+            for leg in legs:
+                await _discard(leg)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
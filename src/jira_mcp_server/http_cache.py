@@ -0,0 +1,324 @@
+"""Conditional GET cache that revalidates Jira resources instead of re-downloading them"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from jira_mcp_server.single_flight import copy_response
+
+# Single issue resources, which can be revalidated through their `updated` field
+_ISSUE_PATH = re.compile(r"/rest/api/2/issue/(?!createmeta$)[^/]+$")
+
+
+# Field projections that already include `updated`
+_INCLUDES_UPDATED = frozenset({"updated", "*all", "*navigable"})
+
+
+def _issue_updated(loads: Callable[[bytes], Any], body: bytes) -> Optional[str]:
+    """Read `fields.updated` from an issue body.
+
+    Args:
+        loads: JSON parser for UTF-8 bytes
+        body: Issue response body
+
+    Returns:
+        The issue's last update timestamp, or None if absent or unparsable
+    """
+    try:
+        updated = loads(body).get("fields", {}).get("updated")
+    except (ValueError, AttributeError):
+        return None
+    return updated if isinstance(updated, str) else None
+
+
+def revalidatable_fields(fields: List[str]) -> List[str]:
+    """Add `updated` to an issue field projection so the response can be revalidated.
+
+    Issues are revalidated by comparing their `updated` field with a `fields=updated` probe,
+    so a projection leaving it out would never be served from the cache. Projections made
+    only of exclusions (``-field``) already return it.
+
+    Args:
+        fields: Fields requested
+
+    Returns:
+        The fields, with `updated` appended if the projection would otherwise omit it
+    """
+    if _INCLUDES_UPDATED.intersection(fields) or "-updated" in fields:
+        return fields
+    if all(field.startswith("-") for field in fields):
+        return fields
+    return [*fields, "updated"]
+
+
+class CachedResponse:
+    """A stored response and the validators used to revalidate it.
+
+    An issue stored without HTTP validators is revalidated through its `updated` field, read
+    from the body the first time the entry is revalidated rather than when it is stored: most
+    stored issues are never read again, and the client parses the body it is served anyway.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        loads: Optional[Callable[[bytes], Any]] = None,
+    ):
+        """Initialize cached response.
+
+        Args:
+            response: Fully read response
+            etag: ETag header, if sent
+            last_modified: Last-Modified header, if sent
+            loads: JSON parser used to read `updated` from an issue body (None if not an issue)
+        """
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self._loads = loads
+        self._updated: Optional[str] = None
+
+    @property
+    def updated(self) -> Optional[str]:
+        """The cached issue's `updated` timestamp, or None if it has none."""
+        if self._loads is not None:
+            self._updated = _issue_updated(self._loads, self.response.content)
+            self._loads = None
+        return self._updated
+
+
+class HttpCache:
+    """LRU store of GET responses revalidated with ETag, Last-Modified or an issue's `updated` field.
+
+    Jira answers a conditional request with an empty 304 when the resource is unchanged. Where
+    it sends no validators, issues are checked with a `fields=updated` probe that returns a few
+    bytes instead of the full issue.
+    """
+
+    def __init__(self, max_entries: int = 512, loads: Callable[[bytes], Any] = json.loads):
+        """Initialize HTTP cache.
+
+        Args:
+            max_entries: Maximum number of stored responses (least recently used are evicted)
+            loads: JSON parser for issue bodies (the client's codec)
+        """
+        self.max_entries = max_entries
+        self._loads = loads
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._probes = 0
+        self._evictions = 0
+
+    def lookup(self, request: httpx.Request) -> Optional[CachedResponse]:
+        """Find the stored response for a GET request.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Cached entry, or None if the request is not a GET or nothing is stored
+        """
+        if request.method != "GET":
+            return None
+        with self._lock:
+            entry = self._entries.get(str(request.url))
+            if entry is not None:
+                self._entries.move_to_end(str(request.url))
+            return entry
+
+    def conditional_headers(self, entry: CachedResponse) -> Dict[str, str]:
+        """Build the revalidation headers for a cached entry.
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def probe_request(self, request: httpx.Request, entry: CachedResponse) -> Optional[httpx.Request]:
+        """Build a `fields=updated` probe for an issue cached without HTTP validators.
+
+        Args:
+            request: Original request
+            entry: Cached entry for the request
+
+        Returns:
+            Probe request, or None if the entry is revalidated with HTTP validators instead or
+            the cached issue has no `updated` field (it is then downloaded again)
+        """
+        if entry.etag or entry.last_modified or entry.updated is None:
+            return None
+        with self._lock:
+            self._probes += 1
+        return httpx.Request(
+            "GET",
+            request.url.copy_with(query=b"fields=updated"),
+            headers=request.headers,
+            extensions=request.extensions,
+        )
+
+    def is_unchanged(self, entry: CachedResponse, probe: httpx.Response) -> bool:
+        """Check a probe response against the cached issue.
+
+        Args:
+            entry: Cached entry
+            probe: Fully read probe response
+
+        Returns:
+            True if the issue has not been updated since it was cached
+        """
+        return probe.status_code == 200 and _issue_updated(self._loads, probe.content) == entry.updated
+
+    def hit(self, entry: CachedResponse, request: httpx.Request) -> httpx.Response:
+        """Serve a revalidated entry.
+
+        Args:
+            entry: Cached entry confirmed to be current
+            request: Request being answered
+
+        Returns:
+            Copy of the cached response
+        """
+        with self._lock:
+            self._hits += 1
+        return copy_response(entry.response, request)
+
+    def store(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Remember a fully read 200 response if it can be revalidated later.
+
+        Args:
+            request: GET request
+            response: Fully read response
+        """
+        url = str(request.url)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        is_issue = not etag and not last_modified and _ISSUE_PATH.search(request.url.path) is not None
+
+        with self._lock:
+            self._misses += 1
+            if not etag and not last_modified and not is_issue:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = CachedResponse(response, etag, last_modified, self._loads if is_issue else None)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every stored response."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Revalidated hits, full downloads, probes sent, evictions and stored entries
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "probes": self._probes,
+                "evictions": self._evictions,
+                "total_entries": len(self._entries),
+            }
+
+
+class HttpCacheTransport(httpx.BaseTransport):
+    """httpx transport that revalidates cached GET responses instead of re-downloading them."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: HttpCache):
+        """Initialize HTTP cache transport.
+
+        Args:
+            transport: Transport that sends the requests
+            cache: Store of revalidatable responses
+        """
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self._transport.handle_request(request)
+
+        entry = self._cache.lookup(request)
+        if entry is not None:
+            probe = self._cache.probe_request(request, entry)
+            if probe is None:
+                request.headers.update(self._cache.conditional_headers(entry))
+            else:
+                probe_response = self._transport.handle_request(probe)
+                probe_response.read()
+                if self._cache.is_unchanged(entry, probe_response):
+                    return self._cache.hit(entry, request)
+
+        response = self._transport.handle_request(request)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            return self._cache.hit(entry, request)
+        if response.status_code == 200:
+            response.read()
+            self._cache.store(request, response)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncHttpCacheTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that revalidates cached GET responses instead of re-downloading them."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: HttpCache):
+        """Initialize async HTTP cache transport.
+
+        Args:
+            transport: Transport that sends the requests
+            cache: Store of revalidatable responses
+        """
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        entry = self._cache.lookup(request)
+        if entry is not None:
+            probe = self._cache.probe_request(request, entry)
+            if probe is None:
+                request.headers.update(self._cache.conditional_headers(entry))
+            else:
+                probe_response = await self._transport.handle_async_request(probe)
+                await probe_response.aread()
+                if self._cache.is_unchanged(entry, probe_response):
+                    return self._cache.hit(entry, request)
+
+        response = await self._transport.handle_async_request(request)
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            return self._cache.hit(entry, request)
+        if response.status_code == 200:
+            await response.aread()
+            self._cache.store(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,31 +1,106 @@
 """Jira REST API client (T018-T019)"""
 
-from typing import Any, Dict, List
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 import httpx
 
+from jira_mcp_server.circuit_breaker import CircuitBreakers, CircuitOpenError
+from jira_mcp_server.concurrency import AIMDLimit
 from jira_mcp_server.config import JiraConfig
-
-
-class JiraClient:
-    """HTTP client for Jira REST API v2.
-
-    Handles authentication, requests, and error handling for all Jira API interactions.
+from jira_mcp_server.deadline import DeadlineExceeded
+from jira_mcp_server.endpoints import STREAM_EXTENSION
+from jira_mcp_server.hedging import Hedger
+from jira_mcp_server.http_cache import HttpCache, revalidatable_fields
+from jira_mcp_server.json_codec import get_codec
+from jira_mcp_server.metrics import RequestMetrics
+from jira_mcp_server.pipeline import build_transport, environment_proxy
+from jira_mcp_server.rate_limit import RateLimiter
+from jira_mcp_server.retry import RetryPolicy
+from jira_mcp_server.search_stream import SearchStreamParser
+from jira_mcp_server.single_flight import CoalescingMetrics
+
+# Page size used when walking search results across pages
+DEFAULT_PAGE_SIZE = 100
+
+# Lean field set returned by the search tools unless the caller asks for more
+DEFAULT_SEARCH_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "reporter",
+    "labels",
+    "created",
+    "updated",
+]
+
+
+class BaseJiraClient:
+    """Transport-independent parts of the Jira REST API v2 clients.
+
+    Holds configuration, authentication headers, error mapping and response parsing shared
+    by the synchronous JiraClient and the asyncio-based AsyncJiraClient.
     """
 
-    def __init__(self, config: JiraConfig):
+    def __init__(
+        self,
+        config: JiraConfig,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ):
         """Initialize Jira client.
 
         Args:
             config: JiraConfig with URL and authentication token
+            rate_limiter: RateLimiter shared with other clients (default: a new one built from config)
+            metrics: RequestMetrics shared with other clients (default: a new, client-local one)
         """
         self.base_url = config.url
         self.timeout = config.timeout
         self._token = config.token
         self.verify_ssl = config.verify_ssl
+        self.limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        self.search_fan_out = config.search_fan_out
+        self.codec = get_codec(config.json_codec)
+        self.retry_policy = RetryPolicy(
+            max_retries=config.max_retries, backoff_base=config.retry_backoff, max_delay=config.retry_max_delay
+        )
+        self.request_metrics = metrics or RequestMetrics()
+        self.retry_metrics = self.request_metrics.retries
+        self.rate_limiter = rate_limiter or RateLimiter.from_config(config)
+        self.coalesce_requests = config.coalesce_requests
+        self.tracing = config.tracing
+        # Request pipeline stages, innermost first (see pipeline.py)
+        self.middleware = config.middleware_stages()
+        self.circuit_breakers: Optional[CircuitBreakers] = None
+        if config.circuit_breaker_threshold > 0:
+            self.circuit_breakers = CircuitBreakers(config.circuit_breaker_threshold, config.circuit_breaker_reset)
+        self.coalescing_metrics = CoalescingMetrics()
+        self.hedger: Optional[Hedger] = None
+        if config.hedge_requests:
+            self.hedger = Hedger(max_extra=config.hedge_max_extra)
+        self.http_cache: Optional[HttpCache] = None
+        if config.http_cache_size > 0:
+            self.http_cache = HttpCache(max_entries=config.http_cache_size, loads=self.codec.loads)
+        # In-flight requests adapt per client, bounded by the connection pool
+        self.concurrency_limit: Optional[AIMDLimit] = None
+        if config.adaptive_concurrency:
+            self.concurrency_limit = AIMDLimit(
+                initial=config.adaptive_concurrency_initial, max_limit=config.max_connections
+            )
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers with authentication.
+        """Get the HTTP headers the auth stage of the request pipeline adds to every request.
 
         Returns:
             Dictionary of HTTP headers
@@ -36,6 +111,28 @@ class JiraClient:
             "Accept": "application/json",
         }
 
+    def _encode(self, data: Any) -> bytes:
+        """Serialize a request body with the configured JSON codec.
+
+        Args:
+            data: JSON-serializable payload
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return self.codec.dumps(data)
+
+    def _decode(self, response: httpx.Response) -> Any:
+        """Parse a response body with the configured JSON codec.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Parsed JSON value
+        """
+        return self.codec.loads(response.content)
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses with actionable messages.
 
@@ -58,7 +155,7 @@ class JiraClient:
         elif status == 400:
             # Parse validation errors from response
             try:
-                error_data = response.json()
+                error_data = self._decode(response)
                 errors = error_data.get("errors", {})
                 messages = error_data.get("errorMessages", [])
 
@@ -77,6 +174,54 @@ class JiraClient:
         else:
             raise ValueError(f"Jira API error ({status}): {response.text[:200]}")
 
+    def _pipeline_error(self, error: httpx.TransportError) -> ValueError:
+        """Build the error for a request the pipeline gave up on before Jira answered.
+
+        Args:
+            error: CircuitOpenError raised while Jira keeps failing, or DeadlineExceeded once
+                the tool call's deadline has passed
+
+        Returns:
+            ValueError with the reason and what to do about it
+        """
+        return ValueError(str(error))
+
+    @contextmanager
+    def _request_errors(self, timeout_msg: str) -> Iterator[None]:
+        """Map the failures of sending a request to the ValueErrors the client raises.
+
+        Args:
+            timeout_msg: Message for a request that timed out
+
+        Raises:
+            ValueError: If the pipeline gave up on the request or it timed out
+        """
+        try:
+            yield
+        except (CircuitOpenError, DeadlineExceeded) as e:
+            raise self._pipeline_error(e)
+        except httpx.TimeoutException:
+            raise ValueError(timeout_msg)
+
+    def _check_response(
+        self, response: httpx.Response, ok_statuses: Tuple[int, ...], not_found_msg: Optional[str]
+    ) -> None:
+        """Raise the error for a response whose status is not one the endpoint succeeds with.
+
+        Args:
+            response: HTTP response object
+            ok_statuses: Status codes the endpoint returns on success
+            not_found_msg: Endpoint-specific message for a 404 (None for the generic one)
+
+        Raises:
+            ValueError: With context-specific error message
+        """
+        if response.status_code in ok_statuses:
+            return
+        if response.status_code == 404 and not_found_msg is not None:
+            raise ValueError(not_found_msg)
+        self._handle_error(response)
+
     def _get_resource_type(self, response: httpx.Response) -> str:
         """Determine resource type from URL for better error messages.
 
@@ -96,43 +241,467 @@ class JiraClient:
         else:
             return "resource"
 
-    def health_check(self) -> Dict[str, Any]:
-        """Verify connectivity to Jira instance (T019).
+    def _health_result(self, server_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the health check result from a serverInfo response.
+
+        Args:
+            server_info: Parsed serverInfo response body
 
         Returns:
             Dictionary with connection status and server info
+        """
+        return {
+            "connected": True,
+            "server_version": server_info.get("version", "unknown"),
+            "base_url": server_info.get("baseUrl", self.base_url),
+        }
+
+    def _project_schema_params(self, project_key: str, issue_type: str) -> Dict[str, str]:
+        """Build createmeta query parameters for a project and issue type.
+
+        Args:
+            project_key: Project key
+            issue_type: Issue type name
+
+        Returns:
+            Query parameters dictionary
+        """
+        return {
+            "projectKeys": project_key,
+            "issuetypeNames": issue_type,
+            "expand": "projects.issuetypes.fields",
+        }
+
+    def _project_schema_not_found(self, project_key: str, issue_type: str) -> str:
+        """Build the error message for a createmeta request that returns 404.
+
+        Args:
+            project_key: Project key
+            issue_type: Issue type name
+
+        Returns:
+            Message describing the likely causes
+        """
+        return (
+            f"Project schema not found. Possible causes:\n"
+            f"  - Project '{project_key}' does not exist\n"
+            f"  - You don't have permission to access project '{project_key}'\n"
+            f"  - Issue type '{issue_type}' is not available in this project\n"
+            f"  - The createmeta endpoint may not be available in your Jira version\n"
+            f"Please verify the project key and issue type are correct."
+        )
+
+    def _parse_project_schema(self, data: Dict[str, Any], project_key: str, issue_type: str) -> List[Dict[str, Any]]:
+        """Extract field definitions from a createmeta response.
+
+        Args:
+            data: Parsed createmeta response body
+            project_key: Project key
+            issue_type: Issue type name
+
+        Returns:
+            List of field definitions
 
         Raises:
-            ValueError: If connection fails or authentication error
+            ValueError: If the project or issue type is missing from the response
         """
-        url = f"{self.base_url}/rest/api/2/serverInfo"
+        projects = data.get("projects", [])
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
+        if not projects:
+            raise ValueError(
+                f"Project '{project_key}' returned no data. Possible causes:\n"
+                f"  - Project exists but you don't have permission to create issues\n"
+                f"  - Issue type '{issue_type}' is not available in this project\n"
+                f"Available projects: Check with your Jira administrator"
+            )
 
-                if response.status_code != 200:
-                    self._handle_error(response)
+        issue_types = projects[0].get("issuetypes", [])
+        if not issue_types:
+            raise ValueError(
+                f"Issue type '{issue_type}' not found in project '{project_key}'.\n"
+                f"Common issue types: Task, Bug, Story, Epic\n"
+                f"Note: Issue type names are case-sensitive"
+            )
 
-                server_info = response.json()
-                return {
-                    "connected": True,
-                    "server_version": server_info.get("version", "unknown"),
-                    "base_url": server_info.get("baseUrl", self.base_url),
-                }
+        fields = issue_types[0].get("fields", {})
+        return [{"key": k, **v} for k, v in fields.items()]
 
-        except httpx.TimeoutException:
+    def _parse_project_schemas(self, data: Dict[str, Any], project_key: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract field definitions for every issue type in a createmeta response.
+
+        Args:
+            data: Parsed createmeta response body
+            project_key: Project key
+
+        Returns:
+            Field definitions keyed by issue type name
+
+        Raises:
+            ValueError: If the project is missing from the response
+        """
+        projects = data.get("projects", [])
+
+        if not projects:
             raise ValueError(
-                f"Connection timeout. Could not reach Jira at {self.base_url} within {self.timeout} seconds."
+                f"Project '{project_key}' returned no data. Possible causes:\n"
+                f"  - Project exists but you don't have permission to create issues\n"
+                f"Available projects: Check with your Jira administrator"
             )
+
+        return {
+            issue_type["name"]: [{"key": k, **v} for k, v in issue_type.get("fields", {}).items()]
+            for issue_type in projects[0].get("issuetypes", [])
+        }
+
+    def _search_payload(
+        self,
+        jql: str,
+        max_results: int,
+        start_at: int,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build the request body for a JQL search.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum results to return
+            start_at: Starting offset for pagination
+            fields: Fields to return (None for Jira's default of all navigable fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+
+        Returns:
+            Search request body
+        """
+        data: Dict[str, Any] = {"jql": jql, "maxResults": max_results, "startAt": start_at}
+        if fields is not None:
+            data["fields"] = list(fields)
+        if expand:
+            data["expand"] = list(expand)
+        return data
+
+    def _issue_params(self, fields: Optional[List[str]], expand: Optional[List[str]]) -> Dict[str, str]:
+        """Build query parameters projecting a single-issue request.
+
+        Args:
+            fields: Fields to return (None for all fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+
+        Returns:
+            Query parameters for GET /issue/{key}; with the HTTP cache on, a projection also
+            asks for `updated` so the issue can be revalidated
+        """
+        params: Dict[str, str] = {}
+        if fields is not None:
+            if self.http_cache is not None:
+                fields = revalidatable_fields(fields)
+            params["fields"] = ",".join(fields)
+        if expand:
+            params["expand"] = ",".join(expand)
+        return params
+
+    def _page_size_for(self, page_size: int, limit: Optional[int], fetched: int) -> int:
+        """Size of the next search page, never requesting more than the remaining limit.
+
+        Args:
+            page_size: Preferred page size
+            limit: Maximum issues to fetch overall (None for no limit)
+            fetched: Issues fetched so far
+
+        Returns:
+            maxResults for the next page request
+        """
+        if limit is None:
+            return page_size
+        return min(page_size, limit - fetched)
+
+    def _is_last_page(self, page: Dict[str, Any], start_at: int) -> bool:
+        """Check whether a search page is the last one worth requesting.
+
+        Args:
+            page: Search response page
+            start_at: Offset of the next page
+
+        Returns:
+            True if the page was empty or the next offset is past the total
+        """
+        return not page.get("issues") or start_at >= page.get("total", 0)
+
+    def _remaining_page_requests(
+        self, first_page: Dict[str, Any], start_at: int, limit: Optional[int]
+    ) -> List[Tuple[int, int]]:
+        """Offsets and sizes of the pages that follow a first search page.
+
+        The step is the number of issues the first page actually returned, since Jira may
+        cap maxResults below what was requested.
+
+        Args:
+            first_page: Search response for the first page
+            start_at: Offset the first page was requested at
+            limit: Maximum issues to fetch overall (None for all matching issues)
+
+        Returns:
+            (startAt, maxResults) pairs for every remaining page, in order
+        """
+        step = len(first_page.get("issues", []))
+        if not step:
+            return []
+
+        end = first_page.get("total", 0)
+        if limit is not None:
+            end = min(end, start_at + limit)
+
+        return [(offset, min(step, end - offset)) for offset in range(start_at + step, end, step)]
+
+    def _merge_search_pages(
+        self, pages: Iterable[Dict[str, Any]], start_at: int, limit: Optional[int]
+    ) -> Dict[str, Any]:
+        """Combine ordered search pages into a single search result.
+
+        Issues that shift between pages while they are being fetched can appear twice;
+        only the first occurrence of each issue key is kept.
+
+        Args:
+            pages: Search response pages in offset order
+            start_at: Offset of the first collected issue
+            limit: Maximum issues to keep (None for all)
+
+        Returns:
+            Search result shaped like a single Jira search response
+        """
+        issues: List[Dict[str, Any]] = []
+        seen: set[str] = set()
+        total = 0
+        for page in pages:
+            total = page.get("total", total)
+            for issue in page.get("issues", []):
+                key = issue.get("key") or issue.get("id")
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                issues.append(issue)
+
+        if limit is not None:
+            issues = issues[:limit]
+
+        max_results = len(issues) if limit is None else limit
+        return {"startAt": start_at, "maxResults": max_results, "total": total, "issues": issues}
+
+    def _missing_tail(
+        self, pages: List[Dict[str, Any]], result: Dict[str, Any], start_at: int, limit: Optional[int]
+    ) -> Optional[Tuple[int, int]]:
+        """Find the page to request when de-duplication left a merged result short.
+
+        An issue inserted ahead of the pages being fetched pushes the later ones back, so the
+        page boundary is returned twice and the last issues fall past the offsets requested.
+
+        Args:
+            pages: Search response pages fetched so far, in offset order
+            result: Merged result of those pages
+            start_at: Offset of the first collected issue
+            limit: Maximum issues to collect (None for all)
+
+        Returns:
+            (startAt, maxResults) of the missing issues, or None if the result is complete or
+            nothing is left to fetch
+        """
+        wanted = result["total"] - start_at
+        if limit is not None:
+            wanted = min(wanted, limit)
+        missing = wanted - len(result["issues"])
+        offset = start_at + sum(len(page.get("issues", [])) for page in pages)
+        if missing <= 0 or offset >= result["total"]:
+            return None
+        return offset, missing
+
+    def _create_filter_payload(self, name: str, jql: str, description: str | None, favourite: bool) -> Dict[str, Any]:
+        """Build the request body for creating a filter.
+
+        Args:
+            name: Filter name
+            jql: JQL query string
+            description: Optional filter description
+            favourite: Whether to mark as favorite
+
+        Returns:
+            Filter creation request body
+        """
+        data: Dict[str, Any] = {"name": name, "jql": jql, "favourite": favourite}
+        if description:
+            data["description"] = description
+        return data
+
+    def _update_filter_payload(
+        self,
+        name: str | None,
+        jql: str | None,
+        description: str | None,
+        favourite: bool | None,
+    ) -> Dict[str, Any]:
+        """Build the request body for updating a filter.
+
+        Args:
+            name: New filter name
+            jql: New JQL query
+            description: New description
+            favourite: Whether to mark as favorite
+
+        Returns:
+            Filter update request body
+
+        Raises:
+            ValueError: If no fields are provided
+        """
+        data: Dict[str, Any] = {}
+        if name is not None:
+            data["name"] = name
+        if jql is not None:
+            data["jql"] = jql
+        if description is not None:
+            data["description"] = description
+        if favourite is not None:
+            data["favourite"] = favourite
+
+        if not data:
+            raise ValueError("At least one field must be provided to update")
+
+        return data
+
+    def _transition_payload(self, transition_id: str, fields: Dict[str, Any] | None) -> Dict[str, Any]:
+        """Build the request body for a workflow transition.
+
+        Args:
+            transition_id: Transition ID to execute
+            fields: Optional fields required by the transition
+
+        Returns:
+            Transition request body
+        """
+        data: Dict[str, Any] = {"transition": {"id": transition_id}}
+        if fields:
+            data["fields"] = fields
+        return data
+
+
+class JiraClient(BaseJiraClient):
+    """HTTP client for Jira REST API v2.
+
+    Handles authentication, requests, and error handling for all Jira API interactions.
+    All requests share one pooled ``httpx.Client`` so TCP/TLS connections are reused
+    across calls. Call ``close()`` (or use the client as a context manager) to release them.
+    """
+
+    def __init__(
+        self,
+        config: JiraConfig,
+        rate_limiter: Optional[RateLimiter] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ):
+        """Initialize Jira client.
+
+        Args:
+            config: JiraConfig with URL and authentication token
+            rate_limiter: RateLimiter shared with other clients (default: a new one built from config)
+            metrics: RequestMetrics shared with other clients (default: a new, client-local one)
+        """
+        super().__init__(config, rate_limiter, metrics)
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        """Get the pooled HTTP client, creating it on first use.
+
+        Returns:
+            Shared httpx.Client instance
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    pool = httpx.HTTPTransport(
+                        verify=self.verify_ssl, limits=self.limits, proxy=environment_proxy(self.base_url)
+                    )
+                    transport = build_transport(self, pool)
+                    self._http_client = httpx.Client(timeout=self.timeout, transport=transport)
+        return self._http_client
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        ok_statuses: Tuple[int, ...] = (200,),
+        not_found_msg: Optional[str] = None,
+        *,
+        timeout_msg: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request through the pooled client and check that it succeeded.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            ok_statuses: Status codes the endpoint returns on success
+            not_found_msg: Endpoint-specific message for a 404 (None for the generic one)
+            timeout_msg: Message for a request that timed out
+            **kwargs: Further arguments for httpx.Client.request (params, content, ...)
+
+        Returns:
+            Successful HTTP response
+
+        Raises:
+            ValueError: If the request failed, timed out or was refused by the pipeline
+        """
+        with self._request_errors(timeout_msg):
+            response = self._get_http_client().request(method, url, **kwargs)
+        self._check_response(response, ok_statuses, not_found_msg)
+        return response
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def health_check(self) -> Dict[str, Any]:
+        """Verify connectivity to Jira instance (T019).
+
+        Returns:
+            Dictionary with connection status and server info
+
+        Raises:
+            ValueError: If connection fails or authentication error
+        """
+        url = f"{self.base_url}/rest/api/2/serverInfo"
+        timeout_msg = f"Connection timeout. Could not reach Jira at {self.base_url} within {self.timeout} seconds."
+
+        try:
+            response = self._request("GET", url, timeout_msg=timeout_msg)
         except httpx.NetworkError as e:
             raise ValueError(f"Network error connecting to Jira: {str(e)}")
 
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
+        return self._health_result(self._decode(response))
+
+    def get_issue(
+        self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """Get issue details by key.
 
         Args:
             issue_key: Issue key (e.g., "PROJ-123")
+            fields: Fields to return (None for all fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
 
         Returns:
             Issue data dictionary
@@ -142,19 +711,14 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    if response.status_code == 404:
-                        raise ValueError(f"Issue {issue_key} not found.")
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout getting issue {issue_key}")
+        response = self._request(
+            "GET",
+            url,
+            not_found_msg=f"Issue {issue_key} not found.",
+            timeout_msg=f"Timeout getting issue {issue_key}",
+            params=self._issue_params(fields, expand),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def create_issue(self, issue_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new issue.
@@ -170,17 +734,10 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.post(url, headers=self._get_headers(), json=issue_data)
-
-                if response.status_code not in (200, 201):
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError("Timeout creating issue")
+        response = self._request(
+            "POST", url, ok_statuses=(200, 201), timeout_msg="Timeout creating issue", content=self._encode(issue_data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def update_issue(self, issue_key: str, update_data: Dict[str, Any]) -> None:
         """Update an existing issue.
@@ -194,15 +751,13 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.put(url, headers=self._get_headers(), json=update_data)
-
-                if response.status_code not in (200, 204):
-                    self._handle_error(response)
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout updating issue {issue_key}")
+        self._request(
+            "PUT",
+            url,
+            ok_statuses=(200, 204),
+            timeout_msg=f"Timeout updating issue {issue_key}",
+            content=self._encode(update_data),
+        )
 
     def get_project_schema(self, project_key: str, issue_type: str) -> List[Dict[str, Any]]:
         """Get field schema for a project and issue type.
@@ -218,60 +773,57 @@ class JiraClient:
             ValueError: If project not found or API error
         """
         url = f"{self.base_url}/rest/api/2/issue/createmeta"
-        params = {
-            "projectKeys": project_key,
-            "issuetypeNames": issue_type,
-            "expand": "projects.issuetypes.fields",
-        }
+        params = self._project_schema_params(project_key, issue_type)
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers(), params=params)
-
-                if response.status_code == 404:
-                    raise ValueError(
-                        f"Project schema not found. Possible causes:\n"
-                        f"  - Project '{project_key}' does not exist\n"
-                        f"  - You don't have permission to access project '{project_key}'\n"
-                        f"  - Issue type '{issue_type}' is not available in this project\n"
-                        f"  - The createmeta endpoint may not be available in your Jira version\n"
-                        f"Please verify the project key and issue type are correct."
-                    )
-                elif response.status_code != 200:
-                    self._handle_error(response)
+        response = self._request(
+            "GET",
+            url,
+            not_found_msg=self._project_schema_not_found(project_key, issue_type),
+            timeout_msg=f"Timeout getting schema for {project_key}/{issue_type}",
+            params=params,
+        )
+        return self._parse_project_schema(self._decode(response), project_key, issue_type)
 
-                data = response.json()
-                projects = data.get("projects", [])
+    def get_project_schemas(self, project_key: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get field schemas for every issue type of a project in one request.
 
-                if not projects:
-                    raise ValueError(
-                        f"Project '{project_key}' returned no data. Possible causes:\n"
-                        f"  - Project exists but you don't have permission to create issues\n"
-                        f"  - Issue type '{issue_type}' is not available in this project\n"
-                        f"Available projects: Check with your Jira administrator"
-                    )
-
-                issue_types = projects[0].get("issuetypes", [])
-                if not issue_types:
-                    raise ValueError(
-                        f"Issue type '{issue_type}' not found in project '{project_key}'.\n"
-                        f"Common issue types: Task, Bug, Story, Epic\n"
-                        f"Note: Issue type names are case-sensitive"
-                    )
-
-                fields = issue_types[0].get("fields", {})
-                return [{"key": k, **v} for k, v in fields.items()]
+        Args:
+            project_key: Project key
 
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout getting schema for {project_key}/{issue_type}")
+        Returns:
+            Field definitions keyed by issue type name
 
-    def search_issues(self, jql: str, max_results: int = 100, start_at: int = 0) -> Dict[str, Any]:
+        Raises:
+            ValueError: If project not found or API error
+        """
+        url = f"{self.base_url}/rest/api/2/issue/createmeta"
+        params = {"projectKeys": project_key, "expand": "projects.issuetypes.fields"}
+
+        response = self._request(
+            "GET",
+            url,
+            not_found_msg=f"Project '{project_key}' not found or not accessible",
+            timeout_msg=f"Timeout getting schemas for {project_key}",
+            params=params,
+        )
+        return self._parse_project_schemas(self._decode(response), project_key)
+
+    def search_issues(
+        self,
+        jql: str,
+        max_results: int = 100,
+        start_at: int = 0,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """Search issues using JQL.
 
         Args:
             jql: JQL query string
             max_results: Maximum results to return
             start_at: Starting offset for pagination
+            fields: Fields to return (None for Jira's default of all navigable fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
 
         Returns:
             Search results with issues and pagination info
@@ -280,19 +832,230 @@ class JiraClient:
             ValueError: If JQL invalid or API error
         """
         url = f"{self.base_url}/rest/api/2/search"
-        data = {"jql": jql, "maxResults": max_results, "startAt": start_at}
+        data = self._search_payload(jql, max_results, start_at, fields, expand)
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.post(url, headers=self._get_headers(), json=data)
+        response = self._request("POST", url, timeout_msg="Timeout executing search query", content=self._encode(data))
+        return self._decode(response)  # type: ignore[no-any-return]
+
+    def iter_search_pages(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily walk JQL search results page by page.
+
+        Each page is requested only when the previous one has been consumed, so at most one
+        page of issues is held in memory at a time.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to fetch overall (None for all matching issues)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
 
+        Yields:
+            Raw search response pages (with total, startAt, maxResults and issues)
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        fetched = 0
+        while limit is None or fetched < limit:
+            page = self.search_issues(
+                jql,
+                max_results=self._page_size_for(page_size, limit, fetched),
+                start_at=start_at,
+                fields=fields,
+                expand=expand,
+            )
+            yield page
+
+            count = len(page.get("issues", []))
+            fetched += count
+            start_at += count
+            if self._is_last_page(page, start_at):
+                return
+
+    def iter_search(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        stream: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield issues matching a JQL query across all pages.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to yield (None for all matching issues)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
+            stream: Parse each page incrementally (see stream_search) so only one issue,
+                rather than one page, is held in memory at a time
+
+        Yields:
+            Issue dictionaries in search order
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        if not stream:
+            for page in self.iter_search_pages(
+                jql, page_size=page_size, start_at=start_at, limit=limit, fields=fields, expand=expand
+            ):
+                yield from page.get("issues", [])
+            return
+
+        fetched = 0
+        while limit is None or fetched < limit:
+            meta: Dict[str, Any] = {}
+            count = 0
+            for issue in self.stream_search(
+                jql,
+                max_results=self._page_size_for(page_size, limit, fetched),
+                start_at=start_at,
+                fields=fields,
+                expand=expand,
+                page=meta,
+            ):
+                count += 1
+                yield issue
+
+            fetched += count
+            start_at += count
+            if not count or start_at >= meta.get("total", 0):
+                return
+
+    def stream_search(
+        self,
+        jql: str,
+        max_results: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the issues of one search request as they are parsed from the response stream.
+
+        Unlike search_issues, the response body is never held whole: each issue is decoded
+        as soon as it has arrived, so memory stays proportional to one issue even for large
+        pages with expanded changelogs.
+
+        Args:
+            jql: JQL query string
+            max_results: Maximum results to return
+            start_at: Starting offset for pagination
+            fields: Fields to return (None for Jira's default of all navigable fields)
+            expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+            page: Optional dictionary updated with the page's total, startAt and maxResults
+                once the response has been read
+
+        Yields:
+            Issue dictionaries in search order
+
+        Raises:
+            ValueError: If JQL invalid, API error or malformed response
+        """
+        url = f"{self.base_url}/rest/api/2/search"
+        data = self._search_payload(jql, max_results, start_at, fields, expand)
+        parser = SearchStreamParser(self.codec.loads)
+
+        with self._request_errors("Timeout executing search query"):
+            with self._get_http_client().stream(
+                "POST",
+                url,
+                content=self._encode(data),
+                extensions={STREAM_EXTENSION: True},
+            ) as response:
                 if response.status_code != 200:
+                    response.read()
                     self._handle_error(response)
 
-                return response.json()  # type: ignore[no-any-return]
+                for chunk in response.iter_bytes():
+                    yield from parser.feed(chunk)
 
-        except httpx.TimeoutException:
-            raise ValueError("Timeout executing search query")
+            meta = parser.close()
+
+        if page is not None:
+            page.update(meta)
+
+    def search_all(
+        self,
+        jql: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start_at: int = 0,
+        limit: Optional[int] = None,
+        fan_out: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Collect JQL search results across pages, fetching pages concurrently.
+
+        The first page is fetched on its own to learn the total; the remaining offsets are
+        then requested in parallel on the shared connection pool and reassembled in order.
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+            start_at: Offset of the first issue to return
+            limit: Maximum issues to collect (None for all matching issues)
+            fan_out: Maximum concurrent page requests (defaults to config search_fan_out)
+            fields: Fields to return for each issue (None for Jira's default)
+            expand: Entities to expand for each issue
+
+        Returns:
+            Search result with total, startAt, maxResults and de-duplicated issues; issues that
+            shifted past the requested pages are fetched so duplicates do not shorten it
+
+        Raises:
+            ValueError: If JQL invalid or API error
+        """
+        first_page = self.search_issues(
+            jql, max_results=self._page_size_for(page_size, limit, 0), start_at=start_at, fields=fields, expand=expand
+        )
+        page_requests = self._remaining_page_requests(first_page, start_at, limit)
+
+        pages = [first_page]
+        if page_requests:
+            workers = min(fan_out or self.search_fan_out, len(page_requests))
+            # Each page runs in a copy of the caller's context so it keeps the tool call's deadline
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages.extend(
+                    executor.map(
+                        lambda request: context.copy().run(
+                            self.search_issues,
+                            jql,
+                            max_results=request[1],
+                            start_at=request[0],
+                            fields=fields,
+                            expand=expand,
+                        ),
+                        page_requests,
+                    )
+                )
+
+        result = self._merge_search_pages(pages, start_at, limit)
+        tail = self._missing_tail(pages, result, start_at, limit)
+        while tail is not None:
+            page = self.search_issues(jql, max_results=tail[1], start_at=tail[0], fields=fields, expand=expand)
+            if not page.get("issues"):
+                break
+            pages.append(page)
+            result = self._merge_search_pages(pages, start_at, limit)
+            tail = self._missing_tail(pages, result, start_at, limit)
+        return result
 
     def create_filter(
         self, name: str, jql: str, description: str | None = None, favourite: bool = False
@@ -312,21 +1075,12 @@ class JiraClient:
             ValueError: If filter creation fails
         """
         url = f"{self.base_url}/rest/api/2/filter"
-        data = {"name": name, "jql": jql, "favourite": favourite}
-        if description:
-            data["description"] = description
+        data = self._create_filter_payload(name, jql, description, favourite)
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.post(url, headers=self._get_headers(), json=data)
-
-                if response.status_code not in (200, 201):
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError("Timeout creating filter")
+        response = self._request(
+            "POST", url, ok_statuses=(200, 201), timeout_msg="Timeout creating filter", content=self._encode(data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def list_filters(self) -> Dict[str, Any]:
         """List all accessible filters.
@@ -339,17 +1093,8 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/filter/my"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError("Timeout listing filters")
+        response = self._request("GET", url, timeout_msg="Timeout listing filters")
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def get_filter(self, filter_id: str) -> Dict[str, Any]:
         """Get filter details by ID.
@@ -365,17 +1110,8 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout getting filter {filter_id}")
+        response = self._request("GET", url, timeout_msg=f"Timeout getting filter {filter_id}")
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def update_filter(
         self,
@@ -401,30 +1137,12 @@ class JiraClient:
             ValueError: If filter update fails
         """
         url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
-        data: Dict[str, Any] = {}
-        if name is not None:
-            data["name"] = name
-        if jql is not None:
-            data["jql"] = jql
-        if description is not None:
-            data["description"] = description
-        if favourite is not None:
-            data["favourite"] = favourite
-
-        if not data:
-            raise ValueError("At least one field must be provided to update")
+        data = self._update_filter_payload(name, jql, description, favourite)
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.put(url, headers=self._get_headers(), json=data)
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout updating filter {filter_id}")
+        response = self._request(
+            "PUT", url, timeout_msg=f"Timeout updating filter {filter_id}", content=self._encode(data)
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def delete_filter(self, filter_id: str) -> None:
         """Delete a filter.
@@ -437,15 +1155,7 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/filter/{filter_id}"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.delete(url, headers=self._get_headers())
-
-                if response.status_code != 204:
-                    self._handle_error(response)
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout deleting filter {filter_id}")
+        self._request("DELETE", url, ok_statuses=(204,), timeout_msg=f"Timeout deleting filter {filter_id}")
 
     def get_transitions(self, issue_key: str) -> Dict[str, Any]:
         """Get available transitions for an issue.
@@ -461,17 +1171,8 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/transitions"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout getting transitions for {issue_key}")
+        response = self._request("GET", url, timeout_msg=f"Timeout getting transitions for {issue_key}")
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def transition_issue(self, issue_key: str, transition_id: str, fields: Dict[str, Any] | None = None) -> None:
         """Transition an issue through workflow.
@@ -485,19 +1186,15 @@ class JiraClient:
             ValueError: If transition invalid or API error
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/transitions"
-        data: Dict[str, Any] = {"transition": {"id": transition_id}}
-        if fields:
-            data["fields"] = fields
-
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.post(url, headers=self._get_headers(), json=data)
+        data = self._transition_payload(transition_id, fields)
 
-                if response.status_code != 204:
-                    self._handle_error(response)
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout transitioning issue {issue_key}")
+        self._request(
+            "POST",
+            url,
+            ok_statuses=(204,),
+            timeout_msg=f"Timeout transitioning issue {issue_key}",
+            content=self._encode(data),
+        )
 
     def add_comment(self, issue_key: str, body: str) -> Dict[str, Any]:
         """Add a comment to an issue.
@@ -515,17 +1212,14 @@ class JiraClient:
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment"
         data = {"body": body}
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.post(url, headers=self._get_headers(), json=data)
-
-                if response.status_code not in (200, 201):
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout adding comment to issue {issue_key}")
+        response = self._request(
+            "POST",
+            url,
+            ok_statuses=(200, 201),
+            timeout_msg=f"Timeout adding comment to issue {issue_key}",
+            content=self._encode(data),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def list_comments(self, issue_key: str) -> Dict[str, Any]:
         """List all comments on an issue.
@@ -541,17 +1235,8 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.get(url, headers=self._get_headers())
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout listing comments for issue {issue_key}")
+        response = self._request("GET", url, timeout_msg=f"Timeout listing comments for issue {issue_key}")
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def update_comment(self, issue_key: str, comment_id: str, body: str) -> Dict[str, Any]:
         """Update an existing comment.
@@ -570,17 +1255,13 @@ class JiraClient:
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment/{comment_id}"
         data = {"body": body}
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.put(url, headers=self._get_headers(), json=data)
-
-                if response.status_code != 200:
-                    self._handle_error(response)
-
-                return response.json()  # type: ignore[no-any-return]
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout updating comment {comment_id} on issue {issue_key}")
+        response = self._request(
+            "PUT",
+            url,
+            timeout_msg=f"Timeout updating comment {comment_id} on issue {issue_key}",
+            content=self._encode(data),
+        )
+        return self._decode(response)  # type: ignore[no-any-return]
 
     def delete_comment(self, issue_key: str, comment_id: str) -> None:
         """Delete a comment.
@@ -594,12 +1275,6 @@ class JiraClient:
         """
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/comment/{comment_id}"
 
-        try:
-            with httpx.Client(timeout=self.timeout, verify=self.verify_ssl) as client:
-                response = client.delete(url, headers=self._get_headers())
-
-                if response.status_code != 204:
-                    self._handle_error(response)
-
-        except httpx.TimeoutException:
-            raise ValueError(f"Timeout deleting comment {comment_id} on issue {issue_key}")
+        self._request(
+            "DELETE", url, ok_statuses=(204,), timeout_msg=f"Timeout deleting comment {comment_id} on issue {issue_key}"
+        )
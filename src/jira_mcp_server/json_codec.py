@@ -0,0 +1,75 @@
+"""Pluggable JSON codec for Jira request and response bodies"""
+
+import importlib
+import json
+from typing import Any, Callable, NamedTuple
+
+# Codecs tried in order when JIRA_MCP_JSON_CODEC is "auto"
+CODECS = ("orjson", "msgspec", "stdlib")
+
+
+class JsonCodec(NamedTuple):
+    """A JSON implementation: ``loads`` parses UTF-8 bytes, ``dumps`` serializes to UTF-8 bytes."""
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Same compact, non-ASCII-escaping output httpx produces for json=
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _load_orjson() -> JsonCodec:
+    orjson = importlib.import_module("orjson")
+    return JsonCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _load_msgspec() -> JsonCodec:
+    msgspec = importlib.import_module("msgspec")
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: bytes) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Callers handle malformed bodies as ValueError, like json.JSONDecodeError
+            raise ValueError(str(e)) from e
+
+    return JsonCodec("msgspec", loads, encoder.encode)
+
+
+def _load_stdlib() -> JsonCodec:
+    return JsonCodec("stdlib", json.loads, _stdlib_dumps)
+
+
+_LOADERS = {"orjson": _load_orjson, "msgspec": _load_msgspec, "stdlib": _load_stdlib}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Select a JSON codec.
+
+    Args:
+        name: "orjson", "msgspec", "stdlib", or "auto" for the fastest one installed
+
+    Returns:
+        JsonCodec instance
+
+    Raises:
+        ValueError: If the codec is unknown or its package is not installed
+    """
+    if name == "auto":
+        for candidate in CODECS:
+            try:
+                return _LOADERS[candidate]()
+            except ImportError:
+                continue
+
+    if name not in _LOADERS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Choose from: auto, {', '.join(CODECS)}")
+    try:
+        return _LOADERS[name]()
+    except ImportError as e:
+        raise ValueError(f"JSON codec '{name}' is not installed: {e}") from e
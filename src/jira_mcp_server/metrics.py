@@ -0,0 +1,340 @@
+"""Per-endpoint request metrics for Jira API calls"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, cast
+
+import httpx
+
+from jira_mcp_server.endpoints import endpoint_name
+from jira_mcp_server.retry import RetryMetrics
+
+# Upper bounds (seconds) of the latency histogram buckets; slower requests land in +Inf
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by RequestMetrics)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """Initialize empty histogram.
+
+        Args:
+            buckets: Ascending bucket upper bounds in seconds
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency.
+
+        Args:
+            seconds: Observed latency
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Cumulative counts per bucket, labelled as Prometheus ``le`` values.
+
+        Returns:
+            (upper bound, observations at or below it) pairs ending with "+Inf"
+        """
+        pairs = []
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Latency in seconds (the largest finite bound if it falls in +Inf), or None if empty
+        """
+        count = self.count
+        if not count:
+            return None
+        running = 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            if running >= q * count:
+                return bound
+        return self.buckets[-1]
+
+
+class _EndpointStats:
+    """Counters for one endpoint."""
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint latency, status, size and retry metrics.
+
+    Every attempt sent to Jira is recorded under its endpoint (issue, search, createmeta,
+    filter, transitions, comment, ...). Latency runs from sending the request until its
+    response body has been read. One instance can be shared by several clients so the
+    numbers cover the whole server.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self.retries = RetryMetrics()
+
+    def _endpoint(self, name: str) -> _EndpointStats:
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = self._endpoints[name] = _EndpointStats()
+        return stats
+
+    def record_response(self, endpoint: str, status: int, seconds: float, sent: int, received: int) -> None:
+        """Record a completed exchange.
+
+        Args:
+            endpoint: Endpoint name from endpoints.endpoint_name
+            status: HTTP status code
+            seconds: Time from sending the request until the body was read
+            sent: Request body size in bytes
+            received: Response body size in bytes, as transferred
+        """
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.latency.observe(seconds)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+
+    def record_error(self, endpoint: str, sent: int) -> None:
+        """Record an attempt that failed without a response (timeout, connection error).
+
+        Args:
+            endpoint: Endpoint name from endpoints.endpoint_name
+            sent: Request body size in bytes
+        """
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.errors += 1
+            stats.bytes_sent += sent
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get metrics per endpoint.
+
+        Returns:
+            For each endpoint: request count, errors, status code counts, bytes sent and
+            received, and latency (mean, p50/p95/p99 bucket estimates and histogram); plus
+            retry statistics
+        """
+        with self._lock:
+            endpoints = {}
+            for name, stats in sorted(self._endpoints.items()):
+                latency = stats.latency
+                count = latency.count
+                endpoints[name] = {
+                    "requests": count,
+                    "errors": stats.errors,
+                    "status_codes": {str(code): n for code, n in sorted(stats.statuses.items())},
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "latency_seconds": {
+                        "mean": round(latency.total / count, 4) if count else None,
+                        "p50": latency.quantile(0.5),
+                        "p95": latency.quantile(0.95),
+                        "p99": latency.quantile(0.99),
+                        "histogram": dict(latency.cumulative()),
+                    },
+                }
+        return {"endpoints": endpoints, "retries": self.retries.get_stats()}
+
+    def render_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics document ending with a newline
+        """
+        lines = [
+            "# HELP jira_request_duration_seconds Jira API request latency until the response body was read.",
+            "# TYPE jira_request_duration_seconds histogram",
+        ]
+        requests, errors, sent, received = [], [], [], []
+        with self._lock:
+            for name, stats in sorted(self._endpoints.items()):
+                label = f'endpoint="{name}"'
+                for bound, running in stats.latency.cumulative():
+                    lines.append(f'jira_request_duration_seconds_bucket{{{label},le="{bound}"}} {running}')
+                lines.append(f"jira_request_duration_seconds_sum{{{label}}} {stats.latency.total}")
+                lines.append(f"jira_request_duration_seconds_count{{{label}}} {stats.latency.count}")
+                for code, n in sorted(stats.statuses.items()):
+                    requests.append(f'jira_requests_total{{{label},status="{code}"}} {n}')
+                errors.append(f"jira_request_errors_total{{{label}}} {stats.errors}")
+                sent.append(f"jira_request_bytes_total{{{label}}} {stats.bytes_sent}")
+                received.append(f"jira_response_bytes_total{{{label}}} {stats.bytes_received}")
+
+        retries = self.retries.get_stats()
+        by_reason, by_endpoint = retries["retries_by_reason"], retries["retries_by_endpoint"]
+        sections: List[Tuple[str, str, List[str]]] = [
+            ("jira_requests_total", "Jira API responses by endpoint and status code.", requests),
+            ("jira_request_errors_total", "Jira API attempts that failed without a response.", errors),
+            ("jira_request_bytes_total", "Request body bytes sent to Jira.", sent),
+            ("jira_response_bytes_total", "Response body bytes received from Jira.", received),
+            (
+                "jira_retries_total",
+                "Jira API retries by endpoint.",
+                [f'jira_retries_total{{endpoint="{name}"}} {n}' for name, n in sorted(by_endpoint.items())],
+            ),
+            (
+                "jira_retries_by_reason_total",
+                "Jira API retries by reason.",
+                [f'jira_retries_by_reason_total{{reason="{r}"}} {n}' for r, n in sorted(by_reason.items())],
+            ),
+        ]
+        for metric, help_text, samples in sections:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter", *samples]
+        return "\n".join(lines) + "\n"
+
+
+class _Exchange:
+    """Timing and size of one attempt, recorded once its response body has been read."""
+
+    def __init__(self, metrics: RequestMetrics, request: httpx.Request):
+        self.metrics = metrics
+        self.endpoint = endpoint_name(request)
+        # Streamed request bodies have no known length up front
+        self.sent = int(request.headers.get("Content-Length", 0))
+        self.started = time.perf_counter()
+        self.received = 0
+        self.status = 0
+        self.done = False
+
+    def error(self) -> None:
+        self.metrics.record_error(self.endpoint, self.sent)
+
+    def finish(self) -> None:
+        if not self.done:
+            self.done = True
+            elapsed = time.perf_counter() - self.started
+            self.metrics.record_response(self.endpoint, self.status, elapsed, self.sent, self.received)
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Response body wrapper that counts bytes and records the exchange when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, exchange: _Exchange):
+        self._stream = stream
+        self._exchange = exchange
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._exchange.received += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._exchange.finish()
+
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    """Async response body wrapper that counts bytes and records the exchange when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, exchange: _Exchange):
+        self._stream = stream
+        self._exchange = exchange
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._exchange.received += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._exchange.finish()
+
+
+class MetricsTransport(httpx.BaseTransport):
+    """httpx transport that records every attempt in RequestMetrics."""
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: RequestMetrics):
+        """Initialize metrics transport.
+
+        Args:
+            transport: Transport that sends the requests
+            metrics: Metrics updated for every attempt
+        """
+        self._transport = transport
+        self._metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = _Exchange(self._metrics, request)
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError:
+            exchange.error()
+            raise
+        exchange.status = response.status_code
+        if response.is_closed:
+            # Built from in-memory content; there is no stream left to wait for
+            exchange.received = len(response.content)
+            exchange.finish()
+        else:
+            response.stream = _CountingStream(cast(httpx.SyncByteStream, response.stream), exchange)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncMetricsTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that records every attempt in RequestMetrics."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: RequestMetrics):
+        """Initialize async metrics transport.
+
+        Args:
+            transport: Transport that sends the requests
+            metrics: Metrics updated for every attempt
+        """
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = _Exchange(self._metrics, request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            exchange.error()
+            raise
+        exchange.status = response.status_code
+        if response.is_closed:
+            exchange.received = len(response.content)
+            exchange.finish()
+        else:
+            response.stream = _AsyncCountingStream(cast(httpx.AsyncByteStream, response.stream), exchange)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -98,6 +98,15 @@ class CachedSchema(BaseModel):
     expires_at: datetime = Field(..., description="When schema expires")
 
 
+class CachedSearch(BaseModel):
+    """Internal model for search result caching."""
+
+    jql: str = Field(..., description="Normalized JQL query")
+    result: Dict[str, Any] = Field(..., description="Search result as returned to the caller")
+    cached_at: datetime = Field(..., description="When the result was cached")
+    expires_at: datetime = Field(..., description="When the result expires")
+
+
 class Filter(BaseModel):
     """Saved search filter model."""
 
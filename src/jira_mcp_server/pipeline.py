@@ -0,0 +1,201 @@
+"""Request pipeline: the middleware stages every Jira request passes through"""
+
+import urllib.request
+from typing import TYPE_CHECKING, Dict, Optional
+
+import httpx
+
+from jira_mcp_server.circuit_breaker import AsyncCircuitBreakerTransport, CircuitBreakerTransport
+from jira_mcp_server.concurrency import AsyncConcurrencyLimitTransport, ConcurrencyLimitTransport
+from jira_mcp_server.deadline import AsyncDeadlineTransport, DeadlineTransport
+from jira_mcp_server.hedging import AsyncHedgingTransport, HedgingTransport
+from jira_mcp_server.http_cache import AsyncHttpCacheTransport, HttpCacheTransport
+from jira_mcp_server.metrics import AsyncMetricsTransport, MetricsTransport
+from jira_mcp_server.rate_limit import AsyncRateLimitTransport, RateLimitTransport
+from jira_mcp_server.retry import AsyncRetryTransport, RetryTransport
+from jira_mcp_server.single_flight import AsyncSingleFlightTransport, SingleFlightTransport
+from jira_mcp_server.tracing import AsyncTracingTransport, TracingTransport
+
+if TYPE_CHECKING:
+    from jira_mcp_server.jira_client import BaseJiraClient
+
+# Stage order, innermost first (config.MIDDLEWARE_STAGES):
+# - auth: every attempt carries credentials, and no layer above ever sees the token
+# - metrics: each attempt is measured
+# - deadline: each attempt gets the time left in the tool call
+# - concurrency, rate_limit: each attempt is limited
+# - retry
+# - circuit_breaker: a call counts once, after its retries, and an open circuit skips them
+# - hedging: each copy is a full call
+# - http_cache: revalidation of cached GETs
+# - coalesce: duplicates share the whole call
+# - tracing: each span covers the call as the caller sees it
+
+
+def environment_proxy(url: str) -> Optional[str]:
+    """Find the proxy the environment configures for a URL.
+
+    httpx ignores HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY once a client is given its
+    own transport, so the connection pool under the pipeline is configured from them here.
+
+    Args:
+        url: Jira base URL
+
+    Returns:
+        Proxy URL, or None if no proxy is set or NO_PROXY exempts the host
+    """
+    target = httpx.URL(url)
+    proxies = urllib.request.getproxies_environment()
+    proxy = proxies.get(target.scheme) or proxies.get("all")
+    # proxy_bypass_environment applies NO_PROXY; it is public but missing from typeshed
+    bypass = urllib.request.proxy_bypass_environment(target.host, proxies)  # type: ignore[attr-defined]
+    if not proxy or bypass:
+        return None
+    return proxy
+
+
+class AuthTransport(httpx.BaseTransport):
+    """httpx transport that adds the authentication and JSON content headers to every request."""
+
+    def __init__(self, transport: httpx.BaseTransport, headers: Dict[str, str]):
+        """Initialize auth transport.
+
+        Args:
+            transport: Transport that sends the requests
+            headers: Headers set on every request, replacing httpx's defaults
+        """
+        self._transport = transport
+        self._headers = headers
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers.update(self._headers)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncAuthTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that adds the authentication and JSON content headers to every request."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, headers: Dict[str, str]):
+        """Initialize async auth transport.
+
+        Args:
+            transport: Transport that sends the requests
+            headers: Headers set on every request, replacing httpx's defaults
+        """
+        self._transport = transport
+        self._headers = headers
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers.update(self._headers)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _wrap(stage: str, client: "BaseJiraClient", transport: httpx.BaseTransport) -> httpx.BaseTransport:
+    """Wrap a transport in one stage, or return it unchanged if the stage's feature is off.
+
+    Args:
+        stage: Stage name from config.MIDDLEWARE_STAGES
+        client: Client whose configuration and shared state the stage uses
+        transport: Transport the stage sends requests through
+
+    Returns:
+        Wrapped transport
+    """
+    if stage == "auth":
+        return AuthTransport(transport, client._get_headers())
+    if stage == "metrics":
+        return MetricsTransport(transport, client.request_metrics)
+    if stage == "deadline":
+        return DeadlineTransport(transport)
+    if stage == "concurrency" and client.concurrency_limit is not None:
+        return ConcurrencyLimitTransport(transport, client.concurrency_limit)
+    if stage == "rate_limit" and client.rate_limiter.enabled:
+        return RateLimitTransport(transport, client.rate_limiter)
+    if stage == "retry":
+        return RetryTransport(transport, client.retry_policy, client.retry_metrics)
+    if stage == "circuit_breaker" and client.circuit_breakers is not None:
+        return CircuitBreakerTransport(transport, client.circuit_breakers)
+    if stage == "hedging" and client.hedger is not None:
+        return HedgingTransport(transport, client.hedger, client.limits.max_connections or 8)
+    if stage == "http_cache" and client.http_cache is not None:
+        return HttpCacheTransport(transport, client.http_cache)
+    if stage == "coalesce" and client.coalesce_requests:
+        return SingleFlightTransport(transport, client.coalescing_metrics)
+    if stage == "tracing" and client.tracing:
+        return TracingTransport(transport)
+    return transport
+
+
+def _wrap_async(stage: str, client: "BaseJiraClient", transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """Wrap an async transport in one stage, or return it unchanged if the stage's feature is off.
+
+    Args:
+        stage: Stage name from config.MIDDLEWARE_STAGES
+        client: Client whose configuration and shared state the stage uses
+        transport: Transport the stage sends requests through
+
+    Returns:
+        Wrapped transport
+    """
+    if stage == "auth":
+        return AsyncAuthTransport(transport, client._get_headers())
+    if stage == "metrics":
+        return AsyncMetricsTransport(transport, client.request_metrics)
+    if stage == "deadline":
+        return AsyncDeadlineTransport(transport)
+    if stage == "concurrency" and client.concurrency_limit is not None:
+        return AsyncConcurrencyLimitTransport(transport, client.concurrency_limit)
+    if stage == "rate_limit" and client.rate_limiter.enabled:
+        return AsyncRateLimitTransport(transport, client.rate_limiter)
+    if stage == "retry":
+        return AsyncRetryTransport(transport, client.retry_policy, client.retry_metrics)
+    if stage == "circuit_breaker" and client.circuit_breakers is not None:
+        return AsyncCircuitBreakerTransport(transport, client.circuit_breakers)
+    if stage == "hedging" and client.hedger is not None:
+        return AsyncHedgingTransport(transport, client.hedger)
+    if stage == "http_cache" and client.http_cache is not None:
+        return AsyncHttpCacheTransport(transport, client.http_cache)
+    if stage == "coalesce" and client.coalesce_requests:
+        return AsyncSingleFlightTransport(transport, client.coalescing_metrics)
+    if stage == "tracing" and client.tracing:
+        return AsyncTracingTransport(transport)
+    return transport
+
+
+def build_transport(client: "BaseJiraClient", transport: httpx.BaseTransport) -> httpx.BaseTransport:
+    """Wrap a connection pool in the client's middleware stages.
+
+    Stages run in config.MIDDLEWARE_STAGES order, minus those disabled with
+    JIRA_MCP_DISABLED_MIDDLEWARE; optional stages are also skipped while their feature is off.
+
+    Args:
+        client: Client whose configuration and shared state the stages use
+        transport: Transport that sends requests to Jira
+
+    Returns:
+        Outermost transport of the pipeline
+    """
+    for stage in client.middleware:
+        transport = _wrap(stage, client, transport)
+    return transport
+
+
+def build_async_transport(client: "BaseJiraClient", transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """Wrap an async connection pool in the client's middleware stages.
+
+    Args:
+        client: Client whose configuration and shared state the stages use
+        transport: Transport that sends requests to Jira
+
+    Returns:
+        Outermost transport of the pipeline
+    """
+    for stage in client.middleware:
+        transport = _wrap_async(stage, client, transport)
+    return transport
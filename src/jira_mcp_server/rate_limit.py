@@ -0,0 +1,228 @@
+"""Client-side token-bucket rate limiting for Jira API requests"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.deadline import remaining, wait_expired
+from jira_mcp_server.endpoints import SEARCH, WRITE, endpoint_class
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations instead of rejecting calls.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. A caller that finds the
+    bucket empty still takes a token, driving the balance negative, and is told how long to
+    wait for it; later callers queue behind it, so waits are granted in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (requests allowed back to back after an idle period)
+            clock: Monotonic clock in seconds
+        """
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds the caller must wait before using the token (0 if available now)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Return a reserved token that was not used."""
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1)
+
+
+class RateLimiter:
+    """Request rate limits shared by every client talking to one Jira instance.
+
+    An overall bucket bounds all requests; optional buckets per endpoint class (search, write)
+    bound those requests further. A request waits for a token from each bucket that applies.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: int = 10, class_rates: Optional[Dict[str, float]] = None):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Requests per second across all endpoints (0 for no overall limit)
+            burst: Bucket size for every limit
+            class_rates: Requests per second by endpoint class (0 or missing for no limit)
+        """
+        self._overall = TokenBucket(rate, burst) if rate > 0 else None
+        self._by_class = {name: TokenBucket(r, burst) for name, r in (class_rates or {}).items() if r > 0}
+        self._lock = threading.Lock()
+        self._throttled = 0
+        self._wait_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: JiraConfig) -> "RateLimiter":
+        """Build the rate limiter described by the JIRA_MCP_*RATE_LIMIT settings.
+
+        Args:
+            config: JiraConfig instance
+
+        Returns:
+            RateLimiter instance (disabled if no limits are configured)
+        """
+        return cls(
+            rate=config.rate_limit,
+            burst=config.rate_limit_burst,
+            class_rates={SEARCH: config.search_rate_limit, WRITE: config.write_rate_limit},
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self._overall is not None or bool(self._by_class)
+
+    def reserve(self, request: httpx.Request) -> float:
+        """Reserve capacity for a request.
+
+        Args:
+            request: HTTP request about to be sent
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        delays = [bucket.reserve() for bucket in self._buckets(request)]
+        delay = max(delays, default=0.0)
+        if delay > 0:
+            with self._lock:
+                self._throttled += 1
+                self._wait_seconds += delay
+        return delay
+
+    def release(self, request: httpx.Request, delay: float) -> None:
+        """Give back the capacity reserved for a request that will not be sent.
+
+        Args:
+            request: HTTP request the capacity was reserved for
+            delay: Wait returned by ``reserve`` for it
+        """
+        for bucket in self._buckets(request):
+            bucket.refund()
+        if delay > 0:
+            with self._lock:
+                self._throttled -= 1
+                self._wait_seconds -= delay
+
+    def _buckets(self, request: httpx.Request) -> List[TokenBucket]:
+        """Get the buckets that apply to a request."""
+        return [bucket for bucket in (self._overall, self._by_class.get(endpoint_class(request))) if bucket]
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get rate limiting statistics.
+
+        Returns:
+            Number of throttled requests and total seconds spent waiting
+        """
+        with self._lock:
+            return {"throttled": self._throttled, "wait_seconds": round(self._wait_seconds, 3)}
+
+
+def _check_deadline(request: httpx.Request, delay: float) -> None:
+    """Refuse to wait for capacity that arrives after the tool call's deadline.
+
+    Args:
+        request: HTTP request waiting for capacity
+        delay: Seconds until its token is available
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before the token is available
+    """
+    left = remaining()
+    if left is not None and delay >= left:
+        raise wait_expired(request, "rate limit capacity")
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """httpx transport that waits for rate limit capacity before sending each request."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        limiter: RateLimiter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize rate limit transport.
+
+        Args:
+            transport: Transport that sends the requests
+            limiter: Rate limiter shared by all clients
+            sleep: Function used to wait for capacity
+        """
+        self._transport = transport
+        self._limiter = limiter
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._limiter.reserve(request)
+        if delay:
+            try:
+                _check_deadline(request, delay)
+                self._sleep(delay)
+            except BaseException:
+                # Not sent after all: later requests must not queue behind its token
+                self._limiter.release(request, delay)
+                raise
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that waits for rate limit capacity without blocking the event loop."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """Initialize async rate limit transport.
+
+        Args:
+            transport: Transport that sends the requests
+            limiter: Rate limiter shared by all clients
+            sleep: Coroutine function used to wait for capacity
+        """
+        self._transport = transport
+        self._limiter = limiter
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._limiter.reserve(request)
+        if delay:
+            try:
+                _check_deadline(request, delay)
+                await self._sleep(delay)
+            except BaseException:
+                # Rejected by the deadline or cancelled while waiting
+                self._limiter.release(request, delay)
+                raise
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
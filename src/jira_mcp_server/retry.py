@@ -0,0 +1,347 @@
+"""Retry policy and HTTP transports for transient Jira API failures"""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from jira_mcp_server.deadline import DeadlineExceeded, remaining
+from jira_mcp_server.endpoints import OTHER, endpoint_name, is_read_only_post
+
+# HTTP methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Rate limiting and gateway/availability errors worth another attempt
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Errors raised before the request reached Jira; retrying these can never duplicate a write
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _seconds_until(value: str) -> Optional[float]:
+    """Parse a Retry-After or X-RateLimit-Reset header value into a wait in seconds.
+
+    Accepts a delay in seconds, a Unix timestamp, an HTTP date or an ISO 8601 timestamp.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait (never negative), or None if the value cannot be parsed
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        # Large values are absolute epoch timestamps rather than relative delays
+        return max(0.0, number - time.time() if number > 1e9 else number)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides which failed requests are retried and how long to wait before each attempt.
+
+    Idempotent requests (GET, PUT, DELETE and read-only POSTs such as search) are retried on
+    429/502/503/504 responses, timeouts and dropped connections. Other POSTs, such as issue
+    creation, comments and transitions, are only retried when Jira provably did not process
+    them: a 429 rejection or a connection that was never established.
+    """
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, max_delay: float = 30.0):
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retries per request (0 disables retrying)
+            backoff_base: Base delay in seconds for exponential backoff
+            max_delay: Longest wait in seconds; a server asking for more is not retried
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_delay = max_delay
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        """Check whether repeating a request cannot change the outcome.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            True if the request may be sent again after an ambiguous failure
+        """
+        return request.method in IDEMPOTENT_METHODS or is_read_only_post(request)
+
+    def retry_reason(
+        self,
+        request: httpx.Request,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[str]:
+        """Classify a failed attempt as retryable.
+
+        Args:
+            request: HTTP request that failed
+            response: Response received, if any
+            error: Transport error raised, if any
+
+        Returns:
+            Reason label used in retry metrics, or None if the failure must not be retried
+        """
+        if error is not None:
+            if isinstance(error, DeadlineExceeded):
+                return None
+            if isinstance(error, _UNSENT_ERRORS):
+                return "connect"
+            if not self.is_idempotent(request):
+                return None
+            if isinstance(error, httpx.TimeoutException):
+                return "timeout"
+            if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+                return "network"
+            return None
+
+        if response is None or response.status_code not in RETRY_STATUSES:
+            return None
+        if response.status_code == 429 or self.is_idempotent(request):
+            return str(response.status_code)
+        return None
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Compute the wait before the next attempt.
+
+        A wait requested by Jira through Retry-After or exhausted X-RateLimit-* headers takes
+        precedence; otherwise full-jitter exponential backoff is used.
+
+        Args:
+            attempt: Number of retries already made for this request
+            response: Failed response, if any
+
+        Returns:
+            Seconds to wait
+        """
+        if response is not None:
+            server_delay = self._server_delay(response)
+            if server_delay is not None:
+                return server_delay
+        return random.uniform(0, min(self.max_delay, self.backoff_base * 2**attempt))
+
+    def _server_delay(self, response: httpx.Response) -> Optional[float]:
+        """Read the wait Jira asked for from rate limit headers.
+
+        Args:
+            response: Failed response
+
+        Returns:
+            Seconds to wait, or None if the response carries no usable hint
+        """
+        headers = response.headers
+        if "Retry-After" in headers:
+            retry_after = _seconds_until(headers["Retry-After"])
+            if retry_after is not None:
+                return retry_after
+
+        if headers.get("X-RateLimit-Remaining", "").strip() != "0":
+            return None
+        if "X-RateLimit-Reset" in headers:
+            return _seconds_until(headers["X-RateLimit-Reset"])
+        try:
+            # Jira Data Center refills FillRate tokens every Interval-Seconds
+            return float(headers["X-RateLimit-Interval-Seconds"]) / float(headers["X-RateLimit-FillRate"])
+        except (KeyError, ValueError, ZeroDivisionError):
+            return None
+
+
+class RetryMetrics:
+    """Thread-safe counters describing retry behaviour, for tuning the retry policy."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._retries: Dict[str, int] = {}
+        self._by_endpoint: Dict[str, int] = {}
+        self._recovered = 0
+        self._exhausted = 0
+
+    def record_retry(self, reason: str, endpoint: str = OTHER) -> None:
+        """Count a retry.
+
+        Args:
+            reason: Reason label from RetryPolicy.retry_reason
+            endpoint: Endpoint name from endpoints.endpoint_name
+        """
+        with self._lock:
+            self._retries[reason] = self._retries.get(reason, 0) + 1
+            self._by_endpoint[endpoint] = self._by_endpoint.get(endpoint, 0) + 1
+
+    def record_recovered(self) -> None:
+        """Count a request that succeeded after at least one retry."""
+        with self._lock:
+            self._recovered += 1
+
+    def record_exhausted(self) -> None:
+        """Count a retryable failure given up on (retry budget spent, wait too long or past the deadline)."""
+        with self._lock:
+            self._exhausted += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retry statistics.
+
+        Returns:
+            Total retries, retries by reason and by endpoint, recovered requests and exhausted requests
+        """
+        with self._lock:
+            return {
+                "retries": sum(self._retries.values()),
+                "retries_by_reason": dict(self._retries),
+                "retries_by_endpoint": dict(self._by_endpoint),
+                "recovered": self._recovered,
+                "exhausted": self._exhausted,
+            }
+
+
+class _RetryState:
+    """Retry bookkeeping shared by the sync and async transports."""
+
+    def __init__(self, policy: RetryPolicy, metrics: RetryMetrics):
+        self._policy = policy
+        self._metrics = metrics
+
+    def _next_delay(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Decide whether to retry an attempt and record the outcome.
+
+        Args:
+            request: HTTP request
+            attempt: Number of retries already made for this request
+            response: Response received, if any
+            error: Transport error raised, if any
+
+        Returns:
+            Seconds to wait before retrying, or None to stop and surface the result
+        """
+        reason = self._policy.retry_reason(request, response, error)
+        if reason is None:
+            if attempt and response is not None and response.status_code < 400:
+                self._metrics.record_recovered()
+            return None
+
+        delay = self._policy.delay(attempt, response)
+        # A retry that would start after the tool call's deadline cannot help it
+        left = remaining()
+        past_deadline = left is not None and delay >= left
+        if attempt >= self._policy.max_retries or delay > self._policy.max_delay or past_deadline:
+            self._metrics.record_exhausted()
+            return None
+
+        self._metrics.record_retry(reason, endpoint_name(request))
+        return delay
+
+
+class RetryTransport(_RetryState, httpx.BaseTransport):
+    """httpx transport that retries transient failures of the wrapped transport."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: RetryPolicy,
+        metrics: RetryMetrics,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize retry transport.
+
+        Args:
+            transport: Transport that sends the requests
+            policy: Retry policy
+            metrics: Counters updated on every retry
+            sleep: Function used to wait between attempts
+        """
+        super().__init__(policy, metrics)
+        self._transport = transport
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as e:
+                delay = self._next_delay(request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+
+            self._sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(_RetryState, httpx.AsyncBaseTransport):
+    """httpx async transport that retries transient failures of the wrapped transport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy,
+        metrics: RetryMetrics,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """Initialize async retry transport.
+
+        Args:
+            transport: Transport that sends the requests
+            policy: Retry policy
+            metrics: Counters updated on every retry
+            sleep: Coroutine function used to wait between attempts
+        """
+        super().__init__(policy, metrics)
+        self._transport = transport
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                delay = self._next_delay(request, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._next_delay(request, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await self._sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,9 +1,11 @@
 """Schema caching with TTL logic (T017)"""
 
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from jira_mcp_server.models import CachedSchema, FieldSchema
+from jira_mcp_server.schema_store import SchemaStore
 
 
 class SchemaCache:
@@ -11,18 +13,35 @@ class SchemaCache:
 
     Caches field schemas by project key and issue type combination.
     Automatically expires entries after TTL to ensure freshness.
+
+    With a non-zero ``max_stale_seconds`` the cache runs in stale-while-revalidate mode:
+    once an entry passes its TTL it is still returned for up to ``max_stale_seconds`` more,
+    and ``start_refresh`` tells exactly one caller to fetch a replacement in the background.
+
+    An optional SchemaStore adds a persistent second tier: entries missing from memory are
+    looked up on disk (keeping their original expiry) and every set() is written through.
     """
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, max_stale_seconds: int = 0, store: Optional[SchemaStore] = None):
         """Initialize schema cache.
 
         Args:
             ttl_seconds: Time-to-live for cached schemas in seconds (default: 1 hour)
+            max_stale_seconds: How long past its TTL an entry may still be served while it is
+                refreshed (default: 0, expired entries are never served)
+            store: Optional on-disk tier shared across restarts and processes
         """
         self._cache: Dict[str, CachedSchema] = {}
+        self._store = store
         self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_stale = timedelta(seconds=max_stale_seconds)
+        self._refreshing: Set[str] = set()
+        self._refresh_lock = threading.Lock()
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._disk_hits = 0
 
     def _make_key(self, project_key: str, issue_type: str) -> str:
         """Generate cache key from project and issue type.
@@ -44,25 +63,74 @@ class SchemaCache:
             issue_type: Issue type name
 
         Returns:
-            List of FieldSchema if cached and not expired, None otherwise
+            List of FieldSchema if cached and not expired (or stale but within the
+            max_stale_seconds cap), None otherwise
         """
         key = self._make_key(project_key, issue_type)
         entry = self._cache.get(key)
 
+        # Fall back to the disk tier, promoting what it holds into memory
+        if entry is None and self._store is not None:
+            entry = self._store.load(project_key, issue_type)
+            if entry is not None:
+                self._cache[key] = entry
+                self._disk_hits += 1
+
         if entry is None:
             self._misses += 1
             return None
 
-        # Check if expired
-        if datetime.now() >= entry.expires_at:
+        now = datetime.now()
+
+        # Check if expired beyond the hard-expiry cap
+        if now >= entry.expires_at + self._max_stale:
             # Remove expired entry
-            del self._cache[key]
+            self._cache.pop(key, None)
+            if self._store is not None:
+                self._store.delete(project_key, issue_type)
             self._misses += 1
             return None
 
-        self._hits += 1
+        if now >= entry.expires_at:
+            self._stale_hits += 1
+        else:
+            self._hits += 1
         return entry.fields
 
+    def start_refresh(self, project_key: str, issue_type: str) -> bool:
+        """Claim the background refresh of a stale entry.
+
+        Args:
+            project_key: Jira project key
+            issue_type: Issue type name
+
+        Returns:
+            True if the entry is stale and no other refresh is in progress; the caller must
+            then call set() or finish_refresh() when done
+        """
+        key = self._make_key(project_key, issue_type)
+        entry = self._cache.get(key)
+        if entry is None or datetime.now() < entry.expires_at:
+            return False
+
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        self._refreshes += 1
+        return True
+
+    def finish_refresh(self, project_key: str, issue_type: str) -> None:
+        """Release a refresh claimed with start_refresh().
+
+        Args:
+            project_key: Jira project key
+            issue_type: Issue type name
+        """
+        with self._refresh_lock:
+            self._refreshing.discard(self._make_key(project_key, issue_type))
+
     def set(self, project_key: str, issue_type: str, fields: List[FieldSchema]) -> None:
         """Store schema in cache with TTL.
 
@@ -83,6 +151,9 @@ class SchemaCache:
         )
 
         self._cache[key] = cached_schema
+        if self._store is not None:
+            self._store.save(cached_schema)
+        self.finish_refresh(project_key, issue_type)
 
     def clear(self, project_key: str, issue_type: str) -> None:
         """Remove a specific cache entry.
@@ -93,21 +164,31 @@ class SchemaCache:
         """
         key = self._make_key(project_key, issue_type)
         self._cache.pop(key, None)
+        if self._store is not None:
+            self._store.delete(project_key, issue_type)
 
     def clear_all(self) -> None:
-        """Remove all cache entries."""
+        """Remove all cache entries, including those on disk."""
         self._cache.clear()
+        if self._store is not None:
+            self._store.clear()
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._disk_hits = 0
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics.
 
         Returns:
-            Dictionary with hits, misses, and total_entries
+            Dictionary with hits, misses, stale_hits, refreshes, disk_hits, and total_entries
         """
         return {
             "hits": self._hits,
             "misses": self._misses,
+            "stale_hits": self._stale_hits,
+            "refreshes": self._refreshes,
+            "disk_hits": self._disk_hits,
             "total_entries": len(self._cache),
         }
@@ -0,0 +1,142 @@
+"""Persistent on-disk tier for the schema cache"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from jira_mcp_server.models import CachedSchema
+
+# File created inside the configured cache directory
+SCHEMA_STORE_FILENAME = "schema_cache.sqlite3"
+
+
+class SchemaStore:
+    """SQLite-backed store for cached project schemas that survives restarts.
+
+    The database is opened lazily on first use. SQLite's own file locking makes it safe for
+    several server processes to share one file; writes are single-statement upserts and
+    readers never see partial rows. Entries are namespaced by Jira URL so servers pointing
+    at different instances can share a directory.
+
+    Storage errors are never raised to callers: a broken or locked store behaves like an
+    empty one and the in-memory cache keeps working.
+    """
+
+    def __init__(self, path: Path, namespace: str = "", timeout: float = 5.0):
+        """Initialize schema store.
+
+        Args:
+            path: SQLite database file (parent directories are created on first use)
+            namespace: Prefix separating entries of different Jira instances (e.g., the Jira URL)
+            timeout: Seconds to wait for another process's write lock before giving up
+        """
+        self.path = Path(path)
+        self._namespace = namespace
+        self._timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema table on first use.
+
+        Returns:
+            Open SQLite connection
+        """
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self._timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS schemas ("
+                "namespace TEXT NOT NULL, project_key TEXT NOT NULL, issue_type TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, entry TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, project_key, issue_type))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def load(self, project_key: str, issue_type: str) -> Optional[CachedSchema]:
+        """Read a cached schema entry.
+
+        Args:
+            project_key: Jira project key
+            issue_type: Issue type name
+
+        Returns:
+            Stored entry (possibly expired), or None if absent or unreadable
+        """
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT entry FROM schemas WHERE namespace = ? AND project_key = ? AND issue_type = ?",
+                        (self._namespace, project_key, issue_type),
+                    )
+                    .fetchone()
+                )
+            if row is None:
+                return None
+            return CachedSchema.model_validate_json(row[0])
+        except (sqlite3.Error, OSError, ValidationError):
+            return None
+
+    def save(self, entry: CachedSchema) -> None:
+        """Write a cached schema entry, replacing any previous one.
+
+        Args:
+            entry: Schema cache entry
+        """
+        self._execute(
+            "INSERT OR REPLACE INTO schemas (namespace, project_key, issue_type, expires_at, entry) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                self._namespace,
+                entry.project_key,
+                entry.issue_type,
+                entry.expires_at.timestamp(),
+                entry.model_dump_json(),
+            ),
+        )
+
+    def delete(self, project_key: str, issue_type: str) -> None:
+        """Remove a cached schema entry.
+
+        Args:
+            project_key: Jira project key
+            issue_type: Issue type name
+        """
+        self._execute(
+            "DELETE FROM schemas WHERE namespace = ? AND project_key = ? AND issue_type = ?",
+            (self._namespace, project_key, issue_type),
+        )
+
+    def clear(self) -> None:
+        """Remove every entry in this store's namespace."""
+        self._execute("DELETE FROM schemas WHERE namespace = ?", (self._namespace,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _execute(self, sql: str, params: tuple[object, ...]) -> None:
+        """Run a write statement in its own transaction, ignoring storage errors.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(sql, params)
+        except (sqlite3.Error, OSError):
+            pass
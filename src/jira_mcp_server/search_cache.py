@@ -0,0 +1,209 @@
+"""Search result caching with TTL, size bounds and write-through invalidation"""
+
+import re
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from jira_mcp_server.models import CachedSearch
+
+# Quoted JQL string literals, whose whitespace is significant
+_QUOTED_PATTERN = re.compile(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')")
+
+
+class SearchKey(NamedTuple):
+    """Cache key for one search window."""
+
+    jql: str
+    fields: Optional[Tuple[str, ...]]
+    expand: Tuple[str, ...]
+    start_at: int
+    max_results: int
+    all_pages: bool
+
+
+class SearchCache:
+    """In-memory LRU cache for JQL search results with TTL expiration.
+
+    Results are keyed by normalized JQL, the requested fields and expansions and the
+    pagination window. Any write made through this server drops every cached result: JQL
+    such as ``assignee = currentUser()``, ``filter = 10001`` or ``key in (...)`` can match the
+    written (or newly created) issue without naming its project, so an agent reading back its
+    own change never sees a stale result. Changes made by other Jira clients are only picked
+    up once the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 256):
+        """Initialize search cache.
+
+        Args:
+            ttl_seconds: Time-to-live for cached results in seconds (default: 1 minute)
+            max_entries: Maximum cached results; least recently used entries are evicted first
+        """
+        self._cache: "OrderedDict[SearchKey, CachedSearch]" = OrderedDict()
+        self._ttl = timedelta(seconds=ttl_seconds)
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def normalize_jql(jql: str) -> str:
+        """Collapse insignificant whitespace in a JQL query.
+
+        Whitespace inside quoted values is preserved.
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            Normalized JQL query
+        """
+        parts = _QUOTED_PATTERN.split(jql.strip())
+        # Even indices are unquoted text, odd indices are quoted literals
+        return "".join(part if i % 2 else " ".join(part.split()) for i, part in enumerate(parts))
+
+    def _make_key(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = 50,
+        all_pages: bool = False,
+    ) -> SearchKey:
+        """Generate cache key from a search window.
+
+        Args:
+            jql: JQL query string
+            fields: Fields requested (order does not matter)
+            expand: Expansions requested (order does not matter)
+            start_at: Starting offset
+            max_results: Maximum results requested
+            all_pages: Whether results were collected across pages
+
+        Returns:
+            Cache key
+        """
+        return SearchKey(
+            jql=self.normalize_jql(jql),
+            fields=tuple(sorted(fields)) if fields is not None else None,
+            expand=tuple(sorted(expand or [])),
+            start_at=start_at,
+            max_results=max_results,
+            all_pages=all_pages,
+        )
+
+    def get(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = 50,
+        all_pages: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve a search result from cache if not expired.
+
+        Args:
+            jql: JQL query string
+            fields: Fields requested
+            expand: Expansions requested
+            start_at: Starting offset
+            max_results: Maximum results requested
+            all_pages: Whether results were collected across pages
+
+        Returns:
+            Cached search result if present and not expired, None otherwise
+        """
+        key = self._make_key(jql, fields, expand, start_at, max_results, all_pages)
+        entry = self._cache.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if datetime.now() >= entry.expires_at:
+            del self._cache[key]
+            self._misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry.result
+
+    def set(
+        self,
+        jql: str,
+        result: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = 50,
+        all_pages: bool = False,
+    ) -> None:
+        """Store a search result in cache with TTL.
+
+        Args:
+            jql: JQL query string
+            result: Search result to cache
+            fields: Fields requested
+            expand: Expansions requested
+            start_at: Starting offset
+            max_results: Maximum results requested
+            all_pages: Whether results were collected across pages
+        """
+        if self._max_entries <= 0:
+            return
+
+        key = self._make_key(jql, fields, expand, start_at, max_results, all_pages)
+        now = datetime.now()
+        self._cache[key] = CachedSearch(
+            jql=key.jql,
+            result=result,
+            cached_at=now,
+            expires_at=now + self._ttl,
+        )
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate_all(self) -> int:
+        """Drop every cached result after a write to Jira.
+
+        Whether a query matches an issue or filter after a write cannot be told from the JQL
+        text, and a created issue is in no cached result, so no entry can be kept.
+        Hit, miss and eviction statistics are kept.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = len(self._cache)
+        self._cache.clear()
+        self._invalidations += removed
+        return removed
+
+    def clear_all(self) -> None:
+        """Remove all cache entries."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations and total_entries
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "total_entries": len(self._cache),
+        }
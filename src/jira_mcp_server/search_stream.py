@@ -0,0 +1,153 @@
+"""Incremental parsing of JQL search responses from a byte stream"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# Bytes that change nesting or start a string outside of strings
+_STRUCTURAL = re.compile(rb'["{}\[\]]')
+
+# Bytes that end a string or escape the next byte inside strings
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+_QUOTE, _BACKSLASH = ord('"'), ord("\\")
+_OPENERS = frozenset(b"{[")
+
+_ISSUES_KEY = b"issues"
+
+
+class SearchStreamParser:
+    """Split a search response into issues as its bytes arrive.
+
+    Each element of the top-level ``issues`` array is decoded as soon as its closing brace
+    is seen and then released, so memory stays proportional to the largest single issue
+    rather than the whole page. Everything else in the response (total, startAt, names,
+    ...) is kept and decoded by :meth:`close` with ``issues`` left empty.
+
+    The scanner only tracks string and nesting boundaries; each issue and the remaining
+    page metadata are decoded by the configured JSON codec, which also validates them.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any]):
+        """Initialize parser.
+
+        Args:
+            loads: JSON decoder applied to each issue and to the page metadata
+        """
+        self._loads = loads
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key = b""
+        self._in_issues = False
+        self._issue_start: Optional[int] = None
+        self._meta = bytearray()
+        self._meta_start: Optional[int] = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume the next chunk of the response body.
+
+        Args:
+            chunk: Raw (decompressed) response bytes
+
+        Returns:
+            Issues completed by this chunk, in response order
+
+        Raises:
+            ValueError: If the body is not a JSON object or an issue is malformed
+        """
+        buf = self._buf
+        buf += chunk
+        pos, end = self._pos, len(buf)
+        issues: List[Any] = []
+
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = end
+                    break
+                p = match.start()
+                if buf[p] == _BACKSLASH:
+                    if p + 1 >= end:
+                        # The escaped byte is in the next chunk
+                        pos = p
+                        break
+                    pos = p + 2
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    # At the top level the last string before a value is that value's key
+                    self._last_key = bytes(buf[self._string_start : p])
+                pos = p + 1
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = end
+                break
+            p = match.start()
+            byte = buf[p]
+            pos = p + 1
+
+            if byte == _QUOTE:
+                self._in_string = True
+                self._string_start = pos
+            elif byte in _OPENERS:
+                if self._depth == 0 and byte != ord("{"):
+                    raise ValueError("Search response is not a JSON object")
+                if self._depth == 1 and byte == ord("[") and self._last_key == _ISSUES_KEY:
+                    self._meta += buf[self._meta_start : pos]
+                    self._meta_start = None
+                    self._in_issues = True
+                elif self._in_issues and self._depth == 2:
+                    self._issue_start = p
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._in_issues and self._depth == 2 and self._issue_start is not None:
+                    issues.append(self._loads(bytes(buf[self._issue_start : pos])))
+                    self._issue_start = None
+                elif self._in_issues and self._depth == 1:
+                    self._in_issues = False
+                    self._meta_start = p
+
+        self._pos = pos
+        self._compact()
+        return issues
+
+    def _compact(self) -> None:
+        """Drop scanned bytes that are no longer needed, moving metadata aside."""
+        if self._issue_start is not None:
+            cut = self._issue_start
+        elif self._meta_start is not None and self._in_string:
+            # Keep the open string so a top-level key can still be read when it closes
+            cut = self._string_start - 1
+        else:
+            cut = self._pos
+
+        if self._meta_start is not None:
+            self._meta += self._buf[self._meta_start : cut]
+            self._meta_start = 0
+        del self._buf[:cut]
+        self._pos -= cut
+        self._string_start -= cut
+        if self._issue_start is not None:
+            self._issue_start -= cut
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing once the body has been fully read.
+
+        Returns:
+            The response without its issues (``issues`` is an empty list)
+
+        Raises:
+            ValueError: If the body ended early or was not a search response
+        """
+        if self._depth != 0 or self._in_string or self._meta_start is None:
+            raise ValueError("Search response ended before the JSON document was complete")
+        meta = self._loads(bytes(self._meta))
+        if not isinstance(meta, dict):
+            raise ValueError("Search response is not a JSON object")
+        return meta
@@ -1,61 +1,101 @@
 """FastMCP server entry point"""
 
+import asyncio
 import sys
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
+from jira_mcp_server.async_jira_client import AsyncJiraClient
 from jira_mcp_server.config import JiraConfig
-from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.deadline import configure_deadline, with_deadline
+from jira_mcp_server.metrics import PROMETHEUS_CONTENT_TYPE, RequestMetrics
+from jira_mcp_server.search_cache import SearchCache
 from jira_mcp_server.tools.comment_tools import (
     initialize_comment_tools,
-    jira_comment_add,
-    jira_comment_delete,
-    jira_comment_list,
-    jira_comment_update,
+    jira_comment_add_async,
+    jira_comment_delete_async,
+    jira_comment_list_async,
+    jira_comment_update_async,
 )
 from jira_mcp_server.tools.filter_tools import (
     initialize_filter_tools,
-    jira_filter_create,
-    jira_filter_delete,
-    jira_filter_execute,
-    jira_filter_get,
-    jira_filter_list,
-    jira_filter_update,
+    jira_filter_create_async,
+    jira_filter_delete_async,
+    jira_filter_execute_async,
+    jira_filter_get_async,
+    jira_filter_list_async,
+    jira_filter_update_async,
 )
 from jira_mcp_server.tools.issue_tools import (
-    _get_field_schema,
+    _get_field_schema_async,
     initialize_issue_tools,
-    jira_issue_create,
-    jira_issue_get,
-    jira_issue_update,
+    jira_issue_create_async,
+    jira_issue_get_async,
+    jira_issue_update_async,
+    prefetch_schemas,
 )
 from jira_mcp_server.tools.search_tools import (
     initialize_search_tools,
-    jira_search_issues,
-    jira_search_jql,
+    jira_search_issues_async,
+    jira_search_jql_async,
 )
 from jira_mcp_server.tools.workflow_tools import (
     initialize_workflow_tools,
-    jira_workflow_get_transitions,
-    jira_workflow_transition,
+    jira_workflow_get_transitions_async,
+    jira_workflow_transition_async,
 )
+from jira_mcp_server.tracing import configure_tracing, traced
+
+# Client shared by every tool module and the health check (created in main); it serves the
+# tool handlers on the server's event loop and is closed by the server lifespan
+_async_client: Optional[AsyncJiraClient] = None
+# Request metrics recorded by the client
+_metrics: Optional[RequestMetrics] = None
+
+# Schemas warmed in the background once the server's event loop is running (JIRA_MCP_PREFETCH)
+_prefetch_targets: List[Tuple[str, Optional[str]]] = []
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm configured schemas on startup and close the async client's connection pool on shutdown.
+
+    The warm-up runs in the background so the server accepts requests immediately; tool
+    calls that arrive first simply fetch their schema as usual.
+
+    Args:
+        server: FastMCP server instance
+    """
+    prefetch = asyncio.create_task(prefetch_schemas(_prefetch_targets)) if _prefetch_targets else None
+    try:
+        yield
+    finally:
+        if prefetch is not None and not prefetch.done():
+            prefetch.cancel()
+        if _async_client is not None:
+            await _async_client.aclose()
+
 
 # Initialize FastMCP server
-mcp = FastMCP("jira-mcp-server")
+mcp = FastMCP("jira-mcp-server", lifespan=_lifespan)
 
 
 # Health check implementation
-def _jira_health_check() -> Dict[str, Any]:
+async def _jira_health_check() -> Dict[str, Any]:
     """Verify connectivity to Jira instance and validate authentication.
 
     Returns:
         Connection status and server info including version and URL
     """
+    if _async_client is None:
+        return {"connected": False, "error": "Server not initialized"}
+
     try:
-        config = JiraConfig()  # type: ignore[call-arg]  # pydantic-settings loads from env
-        client = JiraClient(config)
-        return client.health_check()
+        return await _async_client.health_check()
     except Exception as e:
         return {
             "connected": False,
@@ -65,18 +105,64 @@ def _jira_health_check() -> Dict[str, Any]:
 
 # Health check tool
 @mcp.tool()
-def jira_health_check() -> Dict[str, Any]:  # pragma: no cover
+@traced("jira_health_check")
+@with_deadline
+async def jira_health_check() -> Dict[str, Any]:
     """Verify connectivity to Jira instance and validate authentication.
 
     Returns:
         Connection status and server info including version and URL
     """
-    return _jira_health_check()  # pragma: no cover
+    return await _jira_health_check()
+
+
+# Metrics implementation
+def _jira_metrics() -> Dict[str, Any]:
+    """Report latency, status codes, sizes and retries of Jira API calls per endpoint.
+
+    Returns:
+        Metrics per endpoint and retry statistics
+    """
+    if _metrics is None:
+        return {"error": "Server not initialized"}
+    return _metrics.get_stats()
+
+
+# Metrics tool
+@mcp.tool()
+@traced("jira_metrics")
+def jira_metrics() -> Dict[str, Any]:  # pragma: no cover
+    """Report latency, status codes, sizes and retries of Jira API calls per endpoint.
+
+    Latency is given as a mean, p50/p95/p99 estimates and a cumulative histogram in seconds.
+
+    Returns:
+        Metrics per endpoint (issue, search, createmeta, filter, transitions, comment, ...)
+        and retry statistics
+    """
+    return _jira_metrics()  # pragma: no cover
+
+
+# Prometheus scrape endpoint, served when the server runs over HTTP
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> Response:
+    """Expose request metrics in the Prometheus text format.
+
+    Args:
+        request: Incoming scrape request
+
+    Returns:
+        Metrics document (empty before the server is initialized)
+    """
+    text = _metrics.render_prometheus() if _metrics is not None else ""
+    return PlainTextResponse(text, media_type=PROMETHEUS_CONTENT_TYPE)
 
 
 # Register issue tools
 @mcp.tool()
-def jira_issue_create_tool(
+@traced("jira_issue_create_tool")
+@with_deadline
+async def jira_issue_create_tool(
     project: str,
     summary: str,
     issue_type: str = "Task",
@@ -118,7 +204,7 @@ def jira_issue_create_tool(
     if custom_fields:  # pragma: no cover
         kwargs.update(custom_fields)  # pragma: no cover
 
-    return jira_issue_create(  # pragma: no cover
+    return await jira_issue_create_async(  # pragma: no cover
         project=project,
         summary=summary,
         issue_type=issue_type,
@@ -132,7 +218,9 @@ def jira_issue_create_tool(
 
 
 @mcp.tool()
-def jira_issue_update_tool(
+@traced("jira_issue_update_tool")
+@with_deadline
+async def jira_issue_update_tool(
     issue_key: str,
     summary: str | None = None,
     description: str | None = None,
@@ -170,7 +258,7 @@ def jira_issue_update_tool(
     if custom_fields:  # pragma: no cover
         kwargs.update(custom_fields)  # pragma: no cover
 
-    return jira_issue_update(  # pragma: no cover
+    return await jira_issue_update_async(  # pragma: no cover
         issue_key=issue_key,
         summary=summary,
         description=description,
@@ -183,11 +271,17 @@ def jira_issue_update_tool(
 
 
 @mcp.tool()
-def jira_issue_get_tool(issue_key: str) -> Dict[str, Any]:
+@traced("jira_issue_get_tool")
+@with_deadline
+async def jira_issue_get_tool(
+    issue_key: str, fields: list[str] | None = None, expand: list[str] | None = None
+) -> Dict[str, Any]:
     """Retrieve full details of a single issue including all custom fields.
 
     Args:
         issue_key: Issue key (e.g., "PROJ-123")
+        fields: Only return these fields (default: all fields)
+        expand: Entities to expand (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Complete issue details including standard and custom fields
@@ -195,11 +289,13 @@ def jira_issue_get_tool(issue_key: str) -> Dict[str, Any]:
     Example:
         jira_issue_get_tool(issue_key="PROJ-123")
     """
-    return jira_issue_get(issue_key=issue_key)  # pragma: no cover
+    return await jira_issue_get_async(issue_key=issue_key, fields=fields, expand=expand)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_project_get_schema(project: str, issue_type: str = "Task") -> Dict[str, Any]:
+@traced("jira_project_get_schema")
+@with_deadline
+async def jira_project_get_schema(project: str, issue_type: str = "Task") -> Dict[str, Any]:
     """Get field schema for a project and issue type for debugging.
 
     This tool helps you understand what fields are available for a project
@@ -216,7 +312,7 @@ def jira_project_get_schema(project: str, issue_type: str = "Task") -> Dict[str,
         jira_project_get_schema(project="PROJ", issue_type="Bug")
     """
     try:  # pragma: no cover
-        schemas = _get_field_schema(project, issue_type)  # pragma: no cover
+        schemas = await _get_field_schema_async(project, issue_type)  # pragma: no cover
         return {  # pragma: no cover
             "project": project,
             "issue_type": issue_type,
@@ -238,7 +334,9 @@ def jira_project_get_schema(project: str, issue_type: str = "Task") -> Dict[str,
 
 # Register search tools
 @mcp.tool()
-def jira_search_issues_tool(
+@traced("jira_search_issues_tool")
+@with_deadline
+async def jira_search_issues_tool(
     project: str | None = None,
     assignee: str | None = None,
     status: str | None = None,
@@ -250,6 +348,8 @@ def jira_search_issues_tool(
     updated_before: str | None = None,
     max_results: int = 50,
     start_at: int = 0,
+    fields: list[str] | None = None,
+    expand: list[str] | None = None,
 ) -> Dict[str, Any]:
     """Search for Jira issues using multiple criteria.
 
@@ -267,6 +367,9 @@ def jira_search_issues_tool(
         updated_before: Updated before date in YYYY-MM-DD format
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue. Defaults to a lean set (summary, status, issuetype,
+            priority, assignee, reporter, labels, created, updated); pass ["*all"] for every field
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -279,7 +382,7 @@ def jira_search_issues_tool(
             max_results=10
         )
     """
-    return jira_search_issues(  # pragma: no cover
+    return await jira_search_issues_async(  # pragma: no cover
         project=project,
         assignee=assignee,
         status=status,
@@ -291,14 +394,21 @@ def jira_search_issues_tool(
         updated_before=updated_before,
         max_results=max_results,
         start_at=start_at,
+        fields=fields,
+        expand=expand,
     )
 
 
 @mcp.tool()
-def jira_search_jql_tool(
+@traced("jira_search_jql_tool")
+@with_deadline
+async def jira_search_jql_tool(
     jql: str,
     max_results: int = 50,
     start_at: int = 0,
+    all_pages: bool = False,
+    fields: list[str] | None = None,
+    expand: list[str] | None = None,
 ) -> Dict[str, Any]:
     """Execute a JQL (Jira Query Language) query directly.
 
@@ -309,6 +419,12 @@ def jira_search_jql_tool(
         jql: JQL query string (e.g., 'project = PROJ AND created >= -7d ORDER BY created DESC')
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        all_pages: Set to true to collect up to max_results issues across multiple pages in one call,
+            instead of being limited to a single Jira page. Pages after the first are fetched
+            concurrently (default: False)
+        fields: Fields to return for each issue. Defaults to a lean set (summary, status, issuetype,
+            priority, assignee, reporter, labels, created, updated); pass ["*all"] for every field
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -319,16 +435,21 @@ def jira_search_jql_tool(
             max_results=20
         )
     """
-    return jira_search_jql(  # pragma: no cover
+    return await jira_search_jql_async(  # pragma: no cover
         jql=jql,
         max_results=max_results,
         start_at=start_at,
+        all_pages=all_pages,
+        fields=fields,
+        expand=expand,
     )
 
 
 # Register filter tools
 @mcp.tool()
-def jira_filter_create_tool(
+@traced("jira_filter_create_tool")
+@with_deadline
+async def jira_filter_create_tool(
     name: str,
     jql: str,
     description: str | None = None,
@@ -354,7 +475,7 @@ def jira_filter_create_tool(
             description="All my open issues"
         )
     """
-    return jira_filter_create(  # pragma: no cover
+    return await jira_filter_create_async(  # pragma: no cover
         name=name,
         jql=jql,
         description=description,
@@ -363,7 +484,9 @@ def jira_filter_create_tool(
 
 
 @mcp.tool()
-def jira_filter_list_tool() -> Dict[str, Any]:
+@traced("jira_filter_list_tool")
+@with_deadline
+async def jira_filter_list_tool() -> Dict[str, Any]:
     """List all accessible filters.
 
     Returns all filters you have permission to view, including your own and shared filters.
@@ -374,11 +497,13 @@ def jira_filter_list_tool() -> Dict[str, Any]:
     Example:
         jira_filter_list_tool()
     """
-    return jira_filter_list()  # pragma: no cover
+    return await jira_filter_list_async()  # pragma: no cover
 
 
 @mcp.tool()
-def jira_filter_get_tool(filter_id: str) -> Dict[str, Any]:
+@traced("jira_filter_get_tool")
+@with_deadline
+async def jira_filter_get_tool(filter_id: str) -> Dict[str, Any]:
     """Get complete filter details by ID.
 
     Args:
@@ -390,14 +515,18 @@ def jira_filter_get_tool(filter_id: str) -> Dict[str, Any]:
     Example:
         jira_filter_get_tool(filter_id="10000")
     """
-    return jira_filter_get(filter_id=filter_id)  # pragma: no cover
+    return await jira_filter_get_async(filter_id=filter_id)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_filter_execute_tool(
+@traced("jira_filter_execute_tool")
+@with_deadline
+async def jira_filter_execute_tool(
     filter_id: str,
     max_results: int = 50,
     start_at: int = 0,
+    fields: list[str] | None = None,
+    expand: list[str] | None = None,
 ) -> Dict[str, Any]:
     """Execute a saved filter and return matching issues.
 
@@ -407,6 +536,9 @@ def jira_filter_execute_tool(
         filter_id: Filter ID
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue. Defaults to a lean set (summary, status, issuetype,
+            priority, assignee, reporter, labels, created, updated); pass ["*all"] for every field
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -414,15 +546,19 @@ def jira_filter_execute_tool(
     Example:
         jira_filter_execute_tool(filter_id="10000", max_results=20)
     """
-    return jira_filter_execute(  # pragma: no cover
+    return await jira_filter_execute_async(  # pragma: no cover
         filter_id=filter_id,
         max_results=max_results,
         start_at=start_at,
+        fields=fields,
+        expand=expand,
     )
 
 
 @mcp.tool()
-def jira_filter_update_tool(
+@traced("jira_filter_update_tool")
+@with_deadline
+async def jira_filter_update_tool(
     filter_id: str,
     name: str | None = None,
     jql: str | None = None,
@@ -449,7 +585,7 @@ def jira_filter_update_tool(
             jql="assignee = currentUser() AND status IN (Open, 'In Progress')"
         )
     """
-    return jira_filter_update(  # pragma: no cover
+    return await jira_filter_update_async(  # pragma: no cover
         filter_id=filter_id,
         name=name,
         jql=jql,
@@ -459,7 +595,9 @@ def jira_filter_update_tool(
 
 
 @mcp.tool()
-def jira_filter_delete_tool(filter_id: str) -> Dict[str, Any]:
+@traced("jira_filter_delete_tool")
+@with_deadline
+async def jira_filter_delete_tool(filter_id: str) -> Dict[str, Any]:
     """Delete a filter.
 
     Only the filter owner can delete it.
@@ -473,12 +611,14 @@ def jira_filter_delete_tool(filter_id: str) -> Dict[str, Any]:
     Example:
         jira_filter_delete_tool(filter_id="10000")
     """
-    return jira_filter_delete(filter_id=filter_id)  # pragma: no cover
+    return await jira_filter_delete_async(filter_id=filter_id)  # pragma: no cover
 
 
 # Register workflow tools
 @mcp.tool()
-def jira_workflow_get_transitions_tool(issue_key: str) -> Dict[str, Any]:
+@traced("jira_workflow_get_transitions_tool")
+@with_deadline
+async def jira_workflow_get_transitions_tool(issue_key: str) -> Dict[str, Any]:
     """Get available workflow transitions for an issue.
 
     Returns all transitions available for the issue in its current state, including
@@ -493,11 +633,13 @@ def jira_workflow_get_transitions_tool(issue_key: str) -> Dict[str, Any]:
     Example:
         jira_workflow_get_transitions_tool(issue_key="PROJ-123")
     """
-    return jira_workflow_get_transitions(issue_key=issue_key)  # pragma: no cover
+    return await jira_workflow_get_transitions_async(issue_key=issue_key)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_workflow_transition_tool(
+@traced("jira_workflow_transition_tool")
+@with_deadline
+async def jira_workflow_transition_tool(
     issue_key: str, transition_id: str, fields: Dict[str, Any] | None = None
 ) -> Dict[str, Any]:
     """Transition an issue through workflow.
@@ -524,14 +666,16 @@ def jira_workflow_transition_tool(
             fields={"resolution": {"name": "Done"}}
         )
     """
-    return jira_workflow_transition(  # pragma: no cover
+    return await jira_workflow_transition_async(  # pragma: no cover
         issue_key=issue_key, transition_id=transition_id, fields=fields
     )
 
 
 # Register comment tools
 @mcp.tool()
-def jira_comment_add_tool(issue_key: str, body: str) -> Dict[str, Any]:
+@traced("jira_comment_add_tool")
+@with_deadline
+async def jira_comment_add_tool(issue_key: str, body: str) -> Dict[str, Any]:
     """Add a comment to an issue.
 
     Comments support Jira markup for formatting (bold, italic, lists, etc.).
@@ -549,11 +693,13 @@ def jira_comment_add_tool(issue_key: str, body: str) -> Dict[str, Any]:
             body="This issue is ready for review"
         )
     """
-    return jira_comment_add(issue_key=issue_key, body=body)  # pragma: no cover
+    return await jira_comment_add_async(issue_key=issue_key, body=body)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_comment_list_tool(issue_key: str) -> Dict[str, Any]:
+@traced("jira_comment_list_tool")
+@with_deadline
+async def jira_comment_list_tool(issue_key: str) -> Dict[str, Any]:
     """List all comments on an issue.
 
     Retrieves all comments with author information and timestamps.
@@ -567,11 +713,13 @@ def jira_comment_list_tool(issue_key: str) -> Dict[str, Any]:
     Example:
         jira_comment_list_tool(issue_key="PROJ-123")
     """
-    return jira_comment_list(issue_key=issue_key)  # pragma: no cover
+    return await jira_comment_list_async(issue_key=issue_key)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_comment_update_tool(issue_key: str, comment_id: str, body: str) -> Dict[str, Any]:
+@traced("jira_comment_update_tool")
+@with_deadline
+async def jira_comment_update_tool(issue_key: str, comment_id: str, body: str) -> Dict[str, Any]:
     """Update an existing comment.
 
     Only the comment author or users with appropriate permissions can update a comment.
@@ -591,11 +739,13 @@ def jira_comment_update_tool(issue_key: str, comment_id: str, body: str) -> Dict
             body="Updated comment text"
         )
     """
-    return jira_comment_update(issue_key=issue_key, comment_id=comment_id, body=body)  # pragma: no cover
+    return await jira_comment_update_async(issue_key=issue_key, comment_id=comment_id, body=body)  # pragma: no cover
 
 
 @mcp.tool()
-def jira_comment_delete_tool(issue_key: str, comment_id: str) -> Dict[str, Any]:
+@traced("jira_comment_delete_tool")
+@with_deadline
+async def jira_comment_delete_tool(issue_key: str, comment_id: str) -> Dict[str, Any]:
     """Delete a comment.
 
     Only the comment author or users with appropriate permissions can delete a comment.
@@ -610,37 +760,61 @@ def jira_comment_delete_tool(issue_key: str, comment_id: str) -> Dict[str, Any]:
     Example:
         jira_comment_delete_tool(issue_key="PROJ-123", comment_id="10001")
     """
-    return jira_comment_delete(issue_key=issue_key, comment_id=comment_id)  # pragma: no cover
+    return await jira_comment_delete_async(issue_key=issue_key, comment_id=comment_id)  # pragma: no cover
 
 
 def main() -> None:
     """Main entry point for the Jira MCP server."""
+    global _async_client, _metrics, _prefetch_targets
     try:
         # Load configuration
         config = JiraConfig()  # type: ignore[call-arg]  # pydantic-settings loads from env
 
-        # Initialize client
-        client = JiraClient(config)
+        # Spans for tool calls, validation and Jira requests (a no-op unless JIRA_MCP_TRACING is set)
+        configure_tracing(config.tracing)
+
+        # Every tool call, and each Jira request it makes, must finish within JIRA_MCP_TOOL_DEADLINE
+        configure_deadline(config.tool_deadline)
+
+        # Initialize the client once and share it (and its connection pool, caches, circuit breakers
+        # and concurrency limit) with every tool module. Every tool runs on the server's event loop,
+        # so no synchronous client is built: it would only duplicate that request pipeline state
+        async_client = _async_client = AsyncJiraClient(config)
+        _metrics = async_client.request_metrics
+
+        # Search results are cached for reads and invalidated by the tools that write issues
+        search_cache = None
+        if config.search_cache_ttl > 0 and config.search_cache_size > 0:
+            search_cache = SearchCache(ttl_seconds=config.search_cache_ttl, max_entries=config.search_cache_size)
 
         # Initialize issue tools
-        initialize_issue_tools(config)
+        initialize_issue_tools(config, search_cache, async_client=async_client)
 
         # Initialize search tools
-        initialize_search_tools(client)
+        initialize_search_tools(async_client=async_client, search_cache=search_cache)
 
         # Initialize filter tools
-        initialize_filter_tools(client)
+        initialize_filter_tools(async_client=async_client, search_cache=search_cache)
 
         # Initialize workflow tools
-        initialize_workflow_tools(client)
+        initialize_workflow_tools(async_client=async_client, search_cache=search_cache)
 
         # Initialize comment tools
-        initialize_comment_tools(client)
+        initialize_comment_tools(async_client=async_client, search_cache=search_cache)
+
+        _prefetch_targets = config.prefetch_targets()
 
         print("Starting Jira MCP Server...")
         print(f"Jira URL: {config.url}")
         print(f"Cache TTL: {config.cache_ttl}s")
+        print(f"Search Cache TTL: {config.search_cache_ttl}s")
+        if _prefetch_targets:
+            print(f"Schema Prefetch: {config.prefetch}")
         print(f"Timeout: {config.timeout}s")
+        if config.tool_deadline > 0:
+            print(f"Tool Deadline: {config.tool_deadline:g}s")
+        if config.transport != "stdio":
+            print(f"Listening: {config.transport} on {config.host}:{config.port} (metrics at /metrics)")
         print(f"SSL Verification: {'Enabled' if config.verify_ssl else 'DISABLED (Testing Only)'}")
         if not config.verify_ssl:
             print()
@@ -650,8 +824,12 @@ def main() -> None:
         print()
         print("Server ready! Use MCP client to interact with Jira.")
 
-        # Run FastMCP server
-        mcp.run()
+        # Run FastMCP server (its lifespan releases the client's pooled connections); /metrics is
+        # only served over HTTP
+        if config.transport == "stdio":
+            mcp.run()
+        else:
+            mcp.run(transport=config.transport, host=config.host, port=config.port)
 
     except Exception as e:
         print(f"Error starting server: {e}", file=sys.stderr)
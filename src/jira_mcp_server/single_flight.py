@@ -0,0 +1,283 @@
+"""Coalescing of identical concurrent read requests (single-flight)"""
+
+import asyncio
+import re
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from jira_mcp_server.endpoints import SAFE_METHODS, is_read_only_post, is_streamed
+
+# Headers describing the wire encoding of a body; copies carry the decoded body instead
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+RequestKey = Tuple[str, str, bytes]
+
+# Issue or filter a request reads or writes: /issue/{key}... or /filter/{id}... (createmeta and
+# the filter/my and filter/favourite lists span resources, so they are not one)
+_RESOURCE_PATH = re.compile(r"/rest/api/2/(issue|filter)/(?!(?:createmeta|my|favourite)(?:/|$))([^/]+)")
+
+# Generation counters per resource, shared by resources whose names hash alike (CRC-32)
+_STRIPES = 256
+
+
+def coalesce_key(request: httpx.Request) -> Optional[RequestKey]:
+    """Build the key under which identical requests are merged.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        (method, URL, body) for reads and read-only POSTs, or None for requests that must
+        always be sent on their own (writes, and streamed reads whose body cannot be shared)
+    """
+    if is_streamed(request) or (request.method not in SAFE_METHODS and not is_read_only_post(request)):
+        return None
+    return (request.method, str(request.url), request.read())
+
+
+def copy_response(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+    """Give a waiting caller its own copy of a shared, fully read response.
+
+    Args:
+        response: Response received by the request that went to the network
+        request: The waiting caller's request
+
+    Returns:
+        Independent response with the same status, headers and body
+    """
+    headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _ENCODING_HEADERS]
+    return httpx.Response(response.status_code, headers=headers, content=response.content, request=request)
+
+
+class CoalescingMetrics:
+    """Thread-safe counters for request coalescing."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._coalesced = 0
+
+    def record_sent(self) -> None:
+        """Count a request that went to the network on behalf of its waiters."""
+        with self._lock:
+            self._sent += 1
+
+    def record_coalesced(self) -> None:
+        """Count a request answered by another identical request already in flight."""
+        with self._lock:
+            self._coalesced += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing statistics.
+
+        Returns:
+            Requests sent and requests served from an in-flight duplicate
+        """
+        with self._lock:
+            return {"sent": self._sent, "coalesced": self._coalesced}
+
+
+def _resource(request: httpx.Request) -> Optional[str]:
+    """Name the single issue or filter a request targets.
+
+    Args:
+        request: HTTP request
+
+    Returns:
+        "issue/KEY" or "filter/ID", or None for requests spanning resources (searches, lists)
+    """
+    match = _RESOURCE_PATH.search(request.url.path)
+    if match is None:
+        return None
+    return f"{match.group(1)}/{match.group(2).upper()}"
+
+
+def _stripe(resource: str) -> int:
+    return zlib.crc32(resource.encode()) % _STRIPES
+
+
+class WriteGenerations:
+    """Thread-safe count of writes, per issue or filter and overall.
+
+    A read is only merged with an in-flight read of the same write generation, so a read
+    starting after a write never receives a response that may predate it. Writes count when
+    they start and when they finish. Reads of a single issue or filter follow the writes to
+    it; reads spanning resources (searches, filter lists) follow every write. Resources share
+    counters by hash, so a collision only keeps some reads from merging.
+    """
+
+    def __init__(self) -> None:
+        """Initialize counters at generation zero."""
+        self._lock = threading.Lock()
+        self._resources: List[int] = [0] * _STRIPES
+        self._overall = 0
+
+    def record_write(self, request: httpx.Request) -> None:
+        """Advance the generations a write affects.
+
+        Args:
+            request: Write request starting or finishing
+        """
+        resource = _resource(request)
+        with self._lock:
+            self._overall += 1
+            if resource is not None:
+                self._resources[_stripe(resource)] += 1
+
+    def current(self, request: httpx.Request) -> int:
+        """Get the write generation a read belongs to.
+
+        Args:
+            request: Read request
+
+        Returns:
+            Writes seen so far to the resource the request reads (to any resource for searches)
+        """
+        resource = _resource(request)
+        with self._lock:
+            return self._overall if resource is None else self._resources[_stripe(resource)]
+
+
+class _Call:
+    """An in-flight request that identical requests wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlightTransport(httpx.BaseTransport):
+    """httpx transport that merges identical concurrent reads into one network call.
+
+    The first caller sends the request; callers arriving while it is in flight wait and
+    receive copies of its response (or its exception). Writes always pass straight through,
+    and reads starting after a write are not merged with reads sent before it.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: CoalescingMetrics):
+        """Initialize single-flight transport.
+
+        Args:
+            transport: Transport that sends the requests
+            metrics: Counters updated for every coalescable request
+        """
+        self._transport = transport
+        self._metrics = metrics
+        self._writes = WriteGenerations()
+        self._calls: Dict[Tuple[int, RequestKey], _Call] = {}
+        self._lock = threading.Lock()
+
+    def _send_write(self, request: httpx.Request) -> httpx.Response:
+        self._writes.record_write(request)
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            self._writes.record_write(request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        read_key = coalesce_key(request)
+        if read_key is None:
+            if request.method in SAFE_METHODS or is_read_only_post(request):
+                return self._transport.handle_request(request)
+            return self._send_write(request)
+        key = (self._writes.current(request), read_key)
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._metrics.record_coalesced()
+            call.done.wait()
+            if call.response is None:
+                raise call.error or RuntimeError("Coalesced request failed")
+            return copy_response(call.response, request)
+
+        self._metrics.record_sent()
+        try:
+            response = self._transport.handle_request(request)
+            response.read()
+            call.response = response
+            return response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncSingleFlightTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that merges identical concurrent reads into one network call."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: CoalescingMetrics):
+        """Initialize async single-flight transport.
+
+        Args:
+            transport: Transport that sends the requests
+            metrics: Counters updated for every coalescable request
+        """
+        self._transport = transport
+        self._metrics = metrics
+        self._writes = WriteGenerations()
+        self._calls: Dict[Tuple[int, RequestKey], "asyncio.Future[httpx.Response]"] = {}
+
+    async def _send_write(self, request: httpx.Request) -> httpx.Response:
+        self._writes.record_write(request)
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self._writes.record_write(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        read_key = coalesce_key(request)
+        if read_key is None:
+            if request.method in SAFE_METHODS or is_read_only_post(request):
+                return await self._transport.handle_async_request(request)
+            return await self._send_write(request)
+        key = (self._writes.current(request), read_key)
+
+        pending = self._calls.get(key)
+        if pending is not None:
+            self._metrics.record_coalesced()
+            try:
+                # shield: a cancelled waiter must not cancel the shared call for everyone else
+                return copy_response(await asyncio.shield(pending), request)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The caller that owned the shared call was cancelled; send this request ourselves
+                return await self.handle_async_request(request)
+
+        future: "asyncio.Future[httpx.Response]" = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self._metrics.record_sent()
+        try:
+            response = await self._transport.handle_async_request(request)
+            await response.aread()
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not reported as never awaited
+            future.exception()
+            raise
+        finally:
+            del self._calls[key]
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
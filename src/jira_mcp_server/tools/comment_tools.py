@@ -2,20 +2,32 @@
 
 from typing import Any, Dict, Optional
 
+from jira_mcp_server.async_jira_client import AsyncJiraClient
 from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.search_cache import SearchCache
 
 # Global client instance (initialized by server)
 _client: Optional[JiraClient] = None
+_async_client: Optional[AsyncJiraClient] = None
+_search_cache: Optional[SearchCache] = None
 
 
-def initialize_comment_tools(client: JiraClient) -> None:
-    """Initialize comment tools with JiraClient instance.
+def initialize_comment_tools(
+    client: Optional[JiraClient] = None,
+    async_client: Optional[AsyncJiraClient] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> None:
+    """Initialize comment tools with Jira client instances.
 
     Args:
-        client: JiraClient instance
+        client: Optional JiraClient used by the synchronous tool variants
+        async_client: Optional AsyncJiraClient used by the async tool variants
+        search_cache: Optional SearchCache invalidated when issues are commented on
     """
-    global _client
+    global _client, _async_client, _search_cache
     _client = client
+    _async_client = async_client
+    _search_cache = search_cache
 
 
 def jira_comment_add(issue_key: str, body: str) -> Dict[str, Any]:
@@ -47,7 +59,10 @@ def jira_comment_add(issue_key: str, body: str) -> Dict[str, Any]:
         raise ValueError("Comment body cannot be empty")
 
     try:
-        return _client.add_comment(issue_key=issue_key, body=body)
+        result = _client.add_comment(issue_key=issue_key, body=body)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return result
     except Exception as e:
         raise ValueError(f"Add comment failed: {str(e)}")
 
@@ -117,7 +132,10 @@ def jira_comment_update(issue_key: str, comment_id: str, body: str) -> Dict[str,
         raise ValueError("Comment body cannot be empty")
 
     try:
-        return _client.update_comment(issue_key=issue_key, comment_id=comment_id, body=body)
+        result = _client.update_comment(issue_key=issue_key, comment_id=comment_id, body=body)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return result
     except Exception as e:
         raise ValueError(f"Update comment failed: {str(e)}")
 
@@ -151,6 +169,134 @@ def jira_comment_delete(issue_key: str, comment_id: str) -> Dict[str, Any]:
 
     try:
         _client.delete_comment(issue_key=issue_key, comment_id=comment_id)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return {
+            "success": True,
+            "message": f"Comment {comment_id} deleted successfully",
+            "issue_key": issue_key,
+            "comment_id": comment_id,
+        }
+    except Exception as e:
+        raise ValueError(f"Delete comment failed: {str(e)}")
+
+
+async def jira_comment_add_async(issue_key: str, body: str) -> Dict[str, Any]:
+    """Add a comment to an issue without blocking the event loop (async jira_comment_add).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        body: Comment text (supports Jira markup)
+
+    Returns:
+        Created comment with ID, author, and timestamp
+
+    Raises:
+        ValueError: If issue not found or validation fails
+    """
+    if not _async_client:
+        raise RuntimeError("Comment tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    if not body or not body.strip():
+        raise ValueError("Comment body cannot be empty")
+
+    try:
+        result = await _async_client.add_comment(issue_key=issue_key, body=body)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return result
+    except Exception as e:
+        raise ValueError(f"Add comment failed: {str(e)}")
+
+
+async def jira_comment_list_async(issue_key: str) -> Dict[str, Any]:
+    """List all comments on an issue without blocking the event loop (async jira_comment_list).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+
+    Returns:
+        Comments list with total count and comment details
+
+    Raises:
+        ValueError: If issue not found or access denied
+    """
+    if not _async_client:
+        raise RuntimeError("Comment tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    try:
+        return await _async_client.list_comments(issue_key=issue_key)
+    except Exception as e:
+        raise ValueError(f"List comments failed: {str(e)}")
+
+
+async def jira_comment_update_async(issue_key: str, comment_id: str, body: str) -> Dict[str, Any]:
+    """Update an existing comment without blocking the event loop (async jira_comment_update).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        comment_id: Comment ID to update
+        body: New comment text (supports Jira markup)
+
+    Returns:
+        Updated comment with ID, author, and timestamp
+
+    Raises:
+        ValueError: If comment not found or permission denied
+    """
+    if not _async_client:
+        raise RuntimeError("Comment tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    if not comment_id or not comment_id.strip():
+        raise ValueError("Comment ID cannot be empty")
+
+    if not body or not body.strip():
+        raise ValueError("Comment body cannot be empty")
+
+    try:
+        result = await _async_client.update_comment(issue_key=issue_key, comment_id=comment_id, body=body)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return result
+    except Exception as e:
+        raise ValueError(f"Update comment failed: {str(e)}")
+
+
+async def jira_comment_delete_async(issue_key: str, comment_id: str) -> Dict[str, Any]:
+    """Delete a comment without blocking the event loop (async jira_comment_delete).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        comment_id: Comment ID to delete
+
+    Returns:
+        Success confirmation with deleted comment ID
+
+    Raises:
+        ValueError: If comment not found or permission denied
+    """
+    if not _async_client:
+        raise RuntimeError("Comment tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    if not comment_id or not comment_id.strip():
+        raise ValueError("Comment ID cannot be empty")
+
+    try:
+        await _async_client.delete_comment(issue_key=issue_key, comment_id=comment_id)
+        if _search_cache:
+            _search_cache.invalidate_all()
         return {
             "success": True,
             "message": f"Comment {comment_id} deleted successfully",
@@ -1,21 +1,33 @@
 """MCP tools for filter management (T048-T053)"""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.jira_client import DEFAULT_SEARCH_FIELDS, JiraClient
+from jira_mcp_server.search_cache import SearchCache
 
 # Global client instance (initialized by server)
 _client: Optional[JiraClient] = None
+_async_client: Optional[AsyncJiraClient] = None
+_search_cache: Optional[SearchCache] = None
 
 
-def initialize_filter_tools(client: JiraClient) -> None:
-    """Initialize filter tools with JiraClient instance.
+def initialize_filter_tools(
+    client: Optional[JiraClient] = None,
+    async_client: Optional[AsyncJiraClient] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> None:
+    """Initialize filter tools with Jira client instances.
 
     Args:
-        client: JiraClient instance
+        client: Optional JiraClient used by the synchronous tool variants
+        async_client: Optional AsyncJiraClient used by the async tool variants
+        search_cache: Optional SearchCache shared with the tools that write issues
     """
-    global _client
+    global _client, _async_client, _search_cache
     _client = client
+    _async_client = async_client
+    _search_cache = search_cache
 
 
 def jira_filter_create(
@@ -112,6 +124,8 @@ def jira_filter_execute(
     filter_id: str,
     max_results: int = 50,
     start_at: int = 0,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Execute a saved filter (T051).
 
@@ -121,6 +135,9 @@ def jira_filter_execute(
         filter_id: Filter ID
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -145,11 +162,23 @@ def jira_filter_execute(
         if not jql:
             raise ValueError("Filter does not contain a valid JQL query")
 
+        fields = fields or DEFAULT_SEARCH_FIELDS
+        if _search_cache:
+            cached = _search_cache.get(jql, fields, expand, start_at, max_results)
+            if cached is not None:
+                return cached
+
         # Execute the filter's JQL
-        return _client.search_issues(jql=jql, max_results=max_results, start_at=start_at)
+        result = _client.search_issues(
+            jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+        )
     except Exception as e:
         raise ValueError(f"Filter execution failed: {str(e)}")
 
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results)
+    return result
+
 
 def jira_filter_update(
     filter_id: str,
@@ -191,12 +220,17 @@ def jira_filter_update(
         raise ValueError("At least one field must be provided to update")
 
     try:
-        return _client.update_filter(
+        result = _client.update_filter(
             filter_id=filter_id, name=name, jql=jql, description=description, favourite=favourite
         )
     except Exception as e:
         raise ValueError(f"Filter update failed: {str(e)}")
 
+    # Searches using "filter = <id>" now run the new JQL
+    if _search_cache:
+        _search_cache.invalidate_all()
+    return result
+
 
 def jira_filter_delete(filter_id: str) -> Dict[str, Any]:
     """Delete a filter (T053).
@@ -223,6 +257,209 @@ def jira_filter_delete(filter_id: str) -> Dict[str, Any]:
 
     try:
         _client.delete_filter(filter_id=filter_id)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return {"success": True, "message": f"Filter {filter_id} deleted successfully"}
+    except Exception as e:
+        raise ValueError(f"Filter deletion failed: {str(e)}")
+
+
+async def jira_filter_create_async(
+    name: str,
+    jql: str,
+    description: str | None = None,
+    favourite: bool = False,
+) -> Dict[str, Any]:
+    """Create a new saved filter without blocking the event loop (async jira_filter_create).
+
+    Args:
+        name: Filter name
+        jql: JQL query string
+        description: Optional filter description
+        favourite: Whether to mark as favorite (default: False)
+
+    Returns:
+        Created filter with ID and details
+
+    Raises:
+        ValueError: If filter creation fails
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    if not name or not name.strip():
+        raise ValueError("Filter name cannot be empty")
+
+    if not jql or not jql.strip():
+        raise ValueError("JQL query cannot be empty")
+
+    try:
+        return await _async_client.create_filter(name=name, jql=jql, description=description, favourite=favourite)
+    except Exception as e:
+        raise ValueError(f"Filter creation failed: {str(e)}")
+
+
+async def jira_filter_list_async() -> Dict[str, Any]:
+    """List all accessible filters without blocking the event loop (async jira_filter_list).
+
+    Returns:
+        List of filter metadata (ID, name, JQL, owner)
+
+    Raises:
+        RuntimeError: If tools not initialized
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    try:
+        return await _async_client.list_filters()
+    except Exception as e:
+        raise ValueError(f"Filter list failed: {str(e)}")
+
+
+async def jira_filter_get_async(filter_id: str) -> Dict[str, Any]:
+    """Get filter details by ID without blocking the event loop (async jira_filter_get).
+
+    Args:
+        filter_id: Filter ID
+
+    Returns:
+        Complete filter information
+
+    Raises:
+        ValueError: If filter not found or access denied
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    if not filter_id or not filter_id.strip():
+        raise ValueError("Filter ID cannot be empty")
+
+    try:
+        return await _async_client.get_filter(filter_id=filter_id)
+    except Exception as e:
+        raise ValueError(f"Get filter failed: {str(e)}")
+
+
+async def jira_filter_execute_async(
+    filter_id: str,
+    max_results: int = 50,
+    start_at: int = 0,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Execute a saved filter without blocking the event loop (async jira_filter_execute).
+
+    Args:
+        filter_id: Filter ID
+        max_results: Maximum results to return (default: 50)
+        start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
+
+    Returns:
+        Search results with total count, issues list, and pagination info
+
+    Raises:
+        ValueError: If filter not found or execution fails
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    if not filter_id or not filter_id.strip():
+        raise ValueError("Filter ID cannot be empty")
+
+    try:
+        filter_data = await _async_client.get_filter(filter_id=filter_id)
+        jql = filter_data.get("jql")
+
+        if not jql:
+            raise ValueError("Filter does not contain a valid JQL query")
+
+        fields = fields or DEFAULT_SEARCH_FIELDS
+        if _search_cache:
+            cached = _search_cache.get(jql, fields, expand, start_at, max_results)
+            if cached is not None:
+                return cached
+
+        result = await _async_client.search_issues(
+            jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+        )
+    except Exception as e:
+        raise ValueError(f"Filter execution failed: {str(e)}")
+
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results)
+    return result
+
+
+async def jira_filter_update_async(
+    filter_id: str,
+    name: str | None = None,
+    jql: str | None = None,
+    description: str | None = None,
+    favourite: bool | None = None,
+) -> Dict[str, Any]:
+    """Update an existing filter without blocking the event loop (async jira_filter_update).
+
+    Args:
+        filter_id: Filter ID
+        name: New filter name
+        jql: New JQL query
+        description: New description
+        favourite: Whether to mark as favorite
+
+    Returns:
+        Updated filter data
+
+    Raises:
+        ValueError: If no fields provided or update fails
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    if not filter_id or not filter_id.strip():
+        raise ValueError("Filter ID cannot be empty")
+
+    if name is None and jql is None and description is None and favourite is None:
+        raise ValueError("At least one field must be provided to update")
+
+    try:
+        result = await _async_client.update_filter(
+            filter_id=filter_id, name=name, jql=jql, description=description, favourite=favourite
+        )
+    except Exception as e:
+        raise ValueError(f"Filter update failed: {str(e)}")
+
+    # Searches using "filter = <id>" now run the new JQL
+    if _search_cache:
+        _search_cache.invalidate_all()
+    return result
+
+
+async def jira_filter_delete_async(filter_id: str) -> Dict[str, Any]:
+    """Delete a filter without blocking the event loop (async jira_filter_delete).
+
+    Args:
+        filter_id: Filter ID
+
+    Returns:
+        Success confirmation message
+
+    Raises:
+        ValueError: If filter deletion fails or permission denied
+    """
+    if not _async_client:
+        raise RuntimeError("Filter tools not initialized")
+
+    if not filter_id or not filter_id.strip():
+        raise ValueError("Filter ID cannot be empty")
+
+    try:
+        await _async_client.delete_filter(filter_id=filter_id)
+        if _search_cache:
+            _search_cache.invalidate_all()
         return {"success": True, "message": f"Filter {filter_id} deleted successfully"}
     except Exception as e:
         raise ValueError(f"Filter deletion failed: {str(e)}")
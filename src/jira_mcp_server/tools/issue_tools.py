@@ -1,31 +1,59 @@
 """MCP tools for issue management (T026-T028)"""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from jira_mcp_server.async_jira_client import AsyncJiraClient
 from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.deadline import no_deadline
 from jira_mcp_server.jira_client import JiraClient
 from jira_mcp_server.models import FieldSchema, FieldType, FieldValidationError
 from jira_mcp_server.schema_cache import SchemaCache
+from jira_mcp_server.schema_store import SCHEMA_STORE_FILENAME, SchemaStore
+from jira_mcp_server.search_cache import SearchCache
+from jira_mcp_server.tracing import traced
 from jira_mcp_server.validators import FieldValidator
 
 # Global instances (initialized by server)
 _client: Optional[JiraClient] = None
+_async_client: Optional[AsyncJiraClient] = None
 _cache: Optional[SchemaCache] = None
 _validator: Optional[FieldValidator] = None
+_search_cache: Optional[SearchCache] = None
 
+# Background schema refreshes in flight (strong references keep the tasks alive)
+_refresh_tasks: Set["asyncio.Task[None]"] = set()
 
-def initialize_issue_tools(config: JiraConfig) -> None:
+
+def initialize_issue_tools(
+    config: JiraConfig,
+    search_cache: Optional[SearchCache] = None,
+    client: Optional[JiraClient] = None,
+    async_client: Optional[AsyncJiraClient] = None,
+) -> None:
     """Initialize issue tools with configuration.
 
     Args:
         config: JiraConfig instance
+        search_cache: Optional SearchCache invalidated when issues are created or updated
+        client: JiraClient shared with the other tool modules, used by the synchronous tool
+            variants (default: none, leaving them uninitialized)
+        async_client: AsyncJiraClient shared with the other tool modules (default: a new client built from config)
     """
-    global _client, _cache, _validator
-    _client = JiraClient(config)
-    _cache = SchemaCache(ttl_seconds=config.cache_ttl)
+    global _client, _async_client, _cache, _validator, _search_cache
+    _client = client
+    _async_client = async_client or AsyncJiraClient(config)
+    store = None
+    if config.cache_dir:
+        store = SchemaStore(Path(config.cache_dir).expanduser() / SCHEMA_STORE_FILENAME, namespace=config.url)
+    _cache = SchemaCache(ttl_seconds=config.cache_ttl, max_stale_seconds=config.cache_max_stale, store=store)
     _validator = FieldValidator()
+    _search_cache = search_cache
 
 
+@traced("jira.get_field_schema")
 def _get_field_schema(project: str, issue_type: str) -> List[FieldSchema]:
     """Get field schema with caching (T029).
 
@@ -42,15 +70,143 @@ def _get_field_schema(project: str, issue_type: str) -> List[FieldSchema]:
     if not _cache or not _client:
         raise RuntimeError("Issue tools not initialized")
 
-    # Try cache first
+    # Try cache first; a stale schema is served while a background thread refreshes it
     cached_schema = _cache.get(project, issue_type)
     if cached_schema is not None:
+        if _cache.start_refresh(project, issue_type):
+            threading.Thread(target=_refresh_field_schema, args=(project, issue_type), daemon=True).start()
         return cached_schema
 
     # Fetch from Jira
     raw_schema = _client.get_project_schema(project, issue_type)
+    field_schemas = _build_field_schemas(raw_schema)
+
+    # Cache the schema
+    _cache.set(project, issue_type, field_schemas)
+
+    return field_schemas
+
+
+def _refresh_field_schema(project: str, issue_type: str) -> None:
+    """Replace a stale cached schema, keeping the stale copy if the fetch fails.
+
+    Args:
+        project: Project key
+        issue_type: Issue type name
+    """
+    if not _cache or not _client:
+        return
+
+    try:
+        raw_schema = _client.get_project_schema(project, issue_type)
+        _cache.set(project, issue_type, _build_field_schemas(raw_schema))
+    except Exception:
+        # The stale schema keeps being served until the hard-expiry cap; the next call retries
+        pass
+    finally:
+        _cache.finish_refresh(project, issue_type)
+
+
+@traced("jira.get_field_schema")
+async def _get_field_schema_async(project: str, issue_type: str) -> List[FieldSchema]:
+    """Get field schema with caching, fetching misses with the async client.
 
-    # Convert to FieldSchema models
+    Args:
+        project: Project key
+        issue_type: Issue type name
+
+    Returns:
+        List of FieldSchema
+
+    Raises:
+        ValueError: If schema cannot be retrieved
+    """
+    if not _cache or not _async_client:
+        raise RuntimeError("Issue tools not initialized")
+
+    # Try cache first; a stale schema is served while a background task refreshes it
+    cached_schema = _cache.get(project, issue_type)
+    if cached_schema is not None:
+        if _cache.start_refresh(project, issue_type):
+            task = asyncio.create_task(_refresh_field_schema_async(project, issue_type))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return cached_schema
+
+    # Fetch from Jira
+    raw_schema = await _async_client.get_project_schema(project, issue_type)
+    field_schemas = _build_field_schemas(raw_schema)
+
+    # Cache the schema
+    _cache.set(project, issue_type, field_schemas)
+
+    return field_schemas
+
+
+async def _refresh_field_schema_async(project: str, issue_type: str) -> None:
+    """Replace a stale cached schema using the async client.
+
+    Args:
+        project: Project key
+        issue_type: Issue type name
+    """
+    if not _cache or not _async_client:
+        return
+
+    try:
+        # The refresh outlives the tool call that started it, so its deadline does not apply
+        with no_deadline():
+            raw_schema = await _async_client.get_project_schema(project, issue_type)
+        _cache.set(project, issue_type, _build_field_schemas(raw_schema))
+    except Exception:
+        # The stale schema keeps being served until the hard-expiry cap; the next call retries
+        pass
+    finally:
+        _cache.finish_refresh(project, issue_type)
+
+
+async def prefetch_schemas(targets: List[Tuple[str, Optional[str]]]) -> Dict[str, int]:
+    """Warm the schema cache for the given targets concurrently.
+
+    A target without an issue type loads every issue type of the project in a single
+    request. Failures are counted rather than raised so a bad entry never blocks startup.
+
+    Args:
+        targets: (project, issue_type) pairs, as returned by JiraConfig.prefetch_targets
+
+    Returns:
+        Number of schemas loaded and number of targets that failed
+    """
+    if not _cache or not _async_client:
+        raise RuntimeError("Issue tools not initialized")
+
+    cache, client = _cache, _async_client
+
+    async def load(project: str, issue_type: Optional[str]) -> int:
+        if issue_type is not None:
+            raw_schemas = {issue_type: await client.get_project_schema(project, issue_type)}
+        else:
+            raw_schemas = await client.get_project_schemas(project)
+        for name, raw_schema in raw_schemas.items():
+            cache.set(project, name, _build_field_schemas(raw_schema))
+        return len(raw_schemas)
+
+    results = await asyncio.gather(
+        *(load(project, issue_type) for project, issue_type in targets), return_exceptions=True
+    )
+    counts = [r for r in results if isinstance(r, int)]
+    return {"loaded": sum(counts), "failed": len(results) - len(counts)}
+
+
+def _build_field_schemas(raw_schema: List[Dict[str, Any]]) -> List[FieldSchema]:
+    """Convert raw createmeta field definitions to FieldSchema models.
+
+    Args:
+        raw_schema: Field definitions returned by JiraClient.get_project_schema
+
+    Returns:
+        List of FieldSchema
+    """
     field_schemas: List[FieldSchema] = []
     for field_data in raw_schema:
         field_key = field_data.get("key", "")
@@ -94,12 +250,91 @@ def _get_field_schema(project: str, issue_type: str) -> List[FieldSchema]:
         )
         field_schemas.append(field_schema)
 
-    # Cache the schema
-    _cache.set(project, issue_type, field_schemas)
-
     return field_schemas
 
 
+def _build_create_fields(
+    project: str,
+    summary: str,
+    issue_type: str,
+    description: str,
+    priority: Optional[str],
+    assignee: Optional[str],
+    labels: Optional[List[str]],
+    due_date: Optional[str],
+    custom_fields: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the fields dictionary for issue creation.
+
+    Returns:
+        Jira fields dictionary including custom fields
+    """
+    fields: Dict[str, Any] = {
+        "project": {"key": project},
+        "summary": summary,
+        "issuetype": {"name": issue_type},
+    }
+
+    if description:
+        fields["description"] = description
+    if priority:
+        fields["priority"] = {"name": priority}
+    if assignee:
+        fields["assignee"] = {"name": assignee}
+    if labels:
+        fields["labels"] = labels
+    if due_date:
+        fields["duedate"] = due_date
+
+    # Add custom fields
+    for key, value in custom_fields.items():
+        fields[key] = value
+
+    return fields
+
+
+def _build_update_fields(
+    summary: Optional[str],
+    description: Optional[str],
+    priority: Optional[str],
+    assignee: Optional[str],
+    labels: Optional[List[str]],
+    due_date: Optional[str],
+    custom_fields: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the fields dictionary for an issue update.
+
+    Returns:
+        Jira fields dictionary containing only the provided fields
+
+    Raises:
+        ValueError: If no fields are provided
+    """
+    fields: Dict[str, Any] = {}
+
+    if summary is not None:
+        fields["summary"] = summary
+    if description is not None:
+        fields["description"] = description
+    if priority is not None:
+        fields["priority"] = {"name": priority}
+    if assignee is not None:
+        fields["assignee"] = {"name": assignee}
+    if labels is not None:
+        fields["labels"] = labels
+    if due_date is not None:
+        fields["duedate"] = due_date
+
+    # Add custom fields
+    for key, value in custom_fields.items():
+        fields[key] = value
+
+    if not fields:
+        raise ValueError("No fields provided to update")
+
+    return fields
+
+
 def jira_issue_create(
     project: str,
     summary: str,
@@ -141,26 +376,9 @@ def jira_issue_create(
         raise ValueError(f"Failed to get project schema: {str(e)}")
 
     # Build fields dictionary
-    fields: Dict[str, Any] = {
-        "project": {"key": project},
-        "summary": summary,
-        "issuetype": {"name": issue_type},
-    }
-
-    if description:
-        fields["description"] = description
-    if priority:
-        fields["priority"] = {"name": priority}
-    if assignee:
-        fields["assignee"] = {"name": assignee}
-    if labels:
-        fields["labels"] = labels
-    if due_date:
-        fields["duedate"] = due_date
-
-    # Add custom fields
-    for key, value in custom_fields.items():
-        fields[key] = value
+    fields = _build_create_fields(
+        project, summary, issue_type, description, priority, assignee, labels, due_date, custom_fields
+    )
 
     # Validate fields (T031)
     try:
@@ -174,11 +392,14 @@ def jira_issue_create(
 
     try:
         result = _client.create_issue(issue_data)
-        return result
     except Exception as e:
         # Error handling (T033)
         raise ValueError(f"Failed to create issue: {str(e)}")
 
+    if _search_cache:
+        _search_cache.invalidate_all()
+    return result
+
 
 def jira_issue_update(
     issue_key: str,
@@ -212,44 +433,30 @@ def jira_issue_update(
         raise RuntimeError("Issue tools not initialized")
 
     # Build update dictionary
-    fields: Dict[str, Any] = {}
-
-    if summary is not None:
-        fields["summary"] = summary
-    if description is not None:
-        fields["description"] = description
-    if priority is not None:
-        fields["priority"] = {"name": priority}
-    if assignee is not None:
-        fields["assignee"] = {"name": assignee}
-    if labels is not None:
-        fields["labels"] = labels
-    if due_date is not None:
-        fields["duedate"] = due_date
-
-    # Add custom fields
-    for key, value in custom_fields.items():
-        fields[key] = value
-
-    if not fields:
-        raise ValueError("No fields provided to update")
+    fields = _build_update_fields(summary, description, priority, assignee, labels, due_date, custom_fields)
 
     # Update issue
     update_data = {"fields": fields}
 
     try:
         _client.update_issue(issue_key, update_data)
+        if _search_cache:
+            _search_cache.invalidate_all()
         # Get updated issue
         return _client.get_issue(issue_key)
     except Exception as e:
         raise ValueError(f"Failed to update issue: {str(e)}")
 
 
-def jira_issue_get(issue_key: str) -> Dict[str, Any]:
+def jira_issue_get(
+    issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """Get full details of a Jira issue (T028).
 
     Args:
         issue_key: Issue key (e.g., "PROJ-123")
+        fields: Fields to return (default: all fields)
+        expand: Entities to expand (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Complete issue details including all fields
@@ -261,7 +468,131 @@ def jira_issue_get(issue_key: str) -> Dict[str, Any]:
         raise RuntimeError("Issue tools not initialized")
 
     try:
-        return _client.get_issue(issue_key)
+        return _client.get_issue(issue_key, fields=fields, expand=expand)
+    except Exception as e:
+        raise ValueError(f"Failed to get issue: {str(e)}")
+
+
+async def jira_issue_create_async(
+    project: str,
+    summary: str,
+    issue_type: str = "Task",
+    description: str = "",
+    priority: Optional[str] = None,
+    assignee: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    due_date: Optional[str] = None,
+    **custom_fields: Any,
+) -> Dict[str, Any]:
+    """Create a new Jira issue without blocking the event loop (async jira_issue_create).
+
+    Args:
+        project: Project key (e.g., "PROJ")
+        summary: Issue title/summary
+        issue_type: Type of issue (default: "Task")
+        description: Detailed description
+        priority: Issue priority
+        assignee: Username or ID to assign
+        labels: List of labels
+        due_date: Due date in ISO format (YYYY-MM-DD)
+        **custom_fields: Additional custom fields as keyword arguments
+
+    Returns:
+        Created issue with key, ID, and field values
+
+    Raises:
+        ValueError: If validation fails or API error
+    """
+    if not _async_client or not _validator:
+        raise RuntimeError("Issue tools not initialized")
+
+    try:
+        schema = await _get_field_schema_async(project, issue_type)
+    except Exception as e:
+        raise ValueError(f"Failed to get project schema: {str(e)}")
+
+    fields = _build_create_fields(
+        project, summary, issue_type, description, priority, assignee, labels, due_date, custom_fields
+    )
+
+    try:
+        _validator.validate_fields(fields, schema)
+    except FieldValidationError as e:
+        raise ValueError(f"Validation failed: {str(e)}")
+
+    try:
+        result = await _async_client.create_issue({"fields": fields})
+    except Exception as e:
+        raise ValueError(f"Failed to create issue: {str(e)}")
+
+    if _search_cache:
+        _search_cache.invalidate_all()
+    return result
+
+
+async def jira_issue_update_async(
+    issue_key: str,
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    due_date: Optional[str] = None,
+    **custom_fields: Any,
+) -> Dict[str, Any]:
+    """Update an existing Jira issue without blocking the event loop (async jira_issue_update).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        summary: New summary
+        description: New description
+        priority: New priority
+        assignee: New assignee
+        labels: New labels (replaces existing)
+        due_date: New due date
+        **custom_fields: Custom fields to update
+
+    Returns:
+        Updated issue data
+
+    Raises:
+        ValueError: If issue not found or validation fails
+    """
+    if not _async_client:
+        raise RuntimeError("Issue tools not initialized")
+
+    fields = _build_update_fields(summary, description, priority, assignee, labels, due_date, custom_fields)
+
+    try:
+        await _async_client.update_issue(issue_key, {"fields": fields})
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return await _async_client.get_issue(issue_key)
+    except Exception as e:
+        raise ValueError(f"Failed to update issue: {str(e)}")
+
+
+async def jira_issue_get_async(
+    issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Get full details of a Jira issue without blocking the event loop (async jira_issue_get).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        fields: Fields to return (default: all fields)
+        expand: Entities to expand (e.g., ["renderedFields", "changelog"])
+
+    Returns:
+        Complete issue details including all fields
+
+    Raises:
+        ValueError: If issue not found
+    """
+    if not _async_client:
+        raise RuntimeError("Issue tools not initialized")
+
+    try:
+        return await _async_client.get_issue(issue_key, fields=fields, expand=expand)
     except Exception as e:
         raise ValueError(f"Failed to get issue: {str(e)}")
 
@@ -2,20 +2,32 @@
 
 from typing import Any, Dict, List, Optional
 
-from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.jira_client import DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_FIELDS, JiraClient
+from jira_mcp_server.search_cache import SearchCache
 
 # Global client instance (initialized by server)
 _client: Optional[JiraClient] = None
+_async_client: Optional[AsyncJiraClient] = None
+_search_cache: Optional[SearchCache] = None
 
 
-def initialize_search_tools(client: JiraClient) -> None:
-    """Initialize search tools with JiraClient instance.
+def initialize_search_tools(
+    client: Optional[JiraClient] = None,
+    async_client: Optional[AsyncJiraClient] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> None:
+    """Initialize search tools with Jira client instances.
 
     Args:
-        client: JiraClient instance
+        client: Optional JiraClient used by the synchronous tool variants
+        async_client: Optional AsyncJiraClient used by the async tool variants
+        search_cache: Optional SearchCache shared with the tools that write issues
     """
-    global _client
+    global _client, _async_client, _search_cache
     _client = client
+    _async_client = async_client
+    _search_cache = search_cache
 
 
 def build_jql_from_criteria(
@@ -97,6 +109,8 @@ def jira_search_issues(
     updated_before: Optional[str] = None,
     max_results: int = 50,
     start_at: int = 0,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Search issues using multiple criteria (T037).
 
@@ -114,6 +128,9 @@ def jira_search_issues(
         updated_before: Updated before date in YYYY-MM-DD format
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -148,16 +165,31 @@ def jira_search_issues(
     if not jql:
         raise ValueError("At least one search criterion must be provided")
 
+    fields = fields or DEFAULT_SEARCH_FIELDS
+    if _search_cache:
+        cached = _search_cache.get(jql, fields, expand, start_at, max_results)
+        if cached is not None:
+            return cached
+
     try:
-        return _client.search_issues(jql=jql, max_results=max_results, start_at=start_at)
+        result = _client.search_issues(
+            jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+        )
     except Exception as e:
         raise ValueError(f"Search failed: {str(e)}")
 
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results)
+    return result
+
 
 def jira_search_jql(
     jql: str,
     max_results: int = 50,
     start_at: int = 0,
+    all_pages: bool = False,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Execute a JQL query directly (T038).
 
@@ -167,6 +199,11 @@ def jira_search_jql(
         jql: JQL query string
         max_results: Maximum results to return (default: 50)
         start_at: Starting offset for pagination (default: 0)
+        all_pages: Collect up to max_results issues across as many pages as needed, fetching
+            pages concurrently (default: False)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
 
     Returns:
         Search results with total count, issues list, and pagination info
@@ -186,7 +223,164 @@ def jira_search_jql(
     if not jql or not jql.strip():
         raise ValueError("JQL query cannot be empty")
 
+    fields = fields or DEFAULT_SEARCH_FIELDS
+    if _search_cache:
+        cached = _search_cache.get(jql, fields, expand, start_at, max_results, all_pages)
+        if cached is not None:
+            return cached
+
+    try:
+        if all_pages:
+            result = _client.search_all(
+                jql,
+                page_size=min(max_results, DEFAULT_PAGE_SIZE),
+                start_at=start_at,
+                limit=max_results,
+                fields=fields,
+                expand=expand,
+            )
+        else:
+            result = _client.search_issues(
+                jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+            )
+    except Exception as e:
+        raise ValueError(f"JQL search failed: {str(e)}")
+
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results, all_pages)
+    return result
+
+
+async def jira_search_issues_async(
+    project: Optional[str] = None,
+    assignee: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None,
+    updated_after: Optional[str] = None,
+    updated_before: Optional[str] = None,
+    max_results: int = 50,
+    start_at: int = 0,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Search issues using multiple criteria without blocking the event loop (async jira_search_issues).
+
+    Args:
+        project: Project key (e.g., "PROJ")
+        assignee: Assignee username or "currentUser()"
+        status: Status name (e.g., "Open", "In Progress")
+        priority: Priority name (e.g., "High", "Critical")
+        labels: List of label names
+        created_after: Created after date in YYYY-MM-DD format
+        created_before: Created before date in YYYY-MM-DD format
+        updated_after: Updated after date in YYYY-MM-DD format
+        updated_before: Updated before date in YYYY-MM-DD format
+        max_results: Maximum results to return (default: 50)
+        start_at: Starting offset for pagination (default: 0)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
+
+    Returns:
+        Search results with total count, issues list, and pagination info
+
+    Raises:
+        ValueError: If no criteria provided or search fails
+    """
+    if not _async_client:
+        raise RuntimeError("Search tools not initialized")
+
+    jql = build_jql_from_criteria(
+        project=project,
+        assignee=assignee,
+        status=status,
+        priority=priority,
+        labels=labels,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+    )
+
+    if not jql:
+        raise ValueError("At least one search criterion must be provided")
+
+    fields = fields or DEFAULT_SEARCH_FIELDS
+    if _search_cache:
+        cached = _search_cache.get(jql, fields, expand, start_at, max_results)
+        if cached is not None:
+            return cached
+
+    try:
+        result = await _async_client.search_issues(
+            jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+        )
+    except Exception as e:
+        raise ValueError(f"Search failed: {str(e)}")
+
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results)
+    return result
+
+
+async def jira_search_jql_async(
+    jql: str,
+    max_results: int = 50,
+    start_at: int = 0,
+    all_pages: bool = False,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Execute a JQL query directly without blocking the event loop (async jira_search_jql).
+
+    Args:
+        jql: JQL query string
+        max_results: Maximum results to return (default: 50)
+        start_at: Starting offset for pagination (default: 0)
+        all_pages: Collect up to max_results issues across as many pages as needed, fetching
+            pages concurrently (default: False)
+        fields: Fields to return for each issue (default: a lean set of common fields;
+            use ["*all"] for every field)
+        expand: Entities to expand for each issue (e.g., ["renderedFields", "changelog"])
+
+    Returns:
+        Search results with total count, issues list, and pagination info
+
+    Raises:
+        ValueError: If JQL is invalid or search fails
+    """
+    if not _async_client:
+        raise RuntimeError("Search tools not initialized")
+
+    if not jql or not jql.strip():
+        raise ValueError("JQL query cannot be empty")
+
+    fields = fields or DEFAULT_SEARCH_FIELDS
+    if _search_cache:
+        cached = _search_cache.get(jql, fields, expand, start_at, max_results, all_pages)
+        if cached is not None:
+            return cached
+
     try:
-        return _client.search_issues(jql=jql, max_results=max_results, start_at=start_at)
+        if all_pages:
+            result = await _async_client.search_all(
+                jql,
+                page_size=min(max_results, DEFAULT_PAGE_SIZE),
+                start_at=start_at,
+                limit=max_results,
+                fields=fields,
+                expand=expand,
+            )
+        else:
+            result = await _async_client.search_issues(
+                jql=jql, max_results=max_results, start_at=start_at, fields=fields, expand=expand
+            )
     except Exception as e:
         raise ValueError(f"JQL search failed: {str(e)}")
+
+    if _search_cache:
+        _search_cache.set(jql, result, fields, expand, start_at, max_results, all_pages)
+    return result
@@ -2,20 +2,59 @@
 
 from typing import Any, Dict, Optional
 
+from jira_mcp_server.async_jira_client import AsyncJiraClient
 from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.search_cache import SearchCache
 
 # Global client instance (initialized by server)
 _client: Optional[JiraClient] = None
+_async_client: Optional[AsyncJiraClient] = None
+_search_cache: Optional[SearchCache] = None
 
 
-def initialize_workflow_tools(client: JiraClient) -> None:
-    """Initialize workflow tools with JiraClient instance.
+def initialize_workflow_tools(
+    client: Optional[JiraClient] = None,
+    async_client: Optional[AsyncJiraClient] = None,
+    search_cache: Optional[SearchCache] = None,
+) -> None:
+    """Initialize workflow tools with Jira client instances.
 
     Args:
-        client: JiraClient instance
+        client: Optional JiraClient used by the synchronous tool variants
+        async_client: Optional AsyncJiraClient used by the async tool variants
+        search_cache: Optional SearchCache invalidated when issues are transitioned
     """
-    global _client
+    global _client, _async_client, _search_cache
     _client = client
+    _async_client = async_client
+    _search_cache = search_cache
+
+
+def _format_transitions(issue_key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a Jira transitions response into the tool's simpler format.
+
+    Args:
+        issue_key: Issue key the transitions belong to
+        result: Raw response from JiraClient.get_transitions
+
+    Returns:
+        Transitions with IDs, names, destination statuses, and required fields
+    """
+    transitions = result.get("transitions", [])
+
+    return {
+        "issue_key": issue_key,
+        "transitions": [
+            {
+                "id": t.get("id"),
+                "name": t.get("name"),
+                "to_status": t.get("to", {}).get("name"),
+                "has_screen": t.get("hasScreen", False),
+                "fields": list(t.get("fields", {}).keys()) if t.get("fields") else [],
+            }
+            for t in transitions
+        ],
+    }
 
 
 def jira_workflow_get_transitions(issue_key: str) -> Dict[str, Any]:
@@ -43,22 +82,7 @@ def jira_workflow_get_transitions(issue_key: str) -> Dict[str, Any]:
 
     try:
         result = _client.get_transitions(issue_key=issue_key)
-        transitions = result.get("transitions", [])
-
-        # Transform to simpler format
-        return {
-            "issue_key": issue_key,
-            "transitions": [
-                {
-                    "id": t.get("id"),
-                    "name": t.get("name"),
-                    "to_status": t.get("to", {}).get("name"),
-                    "has_screen": t.get("hasScreen", False),
-                    "fields": list(t.get("fields", {}).keys()) if t.get("fields") else [],
-                }
-                for t in transitions
-            ],
-        }
+        return _format_transitions(issue_key, result)
     except Exception as e:
         raise ValueError(f"Get transitions failed: {str(e)}")
 
@@ -103,6 +127,72 @@ def jira_workflow_transition(
 
     try:
         _client.transition_issue(issue_key=issue_key, transition_id=transition_id, fields=fields)
+        if _search_cache:
+            _search_cache.invalidate_all()
+        return {
+            "success": True,
+            "message": f"Issue {issue_key} transitioned successfully",
+            "issue_key": issue_key,
+            "transition_id": transition_id,
+        }
+    except Exception as e:
+        raise ValueError(f"Transition failed: {str(e)}")
+
+
+async def jira_workflow_get_transitions_async(issue_key: str) -> Dict[str, Any]:
+    """Get available transitions without blocking the event loop (async jira_workflow_get_transitions).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+
+    Returns:
+        Available transitions with IDs, names, destination statuses, and required fields
+
+    Raises:
+        ValueError: If issue not found or access denied
+    """
+    if not _async_client:
+        raise RuntimeError("Workflow tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    try:
+        result = await _async_client.get_transitions(issue_key=issue_key)
+        return _format_transitions(issue_key, result)
+    except Exception as e:
+        raise ValueError(f"Get transitions failed: {str(e)}")
+
+
+async def jira_workflow_transition_async(
+    issue_key: str, transition_id: str, fields: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Transition an issue without blocking the event loop (async jira_workflow_transition).
+
+    Args:
+        issue_key: Issue key (e.g., "PROJ-123")
+        transition_id: Transition ID to execute
+        fields: Optional fields required by the transition (e.g., resolution, comment)
+
+    Returns:
+        Success confirmation with issue key and transition details
+
+    Raises:
+        ValueError: If transition invalid or required fields missing
+    """
+    if not _async_client:
+        raise RuntimeError("Workflow tools not initialized")
+
+    if not issue_key or not issue_key.strip():
+        raise ValueError("Issue key cannot be empty")
+
+    if not transition_id or not transition_id.strip():
+        raise ValueError("Transition ID cannot be empty")
+
+    try:
+        await _async_client.transition_issue(issue_key=issue_key, transition_id=transition_id, fields=fields)
+        if _search_cache:
+            _search_cache.invalidate_all()
         return {
             "success": True,
             "message": f"Issue {issue_key} transitioned successfully",
@@ -0,0 +1,193 @@
+"""Optional tracing hooks with an OpenTelemetry-compatible span API"""
+
+import functools
+import importlib
+import inspect
+from types import TracebackType
+from typing import Any, Callable, ContextManager, Dict, Optional, Type, TypeVar, cast
+
+import httpx
+
+from jira_mcp_server import __version__
+from jira_mcp_server.endpoints import endpoint_name
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Instrumentation scope reported with every span
+TRACER_NAME = "jira_mcp_server"
+
+# Tracer spans are started from; None while tracing is disabled
+_tracer: Optional[Any] = None
+
+
+class _NoopSpan:
+    """Stand-in span returned while tracing is disabled; it records nothing."""
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def set_tracer(tracer: Optional[Any]) -> None:
+    """Install the tracer spans are started from.
+
+    Args:
+        tracer: Object with the OpenTelemetry ``Tracer.start_as_current_span`` API, or None to
+            disable tracing
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def configure_tracing(enabled: bool) -> None:
+    """Enable tracing through the OpenTelemetry API, or disable it.
+
+    Spans go to whichever tracer provider the process has configured (for example with the
+    OpenTelemetry SDK or ``opentelemetry-instrument``); without one the API drops them.
+
+    Args:
+        enabled: Whether to start spans
+
+    Raises:
+        ValueError: If tracing is enabled but opentelemetry-api is not installed
+    """
+    if not enabled:
+        set_tracer(None)
+        return
+    try:
+        trace = importlib.import_module("opentelemetry.trace")
+    except ImportError as e:
+        raise ValueError(f"Tracing requires opentelemetry-api: {e}") from e
+    set_tracer(trace.get_tracer(TRACER_NAME, __version__))
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Any]:
+    """Start a span that is current for the duration of a ``with`` block.
+
+    An exception leaving the block is recorded on the span, which is marked as failed.
+
+    Args:
+        name: Span name
+        attributes: Attributes set when the span starts
+
+    Returns:
+        Context manager yielding the span (a shared no-op span while tracing is disabled)
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return cast(ContextManager[Any], _tracer.start_as_current_span(name, attributes=attributes))
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a function or coroutine function so each call runs in a span.
+
+    While tracing is disabled the wrapper calls straight through.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator preserving the function's signature and docstring
+    """
+
+    def decorate(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await fn(*args, **kwargs)
+                with _tracer.start_as_current_span(name):
+                    return await fn(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with _tracer.start_as_current_span(name):
+                return fn(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorate
+
+
+def _request_span(request: httpx.Request) -> ContextManager[Any]:
+    """Start a client span named after the request's method and Jira endpoint."""
+    endpoint = endpoint_name(request)
+    return span(
+        f"{request.method} {endpoint}",
+        {
+            "http.request.method": request.method,
+            "url.full": str(request.url.copy_with(query=None)),
+            "server.address": request.url.host,
+            "jira.endpoint": endpoint,
+        },
+    )
+
+
+def _record_status(current: Any, response: httpx.Response) -> None:
+    current.set_attribute("http.response.status_code", response.status_code)
+    if response.status_code >= 400:
+        current.set_attribute("error.type", str(response.status_code))
+
+
+class TracingTransport(httpx.BaseTransport):
+    """httpx transport that runs every request in a span.
+
+    The span covers the whole call through the layers below it, including retries; for
+    streamed responses it ends once the headers have arrived.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        """Initialize tracing transport.
+
+        Args:
+            transport: Transport that sends the requests
+        """
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _request_span(request) as current:
+            response = self._transport.handle_request(request)
+            _record_status(current, response)
+            return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncTracingTransport(httpx.AsyncBaseTransport):
+    """httpx async transport that runs every request in a span."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        """Initialize async tracing transport.
+
+        Args:
+            transport: Transport that sends the requests
+        """
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _request_span(request) as current:
+            response = await self._transport.handle_async_request(request)
+            _record_status(current, response)
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
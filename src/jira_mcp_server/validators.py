@@ -3,6 +3,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from jira_mcp_server.models import FieldSchema, FieldType, FieldValidationError
+from jira_mcp_server.tracing import traced
 
 
 class FieldValidator:
@@ -127,6 +128,7 @@ class FieldValidator:
 
         return True, None
 
+    @traced("jira.validate_fields")
     def validate_fields(self, fields: Dict[str, Any], schema: List[FieldSchema]) -> None:
         """Validate all fields and raise exception if invalid.
 
@@ -0,0 +1 @@
+"""Benchmarks for Jira MCP Server hot paths."""
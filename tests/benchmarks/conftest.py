@@ -0,0 +1,115 @@
+"""Fixtures wiring the tool modules and the FastMCP server to the fake Jira server"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastmcp import Client
+
+from jira_mcp_server import server
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.tools import comment_tools, filter_tools, issue_tools, search_tools, workflow_tools
+from tests.fake_jira import FakeJira
+
+# Module globals set by the initialize_* functions, restored after each benchmark
+TOOL_MODULES = (issue_tools, search_tools, filter_tools, workflow_tools, comment_tools, server)
+TOOL_STATE = ("_client", "_async_client", "_cache", "_validator", "_search_cache", "_metrics")
+
+ToolCaller = Callable[[str, Dict[str, Any]], Any]
+
+
+def make_config(**overrides: Any) -> JiraConfig:
+    """Build a config for benchmarks; the search cache is off so searches reach the client."""
+    return JiraConfig(url="https://jira.test.com", token="bench-token", search_cache_ttl=0, **overrides)
+
+
+@contextmanager
+def tools_against(fake: FakeJira, **overrides: Any) -> Iterator[JiraClient]:
+    """Initialize every tool module and the server with clients talking to a fake Jira.
+
+    Args:
+        fake: Fake Jira server answering the clients
+        **overrides: JiraConfig settings
+
+    Yields:
+        Shared synchronous client
+    """
+    config = make_config(**overrides)
+    with (
+        pytest.MonkeyPatch.context() as monkeypatch,
+        patch("httpx.HTTPTransport", return_value=fake.transport()),
+        patch("httpx.AsyncHTTPTransport", return_value=fake.async_transport()),
+    ):
+        for module in TOOL_MODULES:
+            for name in TOOL_STATE:
+                if hasattr(module, name):
+                    monkeypatch.setattr(module, name, getattr(module, name))
+
+        client = JiraClient(config)
+        async_client = AsyncJiraClient(config)
+        issue_tools.initialize_issue_tools(config, client=client, async_client=async_client)
+        search_tools.initialize_search_tools(client, async_client)
+        filter_tools.initialize_filter_tools(client, async_client)
+        workflow_tools.initialize_workflow_tools(client, async_client)
+        comment_tools.initialize_comment_tools(client, async_client)
+        monkeypatch.setattr(server, "_async_client", async_client)
+        try:
+            yield client
+        finally:
+            client.close()
+
+
+@pytest.fixture
+def fake() -> FakeJira:
+    """Fake Jira with 1000 issues, 50-field schemas and single pages of up to 1000 issues."""
+    return FakeJira(issues=1000, custom_fields=50, page_cap=1000)
+
+
+@pytest.fixture
+def tool_client(fake: FakeJira) -> Iterator[JiraClient]:
+    """Tool modules initialized against the fake, yielding the shared synchronous client."""
+    with tools_against(fake) as client:
+        yield client
+
+
+@pytest.fixture
+def call_tool(fake: FakeJira) -> Iterator[ToolCaller]:
+    """Call tools through the FastMCP server's in-memory transport, on one event loop.
+
+    The server's lifespan runs as it would under a real MCP client, and every call goes
+    through FastMCP's argument validation and result serialization.
+    """
+    loop = asyncio.new_event_loop()
+    with tools_against(fake):
+        mcp_client = Client(server.mcp)
+        loop.run_until_complete(mcp_client.__aenter__())
+
+        def call(name: str, arguments: Dict[str, Any]) -> Any:
+            return loop.run_until_complete(mcp_client.call_tool(name, arguments))
+
+        try:
+            yield call
+        finally:
+            loop.run_until_complete(mcp_client.__aexit__(None, None, None))
+            loop.close()
+
+
+def search_response(fake: FakeJira, issues: int) -> httpx.Response:
+    """Render one page of search results from the fake, for parsing benchmarks.
+
+    Args:
+        fake: Fake Jira server
+        issues: Issues on the page
+
+    Returns:
+        Search response with every field of each issue
+    """
+    request = httpx.Request(
+        "POST", "https://jira.test.com/rest/api/2/search", json={"jql": "project = PROJ", "maxResults": issues}
+    )
+    return fake.handle(request)
@@ -0,0 +1,71 @@
+"""Benchmarks for schema lookup and field validation"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.models import FieldSchema, FieldType
+from jira_mcp_server.tools import issue_tools
+from jira_mcp_server.validators import FieldValidator
+from tests.fake_jira import FakeJira
+
+# A valid value for each field type the validator checks
+VALID_VALUES: Dict[FieldType, Any] = {
+    FieldType.STRING: "value",
+    FieldType.NUMBER: 3.5,
+    FieldType.DATE: "2025-01-31",
+    FieldType.DATETIME: "2025-01-31T12:00:00.000+0000",
+    FieldType.USER: "user1",
+    FieldType.ARRAY: ["a", "b"],
+}
+
+
+def large_schema(custom_fields: int) -> List[FieldSchema]:
+    """Build FieldSchemas from a fake createmeta response with many custom fields."""
+    fake = FakeJira(issues=1, custom_fields=custom_fields)
+    raw = [{"key": key, **definition} for key, definition in fake._schema_fields().items()]
+    return issue_tools._build_field_schemas(raw)
+
+
+def valid_fields(schema: List[FieldSchema]) -> Dict[str, Any]:
+    """Give every field in a schema a value that passes validation."""
+    return {
+        field.key: field.allowed_values[0] if field.allowed_values else VALID_VALUES[field.type] for field in schema
+    }
+
+
+class TestFieldSchemaBenchmarks:
+    """Benchmark _get_field_schema against the fake Jira."""
+
+    def test_cold(self, benchmark: Any, tool_client: JiraClient) -> None:
+        """Schema cache miss: createmeta request, parsing and FieldSchema construction."""
+        benchmark.group = "field schema"
+        cache = issue_tools._cache
+        assert cache is not None
+
+        schema = benchmark.pedantic(
+            issue_tools._get_field_schema, args=("PROJ", "Bug"), setup=cache.clear_all, rounds=50, iterations=1
+        )
+
+        assert len(schema) == 5 + 50
+
+    def test_warm(self, benchmark: Any, tool_client: JiraClient) -> None:
+        """Schema cache hit: no request is sent."""
+        benchmark.group = "field schema"
+        issue_tools._get_field_schema("PROJ", "Bug")
+
+        schema = benchmark(issue_tools._get_field_schema, "PROJ", "Bug")
+
+        assert len(schema) == 5 + 50
+
+
+@pytest.mark.parametrize("custom_fields", [50, 500])
+def test_validate_fields(benchmark: Any, custom_fields: int) -> None:
+    """FieldValidator.validate_fields with a value for every field of a large schema."""
+    benchmark.group = "validate fields"
+    benchmark.extra_info["fields"] = custom_fields + 5
+    schema = large_schema(custom_fields)
+    fields = valid_fields(schema)
+
+    benchmark(FieldValidator().validate_fields, fields, schema)
@@ -0,0 +1,53 @@
+"""Benchmarks for JQL building and search result handling"""
+
+from typing import Any
+
+import pytest
+
+from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.tools.search_tools import build_jql_from_criteria
+from tests.benchmarks.conftest import search_response
+from tests.fake_jira import FakeJira
+
+PAGE_SIZES = [50, 100, 1000]
+
+
+def test_build_jql_from_criteria(benchmark: Any) -> None:
+    """Build JQL from every supported criterion."""
+    jql = benchmark(
+        build_jql_from_criteria,
+        project="PROJ",
+        assignee="currentUser()",
+        status="In Progress",
+        priority="High",
+        labels=["backend", "urgent", "regression"],
+        created_after="2025-01-01",
+        created_before="2025-02-01",
+        updated_after="2025-01-15",
+        updated_before="2025-02-15",
+    )
+
+    assert jql.count(" AND ") == 10
+
+
+@pytest.mark.parametrize("issues", PAGE_SIZES)
+def test_parse_search_page(benchmark: Any, fake: FakeJira, tool_client: JiraClient, issues: int) -> None:
+    """Decode a search page with every field of each issue using the configured JSON codec."""
+    benchmark.group = "search page parse"
+    benchmark.extra_info["issues"] = issues
+    response = search_response(fake, issues)
+
+    page = benchmark(tool_client._decode, response)
+
+    assert len(page["issues"]) == issues
+
+
+@pytest.mark.parametrize("issues", PAGE_SIZES)
+def test_search_page_round_trip(benchmark: Any, tool_client: JiraClient, issues: int) -> None:
+    """Fetch and decode a search page through the client's whole middleware pipeline."""
+    benchmark.group = "search page round trip"
+    benchmark.extra_info["issues"] = issues
+
+    page = benchmark(tool_client.search_issues, "project = PROJ", max_results=issues)
+
+    assert len(page["issues"]) == issues
@@ -0,0 +1,34 @@
+"""End-to-end benchmarks of tool calls through the FastMCP server against the fake Jira"""
+
+from typing import Any
+
+from tests.benchmarks.conftest import ToolCaller
+
+
+def test_issue_get(benchmark: Any, call_tool: ToolCaller) -> None:
+    """Fetch one issue with every field."""
+    benchmark.group = "tool call"
+
+    result = benchmark(call_tool, "jira_issue_get_tool", {"issue_key": "PROJ-1"})
+
+    assert result.data["key"] == "PROJ-1"
+
+
+def test_search_issues(benchmark: Any, call_tool: ToolCaller) -> None:
+    """Search with the default lean field set and page size."""
+    benchmark.group = "tool call"
+
+    result = benchmark(call_tool, "jira_search_issues_tool", {"project": "PROJ", "status": "Done"})
+
+    assert len(result.data["issues"]) == 50
+
+
+def test_issue_create(benchmark: Any, call_tool: ToolCaller) -> None:
+    """Create an issue with a warm schema cache: validation against 55 fields, then the POST."""
+    benchmark.group = "tool call"
+    arguments = {"project": "PROJ", "summary": "Benchmark", "custom_fields": {"customfield_10003": "Option 1"}}
+    call_tool("jira_project_get_schema", {"project": "PROJ", "issue_type": "Task"})
+
+    result = benchmark(call_tool, "jira_issue_create_tool", arguments)
+
+    assert result.data["key"].startswith("PROJ-")
@@ -0,0 +1,509 @@
+"""In-memory stand-in for the Jira REST API v2, for offline benchmarks and end-to-end tests
+
+FakeJira serves the endpoints JiraClient and AsyncJiraClient use through an httpx
+MockTransport, so requests still pass through the client's whole middleware pipeline:
+
+    fake = FakeJira(issues=1000, latency=lognormal(0.05, 0.5), faults={429: 0.02, 503: 0.01})
+    with patch("httpx.HTTPTransport", return_value=fake.transport()):
+        client = JiraClient(config)
+
+Latency, fault injection and generated data all come from one seeded random generator, so a
+run is reproducible given the same seed and the same sequence of requests. JQL is not
+evaluated beyond ``project = KEY`` and ``key = KEY``; every other query matches all issues.
+"""
+
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from jira_mcp_server.endpoints import endpoint_name
+
+# Draws a response delay in seconds from the fake's random generator
+LatencyModel = Callable[[random.Random], float]
+
+API = "/rest/api/2"
+
+# Statuses the fake can inject instead of a real response
+FAULT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+TRANSITIONS = (("11", "To Do"), ("21", "In Progress"), ("31", "Done"))
+
+ISSUE_TYPES = ("Task", "Bug", "Story")
+
+PRIORITIES = ("Highest", "High", "Medium", "Low", "Lowest")
+
+# Jira schema types cycled through when generating custom fields
+CUSTOM_FIELD_TYPES = ("string", "number", "date", "option", "array", "user", "datetime")
+
+_WORDS = ("alpha", "build", "cache", "deploy", "error", "fix", "graph", "host", "index", "job", "kernel", "log")
+
+_PROJECT_JQL = re.compile(r"\bproject\s*=\s*\"?([A-Za-z][A-Za-z0-9_]*)", re.IGNORECASE)
+_KEY_JQL = re.compile(r"\b(?:key|issuekey)\s*=\s*\"?([A-Za-z][A-Za-z0-9_]*-\d+)", re.IGNORECASE)
+
+
+def constant(seconds: float) -> LatencyModel:
+    """Latency model that always waits the same time.
+
+    Args:
+        seconds: Delay applied to every response
+
+    Returns:
+        Latency model
+    """
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float) -> LatencyModel:
+    """Latency model drawing delays uniformly between two bounds.
+
+    Args:
+        low: Shortest delay in seconds
+        high: Longest delay in seconds
+
+    Returns:
+        Latency model
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float) -> LatencyModel:
+    """Latency model with the long right tail typical of real server response times.
+
+    Args:
+        median: Median delay in seconds
+        sigma: Standard deviation of the delay's logarithm; 0.5 gives a p99 about 3x the median
+
+    Returns:
+        Latency model
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class FakeJira:
+    """Fake Jira server with generated issues, createmeta schemas, filters and comments."""
+
+    def __init__(
+        self,
+        issues: int = 100,
+        projects: Sequence[str] = ("PROJ",),
+        latency: Optional[LatencyModel] = None,
+        endpoint_latency: Optional[Dict[str, LatencyModel]] = None,
+        faults: Optional[Dict[int, float]] = None,
+        retry_after: float = 0,
+        description_size: int = 200,
+        custom_fields: int = 10,
+        page_cap: int = 100,
+        seed: int = 0,
+    ):
+        """Initialize the fake and generate its data.
+
+        Args:
+            issues: Issues generated per project
+            projects: Project keys
+            latency: Delay applied to every response (None for no delay)
+            endpoint_latency: Delays for specific endpoints, keyed by endpoints.endpoint_name,
+                overriding latency
+            faults: Probability of answering each request with a status from FAULT_STATUSES
+                instead, for example {429: 0.05, 503: 0.01}
+            retry_after: Retry-After seconds sent with injected 429 and 503 responses
+            description_size: Approximate characters in each issue description
+            custom_fields: Custom fields on every issue and in every createmeta schema
+            page_cap: Largest page a search returns, whatever maxResults asks for (Jira caps at 100)
+            seed: Seed for the random generator behind data, latency and faults
+
+        Raises:
+            ValueError: If a fault status or probability is not supported
+        """
+        self.faults = dict(faults or {})
+        for status, probability in self.faults.items():
+            if status not in FAULT_STATUSES:
+                raise ValueError(f"Cannot inject status {status}. Choose from: {sorted(FAULT_STATUSES)}")
+            if not 0 <= probability <= 1:
+                raise ValueError(f"Fault probability for {status} must be between 0 and 1")
+        if sum(self.faults.values()) > 1:
+            raise ValueError("Fault probabilities must add up to at most 1")
+
+        self.latency = latency
+        self.endpoint_latency = dict(endpoint_latency or {})
+        self.retry_after = retry_after
+        self.description_size = description_size
+        self.custom_fields = custom_fields
+        self.page_cap = page_cap
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        for project in projects:
+            for number in range(1, issues + 1):
+                self._add_issue(project, number, self._generate_fields(project, number))
+        self.projects = tuple(projects)
+        self.filters: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        self._next_id = 10000
+
+        # Requests received and faults injected, keyed by endpoints.endpoint_name
+        self.requests: Dict[str, int] = {}
+        self.faults_injected: Dict[str, int] = {}
+
+    def transport(self) -> httpx.MockTransport:
+        """Create a transport answering synchronous clients, sleeping the thread for latency.
+
+        Returns:
+            httpx MockTransport backed by this fake
+        """
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Create a transport answering async clients, awaiting asyncio.sleep for latency.
+
+        Returns:
+            httpx MockTransport backed by this fake
+        """
+        return httpx.MockTransport(self.handle_async)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request after its simulated latency.
+
+        Args:
+            request: HTTP request sent by a client
+
+        Returns:
+            Simulated Jira response
+        """
+        delay, response = self._prepare(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request after its simulated latency, without blocking the event loop.
+
+        Args:
+            request: HTTP request sent by a client
+
+        Returns:
+            Simulated Jira response
+        """
+        delay, response = self._prepare(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    def reset_stats(self) -> None:
+        """Clear the request and fault counters, for example after a warm-up run."""
+        with self._lock:
+            self.requests.clear()
+            self.faults_injected.clear()
+
+    def _prepare(self, request: httpx.Request) -> Tuple[float, httpx.Response]:
+        """Count a request and decide its latency and response.
+
+        Args:
+            request: HTTP request sent by a client
+
+        Returns:
+            Delay in seconds and the response to send after it
+        """
+        name = endpoint_name(request)
+        with self._lock:
+            self.requests[name] = self.requests.get(name, 0) + 1
+            model = self.endpoint_latency.get(name, self.latency)
+            delay = model(self.rng) if model is not None else 0.0
+            fault = self._draw_fault()
+            if fault is not None:
+                self.faults_injected[name] = self.faults_injected.get(name, 0) + 1
+                return delay, self._fault_response(fault)
+            return delay, self._route(request)
+
+    def _draw_fault(self) -> Optional[int]:
+        if not self.faults:
+            return None
+        roll = self.rng.random()
+        for status, probability in self.faults.items():
+            if roll < probability:
+                return status
+            roll -= probability
+        return None
+
+    def _fault_response(self, status: int) -> httpx.Response:
+        headers = {}
+        if status in (429, 503):
+            headers["Retry-After"] = f"{self.retry_after:g}"
+        return httpx.Response(status, headers=headers, json={"errorMessages": [f"Injected {status} fault"]})
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        """Dispatch a request to the handler for its method and path.
+
+        Args:
+            request: HTTP request sent by a client
+
+        Returns:
+            Simulated Jira response, 404 for paths the fake does not serve
+        """
+        method = request.method
+        path = request.url.path
+        if not path.startswith(API):
+            return _error(404, "Not a Jira REST API path")
+        parts = path[len(API) :].strip("/").split("/")
+        body = json.loads(request.content) if request.content else {}
+
+        if parts == ["serverInfo"] and method == "GET":
+            return httpx.Response(
+                200,
+                json={
+                    "version": "9.12.0",
+                    "baseUrl": str(request.url.copy_with(path="")),
+                    "serverTitle": "Fake Jira",
+                    "deploymentType": "Server",
+                },
+            )
+        if parts == ["search"] and method == "POST":
+            return self._search(body)
+        if parts == ["issue", "createmeta"] and method == "GET":
+            return self._createmeta(request.url.params)
+        if parts == ["issue"] and method == "POST":
+            return self._create_issue(body)
+        if parts[0] == "issue" and len(parts) >= 2:
+            issue = self.issues.get(parts[1].upper())
+            if issue is None:
+                return _error(404, "Issue does not exist or you do not have permission to see it.")
+            return self._issue_route(method, issue, parts[2:], request.url.params, body)
+        if parts[0] == "filter":
+            return self._filter_route(method, parts[1:], body)
+        return _error(404, "Not found")
+
+    def _issue_route(
+        self, method: str, issue: Dict[str, Any], rest: List[str], params: httpx.QueryParams, body: Dict[str, Any]
+    ) -> httpx.Response:
+        key = issue["key"]
+        if not rest:
+            if method == "GET":
+                return httpx.Response(200, json=_project(issue, params.get("fields")))
+            if method == "PUT":
+                issue["fields"].update(body.get("fields", {}))
+                self._touch(issue)
+                return httpx.Response(204)
+        elif rest == ["transitions"]:
+            if method == "GET":
+                return httpx.Response(200, json={"transitions": [_transition(i, n) for i, n in TRANSITIONS]})
+            if method == "POST":
+                names = dict(TRANSITIONS)
+                transition_id = str(body.get("transition", {}).get("id"))
+                if transition_id not in names:
+                    return _error(400, f"Transition id '{transition_id}' is not valid for this issue.")
+                issue["fields"]["status"] = {"name": names[transition_id]}
+                issue["fields"].update(body.get("fields", {}))
+                self._touch(issue)
+                return httpx.Response(204)
+        elif rest == ["comment"]:
+            comments = self.comments.setdefault(key, [])
+            if method == "GET":
+                return httpx.Response(
+                    200, json={"startAt": 0, "maxResults": len(comments), "total": len(comments), "comments": comments}
+                )
+            if method == "POST":
+                comment = {
+                    "id": self._new_id(),
+                    "body": body.get("body", ""),
+                    "author": {"name": "fake"},
+                    "created": _timestamp(self._next_id),
+                }
+                comments.append(comment)
+                return httpx.Response(201, json=comment)
+        elif len(rest) == 2 and rest[0] == "comment":
+            comments = self.comments.get(key, [])
+            comment = next((c for c in comments if c["id"] == rest[1]), None)
+            if comment is None:
+                return _error(404, "Comment not found")
+            if method == "PUT":
+                comment["body"] = body.get("body", "")
+                return httpx.Response(200, json=comment)
+            if method == "DELETE":
+                comments.remove(comment)
+                return httpx.Response(204)
+        return _error(405, "Method not allowed")
+
+    def _filter_route(self, method: str, rest: List[str], body: Dict[str, Any]) -> httpx.Response:
+        if not rest and method == "POST":
+            filter_id = self._new_id()
+            self.filters[filter_id] = {"id": filter_id, "owner": {"name": "fake"}, **body}
+            return httpx.Response(200, json=self.filters[filter_id])
+        if rest == ["my"] and method == "GET":
+            return httpx.Response(200, json=list(self.filters.values()))
+        if len(rest) == 1:
+            saved = self.filters.get(rest[0])
+            if saved is None:
+                return _error(404, "Filter not found")
+            if method == "GET":
+                return httpx.Response(200, json=saved)
+            if method == "PUT":
+                saved.update(body)
+                return httpx.Response(200, json=saved)
+            if method == "DELETE":
+                del self.filters[rest[0]]
+                return httpx.Response(204)
+        return _error(405, "Method not allowed")
+
+    def _search(self, body: Dict[str, Any]) -> httpx.Response:
+        """Page through the issues a JQL query matches.
+
+        Args:
+            body: Search request body with jql, startAt, maxResults and fields
+
+        Returns:
+            Search response; maxResults is capped at page_cap as Jira does
+        """
+        jql = body.get("jql", "")
+        start_at = int(body.get("startAt", 0))
+        max_results = min(int(body.get("maxResults", 50)), self.page_cap)
+        matches = list(self.issues.values())
+        key = _KEY_JQL.search(jql)
+        project = _PROJECT_JQL.search(jql)
+        if key:
+            matches = [issue for issue in matches if issue["key"] == key.group(1).upper()]
+        elif project:
+            matches = [issue for issue in matches if issue["fields"]["project"]["key"] == project.group(1).upper()]
+
+        fields = body.get("fields")
+        page = [_project(issue, ",".join(fields) if fields else None) for issue in matches[start_at:][:max_results]]
+        return httpx.Response(
+            200, json={"startAt": start_at, "maxResults": max_results, "total": len(matches), "issues": page}
+        )
+
+    def _createmeta(self, params: httpx.QueryParams) -> httpx.Response:
+        project = params.get("projectKeys", "").upper()
+        if project not in self.projects:
+            return httpx.Response(200, json={"projects": []})
+        wanted = params.get("issuetypeNames")
+        issue_types = [
+            {"id": str(i + 1), "name": name, "fields": self._schema_fields()}
+            for i, name in enumerate(ISSUE_TYPES)
+            if wanted is None or name == wanted
+        ]
+        return httpx.Response(200, json={"projects": [{"key": project, "name": project, "issuetypes": issue_types}]})
+
+    def _create_issue(self, body: Dict[str, Any]) -> httpx.Response:
+        fields = dict(body.get("fields", {}))
+        project = fields.get("project", {}).get("key", "").upper()
+        if project not in self.projects:
+            return _error(400, "project: valid project is required", field="project")
+        if not fields.get("summary"):
+            return _error(400, "summary: You must specify a summary of the issue.", field="summary")
+        number = sum(1 for issue in self.issues.values() if issue["fields"]["project"]["key"] == project) + 1
+        issue = self._add_issue(project, number, {**self._generate_fields(project, number), **fields})
+        return httpx.Response(201, json={"id": issue["id"], "key": issue["key"], "self": f"{API}/issue/{issue['id']}"})
+
+    def _schema_fields(self) -> Dict[str, Dict[str, Any]]:
+        """Build the createmeta field definitions shared by every issue type.
+
+        Returns:
+            Field definitions keyed by field id
+        """
+        fields: Dict[str, Dict[str, Any]] = {
+            "summary": {"name": "Summary", "required": True, "schema": {"type": "string", "system": "summary"}},
+            "description": {"name": "Description", "required": False, "schema": {"type": "string"}},
+            "priority": {
+                "name": "Priority",
+                "required": False,
+                "schema": {"type": "priority"},
+                "allowedValues": [{"name": name} for name in PRIORITIES],
+            },
+            "labels": {"name": "Labels", "required": False, "schema": {"type": "array", "items": "string"}},
+            "duedate": {"name": "Due Date", "required": False, "schema": {"type": "date"}},
+        }
+        for i in range(self.custom_fields):
+            schema_type = CUSTOM_FIELD_TYPES[i % len(CUSTOM_FIELD_TYPES)]
+            definition: Dict[str, Any] = {
+                "name": f"Custom Field {i}",
+                "required": False,
+                "custom": True,
+                "schema": {"type": schema_type, "custom": f"fake:{schema_type}", "customId": 10000 + i},
+            }
+            if schema_type == "option":
+                definition["allowedValues"] = [{"value": f"Option {n}"} for n in range(5)]
+            fields[f"customfield_{10000 + i}"] = definition
+        return fields
+
+    def _generate_fields(self, project: str, number: int) -> Dict[str, Any]:
+        words = max(1, self.description_size // 6)
+        fields: Dict[str, Any] = {
+            "project": {"key": project},
+            "summary": f"{self.rng.choice(_WORDS).capitalize()} issue {number}",
+            "description": " ".join(self.rng.choice(_WORDS) for _ in range(words)),
+            "issuetype": {"name": ISSUE_TYPES[number % len(ISSUE_TYPES)]},
+            "status": {"name": TRANSITIONS[number % len(TRANSITIONS)][1]},
+            "priority": {"name": PRIORITIES[number % len(PRIORITIES)]},
+            "assignee": {"name": f"user{number % 7}"},
+            "labels": [self.rng.choice(_WORDS)],
+            "created": _timestamp(number),
+        }
+        for i in range(self.custom_fields):
+            schema_type = CUSTOM_FIELD_TYPES[i % len(CUSTOM_FIELD_TYPES)]
+            fields[f"customfield_{10000 + i}"] = _custom_value(schema_type, number)
+        return fields
+
+    def _add_issue(self, project: str, number: int, fields: Dict[str, Any]) -> Dict[str, Any]:
+        key = f"{project}-{number}"
+        issue = {"id": str(len(self.issues) + 1), "key": key, "fields": {**fields, "updated": fields["created"]}}
+        self.issues[key] = issue
+        return issue
+
+    def _touch(self, issue: Dict[str, Any]) -> None:
+        self._next_id += 1
+        issue["fields"]["updated"] = _timestamp(self._next_id)
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return str(self._next_id)
+
+
+def _project(issue: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+    """Keep only the requested fields of an issue, as Jira's ``fields`` parameter does.
+
+    Args:
+        issue: Stored issue
+        fields: Comma-separated field ids, or None (or "*all") for every field
+
+    Returns:
+        Issue with the selected fields
+    """
+    if not fields or fields == "*all":
+        return issue
+    wanted = set(fields.split(","))
+    return {**issue, "fields": {k: v for k, v in issue["fields"].items() if k in wanted}}
+
+
+def _transition(transition_id: str, name: str) -> Dict[str, Any]:
+    return {"id": transition_id, "name": name, "to": {"name": name}}
+
+
+def _custom_value(schema_type: str, number: int) -> Any:
+    if schema_type == "number":
+        return float(number)
+    if schema_type in ("date", "datetime"):
+        return _timestamp(number)[:10] if schema_type == "date" else _timestamp(number)
+    if schema_type == "option":
+        return {"value": f"Option {number % 5}"}
+    if schema_type == "array":
+        return [f"value{number % 3}"]
+    if schema_type == "user":
+        return {"name": f"user{number % 7}"}
+    return f"value {number}"
+
+
+def _timestamp(n: int) -> str:
+    """Build a deterministic Jira timestamp that increases with n."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(1_700_000_000 + n * 60))
+
+
+def _error(status: int, message: str, field: Optional[str] = None) -> httpx.Response:
+    errors = {field: message} if field else {}
+    return httpx.Response(status, json={"errorMessages": [] if field else [message], "errors": errors})
@@ -0,0 +1,869 @@
+"""Integration tests for AsyncJiraClient"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.deadline import configure_deadline, deadline, with_deadline
+from jira_mcp_server.metrics import RequestMetrics
+from jira_mcp_server.rate_limit import RateLimiter
+from jira_mcp_server.single_flight import AsyncSingleFlightTransport
+
+
+@pytest.fixture
+def mock_config() -> JiraConfig:
+    """Create a mock JiraConfig for testing."""
+    return JiraConfig(url="https://jira.test.com", token="test-token-123")
+
+
+def make_response(status_code: int, json_data: Any = None, url: str = "https://jira.test.com/rest/api/2") -> Mock:
+    """Create a mock httpx.Response."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.content = json.dumps(json_data).encode()
+    mock_response.text = "error body"
+    mock_response.request = Mock()
+    mock_response.request.url = url
+    return mock_response
+
+
+def make_http_client(mock_client_class: Mock, response: Any = None, side_effect: Any = None) -> Mock:
+    """Wire a mock httpx.AsyncClient whose requests return ``response``."""
+    mock_client_instance = Mock()
+    mock_client_instance.request = AsyncMock(return_value=response, side_effect=side_effect)
+    mock_client_instance.aclose = AsyncMock()
+    mock_client_class.return_value = mock_client_instance
+    return mock_client_instance
+
+
+# (method name, HTTP verb, call kwargs, expected timeout message)
+ENDPOINTS = [
+    ("get_issue", "get", {"issue_key": "PROJ-1"}, "Timeout getting issue PROJ-1"),
+    ("create_issue", "post", {"issue_data": {"fields": {}}}, "Timeout creating issue"),
+    ("update_issue", "put", {"issue_key": "PROJ-1", "update_data": {"fields": {}}}, "Timeout updating issue PROJ-1"),
+    ("get_project_schema", "get", {"project_key": "PROJ", "issue_type": "Bug"}, "Timeout getting schema"),
+    ("get_project_schemas", "get", {"project_key": "PROJ"}, "Timeout getting schemas for PROJ"),
+    ("search_issues", "post", {"jql": "project = PROJ"}, "Timeout executing search query"),
+    ("create_filter", "post", {"name": "F", "jql": "project = PROJ"}, "Timeout creating filter"),
+    ("list_filters", "get", {}, "Timeout listing filters"),
+    ("get_filter", "get", {"filter_id": "10000"}, "Timeout getting filter 10000"),
+    ("update_filter", "put", {"filter_id": "10000", "name": "F"}, "Timeout updating filter 10000"),
+    ("delete_filter", "delete", {"filter_id": "10000"}, "Timeout deleting filter 10000"),
+    ("get_transitions", "get", {"issue_key": "PROJ-1"}, "Timeout getting transitions for PROJ-1"),
+    ("transition_issue", "post", {"issue_key": "PROJ-1", "transition_id": "21"}, "Timeout transitioning issue"),
+    ("add_comment", "post", {"issue_key": "PROJ-1", "body": "Hi"}, "Timeout adding comment to issue PROJ-1"),
+    ("list_comments", "get", {"issue_key": "PROJ-1"}, "Timeout listing comments for issue PROJ-1"),
+    ("update_comment", "put", {"issue_key": "PROJ-1", "comment_id": "1", "body": "Hi"}, "Timeout updating comment"),
+    ("delete_comment", "delete", {"issue_key": "PROJ-1", "comment_id": "1"}, "Timeout deleting comment"),
+]
+
+
+async def collect(issues: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [issue async for issue in issues]
+
+
+# One call of every endpoint method, for behaviour all of them must share
+CLIENT_CALLS = [
+    pytest.param(lambda c: c.health_check(), id="health_check"),
+    pytest.param(lambda c: c.get_issue("PROJ-1"), id="get_issue"),
+    pytest.param(lambda c: c.create_issue({"fields": {}}), id="create_issue"),
+    pytest.param(lambda c: c.update_issue("PROJ-1", {"fields": {}}), id="update_issue"),
+    pytest.param(lambda c: c.get_project_schema("PROJ", "Task"), id="get_project_schema"),
+    pytest.param(lambda c: c.get_project_schemas("PROJ"), id="get_project_schemas"),
+    pytest.param(lambda c: c.search_issues("project = PROJ"), id="search_issues"),
+    pytest.param(lambda c: collect(c.stream_search("project = PROJ")), id="stream_search"),
+    pytest.param(lambda c: c.create_filter("Mine", "project = PROJ"), id="create_filter"),
+    pytest.param(lambda c: c.list_filters(), id="list_filters"),
+    pytest.param(lambda c: c.get_filter("1"), id="get_filter"),
+    pytest.param(lambda c: c.update_filter("1", name="Renamed"), id="update_filter"),
+    pytest.param(lambda c: c.delete_filter("1"), id="delete_filter"),
+    pytest.param(lambda c: c.get_transitions("PROJ-1"), id="get_transitions"),
+    pytest.param(lambda c: c.transition_issue("PROJ-1", "31"), id="transition_issue"),
+    pytest.param(lambda c: c.add_comment("PROJ-1", "Hi"), id="add_comment"),
+    pytest.param(lambda c: c.list_comments("PROJ-1"), id="list_comments"),
+    pytest.param(lambda c: c.update_comment("PROJ-1", "1", "Hi"), id="update_comment"),
+    pytest.param(lambda c: c.delete_comment("PROJ-1", "1"), id="delete_comment"),
+]
+
+
+class TestAsyncJiraClientLifecycle:
+    """Tests for the pooled httpx.AsyncClient lifecycle."""
+
+    def test_client_initialization(self, mock_config: JiraConfig) -> None:
+        """Test that AsyncJiraClient shares configuration handling with JiraClient."""
+        client = AsyncJiraClient(mock_config)
+
+        assert client.base_url == "https://jira.test.com"
+        assert client.timeout == 30
+        assert client.limits.max_connections == 20
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_http_client_reused_across_calls(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that one httpx.AsyncClient is created and reused."""
+        http = make_http_client(mock_client_class, make_response(200, {"key": "PROJ-1"}))
+
+        client = AsyncJiraClient(mock_config)
+        await client.get_issue("PROJ-1")
+        await client.get_issue("PROJ-2")
+
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args[1]["timeout"] == 30
+        assert isinstance(mock_client_class.call_args[1]["transport"], AsyncSingleFlightTransport)
+        assert http.request.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_aclose_releases_http_client(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that aclose() closes the pool and later calls open a new one."""
+        http = make_http_client(mock_client_class, make_response(200, {"key": "PROJ-1"}))
+
+        client = AsyncJiraClient(mock_config)
+        await client.get_issue("PROJ-1")
+        await client.aclose()
+        await client.aclose()
+
+        http.aclose.assert_awaited_once()
+
+        await client.get_issue("PROJ-1")
+        assert mock_client_class.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_async_context_manager(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that the async context manager closes the pool on exit."""
+        http = make_http_client(
+            mock_client_class, make_response(200, {"version": "9.4.0", "baseUrl": "https://jira.test.com"})
+        )
+
+        async with AsyncJiraClient(mock_config) as client:
+            result = await client.health_check()
+
+        assert result == {"connected": True, "server_version": "9.4.0", "base_url": "https://jira.test.com"}
+        http.aclose.assert_awaited_once()
+
+
+class TestAsyncJiraClientEndpoints:
+    """Tests for AsyncJiraClient endpoint coroutines."""
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_health_check_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test health check maps timeouts to a connection timeout message."""
+        make_http_client(mock_client_class, side_effect=httpx.TimeoutException("Timed out"))
+
+        with pytest.raises(ValueError, match="Connection timeout"):
+            await AsyncJiraClient(mock_config).health_check()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_health_check_network_error(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test health check maps network errors."""
+        make_http_client(mock_client_class, side_effect=httpx.NetworkError("Connection refused"))
+
+        with pytest.raises(ValueError, match="Network error connecting to Jira"):
+            await AsyncJiraClient(mock_config).health_check()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_health_check_auth_failure(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test health check reports authentication failures."""
+        make_http_client(mock_client_class, make_response(401))
+
+        with pytest.raises(ValueError, match="Authentication failed"):
+            await AsyncJiraClient(mock_config).health_check()
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_issue_not_found(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test get_issue reports missing issues by key."""
+        make_http_client(mock_client_class, make_response(404))
+
+        with pytest.raises(ValueError, match="Issue PROJ-999 not found"):
+            await AsyncJiraClient(mock_config).get_issue("PROJ-999")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schema_success(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test getting project schema returns field definitions."""
+        data = {"projects": [{"issuetypes": [{"fields": {"summary": {"name": "Summary", "required": True}}}]}]}
+        http = make_http_client(mock_client_class, make_response(200, data))
+
+        schema = await AsyncJiraClient(mock_config).get_project_schema("PROJ", "Bug")
+
+        assert schema == [{"key": "summary", "name": "Summary", "required": True}]
+        assert http.request.call_args[1]["params"]["projectKeys"] == "PROJ"
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schema_404(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test createmeta 404 explains possible causes."""
+        make_http_client(mock_client_class, make_response(404))
+
+        with pytest.raises(ValueError, match="Project schema not found"):
+            await AsyncJiraClient(mock_config).get_project_schema("PROJ", "Bug")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schema_no_projects(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test createmeta with no projects reports missing data."""
+        make_http_client(mock_client_class, make_response(200, {"projects": []}))
+
+        with pytest.raises(ValueError, match="returned no data"):
+            await AsyncJiraClient(mock_config).get_project_schema("PROJ", "Bug")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schema_no_issue_types(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test createmeta with no issue types reports the missing type."""
+        make_http_client(mock_client_class, make_response(200, {"projects": [{"issuetypes": []}]}))
+
+        with pytest.raises(ValueError, match="Issue type 'Bug' not found"):
+            await AsyncJiraClient(mock_config).get_project_schema("PROJ", "Bug")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schemas_success(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test one createmeta request returns fields for every issue type."""
+        data = {
+            "projects": [
+                {
+                    "issuetypes": [
+                        {"name": "Bug", "fields": {"summary": {"name": "Summary", "required": True}}},
+                        {"name": "Task", "fields": {}},
+                    ]
+                }
+            ]
+        }
+        http = make_http_client(mock_client_class, make_response(200, data))
+
+        schemas = await AsyncJiraClient(mock_config).get_project_schemas("PROJ")
+
+        assert schemas == {"Bug": [{"key": "summary", "name": "Summary", "required": True}], "Task": []}
+        params = http.request.call_args[1]["params"]
+        assert params == {"projectKeys": "PROJ", "expand": "projects.issuetypes.fields"}
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schemas_404(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test createmeta 404 for a whole project."""
+        make_http_client(mock_client_class, make_response(404))
+
+        with pytest.raises(ValueError, match="Project 'PROJ' not found"):
+            await AsyncJiraClient(mock_config).get_project_schemas("PROJ")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_get_project_schemas_no_projects(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test createmeta with no projects reports missing data."""
+        make_http_client(mock_client_class, make_response(200, {"projects": []}))
+
+        with pytest.raises(ValueError, match="returned no data"):
+            await AsyncJiraClient(mock_config).get_project_schemas("PROJ")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_issues_sends_payload(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test search posts JQL and pagination parameters."""
+        http = make_http_client(mock_client_class, make_response(200, {"total": 0, "issues": []}))
+
+        result = await AsyncJiraClient(mock_config).search_issues("project = PROJ", max_results=10, start_at=20)
+
+        assert result["total"] == 0
+        assert json.loads(http.request.call_args[1]["content"]) == {
+            "jql": "project = PROJ",
+            "maxResults": 10,
+            "startAt": 20,
+        }
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_create_filter_with_description(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test filter creation includes the optional description."""
+        http = make_http_client(mock_client_class, make_response(200, {"id": "10000"}))
+
+        result = await AsyncJiraClient(mock_config).create_filter("F", "project = PROJ", description="Mine")
+
+        assert result["id"] == "10000"
+        assert json.loads(http.request.call_args[1]["content"])["description"] == "Mine"
+
+    @pytest.mark.asyncio
+    async def test_update_filter_requires_fields(self, mock_config: JiraConfig) -> None:
+        """Test filter update without fields is rejected before any request."""
+        with pytest.raises(ValueError, match="At least one field"):
+            await AsyncJiraClient(mock_config).update_filter("10000")
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_transition_issue_with_fields(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test transitions include required fields."""
+        http = make_http_client(mock_client_class, make_response(204))
+
+        await AsyncJiraClient(mock_config).transition_issue("PROJ-1", "31", fields={"resolution": {"name": "Done"}})
+
+        assert json.loads(http.request.call_args[1]["content"]) == {
+            "transition": {"id": "31"},
+            "fields": {"resolution": {"name": "Done"}},
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,verb,kwargs,status,expected",
+        [
+            ("get_issue", "get", {"issue_key": "PROJ-1"}, 200, {"key": "PROJ-1"}),
+            ("create_issue", "post", {"issue_data": {"fields": {}}}, 201, {"key": "PROJ-2"}),
+            ("update_issue", "put", {"issue_key": "PROJ-1", "update_data": {"fields": {}}}, 204, None),
+            ("create_filter", "post", {"name": "F", "jql": "project = PROJ"}, 200, {"id": "1"}),
+            ("list_filters", "get", {}, 200, [{"id": "1"}]),
+            ("get_filter", "get", {"filter_id": "10000"}, 200, {"id": "10000"}),
+            ("update_filter", "put", {"filter_id": "10000", "favourite": True}, 200, {"id": "10000"}),
+            ("delete_filter", "delete", {"filter_id": "10000"}, 204, None),
+            ("get_transitions", "get", {"issue_key": "PROJ-1"}, 200, {"transitions": []}),
+            ("transition_issue", "post", {"issue_key": "PROJ-1", "transition_id": "21"}, 204, None),
+            ("add_comment", "post", {"issue_key": "PROJ-1", "body": "Hi"}, 201, {"id": "1"}),
+            ("list_comments", "get", {"issue_key": "PROJ-1"}, 200, {"comments": []}),
+            ("update_comment", "put", {"issue_key": "PROJ-1", "comment_id": "1", "body": "Hi"}, 200, {"id": "1"}),
+            ("delete_comment", "delete", {"issue_key": "PROJ-1", "comment_id": "1"}, 204, None),
+        ],
+    )
+    @patch("httpx.AsyncClient")
+    async def test_endpoint_success(
+        self,
+        mock_client_class: Mock,
+        mock_config: JiraConfig,
+        method: str,
+        verb: str,
+        kwargs: Dict[str, Any],
+        status: int,
+        expected: Any,
+    ) -> None:
+        """Test each endpoint returns the parsed body (or None for empty responses)."""
+        http = make_http_client(mock_client_class, make_response(status, expected))
+
+        result = await getattr(AsyncJiraClient(mock_config), method)(**kwargs)
+
+        assert result == expected
+        http.request.assert_awaited_once()
+        assert http.request.call_args[0][0] == verb.upper()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,verb,kwargs,message", ENDPOINTS)
+    @patch("httpx.AsyncClient")
+    async def test_endpoint_error(
+        self,
+        mock_client_class: Mock,
+        mock_config: JiraConfig,
+        method: str,
+        verb: str,
+        kwargs: Dict[str, Any],
+        message: str,
+    ) -> None:
+        """Test each endpoint maps unexpected status codes through the shared error handler."""
+        make_http_client(mock_client_class, make_response(500))
+
+        with pytest.raises(ValueError, match=r"Jira API error \(500\)"):
+            await getattr(AsyncJiraClient(mock_config), method)(**kwargs)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,verb,kwargs,message", ENDPOINTS)
+    @patch("httpx.AsyncClient")
+    async def test_endpoint_timeout(
+        self,
+        mock_client_class: Mock,
+        mock_config: JiraConfig,
+        method: str,
+        verb: str,
+        kwargs: Dict[str, Any],
+        message: str,
+    ) -> None:
+        """Test each endpoint maps timeouts to an endpoint-specific message."""
+        make_http_client(mock_client_class, side_effect=httpx.TimeoutException("Timed out"))
+
+        with pytest.raises(ValueError, match=message):
+            await getattr(AsyncJiraClient(mock_config), method)(**kwargs)
+
+
+def make_search_page(start_at: int, count: int, total: int) -> Mock:
+    """Create a mock search response page with ``count`` issues starting at ``start_at``."""
+    issues = [{"key": f"PROJ-{start_at + i + 1}"} for i in range(count)]
+    return make_response(200, {"startAt": start_at, "maxResults": count, "total": total, "issues": issues})
+
+
+class TestAsyncJiraClientSearchIteration:
+    """Tests for async auto-paginating search iterators."""
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_iter_search_walks_all_pages(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that iter_search yields every issue across pages."""
+        http = make_http_client(
+            mock_client_class,
+            "post",
+            side_effect=[make_search_page(0, 2, 3), make_search_page(2, 1, 3)],
+        )
+
+        client = AsyncJiraClient(mock_config)
+        keys = [issue["key"] async for issue in client.iter_search("project = PROJ", page_size=2)]
+
+        assert keys == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert [json.loads(c[1]["content"])["startAt"] for c in http.request.call_args_list] == [0, 2]
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_iter_search_pages_respects_limit(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that iteration stops once the limit is reached."""
+        http = make_http_client(
+            mock_client_class,
+            "post",
+            side_effect=[make_search_page(0, 2, 100), make_search_page(2, 1, 100)],
+        )
+
+        client = AsyncJiraClient(mock_config)
+        pages = [page async for page in client.iter_search_pages("project = PROJ", page_size=2, limit=3)]
+
+        assert len(pages) == 2
+        assert json.loads(http.request.call_args_list[1][1]["content"])["maxResults"] == 1
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_iter_search_stops_on_empty_page(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that an empty page ends iteration."""
+        make_http_client(mock_client_class, make_search_page(0, 0, 10))
+
+        client = AsyncJiraClient(mock_config)
+
+        assert [issue async for issue in client.iter_search("project = PROJ")] == []
+
+
+class TestAsyncJiraClientSearchAll:
+    """Tests for async concurrent multi-page search collection."""
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_all_bounds_concurrency(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that pages are reassembled in order with at most fan_out requests in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def post(method: str, url: str, content: bytes) -> Mock:
+            nonlocal in_flight, peak
+            body = json.loads(content)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages finish first to prove results are reordered by offset
+            await asyncio.sleep(0.001 * (10 - body["startAt"]))
+            in_flight -= 1
+            return make_search_page(body["startAt"], min(body["maxResults"], 10 - body["startAt"]), 10)
+
+        http = AsyncMock()
+        http.request.side_effect = post
+        mock_client_class.return_value = http
+
+        client = AsyncJiraClient(mock_config)
+        result = await client.search_all("project = PROJ", page_size=2, fan_out=2)
+
+        assert [issue["key"] for issue in result["issues"]] == [f"PROJ-{i}" for i in range(1, 11)]
+        assert http.request.await_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_all_cancels_other_pages_on_failure(
+        self, mock_client_class: Mock, mock_config: JiraConfig
+    ) -> None:
+        """Test that a failed page cancels the page requests still in flight before the error is raised."""
+        cancelled: List[int] = []
+
+        async def post(method: str, url: str, content: bytes) -> Mock:
+            start_at = json.loads(content)["startAt"]
+            if start_at == 0:
+                return make_search_page(0, 2, 6)
+            if start_at == 2:
+                return make_response(500)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start_at)
+                raise
+            raise AssertionError("the page request was not cancelled")
+
+        make_http_client(mock_client_class, side_effect=post)
+
+        client = AsyncJiraClient(mock_config)
+        with pytest.raises(ValueError, match="Jira API error \\(500\\)"):
+            await client.search_all("project = PROJ", page_size=2, fan_out=2)
+
+        assert cancelled == [4]
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_all_fetches_issues_pushed_past_the_pages(
+        self, mock_client_class: Mock, mock_config: JiraConfig
+    ) -> None:
+        """Test that a limited search still returns ``limit`` issues when a shift produces a duplicate."""
+        keys = [f"PROJ-{i}" for i in range(1, 7)]
+
+        async def post(method: str, url: str, content: bytes) -> Mock:
+            body = json.loads(content)
+            issues = [{"key": key} for key in keys[body["startAt"] : body["startAt"] + body["maxResults"]]]
+            page = make_response(200, {"total": len(keys), "issues": issues})
+            if "PROJ-0" not in keys:
+                keys.insert(0, "PROJ-0")
+            return page
+
+        http = make_http_client(mock_client_class, side_effect=post)
+
+        client = AsyncJiraClient(mock_config)
+        result = await client.search_all("project = PROJ", page_size=2, limit=4)
+
+        assert [issue["key"] for issue in result["issues"]] == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4"]
+        assert http.request.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_all_stops_when_missing_tail_is_empty(
+        self, mock_client_class: Mock, mock_config: JiraConfig
+    ) -> None:
+        """Test that a short result is returned when the missing issues are gone."""
+        pages = [make_search_page(0, 2, 4), make_search_page(1, 2, 5), make_search_page(4, 0, 5)]
+        http = make_http_client(mock_client_class, side_effect=pages)
+
+        client = AsyncJiraClient(mock_config)
+        result = await client.search_all("project = PROJ", page_size=2)
+
+        assert len(result["issues"]) == 3
+        assert http.request.await_count == 3
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient")
+    async def test_search_all_single_page(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that a short result needs only the first request."""
+        http = make_http_client(mock_client_class, make_search_page(0, 3, 3))
+
+        client = AsyncJiraClient(mock_config)
+        result = await client.search_all("project = PROJ")
+
+        assert len(result["issues"]) == 3
+        assert http.request.await_count == 1
+
+
+class TestAsyncJiraClientRateLimit:
+    """Test the async client's transport stack."""
+
+    @pytest.mark.asyncio
+    async def test_shared_rate_limiter(self) -> None:
+        """Test that a limiter passed in is shared and applied to async requests."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", rate_limit=10, rate_limit_burst=1)
+        limiter = RateLimiter.from_config(config)
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=handler):
+            client = AsyncJiraClient(config, limiter)
+            await client.get_issue("PROJ-1")
+            await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert client.rate_limiter is limiter
+        assert limiter.get_stats()["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_request_metrics(self) -> None:
+        """Test that metrics passed in are shared and record async requests."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        metrics = RequestMetrics()
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=handler):
+            client = AsyncJiraClient(config, metrics=metrics)
+            await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert client.request_metrics is metrics
+        assert metrics.get_stats()["endpoints"]["issue"]["status_codes"] == {"200": 1}
+
+    @pytest.mark.asyncio
+    async def test_tracing(self) -> None:
+        """Test that async requests run in a span when tracing is on."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", tracing=True)
+        tracer = MagicMock()
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=handler), patch("jira_mcp_server.tracing._tracer", tracer):
+            client = AsyncJiraClient(config)
+            await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert tracer.start_as_current_span.call_args[0] == ("GET issue",)
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker(self) -> None:
+        """Test that the async client fails fast once searches keep timing out."""
+        config = JiraConfig(
+            url="https://jira.test.com", token="test-token-123", max_retries=0, circuit_breaker_threshold=1
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("GC pause", request=request)
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            with pytest.raises(ValueError, match="Timeout"):
+                await client.search_issues("project = PROJ")
+            with pytest.raises(ValueError, match="Jira search requests are failing fast"):
+                await client.search_issues("project = PROJ")
+            await client.aclose()
+
+        assert client.circuit_breakers is not None
+        assert client.circuit_breakers.get_stats()["search"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_tool_deadline_spans_requests(self) -> None:
+        """Test that a multi-request tool call is bounded as a whole and its stuck request is cancelled."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        read_timeouts = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            read_timeouts.append(request.extensions["timeout"]["read"])
+            if request.method == "PUT":
+                return httpx.Response(204)
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"key": "PROJ-1"})  # pragma: no cover
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+
+            @with_deadline
+            async def update_then_get() -> Dict[str, Any]:
+                await client.update_issue("PROJ-1", {"fields": {"summary": "New"}})
+                return await client.get_issue("PROJ-1")
+
+            configure_deadline(0.05)
+            try:
+                with pytest.raises(ValueError, match="update_then_get did not finish within its 0.05 second deadline"):
+                    await update_then_get()
+            finally:
+                configure_deadline(0)
+            await client.aclose()
+
+        assert len(read_timeouts) == 2
+        assert all(timeout <= 0.05 for timeout in read_timeouts)
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_disabled(self) -> None:
+        """Test that JIRA_MCP_CIRCUIT_BREAKER_THRESHOLD=0 removes the breaker."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", circuit_breaker_threshold=0)
+
+        assert AsyncJiraClient(config).circuit_breakers is None
+
+    @pytest.mark.asyncio
+    async def test_hedged_reads(self) -> None:
+        """Test that a read stuck behind a slow node is answered by its hedge."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", hedge_requests=True)
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 11:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            assert client.hedger is not None
+            for _ in range(20):
+                client.hedger.observe("issue", 0.01)
+            for _ in range(10):
+                await client.get_issue("PROJ-1")
+            await asyncio.wait_for(client.get_issue("PROJ-1"), 1)
+            await client.aclose()
+
+        assert client.hedger.get_stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_adaptive_concurrency(self) -> None:
+        """Test that the async client adds its own AIMD limit when enabled."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", adaptive_concurrency=True)
+        handler = httpx.MockTransport(lambda request: httpx.Response(503))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=handler):
+            client = AsyncJiraClient(config)
+            with pytest.raises(ValueError):
+                await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert client.concurrency_limit is not None
+        assert client.concurrency_limit.get_stats()["decreases"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_schema_fetches_are_coalesced(self) -> None:
+        """Test that concurrent identical createmeta requests share one network call."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        calls = 0
+        data = {"projects": [{"issuetypes": [{"fields": {"summary": {"name": "Summary"}}}]}]}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=data)
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            schemas = await asyncio.gather(*(client.get_project_schema("PROJ", "Bug") for _ in range(5)))
+            other = await client.get_project_schema("PROJ", "Task")
+            await client.aclose()
+
+        assert calls == 2
+        assert all(schema == [{"key": "summary", "name": "Summary"}] for schema in schemas)
+        assert other == schemas[0]
+        assert client.coalescing_metrics.get_stats() == {"sent": 2, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_repeat_issue_read_probes_updated(self) -> None:
+        """Test that an issue without validators is revalidated with a fields=updated probe."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        queries = []
+        issue = {"key": "PROJ-1", "fields": {"summary": "Test", "updated": "2026-10-14T10:00:00.000+0000"}}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            queries.append(request.url.params.get("fields"))
+            return httpx.Response(200, json=issue)
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            first = await client.get_issue("PROJ-1")
+            second = await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert first == second == issue
+        assert queries == [None, "updated"]
+        assert client.http_cache is not None
+        assert client.http_cache.get_stats()["probes"] == 1
+
+
+class TestAsyncJiraClientSearchStreaming:
+    """Tests for incrementally parsed search responses on the async client."""
+
+    @staticmethod
+    def handler(requests: list, total: int) -> Any:
+        """Build a mock Jira handler serving search pages as an async byte stream."""
+
+        async def chunks(data: bytes) -> AsyncIterator[bytes]:
+            for i in range(0, len(data), 5):
+                yield data[i : i + 5]
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body = json.loads(request.content)
+            keys = range(body["startAt"], min(total, body["startAt"] + body["maxResults"]))
+            page = {"startAt": body["startAt"], "total": total, "issues": [{"key": f"PROJ-{k}"} for k in keys]}
+            return httpx.Response(200, content=chunks(json.dumps(page).encode()))
+
+        return handle
+
+    @pytest.mark.asyncio
+    async def test_stream_search(self, mock_config: JiraConfig) -> None:
+        """Test issues and page metadata are parsed from the streamed body."""
+        requests: list = []
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(self.handler(requests, total=4))):
+            client = AsyncJiraClient(mock_config)
+            page: Dict[str, Any] = {}
+            keys = [issue["key"] async for issue in client.stream_search("project = PROJ", max_results=2, page=page)]
+            await client.aclose()
+
+        assert keys == ["PROJ-0", "PROJ-1"]
+        assert page == {"startAt": 0, "total": 4, "issues": []}
+        assert client.coalescing_metrics.get_stats()["sent"] == 0
+
+    @pytest.mark.asyncio
+    async def test_iter_search_streams_every_page(self, mock_config: JiraConfig) -> None:
+        """Test stream=True walks pages until the total or the limit."""
+        requests: list = []
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(self.handler(requests, total=5))):
+            client = AsyncJiraClient(mock_config)
+            keys = [issue["key"] async for issue in client.iter_search("project = PROJ", page_size=2, stream=True)]
+            limited = [i async for i in client.iter_search("project = PROJ", page_size=2, limit=3, stream=True)]
+            await client.aclose()
+
+        assert keys == [f"PROJ-{k}" for k in range(5)]
+        assert len(limited) == 3
+        assert [json.loads(r.content)["startAt"] for r in requests] == [0, 2, 4, 0, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_search_stream_stops_on_empty_page(self, mock_config: JiraConfig) -> None:
+        """Test an empty page ends iteration."""
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"total": 10, "issues": []}))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=handler):
+            client = AsyncJiraClient(mock_config)
+            assert [i async for i in client.iter_search("project = PROJ", stream=True)] == []
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_search_errors(self) -> None:
+        """Test error statuses and timeouts are mapped to ValueError."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", max_retries=0)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "timeout" in json.loads(request.content)["jql"]:
+                raise httpx.ReadTimeout("slow", request=request)
+            return httpx.Response(400, json={"errorMessages": ["Invalid JQL"]})
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            with pytest.raises(ValueError, match="Validation error: Invalid JQL"):
+                [i async for i in client.stream_search("bad jql")]
+            with pytest.raises(ValueError, match="Timeout executing search query"):
+                [i async for i in client.stream_search("timeout")]
+            await client.aclose()
+
+
+class TestAsyncRefusedRequests:
+    """Test requests the pipeline refuses to send are reported as ValueError by every method."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call", CLIENT_CALLS)
+    async def test_open_circuit(self, call: Callable[[AsyncJiraClient], Awaitable[Any]]) -> None:
+        """Test an open circuit fails fast with its reason instead of a raw httpx error."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={})
+
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", circuit_breaker_threshold=1)
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(config)
+            assert client.circuit_breakers is not None
+            for breaker in client.circuit_breakers._breakers.values():
+                breaker.on_failure()
+
+            with pytest.raises(ValueError, match=r"requests are failing fast .*retrying in 30s"):
+                await call(client)
+            await client.aclose()
+
+        assert sent == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("call", CLIENT_CALLS)
+    async def test_expired_deadline(self, call: Callable[[AsyncJiraClient], Awaitable[Any]]) -> None:
+        """Test a spent tool deadline is reported as such, not as Jira being unreachable."""
+        handler = Mock(return_value=httpx.Response(200, json={}))
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(JiraConfig(url="https://jira.test.com", token="test-token-123"))
+            with deadline(0):
+                with pytest.raises(ValueError, match="Tool call deadline exceeded .* JIRA_MCP_TOOL_DEADLINE"):
+                    await call(client)
+            await client.aclose()
+
+        handler.assert_not_called()
@@ -0,0 +1,267 @@
+"""Integration tests running JiraClient and AsyncJiraClient against the fake Jira server"""
+
+import asyncio
+import time
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.jira_client import JiraClient
+from tests.fake_jira import FakeJira, constant, lognormal, uniform
+
+
+def make_config(**overrides: Any) -> JiraConfig:
+    return JiraConfig(url="https://jira.test.com", token="test-token-123", search_cache_ttl=0, **overrides)
+
+
+def sync_client(fake: FakeJira, **overrides: Any) -> JiraClient:
+    with patch("httpx.HTTPTransport", return_value=fake.transport()):
+        client = JiraClient(make_config(**overrides))
+        client._get_http_client()
+    return client
+
+
+@pytest.fixture
+def fake() -> FakeJira:
+    return FakeJira(issues=250, custom_fields=7)
+
+
+@pytest.fixture
+def client(fake: FakeJira) -> Iterator[JiraClient]:
+    client = sync_client(fake)
+    yield client
+    client.close()
+
+
+class TestFakeJiraEndpoints:
+    """Test every endpoint the clients use is served."""
+
+    def test_health_check(self, client: JiraClient) -> None:
+        """Test serverInfo answers the health check."""
+        assert client.health_check() == {
+            "connected": True,
+            "server_version": "9.12.0",
+            "base_url": "https://jira.test.com",
+        }
+
+    def test_get_issue_with_fields(self, client: JiraClient) -> None:
+        """Test issues are generated and the fields parameter selects what is returned."""
+        issue = client.get_issue("PROJ-7", fields=["summary", "updated"])
+
+        assert issue["key"] == "PROJ-7"
+        assert set(issue["fields"]) == {"summary", "updated"}
+        assert len(client.get_issue("PROJ-7")["fields"]["customfield_10006"]) > 0
+
+    def test_projected_issue_is_revalidated(self, client: JiraClient, fake: FakeJira) -> None:
+        """Test a projection without `updated` is still served from the HTTP cache after a probe."""
+        first = client.get_issue("PROJ-7", fields=["summary"])
+        second = client.get_issue("PROJ-7", fields=["summary"])
+
+        assert first == second
+        assert set(second["fields"]) == {"summary", "updated"}
+        assert client.http_cache is not None and client.http_cache.get_stats()["hits"] == 1
+        assert fake.requests["issue"] == 2
+
+    def test_unknown_issue(self, client: JiraClient) -> None:
+        """Test missing issues get Jira's 404."""
+        with pytest.raises(ValueError, match="not found"):
+            client.get_issue("PROJ-999")
+
+    def test_create_and_update_issue(self, client: JiraClient, fake: FakeJira) -> None:
+        """Test created issues get the next key and updates bump their updated time."""
+        created = client.create_issue({"fields": {"project": {"key": "PROJ"}, "summary": "New"}})
+        before = fake.issues["PROJ-251"]["fields"]["updated"]
+        client.update_issue(created["key"], {"fields": {"summary": "Renamed"}})
+
+        assert created["key"] == "PROJ-251"
+        assert fake.issues["PROJ-251"]["fields"]["summary"] == "Renamed"
+        assert fake.issues["PROJ-251"]["fields"]["updated"] > before
+
+    def test_create_issue_validation(self, client: JiraClient) -> None:
+        """Test creates are rejected like Jira rejects them."""
+        with pytest.raises(ValueError, match="summary"):
+            client.create_issue({"fields": {"project": {"key": "PROJ"}}})
+        with pytest.raises(ValueError, match="project"):
+            client.create_issue({"fields": {"project": {"key": "NOPE"}, "summary": "x"}})
+
+    def test_createmeta(self, client: JiraClient) -> None:
+        """Test createmeta serves system and custom field schemas per issue type."""
+        schema = client.get_project_schema("PROJ", "Bug")
+        schemas = client.get_project_schemas("PROJ")
+
+        assert len(schema) == 5 + 7
+        assert next(f for f in schema if f["key"] == "customfield_10003")["allowedValues"][0] == {"value": "Option 0"}
+        assert set(schemas) == {"Task", "Bug", "Story"}
+        with pytest.raises(ValueError, match="not found in project"):
+            client.get_project_schema("PROJ", "Epic")
+        with pytest.raises(ValueError, match="returned no data"):
+            client.get_project_schema("NOPE", "Bug")
+
+    def test_transitions(self, client: JiraClient, fake: FakeJira) -> None:
+        """Test transitions are listed and change the issue's status."""
+        transitions = client.get_transitions("PROJ-1")["transitions"]
+        client.transition_issue("PROJ-1", "31")
+
+        assert [t["name"] for t in transitions] == ["To Do", "In Progress", "Done"]
+        assert fake.issues["PROJ-1"]["fields"]["status"] == {"name": "Done"}
+        with pytest.raises(ValueError):
+            client.transition_issue("PROJ-1", "99")
+
+    def test_comments(self, client: JiraClient) -> None:
+        """Test comments can be added, listed, edited and deleted."""
+        comment = client.add_comment("PROJ-1", "First")
+        client.update_comment("PROJ-1", comment["id"], "Edited")
+
+        assert client.list_comments("PROJ-1")["comments"][0]["body"] == "Edited"
+        client.delete_comment("PROJ-1", comment["id"])
+        assert client.list_comments("PROJ-1")["total"] == 0
+        with pytest.raises(ValueError):
+            client.delete_comment("PROJ-1", comment["id"])
+
+    def test_filters(self, client: JiraClient) -> None:
+        """Test filters can be created, listed, read, updated and deleted."""
+        saved = client.create_filter("Mine", "project = PROJ")
+        client.update_filter(saved["id"], name="Renamed")
+
+        assert client.get_filter(saved["id"])["name"] == "Renamed"
+        assert len(client.list_filters()) == 1
+        client.delete_filter(saved["id"])
+        with pytest.raises(ValueError):
+            client.get_filter(saved["id"])
+
+
+class TestFakeJiraSearch:
+    """Test search pagination."""
+
+    def test_pages_are_capped(self, client: JiraClient, fake: FakeJira) -> None:
+        """Test maxResults above the cap is reduced, and search_all follows the pages."""
+        first = client.search_issues("project = PROJ", max_results=500)
+        result = client.search_all("project = PROJ", page_size=100)
+
+        assert first["maxResults"] == 100 and first["total"] == 250
+        assert len(result["issues"]) == 250
+        assert fake.requests["search"] == 1 + 3
+
+    def test_jql_filters_by_project_and_key(self) -> None:
+        """Test the JQL the fake understands narrows results; anything else matches everything."""
+        fake = FakeJira(issues=10, projects=("PROJ", "OPS"))
+        client = sync_client(fake)
+
+        assert client.search_issues("project = OPS")["total"] == 10
+        assert client.search_issues('key = "ops-3"')["issues"][0]["key"] == "OPS-3"
+        assert client.search_issues("assignee = currentUser()")["total"] == 20
+        client.close()
+
+    def test_search_fields(self, client: JiraClient) -> None:
+        """Test only the requested fields are returned."""
+        page = client.search_issues("project = PROJ", max_results=2, fields=["summary"])
+
+        assert [set(issue["fields"]) for issue in page["issues"]] == [{"summary"}, {"summary"}]
+
+
+class TestFakeJiraFaults:
+    """Test injected failures and their effect on the client."""
+
+    def test_faults_are_retried(self) -> None:
+        """Test injected 429s and 503s are absorbed by the client's retries."""
+        fake = FakeJira(issues=300, faults={429: 0.2, 503: 0.1}, seed=3)
+        client = sync_client(fake, retry_backoff=0.001)
+
+        result = client.search_all("project = PROJ", page_size=50)
+        client.close()
+
+        assert len(result["issues"]) == 300
+        assert sum(fake.faults_injected.values()) > 0
+        assert fake.requests["search"] == 6 + fake.faults_injected["search"]
+
+    def test_fault_response(self) -> None:
+        """Test injected faults look like Jira's, including Retry-After."""
+        fake = FakeJira(faults={429: 1.0}, retry_after=2)
+
+        response = fake.handle(httpx.Request("GET", "https://jira.test.com/rest/api/2/issue/PROJ-1"))
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert fake.faults_injected == {"issue": 1}
+        fake.reset_stats()
+        assert fake.requests == {} and fake.faults_injected == {}
+
+    def test_same_seed_same_run(self) -> None:
+        """Test latency and faults are reproducible for a given seed."""
+
+        def run(seed: int) -> list:
+            fake = FakeJira(issues=1, latency=uniform(0, 0.001), faults={500: 0.5}, seed=seed)
+            return [
+                fake.handle(httpx.Request("GET", "https://jira.test.com/rest/api/2/issue/PROJ-1")).status_code
+                for _ in range(20)
+            ]
+
+        assert run(1) == run(1)
+        assert run(1) != run(2)
+
+    @pytest.mark.parametrize(
+        "faults,message",
+        [
+            ({404: 0.1}, "Cannot inject status 404"),
+            ({500: 1.5}, "must be between 0 and 1"),
+            ({500: 0.6, 503: 0.6}, "add up to at most 1"),
+        ],
+    )
+    def test_invalid_faults(self, faults: dict, message: str) -> None:
+        """Test unsupported fault settings are rejected."""
+        with pytest.raises(ValueError, match=message):
+            FakeJira(faults=faults)
+
+    def test_unknown_paths(self, fake: FakeJira) -> None:
+        """Test paths and methods the fake does not serve get 404 or 405."""
+        assert fake.handle(httpx.Request("GET", "https://jira.test.com/status")).status_code == 404
+        assert fake.handle(httpx.Request("GET", "https://jira.test.com/rest/api/2/myself")).status_code == 404
+        assert fake.handle(httpx.Request("DELETE", "https://jira.test.com/rest/api/2/issue/PROJ-1")).status_code == 405
+        assert fake.handle(httpx.Request("PUT", "https://jira.test.com/rest/api/2/filter")).status_code == 405
+
+
+class TestFakeJiraLatency:
+    """Test simulated latency."""
+
+    def test_latency_models(self) -> None:
+        """Test each model draws delays in its range."""
+        fake = FakeJira(issues=1)
+
+        assert constant(0.2)(fake.rng) == 0.2
+        assert 0.1 <= uniform(0.1, 0.3)(fake.rng) <= 0.3
+        delays = sorted(lognormal(0.05, 0.5)(fake.rng) for _ in range(1001))
+        assert 0.04 < delays[500] < 0.06
+        assert delays[990] > 2 * delays[500]
+
+    def test_sync_latency_per_endpoint(self) -> None:
+        """Test endpoint overrides replace the default delay."""
+        fake = FakeJira(issues=1, latency=constant(0.05), endpoint_latency={"serverinfo": constant(0)})
+        client = sync_client(fake)
+
+        started = time.perf_counter()
+        client.health_check()
+        fast = time.perf_counter() - started
+        started = time.perf_counter()
+        client.get_issue("PROJ-1")
+        slow = time.perf_counter() - started
+        client.close()
+
+        assert fast < 0.05 <= slow
+
+    @pytest.mark.asyncio
+    async def test_async_latency_overlaps(self) -> None:
+        """Test the async transport sleeps without blocking, so concurrent requests overlap."""
+        fake = FakeJira(issues=10, latency=constant(0.05))
+        with patch("httpx.AsyncHTTPTransport", return_value=fake.async_transport()):
+            client = AsyncJiraClient(make_config())
+            started = time.perf_counter()
+            issues = await asyncio.gather(*(client.get_issue(f"PROJ-{n}") for n in range(1, 11)))
+            elapsed = time.perf_counter() - started
+            await client.aclose()
+
+        assert [issue["key"] for issue in issues] == [f"PROJ-{n}" for n in range(1, 11)]
+        assert elapsed < 0.3
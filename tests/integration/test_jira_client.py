@@ -1,12 +1,42 @@
 """Integration tests for JiraClient (T010)"""
 
-from unittest.mock import Mock, patch
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from unittest.mock import MagicMock, Mock, patch
 
 import httpx
 import pytest
 
 from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.deadline import deadline
 from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.single_flight import SingleFlightTransport
+
+# One call of every endpoint method, for behaviour all of them must share
+CLIENT_CALLS = [
+    pytest.param(lambda c: c.health_check(), id="health_check"),
+    pytest.param(lambda c: c.get_issue("PROJ-1"), id="get_issue"),
+    pytest.param(lambda c: c.create_issue({"fields": {}}), id="create_issue"),
+    pytest.param(lambda c: c.update_issue("PROJ-1", {"fields": {}}), id="update_issue"),
+    pytest.param(lambda c: c.get_project_schema("PROJ", "Task"), id="get_project_schema"),
+    pytest.param(lambda c: c.get_project_schemas("PROJ"), id="get_project_schemas"),
+    pytest.param(lambda c: c.search_issues("project = PROJ"), id="search_issues"),
+    pytest.param(lambda c: list(c.stream_search("project = PROJ")), id="stream_search"),
+    pytest.param(lambda c: c.create_filter("Mine", "project = PROJ"), id="create_filter"),
+    pytest.param(lambda c: c.list_filters(), id="list_filters"),
+    pytest.param(lambda c: c.get_filter("1"), id="get_filter"),
+    pytest.param(lambda c: c.update_filter("1", name="Renamed"), id="update_filter"),
+    pytest.param(lambda c: c.delete_filter("1"), id="delete_filter"),
+    pytest.param(lambda c: c.get_transitions("PROJ-1"), id="get_transitions"),
+    pytest.param(lambda c: c.transition_issue("PROJ-1", "31"), id="transition_issue"),
+    pytest.param(lambda c: c.add_comment("PROJ-1", "Hi"), id="add_comment"),
+    pytest.param(lambda c: c.list_comments("PROJ-1"), id="list_comments"),
+    pytest.param(lambda c: c.update_comment("PROJ-1", "1", "Hi"), id="update_comment"),
+    pytest.param(lambda c: c.delete_comment("PROJ-1", "1"), id="delete_comment"),
+]
 
 
 @pytest.fixture
@@ -36,11 +66,11 @@ class TestJiraClient:
         """Test successful health check returns server info."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"version": "8.20.0", "baseUrl": "https://jira.test.com"}
+        mock_response.content = json.dumps({"version": "8.20.0", "baseUrl": "https://jira.test.com"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.health_check()
@@ -59,8 +89,8 @@ class TestJiraClient:
         )
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -72,15 +102,17 @@ class TestJiraClient:
         """Test getting an issue returns correct data."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "key": "PROJ-123",
-            "id": "10001",
-            "fields": {"summary": "Test issue", "status": {"name": "Open"}},
-        }
+        mock_response.content = json.dumps(
+            {
+                "key": "PROJ-123",
+                "id": "10001",
+                "fields": {"summary": "Test issue", "status": {"name": "Open"}},
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         issue = client.get_issue("PROJ-123")
@@ -96,11 +128,11 @@ class TestJiraClient:
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "404 Not Found", request=Mock(), response=mock_response
         )
-        mock_response.json.return_value = {"errorMessages": ["Issue does not exist"]}
+        mock_response.content = json.dumps({"errorMessages": ["Issue does not exist"]}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -112,15 +144,17 @@ class TestJiraClient:
         """Test creating an issue returns the created issue data."""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "key": "PROJ-124",
-            "id": "10002",
-            "self": "https://jira.test.com/rest/api/2/issue/10002",
-        }
+        mock_response.content = json.dumps(
+            {
+                "key": "PROJ-124",
+                "id": "10002",
+                "self": "https://jira.test.com/rest/api/2/issue/10002",
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         issue_data = {"fields": {"project": {"key": "PROJ"}, "summary": "New issue", "issuetype": {"name": "Bug"}}}
@@ -138,11 +172,11 @@ class TestJiraClient:
         mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
             "400 Bad Request", request=Mock(), response=mock_response
         )
-        mock_response.json.return_value = {"errorMessages": [], "errors": {"summary": "Summary is required"}}
+        mock_response.content = json.dumps({"errorMessages": [], "errors": {"summary": "Summary is required"}}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -154,31 +188,33 @@ class TestJiraClient:
         """Test getting project schema returns field definitions."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "projects": [
-                {
-                    "issuetypes": [
-                        {
-                            "fields": {
-                                "summary": {"name": "Summary", "required": True, "schema": {"type": "string"}},
-                                "customfield_10001": {
-                                    "name": "Story Points",
-                                    "required": False,
-                                    "schema": {
-                                        "type": "number",
-                                        "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+        mock_response.content = json.dumps(
+            {
+                "projects": [
+                    {
+                        "issuetypes": [
+                            {
+                                "fields": {
+                                    "summary": {"name": "Summary", "required": True, "schema": {"type": "string"}},
+                                    "customfield_10001": {
+                                        "name": "Story Points",
+                                        "required": False,
+                                        "schema": {
+                                            "type": "number",
+                                            "custom": "com.atlassian.jira.plugin.system.customfieldtypes:float",
+                                        },
                                     },
-                                },
+                                }
                             }
-                        }
-                    ]
-                }
-            ]
-        }
+                        ]
+                    }
+                ]
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         schema = client.get_project_schema("PROJ", "Bug")
@@ -192,11 +228,11 @@ class TestJiraClient:
         """Test getting schema when project not found."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"projects": []}
+        mock_response.content = json.dumps({"projects": []}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -208,11 +244,11 @@ class TestJiraClient:
         """Test getting schema when issue type not found."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"projects": [{"issuetypes": []}]}
+        mock_response.content = json.dumps({"projects": [{"issuetypes": []}]}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -226,8 +262,8 @@ class TestJiraClient:
         mock_response.status_code = 404
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -238,8 +274,8 @@ class TestJiraClient:
     def test_get_project_schema_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test getting schema handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -254,8 +290,8 @@ class TestJiraClient:
         mock_response.text = "Server error"
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -266,8 +302,8 @@ class TestJiraClient:
     def test_client_handles_network_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test client handles network timeouts gracefully."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Request timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Request timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -278,8 +314,8 @@ class TestJiraClient:
     def test_client_handles_network_error(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test client handles network errors."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.NetworkError("Connection refused")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.NetworkError("Connection refused")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -290,8 +326,8 @@ class TestJiraClient:
     def test_get_issue_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test get_issue handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -302,8 +338,8 @@ class TestJiraClient:
     def test_create_issue_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test create_issue handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -314,8 +350,8 @@ class TestJiraClient:
     def test_update_issue_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test update_issue handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.put.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -328,11 +364,11 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request"
-        mock_response.json.return_value = {"errorMessages": ["Invalid field value"], "errors": {}}
+        mock_response.content = json.dumps({"errorMessages": ["Invalid field value"], "errors": {}}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -350,8 +386,8 @@ class TestJiraClient:
         )
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -366,8 +402,8 @@ class TestJiraClient:
         mock_response.text = "Forbidden"
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -386,8 +422,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -401,14 +437,16 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request"
-        mock_response.json.return_value = {
-            "errorMessages": ["Field 'summary' is required", "Priority must be set"],
-            "errors": {},
-        }
+        mock_response.content = json.dumps(
+            {
+                "errorMessages": ["Field 'summary' is required", "Priority must be set"],
+                "errors": {},
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -421,12 +459,11 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request - invalid JSON response"
-        # Raise KeyError (which is caught) instead of generic Exception
-        mock_response.json.side_effect = KeyError("Invalid JSON")
+        mock_response.content = b"Bad request - invalid JSON response"
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -441,8 +478,8 @@ class TestJiraClient:
         mock_response.text = "Internal server error"
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -478,8 +515,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -526,19 +563,21 @@ class TestJiraClient:
         """Test successful issue search."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "total": 2,
-            "maxResults": 100,
-            "startAt": 0,
-            "issues": [
-                {"key": "PROJ-123", "fields": {"summary": "Issue 1"}},
-                {"key": "PROJ-124", "fields": {"summary": "Issue 2"}},
-            ],
-        }
+        mock_response.content = json.dumps(
+            {
+                "total": 2,
+                "maxResults": 100,
+                "startAt": 0,
+                "issues": [
+                    {"key": "PROJ-123", "fields": {"summary": "Issue 1"}},
+                    {"key": "PROJ-124", "fields": {"summary": "Issue 2"}},
+                ],
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.search_issues("project = PROJ")
@@ -552,16 +591,18 @@ class TestJiraClient:
         """Test issue search with pagination parameters."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "total": 100,
-            "maxResults": 50,
-            "startAt": 50,
-            "issues": [],
-        }
+        mock_response.content = json.dumps(
+            {
+                "total": 100,
+                "maxResults": 50,
+                "startAt": 50,
+                "issues": [],
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.search_issues("project = PROJ", max_results=50, start_at=50)
@@ -570,9 +611,9 @@ class TestJiraClient:
         assert result["maxResults"] == 50
 
         # Verify the request was made with correct parameters
-        call_kwargs = mock_client_instance.post.call_args[1]
-        assert call_kwargs["json"]["maxResults"] == 50
-        assert call_kwargs["json"]["startAt"] == 50
+        call_kwargs = mock_client_instance.request.call_args[1]
+        assert json.loads(call_kwargs["content"])["maxResults"] == 50
+        assert json.loads(call_kwargs["content"])["startAt"] == 50
 
     @patch("httpx.Client")
     def test_search_issues_error(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
@@ -580,14 +621,16 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Invalid JQL"
-        mock_response.json.return_value = {
-            "errorMessages": ["JQL syntax error"],
-            "errors": {},
-        }
+        mock_response.content = json.dumps(
+            {
+                "errorMessages": ["JQL syntax error"],
+                "errors": {},
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -598,8 +641,8 @@ class TestJiraClient:
     def test_search_issues_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test search handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -611,11 +654,11 @@ class TestJiraClient:
         """Test creating a filter."""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "10000", "name": "Test Filter", "jql": "project = PROJ"}
+        mock_response.content = json.dumps({"id": "10000", "name": "Test Filter", "jql": "project = PROJ"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.create_filter(name="Test Filter", jql="project = PROJ")
@@ -628,11 +671,11 @@ class TestJiraClient:
         """Test listing filters."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [{"id": "10000", "name": "Filter 1"}]
+        mock_response.content = json.dumps([{"id": "10000", "name": "Filter 1"}]).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.list_filters()
@@ -645,11 +688,11 @@ class TestJiraClient:
         """Test getting a filter."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "10000", "name": "Test Filter", "jql": "project = PROJ"}
+        mock_response.content = json.dumps({"id": "10000", "name": "Test Filter", "jql": "project = PROJ"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.get_filter(filter_id="10000")
@@ -661,11 +704,11 @@ class TestJiraClient:
         """Test updating a filter."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "10000", "name": "Updated Filter"}
+        mock_response.content = json.dumps({"id": "10000", "name": "Updated Filter"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.update_filter(filter_id="10000", name="Updated Filter")
@@ -679,8 +722,8 @@ class TestJiraClient:
         mock_response.status_code = 204
 
         mock_client_instance = Mock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         client.delete_filter(filter_id="10000")
@@ -691,8 +734,8 @@ class TestJiraClient:
     def test_create_filter_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test create filter handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -704,25 +747,25 @@ class TestJiraClient:
         """Test creating a filter with description."""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "10000"}
+        mock_response.content = json.dumps({"id": "10000"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         client.create_filter(name="Test", jql="project = PROJ", description="Test description")
 
         # Verify description was passed
-        call_kwargs = mock_client_instance.post.call_args[1]
-        assert call_kwargs["json"]["description"] == "Test description"
+        call_kwargs = mock_client_instance.request.call_args[1]
+        assert json.loads(call_kwargs["content"])["description"] == "Test description"
 
     @patch("httpx.Client")
     def test_list_filters_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test list filters handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -733,8 +776,8 @@ class TestJiraClient:
     def test_get_filter_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test get filter handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -754,27 +797,27 @@ class TestJiraClient:
         """Test update filter with all fields."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "10000"}
+        mock_response.content = json.dumps({"id": "10000"}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         client.update_filter(filter_id="10000", name="New Name", jql="new jql", description="New Desc", favourite=True)
 
-        call_kwargs = mock_client_instance.put.call_args[1]
-        assert call_kwargs["json"]["name"] == "New Name"
-        assert call_kwargs["json"]["jql"] == "new jql"
-        assert call_kwargs["json"]["description"] == "New Desc"
-        assert call_kwargs["json"]["favourite"] is True
+        call_kwargs = mock_client_instance.request.call_args[1]
+        assert json.loads(call_kwargs["content"])["name"] == "New Name"
+        assert json.loads(call_kwargs["content"])["jql"] == "new jql"
+        assert json.loads(call_kwargs["content"])["description"] == "New Desc"
+        assert json.loads(call_kwargs["content"])["favourite"] is True
 
     @patch("httpx.Client")
     def test_update_filter_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test update filter handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.put.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -785,8 +828,8 @@ class TestJiraClient:
     def test_delete_filter_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test delete filter handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.delete.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -799,11 +842,11 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request"
-        mock_response.json.return_value = {"errorMessages": ["Invalid JQL"], "errors": {}}
+        mock_response.content = json.dumps({"errorMessages": ["Invalid JQL"], "errors": {}}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -818,8 +861,8 @@ class TestJiraClient:
         mock_response.text = "Forbidden"
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -838,8 +881,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -854,8 +897,8 @@ class TestJiraClient:
         mock_response.text = "Forbidden"
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -870,8 +913,8 @@ class TestJiraClient:
         mock_response.text = "Forbidden"
 
         mock_client_instance = Mock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -883,16 +926,18 @@ class TestJiraClient:
         """Test getting available transitions."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "transitions": [
-                {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
-                {"id": "31", "name": "Done", "to": {"name": "Done"}},
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "transitions": [
+                    {"id": "21", "name": "In Progress", "to": {"name": "In Progress"}},
+                    {"id": "31", "name": "Done", "to": {"name": "Done"}},
+                ]
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.get_transitions(issue_key="PROJ-123")
@@ -904,8 +949,8 @@ class TestJiraClient:
     def test_get_transitions_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test get transitions handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -924,8 +969,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -939,8 +984,8 @@ class TestJiraClient:
         mock_response.status_code = 204
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         client.transition_issue(issue_key="PROJ-123", transition_id="21")
@@ -954,23 +999,23 @@ class TestJiraClient:
         mock_response.status_code = 204
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         fields = {"resolution": {"name": "Done"}}
         client.transition_issue(issue_key="PROJ-123", transition_id="31", fields=fields)
 
         # Verify fields were passed
-        call_kwargs = mock_client_instance.post.call_args[1]
-        assert call_kwargs["json"]["fields"] == fields
+        call_kwargs = mock_client_instance.request.call_args[1]
+        assert json.loads(call_kwargs["content"])["fields"] == fields
 
     @patch("httpx.Client")
     def test_transition_issue_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test transition handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -983,11 +1028,11 @@ class TestJiraClient:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request"
-        mock_response.json.return_value = {"errorMessages": ["Invalid transition"], "errors": {}}
+        mock_response.content = json.dumps({"errorMessages": ["Invalid transition"], "errors": {}}).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -999,16 +1044,18 @@ class TestJiraClient:
         """Test adding a comment to an issue."""
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": "10001",
-            "body": "Test comment",
-            "author": {"displayName": "John Doe"},
-            "created": "2025-01-15T10:00:00.000+0000",
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "10001",
+                "body": "Test comment",
+                "author": {"displayName": "John Doe"},
+                "created": "2025-01-15T10:00:00.000+0000",
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.add_comment(issue_key="PROJ-123", body="Test comment")
@@ -1020,8 +1067,8 @@ class TestJiraClient:
     def test_add_comment_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test add comment handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.post.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1040,8 +1087,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.post.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1053,29 +1100,31 @@ class TestJiraClient:
         """Test listing all comments on an issue."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "comments": [
-                {
-                    "id": "10001",
-                    "body": "First comment",
-                    "author": {"displayName": "John Doe"},
-                    "created": "2025-01-15T10:00:00.000+0000",
-                },
-                {
-                    "id": "10002",
-                    "body": "Second comment",
-                    "author": {"displayName": "Jane Smith"},
-                    "created": "2025-01-15T11:00:00.000+0000",
-                },
-            ],
-            "total": 2,
-            "maxResults": 50,
-            "startAt": 0,
-        }
-
-        mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_response.content = json.dumps(
+            {
+                "comments": [
+                    {
+                        "id": "10001",
+                        "body": "First comment",
+                        "author": {"displayName": "John Doe"},
+                        "created": "2025-01-15T10:00:00.000+0000",
+                    },
+                    {
+                        "id": "10002",
+                        "body": "Second comment",
+                        "author": {"displayName": "Jane Smith"},
+                        "created": "2025-01-15T11:00:00.000+0000",
+                    },
+                ],
+                "total": 2,
+                "maxResults": 50,
+                "startAt": 0,
+            }
+        ).encode()
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.list_comments(issue_key="PROJ-123")
@@ -1088,16 +1137,18 @@ class TestJiraClient:
         """Test listing comments when issue has no comments."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "comments": [],
-            "total": 0,
-            "maxResults": 50,
-            "startAt": 0,
-        }
+        mock_response.content = json.dumps(
+            {
+                "comments": [],
+                "total": 0,
+                "maxResults": 50,
+                "startAt": 0,
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.list_comments(issue_key="PROJ-123")
@@ -1109,8 +1160,8 @@ class TestJiraClient:
     def test_list_comments_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test list comments handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.get.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1129,8 +1180,8 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1142,16 +1193,18 @@ class TestJiraClient:
         """Test updating a comment."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "10001",
-            "body": "Updated comment",
-            "author": {"displayName": "John Doe"},
-            "updated": "2025-01-15T12:00:00.000+0000",
-        }
+        mock_response.content = json.dumps(
+            {
+                "id": "10001",
+                "body": "Updated comment",
+                "author": {"displayName": "John Doe"},
+                "updated": "2025-01-15T12:00:00.000+0000",
+            }
+        ).encode()
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         result = client.update_comment(issue_key="PROJ-123", comment_id="10001", body="Updated comment")
@@ -1163,8 +1216,8 @@ class TestJiraClient:
     def test_update_comment_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test update comment handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.put.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1179,8 +1232,8 @@ class TestJiraClient:
         mock_response.text = "Forbidden"
 
         mock_client_instance = Mock()
-        mock_client_instance.put.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1194,8 +1247,8 @@ class TestJiraClient:
         mock_response.status_code = 204
 
         mock_client_instance = Mock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
         client.delete_comment(issue_key="PROJ-123", comment_id="10001")
@@ -1206,8 +1259,8 @@ class TestJiraClient:
     def test_delete_comment_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
         """Test delete comment handles timeout."""
         mock_client_instance = Mock()
-        mock_client_instance.delete.side_effect = httpx.TimeoutException("Timed out")
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
@@ -1225,10 +1278,889 @@ class TestJiraClient:
         mock_response.request = mock_request
 
         mock_client_instance = Mock()
-        mock_client_instance.delete.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client_instance
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
 
         client = JiraClient(mock_config)
 
         with pytest.raises(ValueError, match="does not exist"):
             client.delete_comment(issue_key="PROJ-123", comment_id="10001")
+
+
+class TestJiraClientConnectionPool:
+    """Tests for the pooled HTTP client lifecycle."""
+
+    def test_pool_limits_from_config(self) -> None:
+        """Test that pool limits are taken from JiraConfig."""
+        config = JiraConfig(
+            url="https://jira.test.com",
+            token="test-token-123",
+            max_connections=5,
+            max_keepalive_connections=2,
+            keepalive_expiry=12.5,
+        )
+
+        client = JiraClient(config)
+
+        assert client.limits.max_connections == 5
+        assert client.limits.max_keepalive_connections == 2
+        assert client.limits.keepalive_expiry == 12.5
+
+    @patch("httpx.Client")
+    def test_http_client_reused_across_calls(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that one httpx.Client is created and reused for every request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"key": "PROJ-123"}).encode()
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.get_issue("PROJ-123")
+        client.get_issue("PROJ-124")
+        client.get_transitions("PROJ-123")
+
+        mock_client_class.assert_called_once()
+        assert mock_client_class.call_args[1]["timeout"] == 30
+        assert isinstance(mock_client_class.call_args[1]["transport"], SingleFlightTransport)
+        assert mock_client_instance.request.call_count == 3
+
+    @patch("httpx.Client")
+    def test_close_releases_http_client(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that close() closes the pooled client and a later call opens a new one."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"key": "PROJ-123"}).encode()
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.get_issue("PROJ-123")
+        client.close()
+
+        mock_client_instance.close.assert_called_once()
+
+        client.get_issue("PROJ-123")
+        assert mock_client_class.call_count == 2
+
+    @patch("httpx.Client")
+    def test_close_without_requests_is_noop(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that closing an unused client does not create a connection pool."""
+        client = JiraClient(mock_config)
+        client.close()
+
+        mock_client_class.assert_not_called()
+
+    @patch("httpx.Client")
+    def test_context_manager_closes_client(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that using JiraClient as a context manager closes the pool on exit."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"version": "8.20.0", "baseUrl": "https://jira.test.com"}).encode()
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        with JiraClient(mock_config) as client:
+            client.health_check()
+
+        mock_client_instance.close.assert_called_once()
+
+
+def _search_page(start_at: int, count: int, total: int) -> Mock:
+    """Create a mock search response page with ``count`` issues starting at ``start_at``."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(
+        {
+            "startAt": start_at,
+            "maxResults": count,
+            "total": total,
+            "issues": [{"key": f"PROJ-{start_at + i + 1}"} for i in range(count)],
+        }
+    ).encode()
+    return mock_response
+
+
+class TestJiraClientSearchIteration:
+    """Tests for auto-paginating search iterators."""
+
+    @patch("httpx.Client")
+    def test_iter_search_walks_all_pages(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that iter_search yields every issue and requests consecutive offsets."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 2, 5), _search_page(2, 2, 5), _search_page(4, 1, 5)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        keys = [issue["key"] for issue in client.iter_search("project = PROJ", page_size=2)]
+
+        assert keys == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4", "PROJ-5"]
+        offsets = [json.loads(c[1]["content"])["startAt"] for c in mock_client_instance.request.call_args_list]
+        assert offsets == [0, 2, 4]
+
+    @patch("httpx.Client")
+    def test_iter_search_is_lazy(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that the next page is only requested once the current one is consumed."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 2, 4), _search_page(2, 2, 4)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        issues = client.iter_search("project = PROJ", page_size=2)
+
+        assert next(issues)["key"] == "PROJ-1"
+        assert next(issues)["key"] == "PROJ-2"
+        assert mock_client_instance.request.call_count == 1
+
+        assert next(issues)["key"] == "PROJ-3"
+        assert mock_client_instance.request.call_count == 2
+
+    @patch("httpx.Client")
+    def test_iter_search_pages_respects_limit(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that the final page only requests the issues still needed."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(10, 3, 100), _search_page(13, 2, 100)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        pages = list(client.iter_search_pages("project = PROJ", page_size=3, start_at=10, limit=5))
+
+        assert len(pages) == 2
+        requests = [json.loads(c[1]["content"]) for c in mock_client_instance.request.call_args_list]
+        assert [(r["startAt"], r["maxResults"]) for r in requests] == [(10, 3), (13, 2)]
+
+    @patch("httpx.Client")
+    def test_iter_search_follows_server_page_cap(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that offsets advance by the issues actually returned when Jira caps the page size."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 2, 3), _search_page(2, 1, 3)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        issues = list(client.iter_search("project = PROJ", page_size=50))
+
+        assert len(issues) == 3
+        assert json.loads(mock_client_instance.request.call_args_list[1][1]["content"])["startAt"] == 2
+
+    @patch("httpx.Client")
+    def test_iter_search_stops_on_empty_page(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that an empty page ends iteration even if total claims more issues."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 0, 10)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+
+        assert list(client.iter_search("project = PROJ")) == []
+        assert mock_client_instance.request.call_count == 1
+
+
+class TestJiraClientSearchAll:
+    """Tests for concurrent multi-page search collection."""
+
+    def _post_by_offset(self, total: int, page_cap: int = 100) -> Mock:
+        """Build a request side effect that serves pages by requested startAt."""
+
+        def post(method: str, url: str, content: bytes) -> Mock:
+            body = json.loads(content)
+            count = max(0, min(body["maxResults"], page_cap, total - body["startAt"]))
+            return _search_page(body["startAt"], count, total)
+
+        return Mock(side_effect=post)
+
+    @patch("httpx.Client")
+    def test_search_all_fetches_remaining_pages(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that every remaining offset is requested and issues come back in order."""
+        mock_client_instance = Mock()
+        mock_client_instance.request = self._post_by_offset(total=7)
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ", page_size=2, fan_out=3)
+
+        assert [issue["key"] for issue in result["issues"]] == [f"PROJ-{i}" for i in range(1, 8)]
+        assert result["total"] == 7
+        assert result["startAt"] == 0
+        assert result["maxResults"] == 7
+        offsets = sorted(json.loads(c[1]["content"])["startAt"] for c in mock_client_instance.request.call_args_list)
+        assert offsets == [0, 2, 4, 6]
+
+    @patch("httpx.Client")
+    def test_search_all_respects_limit_and_server_cap(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that offsets step by Jira's actual page size and stop at the limit."""
+        mock_client_instance = Mock()
+        mock_client_instance.request = self._post_by_offset(total=1000, page_cap=50)
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ", page_size=100, start_at=10, limit=120)
+
+        assert len(result["issues"]) == 120
+        assert result["issues"][0]["key"] == "PROJ-11"
+        assert result["maxResults"] == 120
+        requests = sorted(
+            (json.loads(c[1]["content"])["startAt"], json.loads(c[1]["content"])["maxResults"])
+            for c in mock_client_instance.request.call_args_list
+        )
+        assert requests == [(10, 100), (60, 50), (110, 20)]
+
+    @patch("httpx.Client")
+    def test_search_all_deduplicates_shifted_issues(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that an issue seen on two pages is only returned once."""
+        shifted = _search_page(2, 2, 4)
+        page = json.loads(shifted.content)
+        page["issues"][0] = {"key": "PROJ-2"}
+        shifted.content = json.dumps(page).encode()
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 2, 4), shifted]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ", page_size=2)
+
+        assert [issue["key"] for issue in result["issues"]] == ["PROJ-1", "PROJ-2", "PROJ-4"]
+
+    @patch("httpx.Client")
+    def test_search_all_fetches_issues_pushed_past_the_pages(
+        self, mock_client_class: Mock, mock_config: JiraConfig
+    ) -> None:
+        """Test that an issue created mid-search does not leave the result short after de-duplication."""
+        keys = [f"PROJ-{i}" for i in range(1, 7)]
+
+        def post(method: str, url: str, content: bytes) -> Mock:
+            body = json.loads(content)
+            page = _search_page(0, 0, len(keys))
+            page.content = json.dumps(
+                {
+                    "total": len(keys),
+                    "issues": [{"key": key} for key in keys[body["startAt"] : body["startAt"] + body["maxResults"]]],
+                }
+            ).encode()
+            if "PROJ-0" not in keys:
+                # Created after the first page, ahead of every issue: the rest shift back by one
+                keys.insert(0, "PROJ-0")
+            return page
+
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = post
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ", page_size=2, fan_out=1)
+
+        # PROJ-2 comes back twice and PROJ-6 moves to offset 6, past the pages requested
+        assert [issue["key"] for issue in result["issues"]] == [f"PROJ-{i}" for i in range(1, 7)]
+        assert result["total"] == 7
+        requests = [json.loads(c[1]["content"]) for c in mock_client_instance.request.call_args_list]
+        assert [(r["startAt"], r["maxResults"]) for r in requests] == [(0, 2), (2, 2), (4, 2), (6, 2)]
+
+    @patch("httpx.Client")
+    def test_search_all_stops_when_missing_tail_is_empty(
+        self, mock_client_class: Mock, mock_config: JiraConfig
+    ) -> None:
+        """Test that the result is returned short when the issues it lacks are no longer there."""
+        shifted = _search_page(1, 2, 5)
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 2, 4), shifted, _search_page(4, 0, 5)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ", page_size=2)
+
+        assert [issue["key"] for issue in result["issues"]] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert mock_client_instance.request.call_count == 3
+
+    @patch("httpx.Client")
+    def test_search_all_single_page(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that no further requests are made when the first page holds everything."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 0, 0)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        result = client.search_all("project = PROJ")
+
+        assert result == {"startAt": 0, "maxResults": 0, "total": 0, "issues": []}
+        assert mock_client_instance.request.call_count == 1
+
+
+class TestJiraClientFieldProjection:
+    """Tests for fields/expand projection on search and get_issue."""
+
+    @patch("httpx.Client")
+    def test_search_issues_sends_fields_and_expand(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that projection is added to the search body."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = _search_page(0, 0, 0)
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.search_issues("project = PROJ", fields=["summary", "status"], expand=["renderedFields"])
+
+        body = json.loads(mock_client_instance.request.call_args[1]["content"])
+        assert body["fields"] == ["summary", "status"]
+        assert body["expand"] == ["renderedFields"]
+
+    @patch("httpx.Client")
+    def test_search_issues_omits_projection_by_default(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that the body is unchanged when no projection is requested."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = _search_page(0, 0, 0)
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.search_issues("project = PROJ")
+
+        assert json.loads(mock_client_instance.request.call_args[1]["content"]) == {
+            "jql": "project = PROJ",
+            "maxResults": 100,
+            "startAt": 0,
+        }
+
+    @patch("httpx.Client")
+    def test_search_all_projects_every_page(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that concurrent collection applies the projection to every page."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [_search_page(0, 1, 2), _search_page(1, 1, 2)]
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.search_all("project = PROJ", page_size=1, fields=["summary"])
+
+        assert all(
+            json.loads(c[1]["content"])["fields"] == ["summary"] for c in mock_client_instance.request.call_args_list
+        )
+
+    @patch("httpx.Client")
+    def test_get_issue_sends_query_params(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test that get_issue joins fields and expand into query parameters."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"key": "PROJ-1"}).encode()
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        client = JiraClient(mock_config)
+        client.get_issue("PROJ-1", fields=["summary", "status"], expand=["changelog"])
+        client.get_issue("PROJ-1")
+        JiraClient(mock_config.model_copy(update={"http_cache_size": 0})).get_issue("PROJ-1", fields=["summary"])
+
+        first, second, uncached = mock_client_instance.request.call_args_list
+        # With the HTTP cache on, projections ask for `updated` so they can be revalidated
+        assert first[1]["params"] == {"fields": "summary,status,updated", "expand": "changelog"}
+        assert second[1]["params"] == {}
+        assert uncached[1]["params"] == {"fields": "summary"}
+
+
+class TestJiraClientProjectSchemas:
+    """Test loading every issue type schema of a project in one request."""
+
+    @patch("httpx.Client")
+    def test_get_project_schemas_success(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test fields are returned per issue type name."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {
+                "projects": [
+                    {
+                        "issuetypes": [
+                            {"name": "Bug", "fields": {"summary": {"name": "Summary", "required": True}}},
+                            {"name": "Task"},
+                        ]
+                    }
+                ]
+            }
+        ).encode()
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        schemas = JiraClient(mock_config).get_project_schemas("PROJ")
+
+        assert schemas == {"Bug": [{"key": "summary", "name": "Summary", "required": True}], "Task": []}
+        params = mock_client_instance.request.call_args[1]["params"]
+        assert params == {"projectKeys": "PROJ", "expand": "projects.issuetypes.fields"}
+
+    @patch("httpx.Client")
+    def test_get_project_schemas_project_not_found(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test an empty createmeta response reports missing data."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"projects": []}).encode()
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        with pytest.raises(ValueError, match="Project 'PROJ' returned no data"):
+            JiraClient(mock_config).get_project_schemas("PROJ")
+
+    @patch("httpx.Client")
+    def test_get_project_schemas_404(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test a 404 reports the project as not accessible."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        with pytest.raises(ValueError, match="Project 'PROJ' not found"):
+            JiraClient(mock_config).get_project_schemas("PROJ")
+
+    @patch("httpx.Client")
+    def test_get_project_schemas_server_error(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test other errors go through the shared error handler."""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.text = "boom"
+        mock_client_instance = Mock()
+        mock_client_instance.request.return_value = mock_response
+        mock_client_class.return_value = mock_client_instance
+
+        with pytest.raises(ValueError, match=r"Jira API error \(500\)"):
+            JiraClient(mock_config).get_project_schemas("PROJ")
+
+    @patch("httpx.Client")
+    def test_get_project_schemas_timeout(self, mock_client_class: Mock, mock_config: JiraConfig) -> None:
+        """Test timeouts are reported per project."""
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = httpx.TimeoutException("Timed out")
+        mock_client_class.return_value = mock_client_instance
+
+        with pytest.raises(ValueError, match="Timeout getting schemas for PROJ"):
+            JiraClient(mock_config).get_project_schemas("PROJ")
+
+
+class TestJiraClientTransports:
+    """Test the retry, rate limit, concurrency and coalescing layers around the connection pool."""
+
+    @pytest.fixture
+    def retry_config(self) -> JiraConfig:
+        """Create a config with a tiny backoff so retries do not slow the suite."""
+        return JiraConfig(url="https://jira.test.com", token="test-token-123", retry_backoff=0.001)
+
+    def test_get_issue_retries_unavailable(self, retry_config: JiraConfig) -> None:
+        """Test that a 503 on a read is retried and the request succeeds."""
+        statuses = iter([503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"key": "PROJ-1"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(retry_config)
+            assert client.get_issue("PROJ-1") == {"key": "PROJ-1"}
+
+        stats = client.retry_metrics.get_stats()
+        assert stats["retries_by_reason"] == {"503": 1}
+        assert stats["recovered"] == 1
+
+    def test_request_metrics_record_every_attempt(self, retry_config: JiraConfig) -> None:
+        """Test that each attempt is measured under its endpoint, retries included."""
+        statuses = iter([503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/search"):
+                return httpx.Response(200, json={"startAt": 0, "total": 0, "issues": []})
+            return httpx.Response(next(statuses), json={"key": "PROJ-1"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(retry_config)
+            client.get_issue("PROJ-1")
+            client.search_issues("project = PROJ")
+            list(client.iter_search("project = PROJ", stream=True))
+
+        stats = client.request_metrics.get_stats()
+        assert stats["endpoints"]["issue"]["status_codes"] == {"200": 1, "503": 1}
+        assert stats["endpoints"]["search"]["requests"] == 2
+        assert stats["endpoints"]["search"]["bytes_sent"] > 0
+        assert stats["retries"]["retries_by_endpoint"] == {"issue": 1}
+        assert client.retry_metrics is client.request_metrics.retries
+
+    def test_tracing_spans_whole_request(self, retry_config: JiraConfig) -> None:
+        """Test that with tracing on, one span covers a request and its retries."""
+        statuses = iter([503, 200])
+        tracer = MagicMock()
+        retry_config.tracing = True
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"key": "PROJ-1"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            with patch("jira_mcp_server.tracing._tracer", tracer):
+                JiraClient(retry_config).get_issue("PROJ-1")
+
+        tracer.start_as_current_span.assert_called_once()
+        assert tracer.start_as_current_span.call_args[0] == ("GET issue",)
+        current = tracer.start_as_current_span.return_value.__enter__.return_value
+        current.set_attribute.assert_called_once_with("http.response.status_code", 200)
+
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        """Test that once reads keep failing, further reads fail fast without reaching Jira."""
+        config = JiraConfig(
+            url="https://jira.test.com",
+            token="test-token-123",
+            max_retries=1,
+            retry_backoff=0.001,
+            circuit_breaker_threshold=2,
+        )
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503, text="reindexing")
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            for _ in range(2):
+                with pytest.raises(ValueError, match=r"\(503\)"):
+                    client.get_issue("PROJ-1")
+            with pytest.raises(ValueError, match="Jira read requests are failing fast"):
+                client.get_issue("PROJ-1")
+
+        # Two calls of two attempts each; the third call never left the client
+        assert len(requests) == 4
+        assert client.circuit_breakers is not None
+        assert client.circuit_breakers.get_stats()["read"]["rejected"] == 1
+        assert client.circuit_breakers.get_stats()["write"]["state"] == "closed"
+
+    def test_hedged_reads(self) -> None:
+        """Test that with hedging on, issue reads are hedged within budget while writes are not."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", hedge_requests=True)
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            client = JiraClient(config)
+            for _ in range(25):
+                assert client.get_issue("PROJ-1") == {"key": "PROJ-1"}
+            client.add_comment("PROJ-1", "Hi")
+            client.close()
+
+        assert client.hedger is not None
+        stats = client.hedger.get_stats()
+        assert stats["requests"] == 25
+        assert stats["hedged"] <= 25 * config.hedge_max_extra
+
+    def test_create_issue_not_retried_on_server_error(self, retry_config: JiraConfig) -> None:
+        """Test that an ambiguous failure of a write surfaces instead of risking a duplicate."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503, text="unavailable")
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(retry_config)
+            with pytest.raises(ValueError, match=r"Jira API error \(503\)"):
+                client.create_issue({"fields": {}})
+
+        assert len(requests) == 1
+        assert client.retry_metrics.get_stats()["retries"] == 0
+
+    def test_rate_limit_retried_after_requested_wait(self, retry_config: JiraConfig) -> None:
+        """Test that a 429 is retried even for a write, honouring Retry-After."""
+        responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(201, json={"id": "1"})])
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(lambda request: next(responses))):
+            client = JiraClient(retry_config)
+            assert client.add_comment("PROJ-1", "Hi") == {"id": "1"}
+
+        assert client.retry_metrics.get_stats()["retries_by_reason"] == {"429": 1}
+
+    def test_retries_disabled(self) -> None:
+        """Test that JIRA_MCP_MAX_RETRIES=0 surfaces the first failure."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", max_retries=0)
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(lambda request: httpx.Response(429))):
+            client = JiraClient(config)
+            with pytest.raises(ValueError, match="Rate limit exceeded"):
+                client.get_issue("PROJ-1")
+
+        assert client.retry_metrics.get_stats()["exhausted"] == 1
+
+    def test_rate_limit_throttles_requests(self) -> None:
+        """Test that a configured rate limit sits in front of the connection pool."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", rate_limit=10, rate_limit_burst=1)
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            client = JiraClient(config)
+            client.get_issue("PROJ-1")
+            client.get_issue("PROJ-1")
+
+        assert client.rate_limiter.get_stats()["throttled"] == 1
+
+    def test_adaptive_concurrency_observes_responses(self) -> None:
+        """Test that enabling adaptive concurrency adds an AIMD limit bounded by the pool size."""
+        config = JiraConfig(
+            url="https://jira.test.com", token="test-token-123", adaptive_concurrency=True, max_connections=6
+        )
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            client = JiraClient(config)
+            client.get_issue("PROJ-1")
+
+        assert client.concurrency_limit is not None
+        assert client.concurrency_limit.max_limit == 6
+        assert client.concurrency_limit.get_stats()["increases"] == 1
+
+    def test_concurrent_identical_reads_are_coalesced(self) -> None:
+        """Test that threads issuing the same GET at once share one network call."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        calls = []
+        gate = threading.Event()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            gate.wait(5)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(client.get_issue, "PROJ-1") for _ in range(4)]
+                while client.coalescing_metrics.get_stats()["coalesced"] < 3:
+                    time.sleep(0.001)
+                gate.set()
+                results = [f.result(timeout=5) for f in futures]
+
+        assert len(calls) == 1
+        assert results == [{"key": "PROJ-1"}] * 4
+
+    def test_coalescing_can_be_disabled(self) -> None:
+        """Test JIRA_MCP_COALESCE_REQUESTS=false sends every request."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", coalesce_requests=False)
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            client = JiraClient(config)
+            client.get_issue("PROJ-1")
+
+        assert client.coalescing_metrics.get_stats() == {"sent": 0, "coalesced": 0}
+
+    def test_repeat_filter_read_revalidated_with_etag(self) -> None:
+        """Test that an unchanged filter is answered with a 304 and served from the HTTP cache."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123")
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"f1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "10000", "name": "Mine"}, headers={"ETag": '"f1"'})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            assert client.get_filter("10000") == client.get_filter("10000") == {"id": "10000", "name": "Mine"}
+
+        assert requests[1].headers["If-None-Match"] == '"f1"'
+        assert client.http_cache is not None
+        assert client.http_cache.get_stats()["hits"] == 1
+
+    def test_http_cache_can_be_disabled(self) -> None:
+        """Test JIRA_MCP_HTTP_CACHE_SIZE=0 downloads every read."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", http_cache_size=0)
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"id": "10000"}, headers={"ETag": '"f1"'})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            client.get_filter("10000")
+            client.get_filter("10000")
+
+        assert client.http_cache is None
+        assert all("If-None-Match" not in r.headers for r in requests)
+
+    def test_search_pages_share_tool_deadline(self, retry_config: JiraConfig) -> None:
+        """Test that pages fetched on worker threads get the caller's remaining budget as their timeout."""
+        read_timeouts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            read_timeouts.append(request.extensions["timeout"]["read"])
+            body = json.loads(request.content)
+            keys = range(body["startAt"], min(7, body["startAt"] + body["maxResults"]))
+            return httpx.Response(
+                200, json={"startAt": body["startAt"], "total": 7, "issues": [{"key": k} for k in keys]}
+            )
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(retry_config)
+            with deadline(5):
+                result = client.search_all("project = PROJ", page_size=2, fan_out=3)
+
+        assert len(result["issues"]) == 7
+        assert len(read_timeouts) == 4
+        assert all(timeout <= 5 for timeout in read_timeouts)
+
+    def test_expired_tool_deadline_sends_nothing(self, retry_config: JiraConfig) -> None:
+        """Test that a request made after the deadline fails without reaching Jira, naming the deadline."""
+        handler = Mock(return_value=httpx.Response(200, json={"key": "PROJ-1"}))
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(retry_config)
+            with deadline(0):
+                with pytest.raises(ValueError, match="Tool call deadline exceeded before the request was sent"):
+                    client.get_issue("PROJ-1")
+
+        handler.assert_not_called()
+        assert client.retry_metrics.get_stats()["retries"] == 0
+
+    @pytest.mark.parametrize("codec", ["stdlib", "orjson"])
+    def test_bodies_use_configured_json_codec(self, codec: str) -> None:
+        """Test that request bodies are encoded and responses decoded with JIRA_MCP_JSON_CODEC."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", json_codec=codec)
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(201, content='{"key":"PROJ-2","summary":"Café"}'.encode())
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            result = client.create_issue({"fields": {"summary": "Café"}})
+
+        assert client.codec.name == codec
+        assert result == {"key": "PROJ-2", "summary": "Café"}
+        assert sent[0].content == '{"fields":{"summary":"Café"}}'.encode()
+        assert sent[0].headers["Content-Type"] == "application/json"
+
+
+def _streamed_search(requests: list, total: int, chunk_size: int = 7) -> Any:
+    """Build a mock Jira handler serving search pages as small body chunks."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = json.loads(request.content)
+        keys = range(body["startAt"], min(total, body["startAt"] + body["maxResults"]))
+        page = json.dumps({"startAt": body["startAt"], "total": total, "issues": [{"key": f"PROJ-{k}"} for k in keys]})
+        data = page.encode()
+        return httpx.Response(200, content=iter([data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]))
+
+    return handler
+
+
+class TestJiraClientSearchStreaming:
+    """Tests for incrementally parsed search responses."""
+
+    def test_stream_search_yields_issues_and_page_metadata(self, mock_config: JiraConfig) -> None:
+        """Test issues are parsed from the streamed body and page metadata is reported."""
+        requests: list = []
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(_streamed_search(requests, total=5))):
+            client = JiraClient(mock_config)
+            page: Dict[str, Any] = {}
+            issues = list(client.stream_search("project = PROJ", max_results=3, expand=["changelog"], page=page))
+
+        assert [issue["key"] for issue in issues] == ["PROJ-0", "PROJ-1", "PROJ-2"]
+        assert page == {"startAt": 0, "total": 5, "issues": []}
+        assert json.loads(requests[0].content)["expand"] == ["changelog"]
+
+    def test_streamed_searches_are_not_coalesced(self, mock_config: JiraConfig) -> None:
+        """Test a streamed body is not buffered by the coalescing layer."""
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(_streamed_search([], total=1))):
+            client = JiraClient(mock_config)
+            list(client.stream_search("project = PROJ"))
+
+        assert client.coalescing_metrics.get_stats() == {"sent": 0, "coalesced": 0}
+
+    def test_iter_search_streams_every_page(self, mock_config: JiraConfig) -> None:
+        """Test stream=True walks pages until the total, honouring the limit."""
+        requests: list = []
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(_streamed_search(requests, total=5))):
+            client = JiraClient(mock_config)
+            keys = [issue["key"] for issue in client.iter_search("project = PROJ", page_size=2, stream=True)]
+            limited = list(client.iter_search("project = PROJ", page_size=2, limit=3, stream=True))
+
+        assert keys == [f"PROJ-{k}" for k in range(5)]
+        assert len(limited) == 3
+        assert [json.loads(r.content)["startAt"] for r in requests] == [0, 2, 4, 0, 2]
+        assert json.loads(requests[-1].content)["maxResults"] == 1
+
+    def test_iter_search_stream_stops_on_empty_page(self, mock_config: JiraConfig) -> None:
+        """Test an empty page ends iteration even if the total claims more."""
+        handler = httpx.MockTransport(lambda request: httpx.Response(200, json={"total": 10, "issues": []}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            assert list(JiraClient(mock_config).iter_search("project = PROJ", stream=True)) == []
+
+    def test_stream_search_error_status(self, mock_config: JiraConfig) -> None:
+        """Test an error response is read and mapped like search_issues."""
+        handler = httpx.MockTransport(lambda request: httpx.Response(400, json={"errorMessages": ["Invalid JQL"]}))
+
+        with patch("httpx.HTTPTransport", return_value=handler):
+            with pytest.raises(ValueError, match="Validation error: Invalid JQL"):
+                list(JiraClient(mock_config).stream_search("bad jql"))
+
+    def test_stream_search_timeout(self, mock_config: JiraConfig) -> None:
+        """Test timeouts are reported as ValueError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", max_retries=0)
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            with pytest.raises(ValueError, match="Timeout executing search query"):
+                list(JiraClient(config).stream_search("project = PROJ"))
+
+
+class TestRefusedRequests:
+    """Test requests the pipeline refuses to send are reported as ValueError by every method."""
+
+    @pytest.mark.parametrize("call", CLIENT_CALLS)
+    def test_open_circuit(self, call: Callable[[JiraClient], Any]) -> None:
+        """Test an open circuit fails fast with its reason instead of a raw httpx error."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={})
+
+        config = JiraConfig(url="https://jira.test.com", token="test-token-123", circuit_breaker_threshold=1)
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(config)
+            assert client.circuit_breakers is not None
+            for breaker in client.circuit_breakers._breakers.values():
+                breaker.on_failure()
+
+            with pytest.raises(ValueError, match=r"requests are failing fast .*retrying in 30s"):
+                call(client)
+
+        assert sent == []
+
+    @pytest.mark.parametrize("call", CLIENT_CALLS)
+    def test_expired_deadline(self, call: Callable[[JiraClient], Any]) -> None:
+        """Test a spent tool deadline is reported as such, not as Jira being unreachable."""
+        handler = Mock(return_value=httpx.Response(200, json={}))
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(JiraConfig(url="https://jira.test.com", token="test-token-123"))
+            with deadline(0):
+                with pytest.raises(ValueError, match="Tool call deadline exceeded .* JIRA_MCP_TOOL_DEADLINE"):
+                    call(client)
+
+        handler.assert_not_called()
+
+    def test_timeout_cut_short_by_deadline(self) -> None:
+        """Test a request whose timeout the deadline shortened reports the deadline, not the connection."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(JiraConfig(url="https://jira.test.com", token="test-token-123"))
+            with deadline(0.01):
+                with pytest.raises(ValueError, match="deadline exceeded while waiting for Jira"):
+                    client.health_check()
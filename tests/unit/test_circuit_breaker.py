@@ -0,0 +1,214 @@
+"""Unit tests for the per-endpoint-class circuit breakers"""
+
+import asyncio
+from typing import List, Union
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AsyncCircuitBreakerTransport,
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitBreakerTransport,
+    CircuitOpenError,
+)
+from jira_mcp_server.deadline import DeadlineExceeded
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tripped(clock: FakeClock, threshold: int = 2) -> CircuitBreaker:
+    """Create a breaker and open it."""
+    breaker = CircuitBreaker("read", failure_threshold=threshold, reset_timeout=30, clock=clock)
+    for _ in range(threshold):
+        breaker.before_request()
+        breaker.on_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Test the closed, open and half-open states."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Test the circuit opens at the threshold and then fails fast."""
+        clock = FakeClock()
+        breaker = tripped(clock, threshold=3)
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError, match=r"Jira read requests are failing fast .* retrying in 30s"):
+            breaker.before_request()
+        assert breaker.get_stats() == {"state": OPEN, "consecutive_failures": 3, "trips": 1, "rejected": 1}
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test failures must be consecutive to open the circuit."""
+        breaker = CircuitBreaker("read", failure_threshold=2)
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+
+        assert breaker.state == CLOSED
+        breaker.before_request()
+
+    def test_half_open_admits_one_probe(self) -> None:
+        """Test a single probe is let through once the reset timeout has passed."""
+        clock = FakeClock()
+        breaker = tripped(clock)
+        clock.now += 30
+
+        breaker.before_request()
+
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError, match="a probe request is in flight"):
+            breaker.before_request()
+
+    def test_successful_probe_closes(self) -> None:
+        """Test a successful probe closes the circuit."""
+        clock = FakeClock()
+        breaker = tripped(clock)
+        clock.now += 31
+        breaker.before_request()
+
+        breaker.on_success()
+
+        assert breaker.state == CLOSED
+        assert breaker.get_stats()["consecutive_failures"] == 0
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self) -> None:
+        """Test a failed probe opens the circuit for another reset timeout."""
+        clock = FakeClock()
+        breaker = tripped(clock)
+        clock.now += 31
+        breaker.before_request()
+
+        breaker.on_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.get_stats()["trips"] == 2
+        clock.now += 29
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_abandoned_probe_frees_slot(self) -> None:
+        """Test a cancelled probe lets the next request probe instead."""
+        clock = FakeClock()
+        breaker = tripped(clock)
+        clock.now += 31
+        breaker.before_request()
+
+        breaker.on_abandoned()
+
+        breaker.before_request()
+        assert breaker.state == HALF_OPEN
+
+
+class TestCircuitBreakers:
+    """Test breakers are kept per endpoint class."""
+
+    def test_classes_trip_independently(self) -> None:
+        """Test a failing search backend does not block reads or writes."""
+        breakers = CircuitBreakers(failure_threshold=1)
+        search = httpx.Request("POST", f"{BASE}/search")
+        read = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        breakers.for_request(search).on_failure()
+
+        assert breakers.for_request(search).state == OPEN
+        assert breakers.for_request(read).state == CLOSED
+        assert {name: stats["state"] for name, stats in breakers.get_stats().items()} == {
+            "search": OPEN,
+            "read": CLOSED,
+            "write": CLOSED,
+        }
+
+
+def make_inner(outcomes: List[Union[int, BaseException]]) -> Mock:
+    """Create a sync transport mock that plays back status codes and exceptions."""
+    inner = Mock(spec=httpx.BaseTransport)
+    inner.handle_request.side_effect = [o if isinstance(o, BaseException) else httpx.Response(o) for o in outcomes]
+    return inner
+
+
+class TestCircuitBreakerTransport:
+    """Test the synchronous breaker transport."""
+
+    def test_counts_outcomes_and_fails_fast(self) -> None:
+        """Test 5xx responses and timeouts open the circuit; 4xx, pool timeouts and spent deadlines do not count."""
+        breakers = CircuitBreakers(failure_threshold=2)
+        inner = make_inner([404, 503, httpx.PoolTimeout("busy"), DeadlineExceeded("spent"), httpx.ReadTimeout("slow")])
+        transport = CircuitBreakerTransport(inner, breakers)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        assert transport.handle_request(request).status_code == 404
+        assert transport.handle_request(request).status_code == 503
+        with pytest.raises(httpx.PoolTimeout):
+            transport.handle_request(request)
+        with pytest.raises(DeadlineExceeded):
+            transport.handle_request(request)
+        with pytest.raises(httpx.ReadTimeout):
+            transport.handle_request(request)
+        with pytest.raises(CircuitOpenError):
+            transport.handle_request(request)
+
+        assert inner.handle_request.call_count == 5
+        assert breakers.get_stats()["read"]["trips"] == 1
+
+    def test_close_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = Mock(spec=httpx.BaseTransport)
+        CircuitBreakerTransport(inner, CircuitBreakers()).close()
+        inner.close.assert_called_once()
+
+
+class TestAsyncCircuitBreakerTransport:
+    """Test the async breaker transport."""
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_when_open(self) -> None:
+        """Test an open circuit rejects requests without sending them."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request.side_effect = [httpx.Response(502), httpx.Response(200)]
+        breakers = CircuitBreakers(failure_threshold=1)
+        transport = AsyncCircuitBreakerTransport(inner, breakers)
+        write = httpx.Request("POST", f"{BASE}/issue")
+
+        assert (await transport.handle_async_request(write)).status_code == 502
+        with pytest.raises(CircuitOpenError):
+            await transport.handle_async_request(write)
+        # Other classes are unaffected
+        assert (await transport.handle_async_request(httpx.Request("GET", f"{BASE}/issue/A-1"))).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_abandoned(self) -> None:
+        """Test a cancelled request does not count as a failure."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request.side_effect = asyncio.CancelledError()
+        breakers = CircuitBreakers(failure_threshold=1)
+        transport = AsyncCircuitBreakerTransport(inner, breakers)
+
+        with pytest.raises(asyncio.CancelledError):
+            await transport.handle_async_request(httpx.Request("GET", f"{BASE}/issue/A-1"))
+
+        assert breakers.get_stats()["read"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        await AsyncCircuitBreakerTransport(inner, CircuitBreakers()).aclose()
+        inner.aclose.assert_awaited_once()
@@ -1,6 +1,6 @@
 """Unit tests for comment tools"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -8,9 +8,13 @@ from jira_mcp_server.jira_client import JiraClient
 from jira_mcp_server.tools.comment_tools import (
     initialize_comment_tools,
     jira_comment_add,
+    jira_comment_add_async,
     jira_comment_delete,
+    jira_comment_delete_async,
     jira_comment_list,
+    jira_comment_list_async,
     jira_comment_update,
+    jira_comment_update_async,
 )
 
 
@@ -312,3 +316,121 @@ class TestDeleteComment:
 
         with pytest.raises(ValueError, match="Delete comment failed: Permission denied"):
             jira_comment_delete(issue_key="PROJ-123", comment_id="10001")
+
+
+class TestAsyncCommentTools:
+    """Test async comment tool variants."""
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._async_client", None)
+    async def test_async_tools_not_initialized(self) -> None:
+        """Test that every async variant requires an async client."""
+        with pytest.raises(RuntimeError, match="Comment tools not initialized"):
+            await jira_comment_add_async(issue_key="PROJ-123", body="Test")
+        with pytest.raises(RuntimeError, match="Comment tools not initialized"):
+            await jira_comment_list_async(issue_key="PROJ-123")
+        with pytest.raises(RuntimeError, match="Comment tools not initialized"):
+            await jira_comment_update_async(issue_key="PROJ-123", comment_id="10001", body="Test")
+        with pytest.raises(RuntimeError, match="Comment tools not initialized"):
+            await jira_comment_delete_async(issue_key="PROJ-123", comment_id="10001")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._async_client", new_callable=AsyncMock)
+    async def test_add_comment_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async comment addition and input validation."""
+        mock_async_client.add_comment.return_value = {"id": "10001", "body": "Test"}
+
+        result = await jira_comment_add_async(issue_key="PROJ-123", body="Test")
+
+        assert result["id"] == "10001"
+        mock_async_client.add_comment.assert_awaited_once_with(issue_key="PROJ-123", body="Test")
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_comment_add_async(issue_key=" ", body="Test")
+        with pytest.raises(ValueError, match="Comment body cannot be empty"):
+            await jira_comment_add_async(issue_key="PROJ-123", body="")
+
+        mock_async_client.add_comment.side_effect = Exception("Issue not found")
+        with pytest.raises(ValueError, match="Add comment failed: Issue not found"):
+            await jira_comment_add_async(issue_key="PROJ-123", body="Test")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._async_client", new_callable=AsyncMock)
+    async def test_list_comments_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async comment listing and input validation."""
+        mock_async_client.list_comments.return_value = {"total": 0, "comments": []}
+
+        result = await jira_comment_list_async(issue_key="PROJ-123")
+
+        assert result["total"] == 0
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_comment_list_async(issue_key="")
+
+        mock_async_client.list_comments.side_effect = Exception("Permission denied")
+        with pytest.raises(ValueError, match="List comments failed: Permission denied"):
+            await jira_comment_list_async(issue_key="PROJ-123")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._async_client", new_callable=AsyncMock)
+    async def test_update_comment_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async comment update and input validation."""
+        mock_async_client.update_comment.return_value = {"id": "10001", "body": "Updated"}
+
+        result = await jira_comment_update_async(issue_key="PROJ-123", comment_id="10001", body="Updated")
+
+        assert result["body"] == "Updated"
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_comment_update_async(issue_key="", comment_id="10001", body="Updated")
+        with pytest.raises(ValueError, match="Comment ID cannot be empty"):
+            await jira_comment_update_async(issue_key="PROJ-123", comment_id="", body="Updated")
+        with pytest.raises(ValueError, match="Comment body cannot be empty"):
+            await jira_comment_update_async(issue_key="PROJ-123", comment_id="10001", body=" ")
+
+        mock_async_client.update_comment.side_effect = Exception("Comment not found")
+        with pytest.raises(ValueError, match="Update comment failed: Comment not found"):
+            await jira_comment_update_async(issue_key="PROJ-123", comment_id="10001", body="Updated")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._async_client", new_callable=AsyncMock)
+    async def test_delete_comment_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async comment deletion and input validation."""
+        result = await jira_comment_delete_async(issue_key="PROJ-123", comment_id="10001")
+
+        assert result["success"] is True
+        assert result["comment_id"] == "10001"
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_comment_delete_async(issue_key="", comment_id="10001")
+        with pytest.raises(ValueError, match="Comment ID cannot be empty"):
+            await jira_comment_delete_async(issue_key="PROJ-123", comment_id=" ")
+
+        mock_async_client.delete_comment.side_effect = Exception("Permission denied")
+        with pytest.raises(ValueError, match="Delete comment failed: Permission denied"):
+            await jira_comment_delete_async(issue_key="PROJ-123", comment_id="10001")
+
+
+class TestCommentsInvalidateSearchCache:
+    """Test that comment writes invalidate cached search results."""
+
+    @patch("jira_mcp_server.tools.comment_tools._search_cache")
+    @patch("jira_mcp_server.tools.comment_tools._client")
+    def test_comment_writes_invalidate(self, mock_client: Mock, mock_search_cache: Mock) -> None:
+        """Test that add, update and delete each invalidate the issue."""
+        jira_comment_add(issue_key="PROJ-1", body="Hello")
+        jira_comment_update(issue_key="PROJ-1", comment_id="10001", body="Edited")
+        jira_comment_delete(issue_key="PROJ-1", comment_id="10001")
+
+        assert mock_search_cache.invalidate_all.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.comment_tools._search_cache")
+    @patch("jira_mcp_server.tools.comment_tools._async_client", new_callable=AsyncMock)
+    async def test_async_comment_writes_invalidate(self, mock_async_client: AsyncMock, mock_search_cache: Mock) -> None:
+        """Test that async add, update and delete each invalidate the issue."""
+        await jira_comment_add_async(issue_key="PROJ-1", body="Hello")
+        await jira_comment_update_async(issue_key="PROJ-1", comment_id="10001", body="Edited")
+        await jira_comment_delete_async(issue_key="PROJ-1", comment_id="10001")
+
+        assert mock_search_cache.invalidate_all.call_count == 3
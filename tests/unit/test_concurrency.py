@@ -0,0 +1,337 @@
+"""Unit tests for the adaptive concurrency limit"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Iterator, List, Optional
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.concurrency import AIMDLimit, AsyncConcurrencyLimitTransport, ConcurrencyLimitTransport
+from jira_mcp_server.deadline import DeadlineExceeded, deadline
+from jira_mcp_server.endpoints import STREAM_EXTENSION
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+def streamed_search() -> httpx.Request:
+    return httpx.Request("POST", f"{BASE}/search", json={"jql": "x"}, extensions={STREAM_EXTENSION: True})
+
+
+class Chunks(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body sent in chunks, optionally failing after them."""
+
+    def __init__(self, *chunks: bytes, error: Optional[Exception] = None):
+        self.chunks = chunks
+        self.error = error
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self.chunks
+        if self.error is not None:
+            raise self.error
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAIMDLimit:
+    """Test additive increase and multiplicative decrease."""
+
+    def test_initial_limit_is_clamped(self) -> None:
+        """Test the starting limit respects the bounds."""
+        assert AIMDLimit(initial=100, max_limit=20).limit == 20
+        assert AIMDLimit(initial=0, min_limit=1).limit == 1
+
+    def test_grows_about_one_per_round_while_latency_is_healthy(self) -> None:
+        """Test that each healthy response adds 1/limit."""
+        limit = AIMDLimit(initial=4, max_limit=64)
+
+        for _ in range(4):
+            limit.on_success(0.1)
+
+        assert limit.limit == 4  # 4 + 4 * (~1/4.x) is just under 5
+        for _ in range(2):
+            limit.on_success(0.1)
+        assert limit.limit == 5
+        assert limit.get_stats()["increases"] == 6
+
+    def test_stops_growing_when_latency_degrades(self) -> None:
+        """Test latency well above the baseline holds the limit."""
+        limit = AIMDLimit(initial=4)
+        limit.on_success(0.1)
+        before = limit.get_stats()["increases"]
+
+        limit.on_success(0.5)
+
+        assert limit.get_stats()["increases"] == before
+        assert limit.get_stats()["baseline_latency"] == pytest.approx(0.104)
+
+    def test_never_exceeds_max(self) -> None:
+        """Test growth stops at max_limit."""
+        limit = AIMDLimit(initial=2, max_limit=2)
+
+        limit.on_success(0.1)
+
+        assert limit.limit == 2
+        assert limit.get_stats()["increases"] == 0
+
+    def test_overload_halves_once_per_burst(self) -> None:
+        """Test a burst of rejections from requests sent together shrinks the limit once."""
+        clock = FakeClock()
+        limit = AIMDLimit(initial=16, clock=clock)
+        started = clock()
+        clock.now += 1
+
+        for _ in range(5):
+            limit.on_overload(started)
+
+        assert limit.limit == 8
+        # A request sent after the decrease can shrink it again
+        limit.on_overload(clock.now + 0.5)
+        assert limit.limit == 4
+        assert limit.get_stats()["decreases"] == 2
+
+    def test_never_below_min(self) -> None:
+        """Test the limit floors at min_limit."""
+        clock = FakeClock()
+        limit = AIMDLimit(initial=1, min_limit=1, clock=clock)
+
+        limit.on_overload(clock())
+
+        assert limit.limit == 1
+
+
+class TestConcurrencyLimitTransport:
+    """Test the synchronous transport."""
+
+    def test_limits_in_flight_requests(self) -> None:
+        """Test that no more than `limit` requests reach the wrapped transport at once."""
+        in_flight: List[int] = []
+        peak: List[int] = [0]
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            with lock:
+                in_flight.append(1)
+                peak[0] = max(peak[0], len(in_flight))
+            release.wait(5)
+            with lock:
+                in_flight.pop()
+            return httpx.Response(200)
+
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = handle
+        transport = ConcurrencyLimitTransport(inner, AIMDLimit(initial=2, max_limit=2))
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        threads = [threading.Thread(target=transport.handle_request, args=(request,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert peak[0] == 2
+        assert inner.handle_request.call_count == 5
+        assert transport._in_flight == 0
+
+    def test_feeds_outcomes_back(self) -> None:
+        """Test overload responses and timeouts shrink the limit, other errors do not."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = [
+            httpx.Response(200),
+            httpx.Response(429),
+            httpx.PoolTimeout("pool"),
+            httpx.ConnectError("refused"),
+        ]
+        limit = Mock(spec=AIMDLimit, limit=4)
+        limit.now.return_value = 1.0
+        transport = ConcurrencyLimitTransport(inner, limit)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        transport.handle_request(request)
+        transport.handle_request(request)
+        for _ in range(2):
+            with pytest.raises(httpx.TransportError):
+                transport.handle_request(request)
+        transport.close()
+
+        limit.on_success.assert_called_once_with(0.0)
+        limit.on_overload.assert_called_once_with(1.0)
+        inner.close.assert_called_once()
+
+    def test_streamed_response_holds_slot_until_closed(self) -> None:
+        """Test a streamed body keeps its slot, and its latency is sampled, until it is closed."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.return_value = httpx.Response(200, stream=Chunks(b'{"issues"', b": []}"))
+        limit = Mock(spec=AIMDLimit, limit=4)
+        limit.now.side_effect = [1.0, 3.5]
+        transport = ConcurrencyLimitTransport(inner, limit)
+
+        response = transport.handle_request(streamed_search())
+        assert transport._in_flight == 1
+        limit.on_success.assert_not_called()
+
+        assert response.read() == b'{"issues": []}'
+        response.close()
+        assert transport._in_flight == 0
+        limit.on_success.assert_called_once_with(2.5)
+
+    def test_stream_failing_midway_counts_as_overload(self) -> None:
+        """Test a timeout while reading a streamed body shrinks the limit and frees the slot."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.return_value = httpx.Response(200, stream=Chunks(b"{", error=httpx.ReadTimeout("slow")))
+        limit = Mock(spec=AIMDLimit, limit=4)
+        limit.now.return_value = 1.0
+        transport = ConcurrencyLimitTransport(inner, limit)
+
+        response = transport.handle_request(streamed_search())
+        with pytest.raises(httpx.ReadTimeout):
+            response.read()
+        response.close()
+
+        limit.on_overload.assert_called_once_with(1.0)
+        limit.on_success.assert_not_called()
+        assert transport._in_flight == 0
+
+    def test_slot_freed_when_inner_transport_is_interrupted(self) -> None:
+        """Test errors other than transport errors free the slot without a sample."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = KeyboardInterrupt
+        limit = Mock(spec=AIMDLimit, limit=4)
+        transport = ConcurrencyLimitTransport(inner, limit)
+
+        with pytest.raises(KeyboardInterrupt):
+            transport.handle_request(streamed_search())
+
+        assert transport._in_flight == 0
+        limit.on_success.assert_not_called()
+        limit.on_overload.assert_not_called()
+
+    def test_slot_wait_ends_at_the_deadline(self) -> None:
+        """Test a request queued behind a full limit gives up when the deadline passes."""
+        inner = Mock(spec=httpx.BaseTransport)
+        transport = ConcurrencyLimitTransport(inner, AIMDLimit(initial=1, max_limit=1))
+        transport._in_flight = 1
+
+        with deadline(0.02), pytest.raises(DeadlineExceeded, match="waiting for a request slot"):
+            transport.handle_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+        inner.handle_request.assert_not_called()
+        assert transport._in_flight == 1
+
+
+class TestAsyncConcurrencyLimitTransport:
+    """Test the asyncio transport."""
+
+    @pytest.mark.asyncio
+    async def test_limits_in_flight_requests(self) -> None:
+        """Test concurrent coroutines queue behind the limit."""
+        active = 0
+        peak = 0
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(side_effect=handle)
+        inner.aclose = AsyncMock()
+        transport = AsyncConcurrencyLimitTransport(inner, AIMDLimit(initial=3, max_limit=3))
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        await asyncio.gather(*(transport.handle_async_request(request) for _ in range(8)))
+        await transport.aclose()
+
+        assert peak == 3
+        assert transport._in_flight == 0
+        inner.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_timeout_shrinks_limit(self) -> None:
+        """Test a read timeout counts as overload and is re-raised."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        limit = AIMDLimit(initial=8)
+        transport = AsyncConcurrencyLimitTransport(inner, limit)
+
+        with pytest.raises(httpx.ReadTimeout):
+            await transport.handle_async_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+        assert limit.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_wait_ends_at_the_deadline(self) -> None:
+        """Test a coroutine queued behind a full limit gives up when the deadline passes."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(return_value=httpx.Response(200))
+        transport = AsyncConcurrencyLimitTransport(inner, AIMDLimit(initial=1, max_limit=1))
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        await transport.handle_async_request(request)
+        transport._in_flight = 1
+
+        with deadline(0.02), pytest.raises(DeadlineExceeded, match="waiting for a request slot"):
+            await transport.handle_async_request(request)
+
+        assert inner.handle_async_request.await_count == 1
+        assert transport._in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_streamed_response_holds_slot_until_closed(self) -> None:
+        """Test a streamed body keeps its slot until it is closed, and mid-stream timeouts count."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(
+            side_effect=[
+                httpx.Response(200, stream=Chunks(b"[]")),
+                httpx.Response(200, stream=Chunks(b"[", error=httpx.ReadTimeout("slow"))),
+            ]
+        )
+        limit = AIMDLimit(initial=8)
+        transport = AsyncConcurrencyLimitTransport(inner, limit)
+
+        response = await transport.handle_async_request(streamed_search())
+        assert transport._in_flight == 1
+        assert await response.aread() == b"[]"
+        await response.aclose()
+        assert transport._in_flight == 0
+        assert limit.get_stats()["baseline_latency"] is not None
+
+        response = await transport.handle_async_request(streamed_search())
+        with pytest.raises(httpx.ReadTimeout):
+            await response.aread()
+        await response.aclose()
+        assert transport._in_flight == 0
+        assert limit.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_slot_freed_when_cancelled(self) -> None:
+        """Test a cancelled request frees its slot without a sample."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(side_effect=asyncio.CancelledError)
+        limit = AIMDLimit(initial=8)
+        transport = AsyncConcurrencyLimitTransport(inner, limit)
+
+        with pytest.raises(asyncio.CancelledError):
+            await transport.handle_async_request(streamed_search())
+
+        assert transport._in_flight == 0
+        assert limit.get_stats()["baseline_latency"] is None
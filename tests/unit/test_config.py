@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.config import MIDDLEWARE_STAGES, JiraConfig
 
 
 class TestJiraConfig:
@@ -18,6 +18,9 @@ class TestJiraConfig:
         assert config.cache_ttl == 3600  # Default
         assert config.timeout == 30  # Default
         assert config.verify_ssl is True  # Default
+        assert config.max_connections == 20  # Default
+        assert config.max_keepalive_connections == 10  # Default
+        assert config.keepalive_expiry == 30.0  # Default
 
     def test_config_uses_custom_values(self) -> None:
         """Test that config accepts custom TTL and timeout values."""
@@ -97,3 +100,185 @@ class TestJiraConfig:
         config = JiraConfig(url="https://jira.example.com", token="test-token-123", verify_ssl=False)
 
         assert config.verify_ssl is False
+
+    def test_config_validates_max_connections_positive(self) -> None:
+        """Test that the connection pool size must be positive."""
+        with pytest.raises(ValidationError) as exc_info:
+            JiraConfig(url="https://jira.example.com", token="test-token-123", max_connections=0)
+
+        assert "greater than 0" in str(exc_info.value)
+
+    def test_config_pool_settings_can_be_customized(self) -> None:
+        """Test that connection pool settings accept custom values."""
+        config = JiraConfig(
+            url="https://jira.example.com",
+            token="test-token-123",
+            max_connections=50,
+            max_keepalive_connections=0,
+            keepalive_expiry=120,
+        )
+
+        assert config.max_connections == 50
+        assert config.max_keepalive_connections == 0
+        assert config.keepalive_expiry == 120.0
+
+    def test_config_search_fan_out(self) -> None:
+        """Test that search fan-out defaults to 4 and must be positive."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert config.search_fan_out == 4
+
+        with pytest.raises(ValidationError) as exc_info:
+            JiraConfig(url="https://jira.example.com", token="test-token-123", search_fan_out=0)
+
+        assert "greater than 0" in str(exc_info.value)
+
+    def test_config_cache_max_stale(self) -> None:
+        """Test the schema stale-while-revalidate window default and bounds."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert config.cache_max_stale == 86400
+
+        disabled = JiraConfig(url="https://jira.example.com", token="test-token-123", cache_max_stale=0)
+        assert disabled.cache_max_stale == 0
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", cache_max_stale=-1)
+
+    def test_config_cache_dir(self) -> None:
+        """Test that the persistent schema cache is off unless a directory is given."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").cache_dir is None
+
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123", cache_dir="/var/cache/jira-mcp")
+        assert config.cache_dir == "/var/cache/jira-mcp"
+
+    def test_config_search_cache_settings(self) -> None:
+        """Test search cache defaults and that zero is accepted to disable it."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert config.search_cache_ttl == 60
+        assert config.search_cache_size == 256
+
+        disabled = JiraConfig(url="https://jira.example.com", token="test-token-123", search_cache_ttl=0)
+        assert disabled.search_cache_ttl == 0
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", search_cache_size=-1)
+
+    def test_config_prefetch_targets(self) -> None:
+        """Test JIRA_MCP_PREFETCH parsing into (project, issue type) pairs."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").prefetch_targets() == []
+
+        config = JiraConfig(
+            url="https://jira.example.com",
+            token="test-token-123",
+            prefetch=" PROJ:Bug, PROJ:User Story,,OPS , PROJ:Bug, DEV: ",
+        )
+        assert config.prefetch_targets() == [("PROJ", "Bug"), ("PROJ", "User Story"), ("OPS", None), ("DEV", None)]
+
+    def test_config_retry_settings(self) -> None:
+        """Test retry defaults and that zero retries is accepted."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert (config.max_retries, config.retry_backoff, config.retry_max_delay) == (3, 0.5, 30.0)
+
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123", max_retries=0).max_retries == 0
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", retry_backoff=0)
+
+    def test_config_rate_limit_settings(self) -> None:
+        """Test rate limiting is off by default and rejects negative rates."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert (config.rate_limit, config.rate_limit_burst) == (0.0, 10)
+        assert (config.search_rate_limit, config.write_rate_limit) == (0.0, 0.0)
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", rate_limit=-1)
+
+    def test_config_adaptive_concurrency(self) -> None:
+        """Test adaptive concurrency is opt-in with a positive starting limit."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert config.adaptive_concurrency is False
+        assert config.adaptive_concurrency_initial == 4
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", adaptive_concurrency_initial=0)
+
+    def test_config_coalesce_requests(self) -> None:
+        """Test request coalescing is on by default and can be disabled."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").coalesce_requests is True
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123", coalesce_requests=False)
+        assert config.coalesce_requests is False
+
+    def test_config_http_cache_size(self) -> None:
+        """Test the HTTP cache is on by default and rejects negative sizes."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").http_cache_size == 512
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", http_cache_size=-1)
+
+    def test_config_json_codec(self) -> None:
+        """Test the JSON codec defaults to auto and only accepts known codecs."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").json_codec == "auto"
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123", json_codec="stdlib")
+        assert config.json_codec == "stdlib"
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", json_codec="simdjson")
+
+    def test_config_tracing_default_off(self) -> None:
+        """Test tracing is disabled unless requested."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").tracing is False
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123", tracing=True).tracing is True
+
+    def test_config_circuit_breaker(self) -> None:
+        """Test circuit breaker defaults and bounds."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert (config.circuit_breaker_threshold, config.circuit_breaker_reset) == (5, 30.0)
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", circuit_breaker_threshold=-1)
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", circuit_breaker_reset=0)
+
+    def test_config_hedging(self) -> None:
+        """Test hedging is off by default and its budget is a fraction."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert (config.hedge_requests, config.hedge_max_extra) == (False, 0.1)
+
+        for fraction in (0, 1.5):
+            with pytest.raises(ValidationError):
+                JiraConfig(url="https://jira.example.com", token="test-token-123", hedge_max_extra=fraction)
+
+    def test_config_tool_deadline(self) -> None:
+        """Test tool calls get a 60 second deadline by default and 0 disables it."""
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123").tool_deadline == 60.0
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123", tool_deadline=0).tool_deadline == 0
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", tool_deadline=-1)
+
+    def test_config_disabled_middleware(self) -> None:
+        """Test every pipeline stage runs by default and unknown or required stages cannot be disabled."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert config.middleware_stages() == MIDDLEWARE_STAGES
+
+        config = JiraConfig(
+            url="https://jira.example.com", token="test-token-123", disabled_middleware=" Retry,,tracing"
+        )
+        assert "retry" not in config.middleware_stages()
+        assert "tracing" not in config.middleware_stages()
+        assert config.middleware_stages()[0] == "auth"
+
+        with pytest.raises(ValidationError, match="Unknown middleware stage 'cache'"):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", disabled_middleware="cache")
+        with pytest.raises(ValidationError, match="'auth' cannot be disabled"):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", disabled_middleware="auth")
+
+    def test_config_transport(self) -> None:
+        """Test the server runs over stdio by default and only accepts known transports and ports."""
+        config = JiraConfig(url="https://jira.example.com", token="test-token-123")
+        assert (config.transport, config.host, config.port) == ("stdio", "127.0.0.1", 8000)
+        assert JiraConfig(url="https://jira.example.com", token="test-token-123", transport="http").transport == "http"
+
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", transport="websocket")
+        with pytest.raises(ValidationError):
+            JiraConfig(url="https://jira.example.com", token="test-token-123", port=0)
@@ -0,0 +1,232 @@
+"""Unit tests for per-tool-call deadlines"""
+
+import asyncio
+import time
+from typing import Dict, Iterator, Optional
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.deadline import (
+    AsyncDeadlineTransport,
+    DeadlineExceeded,
+    DeadlineTransport,
+    configure_deadline,
+    deadline,
+    no_deadline,
+    remaining,
+    with_deadline,
+)
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+@pytest.fixture
+def budget() -> Iterator[None]:
+    """Give decorated tools a 5 second deadline for the duration of a test."""
+    configure_deadline(5)
+    yield
+    configure_deadline(0)
+
+
+def timeouts_sent(transport_class: type, request: httpx.Request) -> Dict[str, Optional[float]]:
+    """Send a request through a deadline transport and return the timeouts the pool saw."""
+    inner = Mock(spec=httpx.BaseTransport)
+    inner.handle_request.return_value = httpx.Response(200)
+    transport_class(inner).handle_request(request)
+    return inner.handle_request.call_args[0][0].extensions["timeout"]  # type: ignore[no-any-return]
+
+
+class TestDeadline:
+    """Test the deadline context."""
+
+    def test_no_deadline_by_default(self) -> None:
+        """Test code outside a deadline has no time limit."""
+        assert remaining() is None
+        with deadline(None):
+            assert remaining() is None
+
+    def test_earlier_deadline_wins(self) -> None:
+        """Test a nested deadline can shorten but never extend the enclosing one."""
+        with deadline(10):
+            with deadline(60):
+                assert remaining() <= 10  # type: ignore[operator]
+            with deadline(1):
+                assert remaining() <= 1  # type: ignore[operator]
+            assert 1 < remaining() <= 10  # type: ignore[operator]
+        assert remaining() is None
+
+    def test_no_deadline_clears(self) -> None:
+        """Test background work can step outside the caller's deadline."""
+        with deadline(1):
+            with no_deadline():
+                assert remaining() is None
+            assert remaining() is not None
+
+
+class TestWithDeadline:
+    """Test the tool decorator."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test tools run without a deadline unless one is configured."""
+
+        @with_deadline
+        def tool() -> Optional[float]:
+            """Report the time left."""
+            return remaining()
+
+        assert tool() is None
+        assert tool.__name__ == "tool" and tool.__doc__ == "Report the time left."
+
+    def test_sync_tool_runs_under_budget(self, budget: None) -> None:
+        """Test synchronous tools see the configured budget."""
+
+        @with_deadline
+        def tool() -> Optional[float]:
+            return remaining()
+
+        assert 4 < tool() <= 5  # type: ignore[operator]
+
+    @pytest.mark.asyncio
+    async def test_async_tool_runs_under_budget(self, budget: None) -> None:
+        """Test coroutine tools see the configured budget."""
+
+        @with_deadline
+        async def tool() -> Optional[float]:
+            return remaining()
+
+        assert 4 < await tool() <= 5  # type: ignore[operator]
+
+    @pytest.mark.asyncio
+    async def test_async_tool_without_budget(self) -> None:
+        """Test coroutine tools are awaited directly while no deadline is configured."""
+
+        @with_deadline
+        async def tool() -> Optional[float]:
+            return remaining()
+
+        assert await tool() is None
+
+    @pytest.mark.asyncio
+    async def test_async_tool_cancelled_at_deadline(self) -> None:
+        """Test outstanding work is cancelled and reported once the deadline expires."""
+        cancelled = asyncio.Event()
+
+        @with_deadline
+        async def jira_slow_tool() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        configure_deadline(0.01)
+        try:
+            with pytest.raises(ValueError, match="jira_slow_tool did not finish within its 0.01 second deadline"):
+                await jira_slow_tool()
+        finally:
+            configure_deadline(0)
+
+        assert cancelled.is_set()
+
+
+class TestDeadlineTransport:
+    """Test request timeouts are shrunk to the remaining budget."""
+
+    def test_passes_through_without_deadline(self) -> None:
+        """Test requests keep their timeouts outside a deadline."""
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1", extensions={"timeout": {"read": 30.0}})
+
+        assert timeouts_sent(DeadlineTransport, request) == {"read": 30.0}
+
+    def test_shrinks_timeouts(self) -> None:
+        """Test every timeout is capped by the time left, and unset ones get it."""
+        request = httpx.Request(
+            "GET", f"{BASE}/issue/PROJ-1", extensions={"timeout": {"connect": 0.5, "read": 30.0, "pool": None}}
+        )
+
+        with deadline(2):
+            sent = timeouts_sent(DeadlineTransport, request)
+
+        assert sent["connect"] == 0.5
+        assert 1 < sent["read"] <= 2  # type: ignore[operator]
+        assert 1 < sent["pool"] <= 2  # type: ignore[operator]
+
+    def test_request_without_timeouts(self) -> None:
+        """Test a request built without httpx's timeout extension still gets the budget."""
+        with deadline(2):
+            sent = timeouts_sent(DeadlineTransport, httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+        assert set(sent) == {"connect", "read", "write", "pool"}
+
+    def test_expired_deadline_is_not_sent(self) -> None:
+        """Test no request is sent once the deadline has passed."""
+        inner = Mock(spec=httpx.BaseTransport)
+
+        with deadline(0):
+            with pytest.raises(DeadlineExceeded, match="deadline exceeded"):
+                DeadlineTransport(inner).handle_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+        inner.handle_request.assert_not_called()
+
+    def test_timeout_after_deadline_is_deadline_exceeded(self) -> None:
+        """Test a timeout that ends past the deadline is reported as the deadline, others pass through."""
+        inner = Mock(spec=httpx.BaseTransport)
+
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.01)
+            raise httpx.ReadTimeout("slow", request=request)
+
+        inner.handle_request.side_effect = slow
+
+        with deadline(0.005):
+            with pytest.raises(DeadlineExceeded, match="while waiting for Jira"):
+                DeadlineTransport(inner).handle_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+        with deadline(5):
+            with pytest.raises(httpx.ReadTimeout) as raised:
+                DeadlineTransport(inner).handle_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+        with pytest.raises(httpx.ReadTimeout):
+            DeadlineTransport(inner).handle_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+        assert not isinstance(raised.value, DeadlineExceeded)
+
+    def test_close_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = Mock(spec=httpx.BaseTransport)
+        DeadlineTransport(inner).close()
+        inner.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_shrinks_timeouts(self) -> None:
+        """Test the async transport applies the same budget."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request.return_value = httpx.Response(200)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1", extensions={"timeout": {"read": 30.0}})
+
+        with deadline(2):
+            await AsyncDeadlineTransport(inner).handle_async_request(request)
+
+        assert request.extensions["timeout"]["read"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_after_deadline(self) -> None:
+        """Test the async transport reports deadline-caused timeouts the same way."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            raise httpx.ReadTimeout("slow", request=request)
+
+        inner.handle_async_request.side_effect = slow
+
+        with deadline(0.005):
+            with pytest.raises(DeadlineExceeded):
+                await AsyncDeadlineTransport(inner).handle_async_request(httpx.Request("GET", f"{BASE}/issue/PROJ-1"))
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        await AsyncDeadlineTransport(inner).aclose()
+        inner.aclose.assert_awaited_once()
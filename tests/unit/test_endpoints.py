@@ -0,0 +1,74 @@
+"""Unit tests for endpoint classification"""
+
+import httpx
+import pytest
+
+from jira_mcp_server.endpoints import (
+    COMMENT,
+    CREATEMETA,
+    FILTER,
+    ISSUE,
+    OTHER,
+    READ,
+    SEARCH,
+    SERVER_INFO,
+    STREAM_EXTENSION,
+    TRANSITIONS,
+    WRITE,
+    endpoint_class,
+    endpoint_name,
+    is_read_only_post,
+    is_streamed,
+)
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("POST", "/search", SEARCH),
+        ("GET", "/search", SEARCH),
+        ("GET", "/issue/PROJ-1", READ),
+        ("GET", "/filter/favourite", READ),
+        ("POST", "/issue", WRITE),
+        ("PUT", "/issue/PROJ-1", WRITE),
+        ("DELETE", "/issue/PROJ-1/comment/1", WRITE),
+    ],
+)
+def test_endpoint_class(method: str, path: str, expected: str) -> None:
+    """Test requests are grouped into search, read and write classes."""
+    assert endpoint_class(httpx.Request(method, f"{BASE}{path}")) == expected
+
+
+def test_is_read_only_post() -> None:
+    """Test that only searches count as read-only POSTs."""
+    assert is_read_only_post(httpx.Request("POST", f"{BASE}/search"))
+    assert not is_read_only_post(httpx.Request("POST", f"{BASE}/issue"))
+    assert not is_read_only_post(httpx.Request("GET", f"{BASE}/search"))
+
+
+def test_is_streamed() -> None:
+    """Test that only requests flagged with the stream extension are streamed."""
+    assert is_streamed(httpx.Request("POST", f"{BASE}/search", extensions={STREAM_EXTENSION: True}))
+    assert not is_streamed(httpx.Request("POST", f"{BASE}/search"))
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("POST", "/search", SEARCH),
+        ("GET", "/issue/PROJ-1", ISSUE),
+        ("POST", "/issue", ISSUE),
+        ("GET", "/issue/createmeta/PROJ/issuetypes/1", CREATEMETA),
+        ("GET", "/issue/PROJ-1/transitions", TRANSITIONS),
+        ("POST", "/issue/PROJ-1/transitions", TRANSITIONS),
+        ("POST", "/issue/PROJ-1/comment", COMMENT),
+        ("GET", "/filter/favourite", FILTER),
+        ("GET", "/serverInfo", SERVER_INFO),
+        ("GET", "/myself", OTHER),
+    ],
+)
+def test_endpoint_name(method: str, path: str, expected: str) -> None:
+    """Test requests are labelled with the Jira endpoint they target."""
+    assert endpoint_name(httpx.Request(method, f"{BASE}{path}")) == expected
@@ -1,18 +1,25 @@
 """Unit tests for filter tools"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.jira_client import DEFAULT_SEARCH_FIELDS, JiraClient
+from jira_mcp_server.search_cache import SearchCache
 from jira_mcp_server.tools.filter_tools import (
     initialize_filter_tools,
     jira_filter_create,
+    jira_filter_create_async,
     jira_filter_delete,
+    jira_filter_delete_async,
     jira_filter_execute,
+    jira_filter_execute_async,
     jira_filter_get,
+    jira_filter_get_async,
     jira_filter_list,
+    jira_filter_list_async,
     jira_filter_update,
+    jira_filter_update_async,
 )
 
 
@@ -183,7 +190,9 @@ class TestFilterExecute:
 
         assert result["total"] == 5
         mock_client.get_filter.assert_called_once_with(filter_id="10000")
-        mock_client.search_issues.assert_called_once_with(jql="project = PROJ", max_results=50, start_at=0)
+        mock_client.search_issues.assert_called_once_with(
+            jql="project = PROJ", max_results=50, start_at=0, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
 
     @patch("jira_mcp_server.tools.filter_tools._client")
     def test_execute_filter_with_pagination(self, mock_client: Mock) -> None:
@@ -193,7 +202,9 @@ class TestFilterExecute:
 
         jira_filter_execute(filter_id="10000", max_results=10, start_at=20)
 
-        mock_client.search_issues.assert_called_once_with(jql="project = PROJ", max_results=10, start_at=20)
+        mock_client.search_issues.assert_called_once_with(
+            jql="project = PROJ", max_results=10, start_at=20, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
 
     @patch("jira_mcp_server.tools.filter_tools._client")
     def test_execute_filter_empty_id_error(self, mock_client: Mock) -> None:
@@ -304,3 +315,182 @@ class TestFilterDelete:
 
         with pytest.raises(ValueError, match="Filter deletion failed: Permission denied"):
             jira_filter_delete(filter_id="10000")
+
+
+class TestAsyncFilterTools:
+    """Test async filter tool variants."""
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", None)
+    async def test_async_tools_not_initialized(self) -> None:
+        """Test that every async variant requires an async client."""
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_create_async(name="F", jql="project = PROJ")
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_list_async()
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_get_async(filter_id="10000")
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_execute_async(filter_id="10000")
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_update_async(filter_id="10000", name="F")
+        with pytest.raises(RuntimeError, match="Filter tools not initialized"):
+            await jira_filter_delete_async(filter_id="10000")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_create_filter_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async filter creation and input validation."""
+        mock_async_client.create_filter.return_value = {"id": "10000", "name": "F"}
+
+        result = await jira_filter_create_async(name="F", jql="project = PROJ", description="Mine")
+
+        assert result["id"] == "10000"
+        mock_async_client.create_filter.assert_awaited_once_with(
+            name="F", jql="project = PROJ", description="Mine", favourite=False
+        )
+
+        with pytest.raises(ValueError, match="Filter name cannot be empty"):
+            await jira_filter_create_async(name=" ", jql="project = PROJ")
+        with pytest.raises(ValueError, match="JQL query cannot be empty"):
+            await jira_filter_create_async(name="F", jql="")
+
+        mock_async_client.create_filter.side_effect = Exception("Duplicate name")
+        with pytest.raises(ValueError, match="Filter creation failed: Duplicate name"):
+            await jira_filter_create_async(name="F", jql="project = PROJ")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_list_and_get_filter_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async filter listing and lookup."""
+        mock_async_client.list_filters.return_value = [{"id": "10000"}]
+        mock_async_client.get_filter.return_value = {"id": "10000", "jql": "project = PROJ"}
+
+        assert await jira_filter_list_async() == [{"id": "10000"}]
+        assert (await jira_filter_get_async(filter_id="10000"))["jql"] == "project = PROJ"
+
+        with pytest.raises(ValueError, match="Filter ID cannot be empty"):
+            await jira_filter_get_async(filter_id="")
+
+        mock_async_client.list_filters.side_effect = Exception("Forbidden")
+        mock_async_client.get_filter.side_effect = Exception("Not found")
+        with pytest.raises(ValueError, match="Filter list failed: Forbidden"):
+            await jira_filter_list_async()
+        with pytest.raises(ValueError, match="Get filter failed: Not found"):
+            await jira_filter_get_async(filter_id="10000")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_execute_filter_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async filter execution runs the filter's JQL."""
+        mock_async_client.get_filter.return_value = {"id": "10000", "jql": "project = PROJ"}
+        mock_async_client.search_issues.return_value = {"total": 2, "issues": []}
+
+        result = await jira_filter_execute_async(filter_id="10000", max_results=20)
+
+        assert result["total"] == 2
+        mock_async_client.search_issues.assert_awaited_once_with(
+            jql="project = PROJ", max_results=20, start_at=0, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
+
+        with pytest.raises(ValueError, match="Filter ID cannot be empty"):
+            await jira_filter_execute_async(filter_id=" ")
+
+        mock_async_client.get_filter.return_value = {"id": "10000"}
+        with pytest.raises(ValueError, match="Filter does not contain a valid JQL query"):
+            await jira_filter_execute_async(filter_id="10000")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_update_filter_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async filter update and input validation."""
+        mock_async_client.update_filter.return_value = {"id": "10000", "name": "Renamed"}
+
+        result = await jira_filter_update_async(filter_id="10000", name="Renamed")
+
+        assert result["name"] == "Renamed"
+
+        with pytest.raises(ValueError, match="Filter ID cannot be empty"):
+            await jira_filter_update_async(filter_id="", name="Renamed")
+        with pytest.raises(ValueError, match="At least one field must be provided"):
+            await jira_filter_update_async(filter_id="10000")
+
+        mock_async_client.update_filter.side_effect = Exception("Not owner")
+        with pytest.raises(ValueError, match="Filter update failed: Not owner"):
+            await jira_filter_update_async(filter_id="10000", favourite=True)
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_delete_filter_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async filter deletion and input validation."""
+        result = await jira_filter_delete_async(filter_id="10000")
+
+        assert result == {"success": True, "message": "Filter 10000 deleted successfully"}
+
+        with pytest.raises(ValueError, match="Filter ID cannot be empty"):
+            await jira_filter_delete_async(filter_id=" ")
+
+        mock_async_client.delete_filter.side_effect = Exception("Not owner")
+        with pytest.raises(ValueError, match="Filter deletion failed: Not owner"):
+            await jira_filter_delete_async(filter_id="10000")
+
+
+class TestFilterExecuteCache:
+    """Test search result caching when executing filters."""
+
+    @patch("jira_mcp_server.tools.filter_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.filter_tools._client")
+    def test_execute_filter_uses_cache(self, mock_client: Mock, search_cache: SearchCache) -> None:
+        """Test that the filter is re-read but its results come from cache."""
+        mock_client.get_filter.return_value = {"id": "10000", "jql": "project = PROJ"}
+        mock_client.search_issues.return_value = {"total": 1, "issues": [{"key": "PROJ-1"}]}
+
+        first = jira_filter_execute(filter_id="10000")
+        second = jira_filter_execute(filter_id="10000")
+
+        assert first == second
+        assert mock_client.get_filter.call_count == 2
+        mock_client.search_issues.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_execute_filter_async_uses_cache(
+        self, mock_async_client: AsyncMock, search_cache: SearchCache
+    ) -> None:
+        """Test that the async variant caches filter results too."""
+        mock_async_client.get_filter.return_value = {"id": "10000", "jql": "project = PROJ"}
+        mock_async_client.search_issues.return_value = {"total": 0, "issues": []}
+
+        await jira_filter_execute_async(filter_id="10000")
+        await jira_filter_execute_async(filter_id="10000")
+
+        mock_async_client.search_issues.assert_awaited_once()
+
+    @patch("jira_mcp_server.tools.filter_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.filter_tools._client")
+    def test_filter_writes_drop_cached_searches(self, mock_client: Mock, search_cache: SearchCache) -> None:
+        """Test that updating or deleting a filter drops searches that may reference it."""
+        search_cache.set("filter = 10001", {"total": 1, "issues": [{"key": "PROJ-1"}]})
+
+        jira_filter_update(filter_id="10001", jql="project = OTHER")
+        assert search_cache.get("filter = 10001") is None
+
+        search_cache.set("filter = 10001", {"total": 0, "issues": []})
+        jira_filter_delete(filter_id="10001")
+        assert search_cache.get("filter = 10001") is None
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.filter_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.filter_tools._async_client", new_callable=AsyncMock)
+    async def test_async_filter_writes_drop_cached_searches(
+        self, mock_async_client: AsyncMock, search_cache: SearchCache
+    ) -> None:
+        """Test that the async update and delete drop cached searches too."""
+        search_cache.set("filter = 10001", {"total": 0, "issues": []})
+        await jira_filter_update_async(filter_id="10001", name="Renamed")
+        assert search_cache.get("filter = 10001") is None
+
+        search_cache.set("filter = 10001", {"total": 0, "issues": []})
+        await jira_filter_delete_async(filter_id="10001")
+        assert search_cache.get("filter = 10001") is None
@@ -0,0 +1,337 @@
+"""Unit tests for hedged requests"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.deadline import deadline, remaining
+from jira_mcp_server.endpoints import STREAM_EXTENSION
+from jira_mcp_server.hedging import AsyncHedgingTransport, Hedger, HedgingTransport, is_hedgeable
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+def warmed(max_extra: float = 1.0, latency: float = 0.01) -> Hedger:
+    """Create a hedger that has seen enough issue latencies to start hedging."""
+    hedger = Hedger(max_extra=max_extra)
+    for _ in range(20):
+        hedger.observe("issue", latency)
+    return hedger
+
+
+def issue_request() -> httpx.Request:
+    return httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+
+def assert_legs_are_copies(original: httpx.Request, inner_calls: List[Any]) -> None:
+    """Check each leg was sent its own copy of the original request."""
+    first, second = (call.args[0] for call in inner_calls)
+    assert len({id(original), id(first), id(second)}) == 3
+    assert len({id(original.extensions), id(first.extensions), id(second.extensions)}) == 3
+    assert first.headers is not second.headers
+    for leg in (first, second):
+        assert (leg.method, leg.url, leg.headers, leg.content) == (
+            original.method,
+            original.url,
+            original.headers,
+            original.content,
+        )
+        assert leg.extensions == original.extensions
+
+
+class TrackedResponse(httpx.Response):
+    """Response that remembers whether it was closed."""
+
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    "request_,expected",
+    [
+        (httpx.Request("GET", f"{BASE}/issue/PROJ-1"), True),
+        (httpx.Request("GET", f"{BASE}/issue/PROJ-1/transitions"), True),
+        (httpx.Request("GET", f"{BASE}/issue/PROJ-1/comment"), True),
+        (httpx.Request("GET", f"{BASE}/filter/1"), True),
+        (httpx.Request("POST", f"{BASE}/issue/PROJ-1/comment"), False),
+        (httpx.Request("POST", f"{BASE}/search"), False),
+        (httpx.Request("GET", f"{BASE}/issue/createmeta"), False),
+        (httpx.Request("GET", f"{BASE}/filter/1", extensions={STREAM_EXTENSION: True}), False),
+    ],
+)
+def test_is_hedgeable(request_: httpx.Request, expected: bool) -> None:
+    """Test only idempotent reads of latency-critical endpoints are hedged."""
+    assert is_hedgeable(request_) is expected
+
+
+class TestHedger:
+    """Test the hedge delay and budget."""
+
+    def test_no_delay_until_enough_samples(self) -> None:
+        """Test endpoints are not hedged before their latency is known."""
+        hedger = Hedger()
+        for _ in range(19):
+            hedger.observe("issue", 0.1)
+
+        assert hedger.delay("issue") is None
+        hedger.observe("issue", 0.1)
+        assert hedger.delay("issue") == 0.1
+        assert hedger.delay("filter") is None
+
+    def test_delay_is_p95(self) -> None:
+        """Test the delay follows the slow tail of recent latencies."""
+        hedger = Hedger()
+        for i in range(1, 101):
+            hedger.observe("issue", i / 100)
+
+        assert hedger.delay("issue") == 0.96
+
+    def test_budget_caps_extra_load(self) -> None:
+        """Test each eligible request earns a fraction of a hedge."""
+        hedger = Hedger(max_extra=0.25)
+        results = []
+        for _ in range(8):
+            hedger.delay("issue")
+            results.append(hedger.try_hedge())
+
+        assert results == [False, False, False, True, False, False, False, True]
+        assert hedger.get_stats() == {"requests": 8, "hedged": 2, "hedge_wins": 0, "budget_exhausted": 6}
+
+
+def blocking_inner(responses: List[Callable[[], Any]]) -> Mock:
+    """Create a sync transport whose n-th call runs the n-th callable."""
+    calls = iter(responses)
+    lock = threading.Lock()
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        with lock:
+            outcome = next(calls)
+        return outcome()  # type: ignore[no-any-return]
+
+    inner = Mock(spec=httpx.BaseTransport)
+    inner.handle_request.side_effect = handle
+    return inner
+
+
+class TestHedgingTransport:
+    """Test the thread-based hedging transport."""
+
+    def test_hedge_wins_and_loser_is_closed(self) -> None:
+        """Test a slow primary is raced by a hedge whose response is used."""
+        release = threading.Event()
+        slow = TrackedResponse(200, content=b"slow")
+
+        def primary() -> httpx.Response:
+            release.wait(5)
+            return slow
+
+        hedger = warmed()
+        inner = blocking_inner([primary, lambda: httpx.Response(200, content=b"fast")])
+        transport = HedgingTransport(inner, hedger)
+        request = issue_request()
+
+        response = transport.handle_request(request)
+        release.set()
+        transport.close()
+        transport._executor.shutdown(wait=True)
+
+        assert response.content == b"fast"
+        assert slow.closed
+        assert hedger.get_stats()["hedge_wins"] == 1
+        assert_legs_are_copies(request, inner.handle_request.call_args_list)
+
+    def test_fast_primary_is_not_hedged(self) -> None:
+        """Test a request answering before the delay is sent once."""
+        hedger = warmed(latency=1.0)
+        inner = blocking_inner([lambda: httpx.Response(200)])
+
+        assert HedgingTransport(inner, hedger).handle_request(issue_request()).status_code == 200
+        assert hedger.get_stats()["hedged"] == 0
+
+    def test_waits_for_primary_without_budget(self) -> None:
+        """Test no hedge is sent once the budget is spent."""
+        hedger = warmed(max_extra=0.01, latency=0.001)
+
+        def slow() -> httpx.Response:
+            threading.Event().wait(0.05)
+            return httpx.Response(200)
+
+        inner = blocking_inner([slow])
+
+        assert HedgingTransport(inner, hedger).handle_request(issue_request()).status_code == 200
+        assert hedger.get_stats()["budget_exhausted"] == 1
+
+    def test_error_surfaces_once_both_legs_fail(self) -> None:
+        """Test a failing hedge does not hide a response still on its way, and vice versa."""
+        release = threading.Event()
+
+        def primary() -> httpx.Response:
+            release.wait(5)
+            raise httpx.ReadTimeout("primary")
+
+        def hedge() -> httpx.Response:
+            release.set()
+            raise httpx.ConnectError("hedge")
+
+        transport = HedgingTransport(blocking_inner([primary, hedge]), warmed(latency=0.001))
+
+        with pytest.raises(httpx.ReadTimeout, match="primary"):
+            transport.handle_request(issue_request())
+
+    def test_primary_wins_after_hedge_fails(self) -> None:
+        """Test the primary's response is used when the hedge fails first."""
+        release = threading.Event()
+
+        def primary() -> httpx.Response:
+            release.wait(5)
+            return httpx.Response(200, content=b"primary")
+
+        def hedge() -> httpx.Response:
+            release.set()
+            raise httpx.ConnectError("hedge")
+
+        hedger = warmed(latency=0.001)
+        transport = HedgingTransport(blocking_inner([primary, hedge]), hedger)
+
+        assert transport.handle_request(issue_request()).content == b"primary"
+        assert hedger.get_stats()["hedge_wins"] == 0
+
+    def test_legs_keep_callers_deadline(self) -> None:
+        """Test requests sent from the hedging threads still see the tool call's deadline."""
+        seen = []
+
+        def leg() -> httpx.Response:
+            seen.append(remaining())
+            return httpx.Response(200)
+
+        transport = HedgingTransport(blocking_inner([leg]), warmed(latency=1.0))
+        with deadline(5):
+            transport.handle_request(issue_request())
+
+        assert seen[0] is not None and seen[0] <= 5
+
+    def test_passes_through_other_requests(self) -> None:
+        """Test writes are sent once and unwarmed endpoints only feed the latency window."""
+        hedger = Hedger()
+        inner = blocking_inner([lambda: httpx.Response(201), lambda: httpx.Response(200)])
+        transport = HedgingTransport(inner, hedger)
+
+        transport.handle_request(httpx.Request("POST", f"{BASE}/issue"))
+        transport.handle_request(issue_request())
+
+        assert hedger.get_stats()["requests"] == 1
+        assert len(hedger._latencies["issue"]) == 1
+
+
+class TestAsyncHedgingTransport:
+    """Test the task-based hedging transport."""
+
+    @staticmethod
+    def make_inner(*legs: Callable[[], Awaitable[httpx.Response]]) -> AsyncMock:
+        """Create an async transport whose n-th call awaits the n-th coroutine function."""
+        calls = iter(legs)
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            return await next(calls)()
+
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request.side_effect = handle
+        return inner
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_is_cancelled(self) -> None:
+        """Test a slow primary is cancelled once the hedge answers."""
+        cancelled = asyncio.Event()
+
+        async def primary() -> httpx.Response:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200)  # pragma: no cover
+
+        async def hedge() -> httpx.Response:
+            return httpx.Response(200, content=b"fast")
+
+        hedger = warmed(latency=0.001)
+        inner = self.make_inner(primary, hedge)
+        transport = AsyncHedgingTransport(inner, hedger)
+        request = issue_request()
+
+        response = await transport.handle_async_request(request)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert response.content == b"fast"
+        assert hedger.get_stats()["hedge_wins"] == 1
+        assert_legs_are_copies(request, inner.handle_async_request.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_finished_loser_is_closed(self) -> None:
+        """Test a losing leg that also got a response has it closed."""
+        both_sent = asyncio.Event()
+        responses = [TrackedResponse(200), TrackedResponse(200)]
+
+        async def primary() -> httpx.Response:
+            await both_sent.wait()
+            return responses[0]
+
+        async def hedge() -> httpx.Response:
+            # Wakes the primary so both legs finish before the transport looks at them
+            both_sent.set()
+            return responses[1]
+
+        transport = AsyncHedgingTransport(self.make_inner(primary, hedge), warmed(latency=0.001))
+
+        response = await transport.handle_async_request(issue_request())
+
+        assert response in responses
+        assert [r.closed for r in responses if r is not response] == [True]
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_and_passthrough(self) -> None:
+        """Test fast primaries, unwarmed endpoints and writes are sent once."""
+
+        async def ok() -> httpx.Response:
+            return httpx.Response(200)
+
+        hedger = warmed(latency=1.0)
+        transport = AsyncHedgingTransport(self.make_inner(ok, ok, ok), hedger)
+
+        await transport.handle_async_request(issue_request())
+        await transport.handle_async_request(httpx.Request("GET", f"{BASE}/filter/1"))
+        await transport.handle_async_request(httpx.Request("POST", f"{BASE}/issue"))
+
+        assert hedger.get_stats()["hedged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_surfaces_once_both_legs_fail(self) -> None:
+        """Test the primary's error is raised when the hedge fails too."""
+
+        async def primary() -> httpx.Response:
+            await asyncio.sleep(0.02)
+            raise httpx.ReadTimeout("primary")
+
+        async def hedge() -> httpx.Response:
+            raise httpx.ConnectError("hedge")
+
+        transport = AsyncHedgingTransport(self.make_inner(primary, hedge), warmed(latency=0.001))
+
+        with pytest.raises(httpx.ReadTimeout, match="primary"):
+            await transport.handle_async_request(issue_request())
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        await AsyncHedgingTransport(inner, Hedger()).aclose()
+        inner.aclose.assert_awaited_once()
@@ -0,0 +1,310 @@
+"""Unit tests for the conditional GET cache and transports"""
+
+import json
+from typing import Any, Callable, List
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.http_cache import AsyncHttpCacheTransport, HttpCache, HttpCacheTransport, revalidatable_fields
+
+BASE = "https://jira.test.com/rest/api/2"
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 14 Oct 2026 10:00:00 GMT"
+
+
+def issue_body(updated: str = "2026-10-14T10:00:00.000+0000") -> bytes:
+    """Serialize a minimal issue."""
+    return json.dumps({"key": "PROJ-1", "fields": {"summary": "Test", "updated": updated}}).encode()
+
+
+class Recorder:
+    """Mock Jira handler that records every request it receives."""
+
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]):
+        self.handler = handler
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.handler(request)
+
+
+def etag_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a filter with an ETag, answering matching revalidations with 304."""
+    if request.headers.get("If-None-Match") == ETAG:
+        return httpx.Response(304)
+    return httpx.Response(200, json={"id": "1", "name": "Mine"}, headers={"ETag": ETAG})
+
+
+class TestHttpCache:
+    """Test the cache store."""
+
+    def test_stores_responses_with_validators(self) -> None:
+        """Test responses with ETag or Last-Modified are kept with their validators."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}/filter/1")
+        response = httpx.Response(200, json={}, headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED})
+
+        cache.store(request, response)
+        entry = cache.lookup(request)
+
+        assert entry is not None
+        assert cache.conditional_headers(entry) == {"If-None-Match": ETAG, "If-Modified-Since": LAST_MODIFIED}
+        assert cache.probe_request(request, entry) is None
+
+    def test_stores_issues_without_validators_for_probing(self) -> None:
+        """Test issues without validators are kept under their updated timestamp."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1?expand=names", headers={"Authorization": "Bearer t"})
+
+        cache.store(request, httpx.Response(200, content=issue_body()))
+        entry = cache.lookup(request)
+
+        assert entry is not None and entry.updated == "2026-10-14T10:00:00.000+0000"
+        probe = cache.probe_request(request, entry)
+        assert probe is not None
+        assert probe.url == httpx.URL(f"{BASE}/issue/PROJ-1?fields=updated")
+        assert probe.headers["Authorization"] == "Bearer t"
+        assert cache.get_stats()["probes"] == 1
+
+    @pytest.mark.parametrize(
+        "path,response",
+        [
+            ("/filter/my", httpx.Response(200, json=[])),
+            ("/issue/createmeta", httpx.Response(200, json={"fields": {"updated": "x"}})),
+        ],
+    )
+    def test_skips_responses_that_cannot_be_revalidated(self, path: str, response: httpx.Response) -> None:
+        """Test responses that are neither issues nor carry validators are not kept."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}{path}")
+
+        cache.store(request, response)
+
+        assert cache.lookup(request) is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    @pytest.mark.parametrize("body", [b"not json", b"[1]", b'{"fields": {}}'])
+    def test_issue_without_updated_is_not_probed(self, body: bytes) -> None:
+        """Test an issue body without a usable updated field is downloaded again rather than probed."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        cache.store(request, httpx.Response(200, content=body))
+        entry = cache.lookup(request)
+
+        assert entry is not None and entry.updated is None
+        assert cache.probe_request(request, entry) is None
+        assert cache.conditional_headers(entry) == {}
+
+    def test_issue_bodies_are_parsed_with_the_codec_once(self) -> None:
+        """Test the given parser reads `updated` on first revalidation only, never on store."""
+        loads = Mock(side_effect=lambda body: json.loads(body))
+        cache = HttpCache(loads=loads)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        probe = httpx.Response(200, content=issue_body())
+
+        cache.store(request, httpx.Response(200, content=issue_body()))
+        assert loads.call_count == 0
+        entry = cache.lookup(request)
+        assert entry is not None
+        for _ in range(3):
+            assert cache.probe_request(request, entry) is not None
+            assert cache.is_unchanged(entry, probe)
+
+        # One parse of the cached issue, then one per (small) probe body
+        assert loads.call_count == 1 + 3
+
+    def test_unrevalidatable_response_replaces_entry(self) -> None:
+        """Test a resource that stops sending validators is dropped."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}/filter/1")
+        cache.store(request, httpx.Response(200, json={}, headers={"ETag": ETAG}))
+
+        cache.store(request, httpx.Response(200, json={}))
+
+        assert cache.lookup(request) is None
+
+    def test_only_gets_are_looked_up(self) -> None:
+        """Test writes never match a cached entry."""
+        cache = HttpCache()
+        cache.store(httpx.Request("GET", f"{BASE}/filter/1"), httpx.Response(200, headers={"ETag": ETAG}))
+
+        assert cache.lookup(httpx.Request("PUT", f"{BASE}/filter/1")) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the oldest untouched entry is evicted at capacity."""
+        cache = HttpCache(max_entries=2)
+        requests = [httpx.Request("GET", f"{BASE}/filter/{i}") for i in range(3)]
+        cache.store(requests[0], httpx.Response(200, headers={"ETag": ETAG}))
+        cache.store(requests[1], httpx.Response(200, headers={"ETag": ETAG}))
+        cache.lookup(requests[0])
+
+        cache.store(requests[2], httpx.Response(200, headers={"ETag": ETAG}))
+
+        assert cache.lookup(requests[0]) is not None
+        assert cache.lookup(requests[1]) is None
+        assert cache.get_stats() == {"hits": 0, "misses": 3, "probes": 0, "evictions": 1, "total_entries": 2}
+
+    def test_clear(self) -> None:
+        """Test clear() drops every entry."""
+        cache = HttpCache()
+        request = httpx.Request("GET", f"{BASE}/filter/1")
+        cache.store(request, httpx.Response(200, headers={"ETag": ETAG}))
+
+        cache.clear()
+
+        assert cache.lookup(request) is None
+
+
+@pytest.mark.parametrize(
+    "fields,expected",
+    [
+        (["summary"], ["summary", "updated"]),
+        (["summary", "updated"], ["summary", "updated"]),
+        (["*all"], ["*all"]),
+        (["*navigable", "-description"], ["*navigable", "-description"]),
+        (["-description"], ["-description"]),
+        (["summary", "-updated"], ["summary", "-updated"]),
+        ([], []),
+    ],
+)
+def test_revalidatable_fields(fields: List[str], expected: List[Any]) -> None:
+    """Test `updated` is added only to projections that would leave it out."""
+    assert revalidatable_fields(fields) == expected
+
+
+class TestHttpCacheTransport:
+    """Test the synchronous cache transport."""
+
+    def make_client(self, handler: Recorder) -> httpx.Client:
+        """Create a client whose requests go through the cache to ``handler``."""
+        return httpx.Client(transport=HttpCacheTransport(httpx.MockTransport(handler), HttpCache()))
+
+    def test_revalidates_with_etag(self) -> None:
+        """Test a repeat read sends If-None-Match and a 304 is served from the cache."""
+        handler = Recorder(etag_handler)
+
+        with self.make_client(handler) as client:
+            first = client.get(f"{BASE}/filter/1")
+            second = client.get(f"{BASE}/filter/1")
+
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"id": "1", "name": "Mine"}
+        assert "If-None-Match" not in handler.requests[0].headers
+        assert handler.requests[1].headers["If-None-Match"] == ETAG
+
+    def test_changed_resource_replaces_entry(self) -> None:
+        """Test a 200 answer to a revalidation is returned and stored."""
+        versions = iter([("v1", "Old"), ("v2", "New"), ("v2", "New")])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            etag, name = next(versions)
+            if request.headers.get("If-None-Match") == f'"{etag}"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"name": name}, headers={"ETag": f'"{etag}"'})
+
+        with self.make_client(Recorder(handler)) as client:
+            names = [client.get(f"{BASE}/filter/1").json()["name"] for _ in range(3)]
+
+        assert names == ["Old", "New", "New"]
+
+    def test_revalidates_with_last_modified(self) -> None:
+        """Test If-Modified-Since is sent when only Last-Modified was received."""
+        handler = Recorder(
+            lambda r: (
+                httpx.Response(304)
+                if r.headers.get("If-Modified-Since")
+                else httpx.Response(200, json=[], headers={"Last-Modified": LAST_MODIFIED})
+            )
+        )
+
+        with self.make_client(handler) as client:
+            client.get(f"{BASE}/issue/PROJ-1/comment")
+            response = client.get(f"{BASE}/issue/PROJ-1/comment")
+
+        assert response.json() == []
+        assert handler.requests[1].headers["If-Modified-Since"] == LAST_MODIFIED
+
+    def test_probes_issue_without_validators(self) -> None:
+        """Test an unchanged issue is served after a fields=updated probe."""
+        handler = Recorder(lambda r: httpx.Response(200, content=issue_body()))
+
+        with self.make_client(handler) as client:
+            client.get(f"{BASE}/issue/PROJ-1")
+            response = client.get(f"{BASE}/issue/PROJ-1")
+
+        assert response.json()["fields"]["summary"] == "Test"
+        assert [str(r.url.query, "ascii") for r in handler.requests] == ["", "fields=updated"]
+
+    def test_probe_detects_update(self) -> None:
+        """Test a changed updated timestamp triggers a full read."""
+        stamps = iter(["2026-10-14T10:00:00.000+0000"] + ["2026-10-15T09:00:00.000+0000"] * 2)
+        handler = Recorder(lambda r: httpx.Response(200, content=issue_body(next(stamps))))
+
+        with self.make_client(handler) as client:
+            client.get(f"{BASE}/issue/PROJ-1")
+            response = client.get(f"{BASE}/issue/PROJ-1")
+
+        assert len(handler.requests) == 3
+        assert response.json()["fields"]["updated"] == "2026-10-15T09:00:00.000+0000"
+
+    def test_passes_through_writes_and_errors(self) -> None:
+        """Test writes bypass the cache and error responses are not stored."""
+        handler = Recorder(lambda r: httpx.Response(404 if r.method == "GET" else 204))
+        transport = HttpCacheTransport(httpx.MockTransport(handler), HttpCache())
+
+        with httpx.Client(transport=transport) as client:
+            assert client.put(f"{BASE}/issue/PROJ-1", json={}).status_code == 204
+            assert client.get(f"{BASE}/issue/PROJ-1").status_code == 404
+
+        assert transport._cache.get_stats()["total_entries"] == 0
+
+    def test_unexpected_304_passed_through(self) -> None:
+        """Test a 304 for an uncached resource is returned untouched."""
+        with self.make_client(Recorder(lambda r: httpx.Response(304))) as client:
+            assert client.get(f"{BASE}/filter/1").status_code == 304
+
+
+class TestAsyncHttpCacheTransport:
+    """Test the asyncio cache transport."""
+
+    def make_client(self, handler: Recorder) -> httpx.AsyncClient:
+        """Create an async client whose requests go through the cache to ``handler``."""
+        return httpx.AsyncClient(transport=AsyncHttpCacheTransport(httpx.MockTransport(handler), HttpCache()))
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag(self) -> None:
+        """Test a repeat read is answered from the cache after a 304."""
+        handler = Recorder(etag_handler)
+
+        async with self.make_client(handler) as client:
+            await client.get(f"{BASE}/filter/1")
+            response = await client.get(f"{BASE}/filter/1")
+
+        assert response.json() == {"id": "1", "name": "Mine"}
+        assert handler.requests[1].headers["If-None-Match"] == ETAG
+
+    @pytest.mark.asyncio
+    async def test_probes_issue_without_validators(self) -> None:
+        """Test unchanged and updated issues behind a fields=updated probe."""
+        stamps = iter(["a", "a", "b", "b"])
+        handler = Recorder(lambda r: httpx.Response(200, content=issue_body(next(stamps))))
+
+        async with self.make_client(handler) as client:
+            for _ in range(3):
+                await client.get(f"{BASE}/issue/PROJ-1")
+
+        # full read, probe (unchanged), probe (changed) + full read
+        assert [str(r.url.query, "ascii") for r in handler.requests] == ["", "fields=updated", "fields=updated", ""]
+
+    @pytest.mark.asyncio
+    async def test_passes_through_writes(self) -> None:
+        """Test writes bypass the cache."""
+        handler = Recorder(lambda r: httpx.Response(201, json={"key": "PROJ-2"}))
+
+        async with self.make_client(handler) as client:
+            response = await client.post(f"{BASE}/issue", json={})
+
+        assert response.status_code == 201
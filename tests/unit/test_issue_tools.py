@@ -1,18 +1,31 @@
 """Unit tests for issue tools (T026-T033)"""
 
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from jira_mcp_server.config import JiraConfig
 from jira_mcp_server.models import FieldSchema, FieldType, FieldValidationError
+from jira_mcp_server.schema_cache import SchemaCache
+from jira_mcp_server.search_cache import SearchCache
+from jira_mcp_server.tools import issue_tools
 from jira_mcp_server.tools.issue_tools import (
     _get_field_schema,
+    _get_field_schema_async,
+    _refresh_field_schema,
+    _refresh_field_schema_async,
     initialize_issue_tools,
     jira_issue_create,
+    jira_issue_create_async,
     jira_issue_get,
+    jira_issue_get_async,
     jira_issue_update,
+    jira_issue_update_async,
+    prefetch_schemas,
 )
 
 
@@ -60,6 +73,25 @@ class TestIssueToolsInitialization:
         # The globals are set, but we can't easily test them directly
         # Integration will be tested through the function tests
 
+    def test_initialize_issue_tools_with_shared_clients(self, mock_config: JiraConfig) -> None:
+        """Test that injected clients are used instead of building new ones."""
+        client, async_client = Mock(), Mock()
+
+        initialize_issue_tools(mock_config, client=client, async_client=async_client)
+
+        assert issue_tools._client is client
+        assert issue_tools._async_client is async_client
+
+    def test_initialize_issue_tools_with_cache_dir(self, tmp_path: Path) -> None:
+        """Test that a configured cache directory adds a persistent schema tier."""
+        config = JiraConfig(url="https://jira.test.com", token="test-token", cache_dir=str(tmp_path))
+
+        initialize_issue_tools(config)
+
+        assert issue_tools._cache is not None
+        assert issue_tools._cache._store is not None
+        assert issue_tools._cache._store.path == tmp_path / "schema_cache.sqlite3"
+
 
 class TestIssueCreate:
     """Test jira_issue_create function."""
@@ -182,8 +214,9 @@ class TestIssueCreate:
                 issue_type="Task",
             )
 
+    @patch("jira_mcp_server.tools.issue_tools._client")
     @patch("jira_mcp_server.tools.issue_tools._get_field_schema")
-    def test_create_issue_schema_fetch_error(self, mock_get_schema: Mock) -> None:
+    def test_create_issue_schema_fetch_error(self, mock_get_schema: Mock, mock_client: Mock) -> None:
         """Test error handling when schema fetch fails."""
         mock_get_schema.side_effect = Exception("Failed to fetch schema")
 
@@ -308,7 +341,7 @@ class TestIssueGet:
 
         assert result["key"] == "PROJ-123"
         assert result["fields"]["summary"] == "Test issue"
-        mock_client.get_issue.assert_called_once_with("PROJ-123")
+        mock_client.get_issue.assert_called_once_with("PROJ-123", fields=None, expand=None)
 
     @patch("jira_mcp_server.tools.issue_tools._client")
     def test_get_issue_not_found(self, mock_client: Mock) -> None:
@@ -341,6 +374,7 @@ class TestGetFieldSchema:
     ) -> None:
         """Test that cached schema is returned when available."""
         mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
 
         result = _get_field_schema("PROJ", "Task")
 
@@ -415,3 +449,327 @@ class TestGetFieldSchema:
 
         assert len(result) == 1
         assert result[0].allowed_values == ["High", "Medium", "Low"]
+
+
+class TestAsyncIssueTools:
+    """Test async issue tool variants."""
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._async_client", None)
+    @patch("jira_mcp_server.tools.issue_tools._cache", None)
+    async def test_async_tools_not_initialized(self) -> None:
+        """Test that async variants require an async client."""
+        with pytest.raises(RuntimeError, match="Issue tools not initialized"):
+            await _get_field_schema_async("PROJ", "Task")
+        with pytest.raises(RuntimeError, match="Issue tools not initialized"):
+            await jira_issue_create_async(project="PROJ", summary="Test")
+        with pytest.raises(RuntimeError, match="Issue tools not initialized"):
+            await jira_issue_update_async(issue_key="PROJ-1", summary="Test")
+        with pytest.raises(RuntimeError, match="Issue tools not initialized"):
+            await jira_issue_get_async(issue_key="PROJ-1")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    async def test_get_field_schema_async_cache_hit_and_miss(
+        self, mock_cache: Mock, mock_async_client: AsyncMock, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test async schema lookup serves hits from cache and fills misses."""
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        assert await _get_field_schema_async("PROJ", "Task") == sample_schema
+        mock_async_client.get_project_schema.assert_not_awaited()
+
+        mock_cache.get.return_value = None
+        mock_async_client.get_project_schema.return_value = [
+            {"key": "customfield_10001", "name": "Story Points", "required": False, "schema": {"type": "number"}}
+        ]
+
+        result = await _get_field_schema_async("PROJ", "Task")
+
+        assert result[0].key == "customfield_10001"
+        assert result[0].type == FieldType.NUMBER
+        mock_cache.set.assert_called_once_with("PROJ", "Task", result)
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._validator", new_callable=Mock)
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    async def test_create_issue_async(
+        self, mock_cache: Mock, mock_async_client: AsyncMock, mock_validator: Mock, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test async issue creation validates fields and creates the issue."""
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        mock_async_client.create_issue.return_value = {"key": "PROJ-124", "id": "10002"}
+
+        result = await jira_issue_create_async(
+            project="PROJ", summary="Test", priority="High", labels=["backend"], customfield_10001=5
+        )
+
+        assert result["key"] == "PROJ-124"
+        fields = mock_async_client.create_issue.call_args[0][0]["fields"]
+        assert fields["priority"] == {"name": "High"}
+        assert fields["customfield_10001"] == 5
+        mock_validator.validate_fields.assert_called_once_with(fields, sample_schema)
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._validator", new_callable=Mock)
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    async def test_create_issue_async_errors(
+        self, mock_cache: Mock, mock_async_client: AsyncMock, mock_validator: Mock, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test async issue creation maps schema, validation and API errors."""
+        mock_cache.get.return_value = None
+        mock_async_client.get_project_schema.side_effect = Exception("Project not found")
+        with pytest.raises(ValueError, match="Failed to get project schema: Project not found"):
+            await jira_issue_create_async(project="PROJ", summary="Test")
+
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        mock_validator.validate_fields.side_effect = FieldValidationError("summary", "required")
+        with pytest.raises(ValueError, match="Validation failed"):
+            await jira_issue_create_async(project="PROJ", summary="Test")
+
+        mock_validator.validate_fields.side_effect = None
+        mock_async_client.create_issue.side_effect = Exception("Jira down")
+        with pytest.raises(ValueError, match="Failed to create issue: Jira down"):
+            await jira_issue_create_async(project="PROJ", summary="Test")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    async def test_update_issue_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async issue update sends only provided fields and returns the fresh issue."""
+        mock_async_client.get_issue.return_value = {"key": "PROJ-1", "fields": {"summary": "New"}}
+
+        result = await jira_issue_update_async(issue_key="PROJ-1", summary="New", due_date="2025-12-31")
+
+        assert result["fields"]["summary"] == "New"
+        mock_async_client.update_issue.assert_awaited_once_with(
+            "PROJ-1", {"fields": {"summary": "New", "duedate": "2025-12-31"}}
+        )
+
+        with pytest.raises(ValueError, match="No fields provided to update"):
+            await jira_issue_update_async(issue_key="PROJ-1")
+
+        mock_async_client.update_issue.side_effect = Exception("Issue not found")
+        with pytest.raises(ValueError, match="Failed to update issue: Issue not found"):
+            await jira_issue_update_async(issue_key="PROJ-1", summary="New")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    async def test_get_issue_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async issue retrieval and error mapping."""
+        mock_async_client.get_issue.return_value = {"key": "PROJ-1"}
+
+        assert await jira_issue_get_async(issue_key="PROJ-1") == {"key": "PROJ-1"}
+
+        mock_async_client.get_issue.side_effect = Exception("Issue PROJ-1 not found.")
+        with pytest.raises(ValueError, match="Failed to get issue: Issue PROJ-1 not found"):
+            await jira_issue_get_async(issue_key="PROJ-1")
+
+
+class TestIssueWritesInvalidateSearchCache:
+    """Test that issue writes invalidate cached search results."""
+
+    @patch("jira_mcp_server.tools.issue_tools._search_cache")
+    @patch("jira_mcp_server.tools.issue_tools._validator")
+    @patch("jira_mcp_server.tools.issue_tools._client")
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    def test_create_invalidates(
+        self,
+        mock_cache: Mock,
+        mock_client: Mock,
+        mock_validator: Mock,
+        mock_search_cache: Mock,
+        sample_schema: List[FieldSchema],
+    ) -> None:
+        """Test that creating an issue invalidates cached search results."""
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        mock_client.create_issue.return_value = {"key": "PROJ-123"}
+
+        jira_issue_create(project="PROJ", summary="Test")
+
+        mock_search_cache.invalidate_all.assert_called_once_with()
+
+    @patch("jira_mcp_server.tools.issue_tools._search_cache")
+    @patch("jira_mcp_server.tools.issue_tools._client")
+    def test_update_invalidates(self, mock_client: Mock, mock_search_cache: Mock) -> None:
+        """Test that updating an issue invalidates cached search results."""
+        jira_issue_update(issue_key="PROJ-123", summary="Updated")
+
+        mock_search_cache.invalidate_all.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.issue_tools._search_cache")
+    @patch("jira_mcp_server.tools.issue_tools._validator", new_callable=Mock)
+    @patch("jira_mcp_server.tools.issue_tools._async_client", new_callable=AsyncMock)
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    async def test_async_writes_invalidate(
+        self,
+        mock_cache: Mock,
+        mock_async_client: AsyncMock,
+        mock_validator: Mock,
+        mock_search_cache: Mock,
+        sample_schema: List[FieldSchema],
+    ) -> None:
+        """Test that async create and update invalidate cached results."""
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        mock_async_client.create_issue.return_value = {"id": "10001"}
+
+        await jira_issue_create_async(project="PROJ", summary="Test")
+        await jira_issue_update_async(issue_key="PROJ-7", summary="Updated")
+
+        assert mock_search_cache.invalidate_all.call_count == 2
+
+    @patch("jira_mcp_server.tools.issue_tools._validator", new_callable=Mock)
+    @patch("jira_mcp_server.tools.issue_tools._client")
+    @patch("jira_mcp_server.tools.issue_tools._cache")
+    def test_create_drops_searches_not_naming_project(
+        self, mock_cache: Mock, mock_client: Mock, mock_validator: Mock, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test a created issue cannot be missing from a cached search that never named its project."""
+        search_cache = SearchCache()
+        search_cache.set("assignee = currentUser()", {"total": 1, "issues": [{"key": "OTHER-1"}]})
+        mock_cache.get.return_value = sample_schema
+        mock_cache.start_refresh.return_value = False
+        mock_client.create_issue.return_value = {"key": "PROJ-123"}
+
+        with patch("jira_mcp_server.tools.issue_tools._search_cache", search_cache):
+            jira_issue_create(project="PROJ", summary="Test", assignee="me")
+
+        assert search_cache.get("assignee = currentUser()") is None
+
+
+class TestStaleSchemaRefresh:
+    """Test stale-while-revalidate refresh of cached schemas."""
+
+    RAW_SCHEMA = [{"key": "summary", "name": "Summary", "required": True, "schema": {"type": "string"}}]
+
+    @pytest.fixture
+    def stale_cache(self, sample_schema: List[FieldSchema]) -> SchemaCache:
+        """Create a cache holding an expired schema that is still inside the stale window."""
+        cache = SchemaCache(ttl_seconds=60, max_stale_seconds=3600)
+        cache.set("PROJ", "Task", sample_schema)
+        cache._cache[cache._make_key("PROJ", "Task")].expires_at = datetime.now() - timedelta(seconds=1)
+        return cache
+
+    def test_stale_schema_served_and_refreshed_in_background(
+        self, stale_cache: SchemaCache, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test that a stale hit returns immediately and a thread fetches the replacement."""
+        mock_client = Mock()
+        mock_client.get_project_schema.return_value = self.RAW_SCHEMA
+        started: List[Mock] = []
+
+        with (
+            patch.object(issue_tools, "_cache", stale_cache),
+            patch.object(issue_tools, "_client", mock_client),
+            patch("jira_mcp_server.tools.issue_tools.threading.Thread") as mock_thread,
+        ):
+            mock_thread.return_value.start.side_effect = lambda: started.append(mock_thread.call_args)
+
+            assert _get_field_schema("PROJ", "Task") == sample_schema
+            # A second caller does not start another refresh
+            assert _get_field_schema("PROJ", "Task") == sample_schema
+            assert len(started) == 1
+
+            # Run the refresh the thread would have run
+            _refresh_field_schema("PROJ", "Task")
+
+        mock_client.get_project_schema.assert_called_once_with("PROJ", "Task")
+        assert stale_cache.get_stats()["stale_hits"] == 2
+        assert stale_cache.start_refresh("PROJ", "Task") is False  # fresh again
+
+    def test_failed_refresh_keeps_stale_schema(
+        self, stale_cache: SchemaCache, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test that a refresh error leaves the stale schema in place and allows a retry."""
+        mock_client = Mock()
+        mock_client.get_project_schema.side_effect = Exception("Jira down")
+        stale_cache.start_refresh("PROJ", "Task")
+
+        with patch.object(issue_tools, "_cache", stale_cache), patch.object(issue_tools, "_client", mock_client):
+            _refresh_field_schema("PROJ", "Task")
+
+        assert stale_cache.get("PROJ", "Task") == sample_schema
+        assert stale_cache.start_refresh("PROJ", "Task") is True
+
+    @pytest.mark.asyncio
+    async def test_stale_schema_refreshed_by_async_task(
+        self, stale_cache: SchemaCache, sample_schema: List[FieldSchema]
+    ) -> None:
+        """Test that the async path schedules a background task for stale entries."""
+        mock_async_client = AsyncMock()
+        mock_async_client.get_project_schema.return_value = self.RAW_SCHEMA
+
+        with (
+            patch.object(issue_tools, "_cache", stale_cache),
+            patch.object(issue_tools, "_async_client", mock_async_client),
+        ):
+            assert await _get_field_schema_async("PROJ", "Task") == sample_schema
+            await asyncio.gather(*issue_tools._refresh_tasks)
+
+            mock_async_client.get_project_schema.side_effect = Exception("Jira down")
+            stale_cache._cache[stale_cache._make_key("PROJ", "Task")].expires_at = datetime.now() - timedelta(seconds=1)
+            await _get_field_schema_async("PROJ", "Task")
+            await asyncio.gather(*issue_tools._refresh_tasks)
+
+        assert mock_async_client.get_project_schema.await_count == 2
+        assert stale_cache.get("PROJ", "Task") is not None
+        assert not issue_tools._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_initialization_is_noop(self) -> None:
+        """Test that refreshes scheduled before re-initialization do nothing."""
+        with patch.object(issue_tools, "_cache", None):
+            _refresh_field_schema("PROJ", "Task")
+            await _refresh_field_schema_async("PROJ", "Task")
+
+
+class TestPrefetchSchemas:
+    """Test startup schema warm-up."""
+
+    RAW_SCHEMA = [{"key": "summary", "name": "Summary", "required": True, "schema": {"type": "string"}}]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_loads_issue_types_and_whole_projects(self) -> None:
+        """Test that single issue types and whole projects land in the schema cache."""
+        cache = SchemaCache(ttl_seconds=3600)
+        mock_async_client = AsyncMock()
+        mock_async_client.get_project_schema.return_value = self.RAW_SCHEMA
+        mock_async_client.get_project_schemas.return_value = {"Bug": self.RAW_SCHEMA, "Task": []}
+
+        with patch.object(issue_tools, "_cache", cache), patch.object(issue_tools, "_async_client", mock_async_client):
+            result = await prefetch_schemas([("PROJ", "Story"), ("OPS", None)])
+
+        assert result == {"loaded": 3, "failed": 0}
+        mock_async_client.get_project_schema.assert_awaited_once_with("PROJ", "Story")
+        mock_async_client.get_project_schemas.assert_awaited_once_with("OPS")
+        story = cache.get("PROJ", "Story")
+        assert story is not None and story[0].key == "summary"
+        assert cache.get("OPS", "Bug") is not None
+        assert cache.get("OPS", "Task") == []
+
+    @pytest.mark.asyncio
+    async def test_prefetch_failures_are_counted_not_raised(self) -> None:
+        """Test that one bad target does not stop the others."""
+        cache = SchemaCache(ttl_seconds=3600)
+        mock_async_client = AsyncMock()
+        mock_async_client.get_project_schema.side_effect = [ValueError("not found"), self.RAW_SCHEMA]
+
+        with patch.object(issue_tools, "_cache", cache), patch.object(issue_tools, "_async_client", mock_async_client):
+            result = await prefetch_schemas([("NOPE", "Bug"), ("PROJ", "Bug")])
+
+        assert result == {"loaded": 1, "failed": 1}
+        assert cache.get("PROJ", "Bug") is not None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_not_initialized(self) -> None:
+        """Test that prefetching before initialization raises."""
+        with patch.object(issue_tools, "_cache", None):
+            with pytest.raises(RuntimeError, match="not initialized"):
+                await prefetch_schemas([("PROJ", "Bug")])
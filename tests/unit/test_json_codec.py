@@ -0,0 +1,103 @@
+"""Unit tests for the pluggable JSON codec"""
+
+import json
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.json_codec import get_codec
+
+PAYLOAD = {"key": "PROJ-1", "fields": {"summary": "Café ☕", "labels": ["a", "b"], "votes": 3, "resolution": None}}
+
+
+class FakeDecodeError(Exception):
+    """Stands in for msgspec.DecodeError, which is not a ValueError."""
+
+
+@pytest.fixture
+def fake_msgspec() -> Iterator[ModuleType]:
+    """Install a minimal msgspec stand-in backed by the stdlib."""
+
+    class Decoder:
+        def decode(self, data: bytes) -> Any:
+            try:
+                return json.loads(data)
+            except json.JSONDecodeError as e:
+                raise FakeDecodeError(str(e)) from e
+
+    class Encoder:
+        def encode(self, obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+    module = ModuleType("msgspec")
+    module.json = SimpleNamespace(Decoder=Decoder, Encoder=Encoder)  # type: ignore[attr-defined]
+    module.DecodeError = FakeDecodeError  # type: ignore[attr-defined]
+    with patch.dict(sys.modules, {"msgspec": module}):
+        yield module
+
+
+class TestGetCodec:
+    """Test codec selection and round-tripping."""
+
+    @pytest.mark.parametrize("name", ["stdlib", "orjson"])
+    def test_round_trip(self, name: str) -> None:
+        """Test each installed codec encodes to compact UTF-8 and parses it back."""
+        codec = get_codec(name)
+
+        encoded = codec.dumps(PAYLOAD)
+
+        assert codec.name == name
+        assert isinstance(encoded, bytes)
+        assert "Café ☕".encode() in encoded
+        assert b", " not in encoded
+        assert codec.loads(encoded) == PAYLOAD
+        assert json.loads(encoded) == PAYLOAD
+
+    def test_stdlib_matches_httpx_encoding(self) -> None:
+        """Test the stdlib codec sends the same bytes httpx's json= would."""
+        assert get_codec("stdlib").dumps(PAYLOAD) == httpx.Request("POST", "https://x", json=PAYLOAD).content
+
+    def test_msgspec(self, fake_msgspec: ModuleType) -> None:
+        """Test msgspec is used through reusable encoder/decoder instances."""
+        codec = get_codec("msgspec")
+
+        assert codec.name == "msgspec"
+        assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+
+    def test_msgspec_decode_errors_are_value_errors(self, fake_msgspec: ModuleType) -> None:
+        """Test malformed bodies raise ValueError like the other codecs."""
+        with pytest.raises(ValueError):
+            get_codec("msgspec").loads(b"not json")
+
+    def test_malformed_body_raises_value_error(self) -> None:
+        """Test every installed codec reports malformed bodies as ValueError."""
+        for name in ("stdlib", "orjson"):
+            with pytest.raises(ValueError):
+                get_codec(name).loads(b"<html>")
+
+    def test_auto_prefers_fastest_installed(self) -> None:
+        """Test auto picks orjson, then msgspec, then the stdlib."""
+        assert get_codec().name == "orjson"
+
+        with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+            assert get_codec("auto").name == "stdlib"
+
+    def test_auto_falls_back_to_msgspec(self, fake_msgspec: ModuleType) -> None:
+        """Test msgspec is chosen when orjson is missing."""
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert get_codec("auto").name == "msgspec"
+
+    def test_missing_codec_rejected(self) -> None:
+        """Test asking for an uninstalled codec fails clearly."""
+        with patch.dict(sys.modules, {"msgspec": None}):
+            with pytest.raises(ValueError, match="JSON codec 'msgspec' is not installed"):
+                get_codec("msgspec")
+
+    def test_unknown_codec_rejected(self) -> None:
+        """Test unknown codec names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON codec 'simdjson'"):
+            get_codec("simdjson")
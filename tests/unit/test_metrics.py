@@ -0,0 +1,196 @@
+"""Unit tests for per-endpoint request metrics and the metrics transports"""
+
+from typing import AsyncIterator, Iterator
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.metrics import (
+    AsyncMetricsTransport,
+    LatencyHistogram,
+    MetricsTransport,
+    RequestMetrics,
+)
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+class Body(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that is only read when iterated, like one coming off the network."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'{"key": '
+        yield b'"PROJ-1"}'
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Mock Jira: issues are streamed, searches fail with 503 from memory, filters time out."""
+    if request.url.path.endswith("/filter/1"):
+        raise httpx.ReadTimeout("slow", request=request)
+    if request.url.path.endswith("/search"):
+        return httpx.Response(503, content=b"busy")
+    return httpx.Response(200, stream=Body())
+
+
+class TestLatencyHistogram:
+    """Test the fixed-bucket histogram."""
+
+    def test_buckets_are_cumulative(self) -> None:
+        """Test observations are counted in the first bucket that holds them."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(seconds)
+
+        assert histogram.count == 4
+        assert histogram.total == pytest.approx(3.65)
+        assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+
+    def test_quantiles(self) -> None:
+        """Test quantiles are estimated as bucket upper bounds."""
+        histogram = LatencyHistogram((0.1, 1.0))
+        assert histogram.quantile(0.5) is None
+
+        for seconds in (0.05,) * 8 + (0.5, 3.0):
+            histogram.observe(seconds)
+
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.9) == 1.0
+        assert histogram.quantile(0.99) == 1.0
+
+
+class TestRequestMetrics:
+    """Test aggregation and rendering of request metrics."""
+
+    def make_metrics(self) -> RequestMetrics:
+        metrics = RequestMetrics()
+        metrics.record_response("issue", 200, 0.02, 0, 1000)
+        metrics.record_response("issue", 404, 0.3, 0, 50)
+        metrics.record_response("search", 200, 1.5, 120, 50000)
+        metrics.record_error("search", 120)
+        metrics.retries.record_retry("timeout", "search")
+        return metrics
+
+    def test_get_stats(self) -> None:
+        """Test counters and latency summaries are reported per endpoint."""
+        stats = self.make_metrics().get_stats()
+
+        assert list(stats["endpoints"]) == ["issue", "search"]
+        issue = stats["endpoints"]["issue"]
+        assert issue["requests"] == 2
+        assert issue["errors"] == 0
+        assert issue["status_codes"] == {"200": 1, "404": 1}
+        assert issue["bytes_received"] == 1050
+        assert issue["latency_seconds"]["mean"] == 0.16
+        assert issue["latency_seconds"]["p50"] == 0.025
+        assert issue["latency_seconds"]["p99"] == 0.5
+        assert issue["latency_seconds"]["histogram"]["+Inf"] == 2
+        search = stats["endpoints"]["search"]
+        assert (search["errors"], search["bytes_sent"]) == (1, 240)
+        assert stats["retries"]["retries_by_endpoint"] == {"search": 1}
+
+    def test_empty_endpoint_latency(self) -> None:
+        """Test an endpoint with only failed attempts has no latency summary."""
+        metrics = RequestMetrics()
+        metrics.record_error("filter", 0)
+
+        latency = metrics.get_stats()["endpoints"]["filter"]["latency_seconds"]
+
+        assert latency["mean"] is None and latency["p95"] is None
+
+    def test_render_prometheus(self) -> None:
+        """Test the text exposition lists histograms and counters per endpoint."""
+        text = self.make_metrics().render_prometheus()
+        lines = text.splitlines()
+
+        assert text.endswith("\n")
+        assert "# TYPE jira_request_duration_seconds histogram" in lines
+        assert 'jira_request_duration_seconds_bucket{endpoint="issue",le="0.025"} 1' in lines
+        assert 'jira_request_duration_seconds_bucket{endpoint="search",le="+Inf"} 1' in lines
+        assert 'jira_request_duration_seconds_count{endpoint="issue"} 2' in lines
+        assert 'jira_requests_total{endpoint="issue",status="404"} 1' in lines
+        assert 'jira_request_errors_total{endpoint="search"} 1' in lines
+        assert 'jira_request_bytes_total{endpoint="search"} 240' in lines
+        assert 'jira_response_bytes_total{endpoint="issue"} 1050' in lines
+        assert 'jira_retries_total{endpoint="search"} 1' in lines
+        assert 'jira_retries_by_reason_total{reason="timeout"} 1' in lines
+        assert "# TYPE jira_retries_total counter" in lines
+
+
+class TestMetricsTransport:
+    """Test the synchronous metrics transport."""
+
+    def test_records_each_exchange(self) -> None:
+        """Test responses are recorded with status, sizes and latency once their body is read."""
+        metrics = RequestMetrics()
+        client = httpx.Client(transport=MetricsTransport(httpx.MockTransport(handler), metrics))
+
+        clock = Mock(**{"perf_counter.side_effect": [10.0, 10.2, 20.0, 20.5]})
+        with patch("jira_mcp_server.metrics.time", clock):
+            client.get(f"{BASE}/issue/PROJ-1")
+            client.post(f"{BASE}/search", content=b'{"jql": "x"}')
+        with pytest.raises(httpx.ReadTimeout):
+            client.get(f"{BASE}/filter/1")
+
+        endpoints = metrics.get_stats()["endpoints"]
+        assert endpoints["issue"]["status_codes"] == {"200": 1}
+        assert endpoints["issue"]["bytes_received"] == 17
+        assert endpoints["issue"]["latency_seconds"]["mean"] == 0.2
+        assert endpoints["search"]["status_codes"] == {"503": 1}
+        assert endpoints["search"]["bytes_received"] == 4
+        assert endpoints["search"]["bytes_sent"] == 12
+        assert endpoints["search"]["latency_seconds"]["p50"] == 0.5
+        assert endpoints["filter"]["errors"] == 1
+        client.close()
+
+    def test_streamed_response_recorded_when_closed(self) -> None:
+        """Test a streamed body is counted as it is read and recorded only once closed."""
+        metrics = RequestMetrics()
+        client = httpx.Client(transport=MetricsTransport(httpx.MockTransport(handler), metrics))
+
+        with client.stream("GET", f"{BASE}/issue/PROJ-1") as response:
+            assert metrics.get_stats()["endpoints"] == {}
+            assert b"".join(response.iter_bytes()) == b'{"key": "PROJ-1"}'
+
+        assert metrics.get_stats()["endpoints"]["issue"]["requests"] == 1
+
+    def test_close_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = httpx.MockTransport(handler)
+        with patch.object(inner, "close") as close:
+            MetricsTransport(inner, RequestMetrics()).close()
+        close.assert_called_once()
+
+
+class TestAsyncMetricsTransport:
+    """Test the async metrics transport."""
+
+    @pytest.mark.asyncio
+    async def test_records_each_exchange(self) -> None:
+        """Test responses and failed attempts are recorded."""
+        metrics = RequestMetrics()
+        client = httpx.AsyncClient(transport=AsyncMetricsTransport(httpx.MockTransport(handler), metrics))
+
+        await client.get(f"{BASE}/issue/PROJ-1")
+        await client.post(f"{BASE}/search", content=b"{}")
+        with pytest.raises(httpx.ReadTimeout):
+            await client.get(f"{BASE}/filter/1")
+
+        endpoints = metrics.get_stats()["endpoints"]
+        assert endpoints["issue"]["requests"] == 1
+        assert endpoints["issue"]["bytes_received"] == 17
+        assert endpoints["search"]["status_codes"] == {"503": 1}
+        assert endpoints["filter"]["errors"] == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = httpx.MockTransport(handler)
+        with patch.object(inner, "aclose") as aclose:
+            await AsyncMetricsTransport(inner, RequestMetrics()).aclose()
+        aclose.assert_awaited_once()
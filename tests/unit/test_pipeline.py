@@ -0,0 +1,235 @@
+"""Unit tests for the request middleware pipeline"""
+
+from typing import Any, List
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.async_jira_client import AsyncJiraClient
+from jira_mcp_server.circuit_breaker import AsyncCircuitBreakerTransport, CircuitBreakerTransport
+from jira_mcp_server.concurrency import AsyncConcurrencyLimitTransport, ConcurrencyLimitTransport
+from jira_mcp_server.config import MIDDLEWARE_STAGES, JiraConfig
+from jira_mcp_server.deadline import AsyncDeadlineTransport, DeadlineTransport
+from jira_mcp_server.hedging import AsyncHedgingTransport, HedgingTransport
+from jira_mcp_server.http_cache import AsyncHttpCacheTransport, HttpCacheTransport
+from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.metrics import AsyncMetricsTransport, MetricsTransport
+from jira_mcp_server.pipeline import (
+    AsyncAuthTransport,
+    AuthTransport,
+    build_async_transport,
+    build_transport,
+    environment_proxy,
+)
+from jira_mcp_server.rate_limit import AsyncRateLimitTransport, RateLimitTransport
+from jira_mcp_server.retry import AsyncRetryTransport, RetryTransport
+from jira_mcp_server.single_flight import AsyncSingleFlightTransport, SingleFlightTransport
+from jira_mcp_server.tracing import AsyncTracingTransport, TracingTransport
+
+BASE = "https://jira.test.com/rest/api/2"
+
+ALL_FEATURES = {
+    "adaptive_concurrency": True,
+    "rate_limit": 10,
+    "hedge_requests": True,
+    "tracing": True,
+}
+
+
+def make_config(**overrides: Any) -> JiraConfig:
+    return JiraConfig(url="https://jira.test.com", token="test-token-123", **overrides)
+
+
+def layers(transport: Any) -> List[type]:
+    """List the transport classes of a pipeline, innermost first."""
+    found = []
+    while hasattr(transport, "_transport"):
+        found.append(type(transport))
+        transport = transport._transport
+    return found[::-1]
+
+
+class TestBuildTransport:
+    """Test stages are stacked in order and only when enabled."""
+
+    def test_every_stage_in_order(self) -> None:
+        """Test a client with every feature on gets every stage, innermost first."""
+        pipeline = build_transport(JiraClient(make_config(**ALL_FEATURES)), httpx.MockTransport(Mock()))
+
+        assert len(MIDDLEWARE_STAGES) == 11
+        assert layers(pipeline) == [
+            AuthTransport,
+            MetricsTransport,
+            DeadlineTransport,
+            ConcurrencyLimitTransport,
+            RateLimitTransport,
+            RetryTransport,
+            CircuitBreakerTransport,
+            HedgingTransport,
+            HttpCacheTransport,
+            SingleFlightTransport,
+            TracingTransport,
+        ]
+        pipeline.close()
+
+    def test_every_async_stage_in_order(self) -> None:
+        """Test the async pipeline mirrors the sync one."""
+        pipeline = build_async_transport(AsyncJiraClient(make_config(**ALL_FEATURES)), httpx.MockTransport(Mock()))
+
+        assert layers(pipeline) == [
+            AsyncAuthTransport,
+            AsyncMetricsTransport,
+            AsyncDeadlineTransport,
+            AsyncConcurrencyLimitTransport,
+            AsyncRateLimitTransport,
+            AsyncRetryTransport,
+            AsyncCircuitBreakerTransport,
+            AsyncHedgingTransport,
+            AsyncHttpCacheTransport,
+            AsyncSingleFlightTransport,
+            AsyncTracingTransport,
+        ]
+
+    def test_features_off_skip_their_stages(self) -> None:
+        """Test optional stages are left out while their feature is off."""
+        config = make_config(circuit_breaker_threshold=0, http_cache_size=0, coalesce_requests=False)
+
+        pipeline = build_transport(JiraClient(config), httpx.MockTransport(Mock()))
+
+        assert layers(pipeline) == [AuthTransport, MetricsTransport, DeadlineTransport, RetryTransport]
+
+    def test_disabled_middleware(self) -> None:
+        """Test JIRA_MCP_DISABLED_MIDDLEWARE removes stages whatever their feature settings."""
+        config = make_config(disabled_middleware="retry, HTTP_CACHE,hedging", hedge_requests=True)
+
+        pipeline = build_async_transport(AsyncJiraClient(config), httpx.MockTransport(Mock()))
+
+        assert layers(pipeline) == [
+            AsyncAuthTransport,
+            AsyncMetricsTransport,
+            AsyncDeadlineTransport,
+            AsyncCircuitBreakerTransport,
+            AsyncSingleFlightTransport,
+        ]
+
+
+class TestAuthTransport:
+    """Test credentials are added to every request."""
+
+    def test_sets_headers(self) -> None:
+        """Test credentials are added and httpx's default Accept header is replaced."""
+        inner = Mock(spec=httpx.BaseTransport)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1", headers={"Accept": "*/*"})
+
+        AuthTransport(inner, {"Authorization": "Bearer t", "Accept": "application/json"}).handle_request(request)
+
+        assert request.headers["Authorization"] == "Bearer t"
+        assert request.headers["Accept"] == "application/json"
+
+    def test_close_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = Mock(spec=httpx.BaseTransport)
+        AuthTransport(inner, {}).close()
+        inner.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_adds_headers(self) -> None:
+        """Test the async transport adds the same headers."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        await AsyncAuthTransport(inner, {"Authorization": "Bearer t"}).handle_async_request(request)
+
+        assert request.headers["Authorization"] == "Bearer t"
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = AsyncMock(spec=httpx.AsyncBaseTransport)
+        await AsyncAuthTransport(inner, {}).aclose()
+        inner.aclose.assert_awaited_once()
+
+
+class TestClientsUsePipeline:
+    """Test every client request flows through the pipeline."""
+
+    def test_sync_requests_are_authenticated(self) -> None:
+        """Test the token reaches Jira without endpoint methods passing headers."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(201, json={"key": "PROJ-2"})
+
+        with patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = JiraClient(make_config())
+            client.create_issue({"fields": {"summary": "New"}})
+            client.close()
+
+        assert sent[0].headers["Authorization"] == "Bearer test-token-123"
+        assert sent[0].headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_async_requests_are_authenticated(self) -> None:
+        """Test the async client authenticates through the same stage."""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        with patch("httpx.AsyncHTTPTransport", return_value=httpx.MockTransport(handler)):
+            client = AsyncJiraClient(make_config())
+            await client.get_issue("PROJ-1")
+            await client.aclose()
+
+        assert sent[0].headers["Authorization"] == "Bearer test-token-123"
+        assert sent[0].headers["Accept"] == "application/json"
+
+
+class TestEnvironmentProxy:
+    """Test the connection pool honours the proxy environment variables."""
+
+    @pytest.fixture(autouse=True)
+    def clean_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Remove proxy settings inherited from the machine running the tests."""
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.lower(), raising=False)
+
+    def test_scheme_proxy_and_no_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the proxy for the URL's scheme is used unless NO_PROXY exempts the host."""
+        assert environment_proxy("https://jira.test.com") is None
+
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.corp:3128")
+        assert environment_proxy("https://jira.test.com") == "http://proxy.corp:3128"
+        assert environment_proxy("http://jira.test.com") is None
+
+        monkeypatch.setenv("NO_PROXY", ".test.com")
+        assert environment_proxy("https://jira.test.com") is None
+
+    def test_all_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ALL_PROXY applies when no scheme-specific proxy is set."""
+        monkeypatch.setenv("ALL_PROXY", "http://proxy.corp:3128")
+
+        assert environment_proxy("http://jira.test.com") == "http://proxy.corp:3128"
+
+    def test_clients_send_through_https_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test both clients build their connection pool with the HTTPS_PROXY proxy."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.corp:3128")
+
+        client = JiraClient(make_config())
+        pool = client._get_http_client()._transport
+        while hasattr(pool, "_transport"):
+            pool = pool._transport
+        client.close()
+        async_client = AsyncJiraClient(make_config())
+        async_pool = async_client._get_http_client()._transport
+        while hasattr(async_pool, "_transport"):
+            async_pool = async_pool._transport
+
+        for transport in (pool, async_pool):
+            assert isinstance(transport, (httpx.HTTPTransport, httpx.AsyncHTTPTransport))
+            assert transport._pool.__class__.__name__.endswith("HTTPProxy")
+            assert transport._pool._proxy_url.host == b"proxy.corp"
@@ -0,0 +1,222 @@
+"""Unit tests for client-side rate limiting"""
+
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.config import JiraConfig
+from jira_mcp_server.deadline import DeadlineExceeded, deadline
+from jira_mcp_server.rate_limit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport, TokenBucket
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Test token bucket reservations."""
+
+    def test_burst_then_queue(self) -> None:
+        """Test a full bucket serves a burst and then spaces requests at the refill rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        # Queued callers wait in arrival order, half a second apart
+        assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    def test_refills_over_time_up_to_burst(self) -> None:
+        """Test tokens refill with elapsed time but never beyond the burst size."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 1.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 1.0
+
+        clock.now += 60.0
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_refund_returns_a_token(self) -> None:
+        """Test a refunded reservation no longer delays later callers, and never exceeds the burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+        bucket.reserve()
+        assert bucket.reserve() == 1.0
+
+        bucket.refund()
+        assert bucket.reserve() == 1.0
+        for _ in range(5):
+            bucket.refund()
+        assert [bucket.reserve(), bucket.reserve()] == [0.0, 1.0]
+
+
+class TestRateLimiter:
+    """Test overall and per-endpoint-class limits."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test a limiter without rates never delays requests."""
+        limiter = RateLimiter()
+
+        assert limiter.enabled is False
+        assert limiter.reserve(httpx.Request("GET", f"{BASE}/issue/PROJ-1")) == 0.0
+        assert limiter.get_stats() == {"throttled": 0, "wait_seconds": 0.0}
+
+    def test_from_config(self) -> None:
+        """Test limits are read from JiraConfig."""
+        config = JiraConfig(
+            url="https://jira.test.com", token="t", rate_limit=5, rate_limit_burst=2, write_rate_limit=1
+        )
+
+        limiter = RateLimiter.from_config(config)
+
+        assert limiter.enabled is True
+        assert limiter._overall is not None and limiter._overall.rate == 5
+        assert set(limiter._by_class) == {"write"}
+        assert limiter._by_class["write"].burst == 2
+
+    def test_class_limit_applies_only_to_its_class(self) -> None:
+        """Test that a write limit throttles writes while reads pass."""
+        limiter = RateLimiter(burst=1, class_rates={"write": 1.0, "search": 0.0})
+        write = httpx.Request("POST", f"{BASE}/issue")
+        read = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        assert limiter.reserve(write) == 0.0
+        assert limiter.reserve(write) > 0.9
+        assert limiter.reserve(read) == 0.0
+        assert limiter.get_stats()["throttled"] == 1
+
+    def test_waits_for_the_slowest_bucket(self) -> None:
+        """Test a request covered by overall and class limits waits for both."""
+        limiter = RateLimiter(rate=100.0, burst=1, class_rates={"search": 1.0})
+        search = httpx.Request("POST", f"{BASE}/search")
+        limiter.reserve(search)
+
+        delay = limiter.reserve(search)
+
+        assert 0.9 < delay <= 1.0
+        assert limiter.get_stats()["wait_seconds"] == pytest.approx(delay, abs=0.001)
+
+
+class TestRateLimitTransport:
+    """Test transports wait for capacity before sending."""
+
+    def test_sync_transport_sleeps_when_throttled(self) -> None:
+        """Test the sync transport sleeps only when a delay is reserved."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.return_value = httpx.Response(200)
+        limiter = Mock(spec=RateLimiter)
+        limiter.reserve.side_effect = [0.0, 0.25]
+        sleeps: List[float] = []
+        transport = RateLimitTransport(inner, limiter, sleep=sleeps.append)
+
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        transport.handle_request(request)
+        transport.handle_request(request)
+        transport.close()
+
+        assert sleeps == [0.25]
+        assert inner.handle_request.call_count == 2
+        inner.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_transport_sleeps_when_throttled(self) -> None:
+        """Test the async transport awaits the reserved delay."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(return_value=httpx.Response(200))
+        inner.aclose = AsyncMock()
+        limiter = Mock(spec=RateLimiter)
+        limiter.reserve.side_effect = [0.0, 0.5]
+        sleep = AsyncMock()
+        transport = AsyncRateLimitTransport(inner, limiter, sleep=sleep)
+
+        request = httpx.Request("POST", f"{BASE}/search")
+        await transport.handle_async_request(request)
+        await transport.handle_async_request(request)
+        await transport.aclose()
+
+        sleep.assert_awaited_once_with(0.5)
+        inner.aclose.assert_awaited_once()
+
+    def test_sync_transport_gives_up_on_waits_past_the_deadline(self) -> None:
+        """Test a wait longer than the time left fails at once, without sleeping or sending."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.return_value = httpx.Response(200)
+        limiter = Mock(spec=RateLimiter)
+        limiter.reserve.side_effect = [0.25, 5.0]
+        sleeps: List[float] = []
+        transport = RateLimitTransport(inner, limiter, sleep=sleeps.append)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        with deadline(1):
+            transport.handle_request(request)
+            with pytest.raises(DeadlineExceeded, match="waiting for rate limit capacity"):
+                transport.handle_request(request)
+
+        assert sleeps == [0.25]
+        assert inner.handle_request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_transport_gives_up_on_waits_past_the_deadline(self) -> None:
+        """Test the async transport fails at once too."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(return_value=httpx.Response(200))
+        limiter = Mock(spec=RateLimiter)
+        limiter.reserve.return_value = 5.0
+        sleep = AsyncMock()
+        transport = AsyncRateLimitTransport(inner, limiter, sleep=sleep)
+
+        with deadline(1), pytest.raises(DeadlineExceeded, match="waiting for rate limit capacity"):
+            await transport.handle_async_request(httpx.Request("POST", f"{BASE}/search"))
+
+        sleep.assert_not_awaited()
+        inner.handle_async_request.assert_not_awaited()
+
+    def test_requests_rejected_by_the_deadline_give_their_tokens_back(self) -> None:
+        """Test rejected requests do not push back the wait of the next request actually sent."""
+        inner = Mock(spec=httpx.BaseTransport)
+        limiter = RateLimiter(rate=1.0, burst=1)
+        sleeps: List[float] = []
+        transport = RateLimitTransport(inner, limiter, sleep=sleeps.append)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        limiter.reserve(request)
+
+        with deadline(0.5):
+            for _ in range(20):
+                with pytest.raises(DeadlineExceeded):
+                    transport.handle_request(request)
+        transport.handle_request(request)
+
+        assert len(sleeps) == 1 and sleeps[0] <= 1.0
+        assert limiter.get_stats()["throttled"] == 1
+        inner.handle_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_gives_its_token_back(self) -> None:
+        """Test a request cancelled while waiting for capacity releases its reservation."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(return_value=httpx.Response(200))
+        limiter = RateLimiter(rate=1.0, burst=1)
+        transport = AsyncRateLimitTransport(inner, limiter, sleep=AsyncMock(side_effect=asyncio.CancelledError))
+        request = httpx.Request("POST", f"{BASE}/search")
+        limiter.reserve(request)
+
+        with pytest.raises(asyncio.CancelledError):
+            await transport.handle_async_request(request)
+
+        assert limiter.get_stats() == {"throttled": 0, "wait_seconds": 0.0}
+        assert limiter.reserve(request) <= 1.0
+        inner.handle_async_request.assert_not_awaited()
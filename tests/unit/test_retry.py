@@ -0,0 +1,299 @@
+"""Unit tests for the retry policy and transports"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import List, Union
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from jira_mcp_server.deadline import DeadlineExceeded, deadline
+from jira_mcp_server.retry import AsyncRetryTransport, RetryMetrics, RetryPolicy, RetryTransport, _seconds_until
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+def make_request(method: str = "GET", path: str = "/issue/PROJ-1") -> httpx.Request:
+    """Create a request against the test Jira instance."""
+    return httpx.Request(method, f"{BASE}{path}")
+
+
+def playback(outcomes: List[Union[int, httpx.Response, Exception]]) -> List[Union[httpx.Response, Exception]]:
+    """Turn status codes into responses so a mock transport can replay one outcome per attempt."""
+    return [httpx.Response(o) if isinstance(o, int) else o for o in outcomes]
+
+
+class TestSecondsUntil:
+    """Test Retry-After / X-RateLimit-Reset parsing."""
+
+    def test_relative_seconds(self) -> None:
+        """Test a plain delay in seconds."""
+        assert _seconds_until(" 2.5 ") == 2.5
+
+    def test_epoch_timestamp(self) -> None:
+        """Test an absolute Unix timestamp."""
+        assert 9 < (_seconds_until(str(time.time() + 10)) or 0) <= 10
+
+    def test_http_date(self) -> None:
+        """Test an HTTP date."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 28 < (_seconds_until(format_datetime(when, usegmt=True)) or 0) <= 30
+
+    def test_iso_timestamp(self) -> None:
+        """Test an ISO 8601 timestamp, with or without a timezone."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 28 < (_seconds_until(when.strftime("%Y-%m-%dT%H:%M:%SZ")) or 0) <= 30
+        assert 28 < (_seconds_until(when.replace(tzinfo=None).isoformat()) or 0) <= 30
+
+    def test_past_and_invalid_values(self) -> None:
+        """Test that past times clamp to zero and garbage is ignored."""
+        assert _seconds_until("2000-01-01T00:00:00Z") == 0.0
+        assert _seconds_until("soon") is None
+
+
+class TestRetryPolicy:
+    """Test retry eligibility and delay computation."""
+
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            ("GET", "/issue/PROJ-1", True),
+            ("PUT", "/issue/PROJ-1", True),
+            ("DELETE", "/filter/1", True),
+            ("POST", "/search", True),
+            ("POST", "/issue", False),
+            ("POST", "/issue/PROJ-1/comment", False),
+            ("POST", "/issue/PROJ-1/transitions", False),
+        ],
+    )
+    def test_is_idempotent(self, method: str, path: str, expected: bool) -> None:
+        """Test which requests may be repeated after an ambiguous failure."""
+        assert RetryPolicy().is_idempotent(make_request(method, path)) is expected
+
+    def test_reads_retry_on_transient_statuses(self) -> None:
+        """Test that reads retry on rate limiting and gateway errors only."""
+        policy = RetryPolicy()
+        request = make_request()
+
+        assert policy.retry_reason(request, httpx.Response(429)) == "429"
+        assert policy.retry_reason(request, httpx.Response(503)) == "503"
+        assert policy.retry_reason(request, httpx.Response(500)) is None
+        assert policy.retry_reason(request, httpx.Response(200)) is None
+        assert policy.retry_reason(request) is None
+
+    def test_writes_retry_only_when_not_processed(self) -> None:
+        """Test that creates and comments only retry on 429 and connection failures."""
+        policy = RetryPolicy()
+        request = make_request("POST", "/issue")
+
+        assert policy.retry_reason(request, httpx.Response(429)) == "429"
+        assert policy.retry_reason(request, httpx.Response(503)) is None
+        assert policy.retry_reason(request, error=httpx.ConnectError("refused")) == "connect"
+        assert policy.retry_reason(request, error=httpx.ReadTimeout("slow")) is None
+        assert policy.retry_reason(request, error=httpx.RemoteProtocolError("dropped")) is None
+
+    def test_reads_retry_on_transport_errors(self) -> None:
+        """Test that reads retry on timeouts and dropped connections."""
+        policy = RetryPolicy()
+        request = make_request()
+
+        assert policy.retry_reason(request, error=httpx.ConnectTimeout("slow")) == "connect"
+        assert policy.retry_reason(request, error=httpx.ReadTimeout("slow")) == "timeout"
+        assert policy.retry_reason(request, error=httpx.ReadError("reset")) == "network"
+        assert policy.retry_reason(request, error=httpx.RemoteProtocolError("dropped")) == "network"
+        assert policy.retry_reason(request, error=httpx.UnsupportedProtocol("ftp")) is None
+        assert policy.retry_reason(request, error=DeadlineExceeded("spent")) is None
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        """Test full-jitter exponential backoff bounded by max_delay."""
+        policy = RetryPolicy(backoff_base=1.0, max_delay=5.0)
+
+        with patch("jira_mcp_server.retry.random.uniform", side_effect=lambda low, high: high) as mock_uniform:
+            assert policy.delay(0) == 1.0
+            assert policy.delay(2) == 4.0
+            assert policy.delay(10) == 5.0
+
+        assert all(call.args[0] == 0 for call in mock_uniform.call_args_list)
+
+    def test_retry_after_takes_precedence(self) -> None:
+        """Test that Jira's requested wait replaces the backoff."""
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+
+        assert RetryPolicy().delay(0, response) == 7.0
+
+    def test_rate_limit_headers(self) -> None:
+        """Test waits derived from exhausted X-RateLimit-* headers."""
+        policy = RetryPolicy()
+
+        reset = httpx.Response(429, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+        assert policy.delay(0, reset) == 3.0
+
+        refill = httpx.Response(
+            429,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Interval-Seconds": "1", "X-RateLimit-FillRate": "4"},
+        )
+        assert policy.delay(0, refill) == 0.25
+
+    def test_unusable_headers_fall_back_to_backoff(self) -> None:
+        """Test that malformed or non-exhausted rate limit headers are ignored."""
+        policy = RetryPolicy(backoff_base=1.0)
+
+        for headers in (
+            {"Retry-After": "later"},
+            {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "60"},
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-FillRate": "0", "X-RateLimit-Interval-Seconds": "1"},
+        ):
+            with patch("jira_mcp_server.retry.random.uniform", return_value=0.42):
+                assert policy.delay(0, httpx.Response(429, headers=headers)) == 0.42
+
+
+class TestRetryMetrics:
+    """Test retry counters."""
+
+    def test_get_stats(self) -> None:
+        """Test counters are aggregated by reason and endpoint."""
+        metrics = RetryMetrics()
+        metrics.record_retry("429", "search")
+        metrics.record_retry("429", "issue")
+        metrics.record_retry("timeout")
+        metrics.record_recovered()
+        metrics.record_exhausted()
+
+        assert metrics.get_stats() == {
+            "retries": 3,
+            "retries_by_reason": {"429": 2, "timeout": 1},
+            "retries_by_endpoint": {"search": 1, "issue": 1, "other": 1},
+            "recovered": 1,
+            "exhausted": 1,
+        }
+
+
+class TestRetryTransport:
+    """Test the synchronous retry transport."""
+
+    def make_transport(self, outcomes: List[Union[int, httpx.Response, Exception]], **policy: float) -> RetryTransport:
+        """Wrap a transport that plays back ``outcomes`` one attempt at a time."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = playback(outcomes)
+        return RetryTransport(inner, RetryPolicy(**policy), RetryMetrics(), sleep=Mock())  # type: ignore[arg-type]
+
+    def test_retries_until_success(self) -> None:
+        """Test transient failures are retried with a sleep between attempts."""
+        transport = self.make_transport([503, httpx.ReadTimeout("slow"), 200])
+
+        response = transport.handle_request(make_request())
+
+        assert response.status_code == 200
+        assert transport._sleep.call_count == 2  # type: ignore[attr-defined]
+        assert transport._metrics.get_stats() == {
+            "retries": 2,
+            "retries_by_reason": {"503": 1, "timeout": 1},
+            "retries_by_endpoint": {"issue": 2},
+            "recovered": 1,
+            "exhausted": 0,
+        }
+
+    def test_gives_up_after_max_retries(self) -> None:
+        """Test the last failure is returned once the retry budget is spent."""
+        transport = self.make_transport([503, 503, 503], max_retries=2)
+
+        response = transport.handle_request(make_request())
+
+        assert response.status_code == 503
+        assert transport._metrics.get_stats()["exhausted"] == 1
+
+    def test_raises_error_after_max_retries(self) -> None:
+        """Test the last transport error is raised once the retry budget is spent."""
+        transport = self.make_transport([httpx.ConnectError("refused")] * 2, max_retries=1)
+
+        with pytest.raises(httpx.ConnectError):
+            transport.handle_request(make_request())
+
+    def test_does_not_retry_writes_on_ambiguous_failures(self) -> None:
+        """Test a timed-out create is raised immediately."""
+        transport = self.make_transport([httpx.ReadTimeout("slow"), 201])
+
+        with pytest.raises(httpx.ReadTimeout):
+            transport.handle_request(make_request("POST", "/issue"))
+
+        transport._sleep.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_long_server_wait_fails_fast(self) -> None:
+        """Test a Retry-After beyond max_delay is surfaced instead of waited out."""
+        transport = self.make_transport([httpx.Response(429, headers={"Retry-After": "120"}), 200], max_delay=30.0)
+
+        response = transport.handle_request(make_request())
+
+        assert response.status_code == 429
+        transport._sleep.assert_not_called()  # type: ignore[attr-defined]
+        assert transport._metrics.get_stats()["exhausted"] == 1
+
+    def test_no_retry_past_deadline(self) -> None:
+        """Test a retry that would start after the tool call's deadline is not waited for."""
+        transport = self.make_transport([httpx.Response(503, headers={"Retry-After": "5"}), 200])
+
+        with deadline(2):
+            response = transport.handle_request(make_request())
+
+        assert response.status_code == 503
+        transport._sleep.assert_not_called()  # type: ignore[attr-defined]
+        assert transport._metrics.get_stats()["exhausted"] == 1
+
+    def test_close_closes_wrapped_transport(self) -> None:
+        """Test close() is forwarded."""
+        transport = self.make_transport([])
+
+        transport.close()
+
+        transport._transport.close.assert_called_once()  # type: ignore[attr-defined]
+
+
+class TestAsyncRetryTransport:
+    """Test the asyncio retry transport."""
+
+    def make_transport(self, outcomes: List[Union[int, httpx.Response, Exception]]) -> AsyncRetryTransport:
+        """Wrap an async transport that plays back ``outcomes`` one attempt at a time."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = AsyncMock(side_effect=playback(outcomes))
+        inner.aclose = AsyncMock()
+        return AsyncRetryTransport(inner, RetryPolicy(), RetryMetrics(), sleep=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self) -> None:
+        """Test transient failures are retried without blocking the event loop."""
+        transport = self.make_transport([429, httpx.ConnectError("refused"), 200])
+
+        response = await transport.handle_async_request(make_request("POST", "/issue"))
+
+        assert response.status_code == 200
+        assert transport._sleep.await_count == 2  # type: ignore[attr-defined]
+        assert transport._metrics.get_stats()["retries_by_reason"] == {"429": 1, "connect": 1}
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raised(self) -> None:
+        """Test ambiguous write failures propagate immediately."""
+        transport = self.make_transport([httpx.ReadTimeout("slow")])
+
+        with pytest.raises(httpx.ReadTimeout):
+            await transport.handle_async_request(make_request("POST", "/issue/PROJ-1/comment"))
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_returned(self) -> None:
+        """Test client errors are returned to the caller untouched."""
+        transport = self.make_transport([404])
+
+        response = await transport.handle_async_request(make_request())
+
+        assert response.status_code == 404
+        assert transport._metrics.get_stats()["retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_wrapped_transport(self) -> None:
+        """Test aclose() is forwarded."""
+        transport = self.make_transport([])
+
+        await transport.aclose()
+
+        transport._transport.aclose.assert_awaited_once()  # type: ignore[attr-defined]
@@ -2,12 +2,14 @@
 
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List
 
 import pytest
 
 from jira_mcp_server.models import FieldSchema, FieldType
 from jira_mcp_server.schema_cache import SchemaCache
+from jira_mcp_server.schema_store import SchemaStore
 
 
 class TestSchemaCache:
@@ -174,3 +176,106 @@ class TestSchemaCache:
 
         # Allow 1 second tolerance for test execution time
         assert abs((entry.expires_at - expected_expiry).total_seconds()) < 1
+
+
+class TestSchemaCacheStaleWhileRevalidate:
+    """Test suite for serving stale schemas while they are refreshed."""
+
+    @pytest.fixture
+    def sample_schema(self) -> List[FieldSchema]:
+        """Create a minimal field schema for testing."""
+        return [FieldSchema(key="summary", name="Summary", type=FieldType.STRING, required=True, custom=False)]
+
+    def _expire(self, cache: SchemaCache, project_key: str, issue_type: str, seconds_ago: int) -> None:
+        """Move an entry's expiry into the past."""
+        entry = cache._cache[cache._make_key(project_key, issue_type)]
+        entry.expires_at = datetime.now() - timedelta(seconds=seconds_ago)
+
+    def test_stale_entry_served_within_cap(self, sample_schema: List[FieldSchema]) -> None:
+        """Test that an expired entry is still returned inside the stale window."""
+        cache = SchemaCache(ttl_seconds=60, max_stale_seconds=600)
+        cache.set("PROJ", "Bug", sample_schema)
+        self._expire(cache, "PROJ", "Bug", seconds_ago=30)
+
+        assert cache.get("PROJ", "Bug") == sample_schema
+        assert cache.get_stats()["stale_hits"] == 1
+
+    def test_stale_entry_dropped_after_hard_expiry(self, sample_schema: List[FieldSchema]) -> None:
+        """Test that entries past the hard-expiry cap are treated as misses."""
+        cache = SchemaCache(ttl_seconds=60, max_stale_seconds=600)
+        cache.set("PROJ", "Bug", sample_schema)
+        self._expire(cache, "PROJ", "Bug", seconds_ago=601)
+
+        assert cache.get("PROJ", "Bug") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    def test_only_one_refresh_claimed(self, sample_schema: List[FieldSchema]) -> None:
+        """Test that a stale entry is refreshed by exactly one caller at a time."""
+        cache = SchemaCache(ttl_seconds=60, max_stale_seconds=600)
+        cache.set("PROJ", "Bug", sample_schema)
+
+        # Fresh entries and unknown keys need no refresh
+        assert cache.start_refresh("PROJ", "Bug") is False
+        assert cache.start_refresh("PROJ", "Task") is False
+
+        self._expire(cache, "PROJ", "Bug", seconds_ago=1)
+        assert cache.start_refresh("PROJ", "Bug") is True
+        assert cache.start_refresh("PROJ", "Bug") is False
+
+        # A failed refresh releases the claim so the next caller can retry
+        cache.finish_refresh("PROJ", "Bug")
+        assert cache.start_refresh("PROJ", "Bug") is True
+
+        # Storing the new schema releases the claim and makes the entry fresh again
+        cache.set("PROJ", "Bug", sample_schema)
+        assert cache.start_refresh("PROJ", "Bug") is False
+        assert cache.get_stats()["refreshes"] == 2
+
+
+class TestSchemaCacheDiskTier:
+    """Test suite for SchemaCache backed by a SchemaStore."""
+
+    @pytest.fixture
+    def sample_schema(self) -> List[FieldSchema]:
+        """Create a minimal field schema for testing."""
+        return [FieldSchema(key="summary", name="Summary", type=FieldType.STRING, required=True, custom=False)]
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SchemaStore:
+        """Create an on-disk schema store."""
+        return SchemaStore(tmp_path / "schemas.sqlite3", namespace="https://jira.test.com")
+
+    def test_restarted_cache_loads_from_disk(self, store: SchemaStore, sample_schema: List[FieldSchema]) -> None:
+        """Test that a fresh cache instance is warmed lazily from the store."""
+        SchemaCache(store=store).set("PROJ", "Bug", sample_schema)
+
+        restarted = SchemaCache(store=store)
+
+        assert restarted.get("PROJ", "Bug") == sample_schema
+        assert restarted.get("PROJ", "Bug") == sample_schema
+        stats = restarted.get_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["hits"] == 2
+
+    def test_disk_entries_keep_original_expiry(self, store: SchemaStore, sample_schema: List[FieldSchema]) -> None:
+        """Test that entries loaded from disk still honour the TTL they were written with."""
+        writer = SchemaCache(ttl_seconds=60, store=store)
+        writer.set("PROJ", "Bug", sample_schema)
+        entry = writer._cache[writer._make_key("PROJ", "Bug")]
+        entry.expires_at = datetime.now() - timedelta(seconds=1)
+        store.save(entry)
+
+        assert SchemaCache(ttl_seconds=60, store=store).get("PROJ", "Bug") is None
+        assert store.load("PROJ", "Bug") is None  # hard-expired rows are removed
+
+    def test_clear_removes_disk_entries(self, store: SchemaStore, sample_schema: List[FieldSchema]) -> None:
+        """Test that clear and clear_all reach the disk tier."""
+        cache = SchemaCache(store=store)
+        cache.set("PROJ", "Bug", sample_schema)
+        cache.set("PROJ", "Task", sample_schema)
+
+        cache.clear("PROJ", "Bug")
+        assert store.load("PROJ", "Bug") is None
+
+        cache.clear_all()
+        assert store.load("PROJ", "Task") is None
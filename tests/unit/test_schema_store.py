@@ -0,0 +1,116 @@
+"""Unit tests for SchemaStore"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from jira_mcp_server.models import CachedSchema, FieldSchema, FieldType
+from jira_mcp_server.schema_store import SchemaStore
+
+
+def make_entry(project_key: str = "PROJ", issue_type: str = "Bug") -> CachedSchema:
+    """Create a schema cache entry for testing."""
+    now = datetime.now()
+    return CachedSchema(
+        project_key=project_key,
+        issue_type=issue_type,
+        fields=[
+            FieldSchema(
+                key="priority",
+                name="Priority",
+                type=FieldType.OPTION,
+                required=False,
+                custom=False,
+                allowed_values=["High", "Low"],
+            )
+        ],
+        cached_at=now,
+        expires_at=now + timedelta(hours=1),
+    )
+
+
+class TestSchemaStore:
+    """Test suite for the SQLite schema store."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> SchemaStore:
+        """Create a store in a not-yet-existing subdirectory."""
+        return SchemaStore(tmp_path / "cache" / "schemas.sqlite3", namespace="https://jira.test.com")
+
+    def test_store_is_created_lazily(self, store: SchemaStore) -> None:
+        """Test that nothing touches disk until the store is used."""
+        assert not store.path.parent.exists()
+
+        assert store.load("PROJ", "Bug") is None
+        assert store.path.exists()
+
+    def test_save_and_load_round_trip(self, store: SchemaStore) -> None:
+        """Test that entries are read back with fields and expiry intact."""
+        entry = make_entry()
+        store.save(entry)
+
+        loaded = store.load("PROJ", "Bug")
+
+        assert loaded == entry
+
+    def test_entries_survive_restart_and_are_shared(self, store: SchemaStore, tmp_path: Path) -> None:
+        """Test that another store on the same file (a restarted or second process) sees the entry."""
+        store.save(make_entry())
+        store.close()
+
+        other = SchemaStore(store.path, namespace="https://jira.test.com")
+        assert other.load("PROJ", "Bug") is not None
+
+        other.save(make_entry(issue_type="Task"))
+        assert store.load("PROJ", "Task") is not None
+
+    def test_namespaces_are_isolated(self, store: SchemaStore) -> None:
+        """Test that different Jira instances do not see each other's schemas."""
+        store.save(make_entry())
+
+        other = SchemaStore(store.path, namespace="https://other.test.com")
+
+        assert other.load("PROJ", "Bug") is None
+
+    def test_delete_and_clear(self, store: SchemaStore) -> None:
+        """Test removing one entry and clearing the namespace."""
+        store.save(make_entry(issue_type="Bug"))
+        store.save(make_entry(issue_type="Task"))
+        store.save(make_entry(issue_type="Story"))
+
+        store.delete("PROJ", "Bug")
+        assert store.load("PROJ", "Bug") is None
+        assert store.load("PROJ", "Task") is not None
+
+        store.clear()
+        assert store.load("PROJ", "Task") is None
+        assert store.load("PROJ", "Story") is None
+
+    def test_unreadable_entry_is_a_miss(self, store: SchemaStore) -> None:
+        """Test that a corrupt row is treated as absent."""
+        store.save(make_entry())
+        with sqlite3.connect(store.path) as conn:
+            conn.execute("UPDATE schemas SET entry = 'not json'")
+
+        assert store.load("PROJ", "Bug") is None
+
+    def test_storage_errors_are_swallowed(self, tmp_path: Path) -> None:
+        """Test that an unusable path degrades to an empty store instead of raising."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("a file, not a directory")
+        store = SchemaStore(blocker / "schemas.sqlite3")
+
+        store.save(make_entry())
+        store.delete("PROJ", "Bug")
+        store.clear()
+
+        assert store.load("PROJ", "Bug") is None
+
+    def test_close_is_idempotent(self, store: SchemaStore) -> None:
+        """Test that closing an unopened or closed store is harmless."""
+        store.close()
+        store.load("PROJ", "Bug")
+        store.close()
+        store.close()
@@ -0,0 +1,122 @@
+"""Unit tests for SearchCache"""
+
+import time
+from typing import Any, Dict
+
+import pytest
+
+from jira_mcp_server.search_cache import SearchCache
+
+
+def make_result(*keys: str) -> Dict[str, Any]:
+    """Create a search result containing the given issue keys."""
+    return {"startAt": 0, "maxResults": 50, "total": len(keys), "issues": [{"key": key} for key in keys]}
+
+
+class TestSearchCache:
+    """Test suite for SearchCache with TTL, LRU and invalidation logic."""
+
+    @pytest.fixture
+    def cache(self) -> SearchCache:
+        """Create a SearchCache instance with default settings."""
+        return SearchCache()
+
+    def test_cache_stores_and_retrieves_result(self, cache: SearchCache) -> None:
+        """Test that cache can store and retrieve a search result."""
+        cache.set("project = PROJ", make_result("PROJ-1"))
+
+        retrieved = cache.get("project = PROJ")
+
+        assert retrieved is not None
+        assert retrieved["issues"] == [{"key": "PROJ-1"}]
+
+    def test_cache_returns_none_for_missing_key(self, cache: SearchCache) -> None:
+        """Test that cache returns None for queries never stored."""
+        assert cache.get("project = OTHER") is None
+
+    def test_cache_expires_after_ttl(self) -> None:
+        """Test that cached results expire after TTL."""
+        cache = SearchCache(ttl_seconds=1)
+        cache.set("project = PROJ", make_result("PROJ-1"))
+
+        assert cache.get("project = PROJ") is not None
+
+        time.sleep(1.5)
+
+        assert cache.get("project = PROJ") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    def test_cache_normalizes_whitespace_outside_quotes(self, cache: SearchCache) -> None:
+        """Test that queries differing only in unquoted whitespace share an entry."""
+        cache.set('project = PROJ AND summary ~ "two  spaces"', make_result("PROJ-1"))
+
+        assert cache.get('  project   =  PROJ\n AND summary ~ "two  spaces" ') is not None
+        assert cache.get('project = PROJ AND summary ~ "two spaces"') is None
+
+    def test_cache_key_includes_fields_and_window(self, cache: SearchCache) -> None:
+        """Test that fields, expansions and pagination window are part of the key."""
+        cache.set("project = PROJ", make_result("PROJ-1"), fields=["summary", "status"], start_at=0, max_results=50)
+
+        assert cache.get("project = PROJ", fields=["status", "summary"], start_at=0, max_results=50) is not None
+        assert cache.get("project = PROJ", fields=["summary"], start_at=0, max_results=50) is None
+        assert cache.get("project = PROJ", fields=["summary", "status"], expand=["changelog"]) is None
+        assert cache.get("project = PROJ", fields=["summary", "status"], start_at=50) is None
+        assert cache.get("project = PROJ", fields=["summary", "status"], all_pages=True) is None
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Test that the cache never grows beyond max_entries."""
+        cache = SearchCache(max_entries=2)
+        cache.set("project = A", make_result("A-1"))
+        cache.set("project = B", make_result("B-1"))
+        cache.get("project = A")  # A is now most recently used
+        cache.set("project = C", make_result("C-1"))
+
+        assert cache.get("project = B") is None
+        assert cache.get("project = A") is not None
+        assert cache.get("project = C") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_cache_with_zero_size_stores_nothing(self) -> None:
+        """Test that max_entries=0 turns the cache into a no-op."""
+        cache = SearchCache(max_entries=0)
+        cache.set("project = PROJ", make_result("PROJ-1"))
+
+        assert cache.get("project = PROJ") is None
+
+    @pytest.mark.parametrize(
+        "jql", ["assignee = currentUser()", 'project = proj AND status = "Done"', "filter = 10001", "key in (A-1, B-2)"]
+    )
+    def test_invalidate_all_drops_every_result(self, cache: SearchCache, jql: str) -> None:
+        """Test that a write drops every cached result, since any query may now match differently."""
+        cache.set(jql, make_result("OTHER-1"))
+        cache.set("project = PROJ", make_result("PROJ-1"))
+
+        removed = cache.invalidate_all()
+
+        assert removed == 2
+        assert cache.get(jql) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_cache_clear_all_removes_everything(self, cache: SearchCache) -> None:
+        """Test that clear_all removes all entries and resets statistics."""
+        cache.set("project = PROJ", make_result("PROJ-1"))
+        cache.get("project = PROJ")
+
+        cache.clear_all()
+
+        assert cache.get_stats() == {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "total_entries": 0}
+
+    def test_cache_stats_tracking(self, cache: SearchCache) -> None:
+        """Test that cache tracks hit/miss/invalidation statistics."""
+        cache.set("project = PROJ", make_result("PROJ-1"))
+
+        cache.get("project = PROJ")
+        cache.get("project = PROJ")
+        cache.get("project = OTHER")
+        cache.invalidate_all()
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["invalidations"] == 1
+        assert stats["total_entries"] == 0
@@ -0,0 +1,111 @@
+"""Unit tests for incremental search response parsing"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from jira_mcp_server.json_codec import get_codec
+from jira_mcp_server.search_stream import SearchStreamParser
+
+ISSUES: List[Dict[str, Any]] = [
+    {"key": "PROJ-1", "fields": {"summary": 'Quote " and brace } inside', "labels": ["a", "[b]"]}},
+    {"key": "PROJ-2", "fields": {"summary": "Back\\slash\\", "issues": [{"nested": True}]}},
+    {"key": "PROJ-3", "fields": {"summary": "Unicode ☕  ", "changelog": {"histories": [{"items": []}]}}},
+]
+
+PAGE: Dict[str, Any] = {
+    "expand": "names,schema",
+    "startAt": 0,
+    "maxResults": 3,
+    "total": 3,
+    "issues": ISSUES,
+    "names": {"summary": "Summary", "issues": "Not the issues array"},
+    "warningMessages": ["[ignored]"],
+}
+
+
+def parse(body: bytes, chunk_size: int) -> Tuple[List[Any], Dict[str, Any]]:
+    """Feed ``body`` to a parser ``chunk_size`` bytes at a time."""
+    parser = SearchStreamParser(json.loads)
+    issues: List[Any] = []
+    for i in range(0, len(body), chunk_size):
+        issues.extend(parser.feed(body[i : i + chunk_size]))
+    return issues, parser.close()
+
+
+class TestSearchStreamParser:
+    """Test splitting search responses into issues."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_issues_and_metadata_for_any_chunking(self, chunk_size: int) -> None:
+        """Test every chunk boundary (inside strings, escapes and keys) yields the same result."""
+        issues, meta = parse(json.dumps(PAGE, indent=2).encode(), chunk_size)
+
+        assert issues == ISSUES
+        assert meta == {**PAGE, "issues": []}
+
+    def test_issues_are_emitted_as_they_complete(self) -> None:
+        """Test an issue is returned by the chunk that closes it, before the page ends."""
+        body = json.dumps(PAGE).encode()
+        second_issue_end = body.index(b'"PROJ-3"')
+        parser = SearchStreamParser(json.loads)
+
+        first = parser.feed(body[:second_issue_end])
+
+        assert [issue["key"] for issue in first] == ["PROJ-1", "PROJ-2"]
+        assert [issue["key"] for issue in parser.feed(body[second_issue_end:])] == ["PROJ-3"]
+
+    def test_buffer_holds_at_most_one_issue(self) -> None:
+        """Test consumed issues are released rather than accumulated."""
+        page = {"total": 50, "issues": [{"key": f"PROJ-{i}", "fields": {"description": "x" * 1000}} for i in range(50)]}
+        body = json.dumps(page).encode()
+        parser = SearchStreamParser(json.loads)
+        largest = 0
+
+        for i in range(0, len(body), 256):
+            parser.feed(body[i : i + 256])
+            largest = max(largest, len(parser._buf))
+
+        assert largest < 1300
+        assert parser.close() == {"total": 50, "issues": []}
+
+    def test_metadata_before_and_after_issues(self) -> None:
+        """Test keys on either side of the issues array are kept."""
+        issues, meta = parse(b'{"total": 1, "issues": [{"key": "A"}], "maxResults": 50}', 5)
+
+        assert issues == [{"key": "A"}]
+        assert meta == {"total": 1, "issues": [], "maxResults": 50}
+
+    def test_empty_issues(self) -> None:
+        """Test an empty result page."""
+        assert parse(b'{"startAt":0,"total":0,"issues":[]}', 4) == ([], {"startAt": 0, "total": 0, "issues": []})
+
+    def test_works_with_fast_codec(self) -> None:
+        """Test issues can be decoded by any configured codec."""
+        parser = SearchStreamParser(get_codec("orjson").loads)
+
+        assert parser.feed(json.dumps(PAGE).encode()) == ISSUES
+
+    def test_truncated_body_rejected(self) -> None:
+        """Test a response cut off mid-document is reported instead of returning partial metadata."""
+        body = json.dumps(PAGE).encode()
+        for cut in (len(body) - 1, body.index(b"PROJ-2"), body.index(b"names") + 2):
+            parser = SearchStreamParser(json.loads)
+            parser.feed(body[:cut])
+            with pytest.raises(ValueError, match="ended before"):
+                parser.close()
+
+    @pytest.mark.parametrize("body", [b"[1, 2]", b'"text"'])
+    def test_non_object_rejected(self, body: bytes) -> None:
+        """Test a body that is not a JSON object is rejected."""
+        parser = SearchStreamParser(json.loads)
+
+        with pytest.raises(ValueError, match="not a JSON object"):
+            parser.feed(body)
+            parser.close()
+
+    def test_malformed_issue_rejected(self) -> None:
+        """Test a corrupt issue surfaces the codec's error."""
+        with pytest.raises(ValueError):
+            SearchStreamParser(json.loads).feed(b'{"issues": [{"key": PROJ-1}]}')
@@ -1,15 +1,18 @@
 """Unit tests for search tools"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from jira_mcp_server.jira_client import JiraClient
+from jira_mcp_server.jira_client import DEFAULT_SEARCH_FIELDS, JiraClient
+from jira_mcp_server.search_cache import SearchCache
 from jira_mcp_server.tools.search_tools import (
     build_jql_from_criteria,
     initialize_search_tools,
     jira_search_issues,
+    jira_search_issues_async,
     jira_search_jql,
+    jira_search_jql_async,
 )
 
 
@@ -117,7 +120,9 @@ class TestSearchIssues:
 
         assert result["total"] == 5
         assert len(result["issues"]) == 2
-        mock_client.search_issues.assert_called_once_with(jql="project = PROJ", max_results=50, start_at=0)
+        mock_client.search_issues.assert_called_once_with(
+            jql="project = PROJ", max_results=50, start_at=0, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
 
     @patch("jira_mcp_server.tools.search_tools._client")
     def test_search_with_multiple_criteria(self, mock_client: Mock) -> None:
@@ -140,7 +145,9 @@ class TestSearchIssues:
 
         jira_search_issues(project="PROJ", max_results=10, start_at=20)
 
-        mock_client.search_issues.assert_called_once_with(jql="project = PROJ", max_results=10, start_at=20)
+        mock_client.search_issues.assert_called_once_with(
+            jql="project = PROJ", max_results=10, start_at=20, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
 
     @patch("jira_mcp_server.tools.search_tools._client", None)
     def test_search_not_initialized(self) -> None:
@@ -180,7 +187,11 @@ class TestSearchJQL:
 
         assert result["total"] == 3
         mock_client.search_issues.assert_called_once_with(
-            jql="project = PROJ AND status = Open", max_results=50, start_at=0
+            jql="project = PROJ AND status = Open",
+            max_results=50,
+            start_at=0,
+            fields=DEFAULT_SEARCH_FIELDS,
+            expand=None,
         )
 
     @patch("jira_mcp_server.tools.search_tools._client")
@@ -191,7 +202,9 @@ class TestSearchJQL:
         jql = "project = PROJ AND created >= -7d AND assignee = currentUser() ORDER BY created DESC"
         jira_search_jql(jql=jql, max_results=20)
 
-        mock_client.search_issues.assert_called_once_with(jql=jql, max_results=20, start_at=0)
+        mock_client.search_issues.assert_called_once_with(
+            jql=jql, max_results=20, start_at=0, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
 
     @patch("jira_mcp_server.tools.search_tools._client", None)
     def test_jql_search_not_initialized(self) -> None:
@@ -218,3 +231,162 @@ class TestSearchJQL:
 
         with pytest.raises(ValueError, match="JQL search failed: Invalid JQL syntax"):
             jira_search_jql(jql="invalid jql query")
+
+
+class TestAsyncSearchTools:
+    """Test async search tool variants."""
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.search_tools._async_client", None)
+    async def test_async_tools_not_initialized(self) -> None:
+        """Test that async variants require an async client."""
+        with pytest.raises(RuntimeError, match="Search tools not initialized"):
+            await jira_search_issues_async(project="PROJ")
+        with pytest.raises(RuntimeError, match="Search tools not initialized"):
+            await jira_search_jql_async(jql="project = PROJ")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.search_tools._async_client", new_callable=AsyncMock)
+    async def test_search_issues_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async criteria search builds JQL and maps failures."""
+        mock_async_client.search_issues.return_value = {"total": 1, "issues": [{"key": "PROJ-1"}]}
+
+        result = await jira_search_issues_async(project="PROJ", status="Open", max_results=10)
+
+        assert result["total"] == 1
+        mock_async_client.search_issues.assert_awaited_once_with(
+            jql='project = PROJ AND status = "Open"',
+            max_results=10,
+            start_at=0,
+            fields=DEFAULT_SEARCH_FIELDS,
+            expand=None,
+        )
+
+        with pytest.raises(ValueError, match="At least one search criterion"):
+            await jira_search_issues_async()
+
+        mock_async_client.search_issues.side_effect = Exception("Jira down")
+        with pytest.raises(ValueError, match="Search failed: Jira down"):
+            await jira_search_issues_async(project="PROJ")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.search_tools._async_client", new_callable=AsyncMock)
+    async def test_search_jql_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async JQL search validates input and maps failures."""
+        mock_async_client.search_issues.return_value = {"total": 0, "issues": []}
+
+        result = await jira_search_jql_async(jql="project = PROJ", max_results=5, start_at=10)
+
+        assert result["total"] == 0
+        mock_async_client.search_issues.assert_awaited_once_with(
+            jql="project = PROJ", max_results=5, start_at=10, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
+
+        with pytest.raises(ValueError, match="JQL query cannot be empty"):
+            await jira_search_jql_async(jql="  ")
+
+        mock_async_client.search_issues.side_effect = Exception("Invalid JQL")
+        with pytest.raises(ValueError, match="JQL search failed: Invalid JQL"):
+            await jira_search_jql_async(jql="project = PROJ")
+
+
+class TestSearchJQLAllPages:
+    """Test the multi-page collection mode of jira_search_jql."""
+
+    @patch("jira_mcp_server.tools.search_tools._client")
+    def test_all_pages_collects_across_pages(self, mock_client: Mock) -> None:
+        """Test that all_pages delegates to the concurrent collector capped at max_results."""
+        merged = {"startAt": 0, "maxResults": 150, "total": 250, "issues": [{"key": "PROJ-1"}]}
+        mock_client.search_all.return_value = merged
+
+        result = jira_search_jql(jql="project = PROJ", max_results=150, all_pages=True)
+
+        assert result == merged
+        mock_client.search_all.assert_called_once_with(
+            "project = PROJ", page_size=100, start_at=0, limit=150, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
+        mock_client.search_issues.assert_not_called()
+
+    @patch("jira_mcp_server.tools.search_tools._client")
+    def test_all_pages_uses_small_page_for_small_limit(self, mock_client: Mock) -> None:
+        """Test that the page size never exceeds the requested number of issues."""
+        jira_search_jql(jql="project = PROJ", max_results=20, start_at=40, all_pages=True)
+
+        mock_client.search_all.assert_called_once_with(
+            "project = PROJ", page_size=20, start_at=40, limit=20, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.search_tools._async_client")
+    async def test_all_pages_async(self, mock_async_client: Mock) -> None:
+        """Test that the async variant delegates to the async concurrent collector."""
+        merged = {"startAt": 0, "maxResults": 500, "total": 3, "issues": [{"key": "PROJ-1"}]}
+        mock_async_client.search_all = AsyncMock(return_value=merged)
+
+        result = await jira_search_jql_async(jql="project = PROJ", max_results=500, all_pages=True)
+
+        assert result == merged
+        mock_async_client.search_all.assert_awaited_once_with(
+            "project = PROJ", page_size=100, start_at=0, limit=500, fields=DEFAULT_SEARCH_FIELDS, expand=None
+        )
+
+
+class TestSearchFieldProjection:
+    """Test fields/expand projection on the search tools."""
+
+    @patch("jira_mcp_server.tools.search_tools._client")
+    def test_search_issues_passes_custom_fields(self, mock_client: Mock) -> None:
+        """Test that explicit fields and expand replace the lean default."""
+        jira_search_issues(project="PROJ", fields=["summary", "customfield_10001"], expand=["changelog"])
+
+        mock_client.search_issues.assert_called_once_with(
+            jql="project = PROJ",
+            max_results=50,
+            start_at=0,
+            fields=["summary", "customfield_10001"],
+            expand=["changelog"],
+        )
+
+    @patch("jira_mcp_server.tools.search_tools._client")
+    def test_search_jql_all_fields(self, mock_client: Mock) -> None:
+        """Test that callers can still ask for every field."""
+        jira_search_jql(jql="project = PROJ", fields=["*all"], all_pages=True)
+
+        assert mock_client.search_all.call_args[1]["fields"] == ["*all"]
+
+
+class TestSearchResultCache:
+    """Test search result caching in the search tools."""
+
+    @patch("jira_mcp_server.tools.search_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.search_tools._client")
+    def test_repeated_searches_hit_cache(self, mock_client: Mock, search_cache: SearchCache) -> None:
+        """Test that identical queries only reach Jira once."""
+        mock_client.search_issues.return_value = {"total": 1, "issues": [{"key": "PROJ-1"}]}
+        mock_client.search_all.return_value = {"total": 1, "issues": [{"key": "PROJ-1"}]}
+
+        for _ in range(2):
+            jira_search_issues(project="PROJ")
+            jira_search_jql(jql="project = PROJ")
+            jira_search_jql(jql="project  =  PROJ", all_pages=True)
+
+        # jira_search_issues builds the same JQL as the first jira_search_jql call
+        mock_client.search_issues.assert_called_once()
+        mock_client.search_all.assert_called_once()
+        assert search_cache.get_stats()["hits"] == 4
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.search_tools._search_cache", new_callable=SearchCache)
+    @patch("jira_mcp_server.tools.search_tools._async_client")
+    async def test_repeated_async_searches_hit_cache(self, mock_async_client: Mock, search_cache: SearchCache) -> None:
+        """Test that the async variants share the same cache."""
+        mock_async_client.search_issues = AsyncMock(return_value={"total": 0, "issues": []})
+        mock_async_client.search_all = AsyncMock(return_value={"total": 0, "issues": []})
+
+        for _ in range(2):
+            await jira_search_issues_async(project="PROJ", max_results=10)
+            await jira_search_jql_async(jql="project = PROJ", max_results=10)
+            await jira_search_jql_async(jql="project = PROJ", all_pages=True)
+
+        mock_async_client.search_issues.assert_awaited_once()
+        mock_async_client.search_all.assert_awaited_once()
@@ -1,44 +1,114 @@
 """Unit tests for FastMCP server."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import sys
+from typing import Iterator
+from unittest.mock import AsyncMock, Mock, patch
 
-from jira_mcp_server import server
+import pytest
+from fastmcp import Client
 
+from jira_mcp_server import deadline, server
+from jira_mcp_server.deadline import configure_deadline
+from jira_mcp_server.metrics import PROMETHEUS_CONTENT_TYPE, RequestMetrics
+from jira_mcp_server.rate_limit import RateLimiter
 
-class TestHealthCheckTool:
-    """Test _jira_health_check implementation."""
 
-    @patch("jira_mcp_server.server.JiraClient")
-    @patch("jira_mcp_server.server.JiraConfig")
-    def test_health_check_success(self, mock_config_class: Mock, mock_client_class: Mock) -> None:
-        """Test successful health check."""
-        mock_config = Mock()
-        mock_config_class.return_value = mock_config
+class TestHealthCheckTool:
+    """Test the jira_health_check tool."""
 
-        mock_client = Mock()
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server.AsyncJiraClient")
+    async def test_health_check_success(self, mock_client_class: Mock) -> None:
+        """Test successful health check reuses the shared async client."""
+        mock_client = AsyncMock()
         mock_client.health_check.return_value = {
             "connected": True,
             "server_version": "8.20.0",
             "base_url": "https://jira.test.com",
         }
-        mock_client_class.return_value = mock_client
 
-        result = server._jira_health_check()
+        with patch("jira_mcp_server.server._async_client", mock_client):
+            result = await server._jira_health_check()
 
         assert result["connected"] is True
         assert result["server_version"] == "8.20.0"
+        mock_client.health_check.assert_awaited_once()
+        mock_client_class.assert_not_called()
 
-    @patch("jira_mcp_server.server.JiraClient")
-    @patch("jira_mcp_server.server.JiraConfig")
-    def test_health_check_failure(self, mock_config_class: Mock, mock_client_class: Mock) -> None:
+    @pytest.mark.asyncio
+    async def test_health_check_failure(self) -> None:
         """Test health check with connection failure."""
-        mock_config_class.side_effect = Exception("Connection failed")
+        mock_client = AsyncMock()
+        mock_client.health_check.side_effect = Exception("Connection failed")
 
-        result = server._jira_health_check()
+        with patch("jira_mcp_server.server._async_client", mock_client):
+            result = await server._jira_health_check()
 
         assert result["connected"] is False
         assert "Connection failed" in result["error"]
 
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server._async_client", None)
+    async def test_health_check_not_initialized(self) -> None:
+        """Test health check before main() has created the shared client."""
+        result = await server._jira_health_check()
+
+        assert result == {"connected": False, "error": "Server not initialized"}
+
+    @pytest.mark.asyncio
+    async def test_registered_tool_awaits_async_client(self) -> None:
+        """Test the tool registered with FastMCP runs on the async client."""
+        mock_client = AsyncMock()
+        mock_client.health_check.return_value = {"connected": True}
+
+        with patch("jira_mcp_server.server._async_client", mock_client):
+            async with Client(server.mcp) as client:
+                result = await client.call_tool("jira_health_check", {})
+
+        assert result.data == {"connected": True}
+        mock_client.health_check.assert_awaited_once()
+
+
+class TestMetrics:
+    """Test the metrics tool and Prometheus endpoint."""
+
+    @pytest.fixture
+    def metrics(self) -> Iterator[RequestMetrics]:
+        """Install shared metrics with one recorded search."""
+        metrics = RequestMetrics()
+        metrics.record_response("search", 200, 0.3, 64, 2048)
+        with patch("jira_mcp_server.server._metrics", metrics):
+            yield metrics
+
+    def test_jira_metrics(self, metrics: RequestMetrics) -> None:
+        """Test the tool reports the shared metrics."""
+        result = server._jira_metrics()
+
+        assert result == metrics.get_stats()
+        assert result["endpoints"]["search"]["requests"] == 1
+
+    @patch("jira_mcp_server.server._metrics", None)
+    def test_jira_metrics_not_initialized(self) -> None:
+        """Test the tool before main() has created the metrics."""
+        assert server._jira_metrics() == {"error": "Server not initialized"}
+
+    @pytest.mark.asyncio
+    async def test_prometheus_metrics(self, metrics: RequestMetrics) -> None:
+        """Test the scrape endpoint renders the text exposition format."""
+        response = await server.prometheus_metrics(Mock())
+
+        assert response.media_type == PROMETHEUS_CONTENT_TYPE
+        assert bytes(response.body).decode() == metrics.render_prometheus()
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server._metrics", None)
+    async def test_prometheus_metrics_not_initialized(self) -> None:
+        """Test the scrape endpoint is empty before main() has run."""
+        response = await server.prometheus_metrics(Mock())
+
+        assert response.body == b""
+
 
 # Note: The FastMCP-decorated tool functions (jira_issue_create_tool, etc.)
 # cannot be directly tested because FastMCP wraps them in FunctionTool objects.
@@ -47,9 +117,85 @@ class TestHealthCheckTool:
 # pragma: no cover to exclude from coverage requirements.
 
 
+class TestLifespan:
+    """Test the server lifespan hook."""
+
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_async_client(self) -> None:
+        """Test that the async client's pool is closed when the server shuts down."""
+        mock_async_client = AsyncMock()
+
+        with patch("jira_mcp_server.server._async_client", mock_async_client):
+            async with server._lifespan(server.mcp):
+                mock_async_client.aclose.assert_not_awaited()
+
+        mock_async_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server._async_client", None)
+    async def test_lifespan_without_client(self) -> None:
+        """Test that the lifespan is a no-op when main() never created a client."""
+        async with server._lifespan(server.mcp):
+            pass
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server._async_client", None)
+    async def test_lifespan_prefetches_schemas(self) -> None:
+        """Test that configured schemas are warmed in the background on startup."""
+        targets = [("PROJ", "Bug"), ("OPS", None)]
+        mock_prefetch = AsyncMock(return_value={"loaded": 3, "failed": 0})
+
+        with (
+            patch("jira_mcp_server.server._prefetch_targets", targets),
+            patch("jira_mcp_server.server.prefetch_schemas", mock_prefetch),
+        ):
+            async with server._lifespan(server.mcp):
+                await asyncio.sleep(0)
+
+        mock_prefetch.assert_awaited_once_with(targets)
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.server._async_client", None)
+    async def test_lifespan_cancels_unfinished_prefetch(self) -> None:
+        """Test that a warm-up still running at shutdown is cancelled."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_prefetch(targets: object) -> None:
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch("jira_mcp_server.server._prefetch_targets", [("PROJ", None)]),
+            patch("jira_mcp_server.server.prefetch_schemas", slow_prefetch),
+        ):
+            async with server._lifespan(server.mcp):
+                await started.wait()
+            await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+
 class TestMain:
     """Test main function."""
 
+    @pytest.fixture(autouse=True)
+    def rate_limiter(self) -> Iterator[RateLimiter]:
+        """Build a disabled rate limiter instead of reading limits from the mocked config."""
+        limiter = RateLimiter()
+        with patch("jira_mcp_server.jira_client.RateLimiter.from_config", return_value=limiter):
+            yield limiter
+
+    @pytest.fixture(autouse=True)
+    def reset_deadline(self) -> Iterator[None]:
+        """Remove the tool deadline main configures."""
+        yield
+        configure_deadline(0)
+
     @patch("jira_mcp_server.server.mcp.run")
     @patch("jira_mcp_server.server.initialize_issue_tools")
     @patch("jira_mcp_server.server.JiraConfig")
@@ -60,19 +206,109 @@ class TestMain:
         mock_config_class: Mock,
         mock_initialize: Mock,
         mock_mcp_run: Mock,
+        rate_limiter: RateLimiter,
     ) -> None:
         """Test successful server startup."""
-        mock_config = Mock()
+        mock_config = Mock(
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport="stdio",
+            circuit_breaker_threshold=0,
+            tool_deadline=45,
+        )
         mock_config.url = "https://jira.test.com"
         mock_config.cache_ttl = 3600
         mock_config.timeout = 30
         mock_config.verify_ssl = True
+        mock_config.search_cache_ttl = 60
+        mock_config.search_cache_size = 256
+        mock_config.prefetch_targets.return_value = []
+        mock_config_class.return_value = mock_config
+
+        server.main()
+
+        mock_initialize.assert_called_once()
+        config_arg, search_cache = mock_initialize.call_args[0]
+        assert config_arg is mock_config
+        assert isinstance(search_cache, server.SearchCache)
+        mock_mcp_run.assert_called_once_with()
+        assert isinstance(server._async_client, server.AsyncJiraClient)
+        assert server._async_client.rate_limiter is rate_limiter
+        assert server._async_client.request_metrics is server._metrics
+        # Issue tools share the server's client; no synchronous client duplicates its pipeline state
+        assert mock_initialize.call_args[1] == {"async_client": server._async_client}
+        # Tool calls are bounded by the configured deadline
+        assert deadline._budget == 45
+        mock_print.assert_any_call("Tool Deadline: 45s")
+
+    @patch("jira_mcp_server.server.mcp.run")
+    @patch("jira_mcp_server.server.initialize_issue_tools")
+    @patch("jira_mcp_server.server.JiraConfig")
+    @patch("builtins.print")
+    def test_main_records_prefetch_targets(
+        self,
+        mock_print: Mock,
+        mock_config_class: Mock,
+        mock_initialize: Mock,
+        mock_mcp_run: Mock,
+    ) -> None:
+        """Test that JIRA_MCP_PREFETCH targets are handed to the lifespan warm-up."""
+        mock_config = Mock(
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport="stdio",
+            circuit_breaker_threshold=0,
+            tool_deadline=0,
+        )
+        mock_config.search_cache_ttl = 0
+        mock_config.search_cache_size = 0
+        mock_config.prefetch = "PROJ:Bug,OPS"
+        mock_config.prefetch_targets.return_value = [("PROJ", "Bug"), ("OPS", None)]
+        mock_config_class.return_value = mock_config
+
+        with patch("jira_mcp_server.server._prefetch_targets", []):
+            server.main()
+            assert server._prefetch_targets == [("PROJ", "Bug"), ("OPS", None)]
+
+        printed = [str(call) for call in mock_print.call_args_list]
+        assert any("Schema Prefetch: PROJ:Bug,OPS" in call for call in printed)
+
+    @patch("jira_mcp_server.server.mcp.run")
+    @patch("jira_mcp_server.server.initialize_issue_tools")
+    @patch("jira_mcp_server.server.initialize_search_tools")
+    @patch("jira_mcp_server.server.JiraConfig")
+    @patch("builtins.print")
+    def test_main_search_cache_disabled(
+        self,
+        mock_print: Mock,
+        mock_config_class: Mock,
+        mock_init_search: Mock,
+        mock_init_issue: Mock,
+        mock_mcp_run: Mock,
+    ) -> None:
+        """Test that a zero search cache TTL disables result caching."""
+        mock_config = Mock(
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport="stdio",
+            circuit_breaker_threshold=0,
+            tool_deadline=0,
+        )
+        mock_config.search_cache_ttl = 0
+        mock_config.search_cache_size = 256
+        mock_config.prefetch_targets.return_value = []
         mock_config_class.return_value = mock_config
 
         server.main()
 
-        mock_initialize.assert_called_once_with(mock_config)
-        mock_mcp_run.assert_called_once()
+        mock_init_issue.assert_called_once_with(mock_config, None, async_client=server._async_client)
+        assert mock_init_search.call_args[1] == {"async_client": server._async_client, "search_cache": None}
 
     @patch("jira_mcp_server.server.mcp.run")
     @patch("jira_mcp_server.server.initialize_issue_tools")
@@ -80,14 +316,12 @@ class TestMain:
     @patch("jira_mcp_server.server.initialize_filter_tools")
     @patch("jira_mcp_server.server.initialize_workflow_tools")
     @patch("jira_mcp_server.server.initialize_comment_tools")
-    @patch("jira_mcp_server.server.JiraClient")
     @patch("jira_mcp_server.server.JiraConfig")
     @patch("builtins.print")
     def test_main_with_ssl_disabled_shows_warning(
         self,
         mock_print: Mock,
         mock_config_class: Mock,
-        mock_client_class: Mock,
         mock_init_comment: Mock,
         mock_init_workflow: Mock,
         mock_init_filter: Mock,
@@ -96,11 +330,22 @@ class TestMain:
         mock_mcp_run: Mock,
     ) -> None:
         """Test that SSL warning is displayed when verification is disabled."""
-        mock_config = Mock()
+        mock_config = Mock(
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport="stdio",
+            circuit_breaker_threshold=0,
+            tool_deadline=0,
+        )
         mock_config.url = "https://jira.test.com"
         mock_config.cache_ttl = 3600
         mock_config.timeout = 30
         mock_config.verify_ssl = False
+        mock_config.search_cache_ttl = 60
+        mock_config.search_cache_size = 256
+        mock_config.prefetch_targets.return_value = []
         mock_config_class.return_value = mock_config
 
         server.main()
@@ -110,6 +355,74 @@ class TestMain:
         warning_found = any("WARNING" in str(call) and "SSL" in str(call) for call in warning_calls)
         assert warning_found, "Expected SSL warning message to be printed"
 
+    @patch("jira_mcp_server.server.mcp.run")
+    @patch("jira_mcp_server.server.initialize_issue_tools")
+    @patch("jira_mcp_server.server.JiraConfig")
+    @patch("builtins.print")
+    @patch("sys.exit")
+    def test_main_exits_when_server_fails(
+        self,
+        mock_exit: Mock,
+        mock_print: Mock,
+        mock_config_class: Mock,
+        mock_initialize: Mock,
+        mock_mcp_run: Mock,
+    ) -> None:
+        """Test that an error from the running server is reported with a non-zero exit."""
+        mock_config_class.return_value = Mock(
+            search_cache_ttl=0,
+            search_cache_size=0,
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport="stdio",
+            circuit_breaker_threshold=0,
+            hedge_requests=False,
+            tool_deadline=0,
+            **{"prefetch_targets.return_value": []},
+        )
+        mock_mcp_run.side_effect = Exception("Transport closed")
+
+        server.main()
+
+        mock_print.assert_any_call("Error starting server: Transport closed", file=sys.stderr)
+        mock_exit.assert_called_once_with(1)
+
+    @pytest.mark.parametrize("transport", ["http", "sse"])
+    @patch("jira_mcp_server.server.mcp.run")
+    @patch("jira_mcp_server.server.initialize_issue_tools")
+    @patch("jira_mcp_server.server.JiraConfig")
+    @patch("builtins.print")
+    def test_main_serves_over_http(
+        self,
+        mock_print: Mock,
+        mock_config_class: Mock,
+        mock_initialize: Mock,
+        mock_mcp_run: Mock,
+        transport: str,
+    ) -> None:
+        """Test that JIRA_MCP_TRANSPORT runs the server over the network, where /metrics is reachable."""
+        mock_config_class.return_value = Mock(
+            search_cache_ttl=0,
+            search_cache_size=0,
+            adaptive_concurrency=False,
+            http_cache_size=0,
+            json_codec="auto",
+            tracing=False,
+            transport=transport,
+            host="0.0.0.0",
+            port=9090,
+            circuit_breaker_threshold=0,
+            tool_deadline=0,
+            **{"prefetch_targets.return_value": []},
+        )
+
+        server.main()
+
+        mock_mcp_run.assert_called_once_with(transport=transport, host="0.0.0.0", port=9090)
+        mock_print.assert_any_call(f"Listening: {transport} on 0.0.0.0:9090 (metrics at /metrics)")
+
     @patch("jira_mcp_server.server.JiraConfig")
     @patch("builtins.print")
     @patch("sys.exit")
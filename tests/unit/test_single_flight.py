@@ -0,0 +1,352 @@
+"""Unit tests for request coalescing"""
+
+import asyncio
+import gzip
+import threading
+import time
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from jira_mcp_server.endpoints import STREAM_EXTENSION
+from jira_mcp_server.single_flight import (
+    AsyncSingleFlightTransport,
+    CoalescingMetrics,
+    SingleFlightTransport,
+    WriteGenerations,
+    coalesce_key,
+)
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+class TestCoalesceKey:
+    """Test which requests may be merged."""
+
+    def test_reads_and_searches_have_keys(self) -> None:
+        """Test GETs and search POSTs are keyed by method, URL and body."""
+        get = httpx.Request("GET", f"{BASE}/issue/PROJ-1", params={"fields": "summary"})
+        search = httpx.Request("POST", f"{BASE}/search", json={"jql": "project = PROJ"})
+
+        assert coalesce_key(get) == ("GET", f"{BASE}/issue/PROJ-1?fields=summary", b"")
+        assert coalesce_key(search) == ("POST", f"{BASE}/search", search.content)
+
+    def test_different_bodies_differ(self) -> None:
+        """Test searches for different pages are not merged."""
+        page1 = httpx.Request("POST", f"{BASE}/search", json={"jql": "x", "startAt": 0})
+        page2 = httpx.Request("POST", f"{BASE}/search", json={"jql": "x", "startAt": 50})
+
+        assert coalesce_key(page1) != coalesce_key(page2)
+
+    def test_writes_are_never_merged(self) -> None:
+        """Test creates, comments and updates always go out on their own."""
+        for method, path in (("POST", "/issue"), ("POST", "/issue/PROJ-1/comment"), ("PUT", "/issue/PROJ-1")):
+            assert coalesce_key(httpx.Request(method, f"{BASE}{path}", json={})) is None
+
+    def test_streamed_reads_are_never_merged(self) -> None:
+        """Test a search whose body is parsed incrementally is not buffered for sharing."""
+        request = httpx.Request("POST", f"{BASE}/search", json={"jql": "x"}, extensions={STREAM_EXTENSION: True})
+
+        assert coalesce_key(request) is None
+
+
+class TestWriteGenerations:
+    """Test which writes separate later reads from in-flight ones."""
+
+    def test_writes_advance_the_resources_they_touch(self) -> None:
+        """Test a write moves its issue and all searches to a new generation, not other issues."""
+        writes = WriteGenerations()
+        issue = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        other = httpx.Request("GET", f"{BASE}/issue/PROJ-2")
+        search = httpx.Request("POST", f"{BASE}/search", json={"jql": "x"})
+        before = [writes.current(r) for r in (issue, other, search)]
+
+        writes.record_write(httpx.Request("POST", f"{BASE}/issue/proj-1/comment", json={}))
+
+        assert [writes.current(r) for r in (issue, other, search)] == [before[0] + 1, before[1], before[2] + 1]
+
+    def test_writes_spanning_resources_advance_searches_only(self) -> None:
+        """Test creates move searches and lists on, but not reads of existing issues."""
+        writes = WriteGenerations()
+        issue = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        createmeta = httpx.Request("GET", f"{BASE}/issue/createmeta")
+
+        writes.record_write(httpx.Request("POST", f"{BASE}/issue", json={}))
+
+        assert writes.current(issue) == 0
+        assert writes.current(createmeta) == 1
+
+    @pytest.mark.parametrize("path", ["filter/my", "filter/favourite"])
+    def test_filter_lists_follow_every_filter_write(self, path: str) -> None:
+        """Test the filter lists move on when any filter is created, updated or deleted."""
+        writes = WriteGenerations()
+        listing = httpx.Request("GET", f"{BASE}/{path}")
+
+        writes.record_write(httpx.Request("POST", f"{BASE}/filter", json={}))
+        writes.record_write(httpx.Request("PUT", f"{BASE}/filter/10001", json={}))
+        writes.record_write(httpx.Request("DELETE", f"{BASE}/filter/10002"))
+
+        assert writes.current(listing) == 3
+
+
+class TestSingleFlightTransport:
+    """Test the synchronous transport."""
+
+    def run_concurrently(self, transport: SingleFlightTransport, request: httpx.Request, count: int) -> List[object]:
+        """Send ``count`` copies of ``request`` from separate threads once they are all waiting."""
+        results: List[object] = [None] * count
+
+        def send(index: int) -> None:
+            try:
+                results[index] = transport.handle_request(request)
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def make_inner(self, gate: threading.Event, outcome: object) -> Mock:
+        """Create a transport that blocks on ``gate`` and then returns or raises ``outcome``."""
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            gate.wait(5)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(200, headers={"Content-Type": "application/json"}, content=b'{"key": "PROJ-1"}')
+
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = handle
+        return inner
+
+    def release_when_waiting(self, metrics: CoalescingMetrics, followers: int, gate: threading.Event) -> None:
+        """Open ``gate`` once ``followers`` requests are queued behind the leader."""
+
+        def watch() -> None:
+            while metrics.get_stats()["coalesced"] < followers:
+                time.sleep(0.001)
+            gate.set()
+
+        threading.Thread(target=watch, daemon=True).start()
+
+    def test_identical_reads_share_one_call(self) -> None:
+        """Test waiters receive independent copies of the leader's response."""
+        gate = threading.Event()
+        metrics = CoalescingMetrics()
+        inner = self.make_inner(gate, None)
+        transport = SingleFlightTransport(inner, metrics)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        self.release_when_waiting(metrics, 3, gate)
+
+        responses = self.run_concurrently(transport, request, 4)
+
+        assert inner.handle_request.call_count == 1
+        assert metrics.get_stats() == {"sent": 1, "coalesced": 3}
+        assert all(isinstance(r, httpx.Response) and r.json() == {"key": "PROJ-1"} for r in responses)
+        assert len({id(r) for r in responses}) == 4
+        assert transport._calls == {}
+
+    def test_waiters_receive_the_leaders_error(self) -> None:
+        """Test a failed shared call raises in every waiter."""
+        gate = threading.Event()
+        metrics = CoalescingMetrics()
+        transport = SingleFlightTransport(self.make_inner(gate, httpx.ConnectError("refused")), metrics)
+        self.release_when_waiting(metrics, 2, gate)
+
+        results = self.run_concurrently(transport, httpx.Request("GET", f"{BASE}/issue/PROJ-1"), 3)
+
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+        assert transport._calls == {}
+
+    def test_writes_pass_through(self) -> None:
+        """Test writes are sent without coalescing bookkeeping."""
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.return_value = httpx.Response(201)
+        metrics = CoalescingMetrics()
+        transport = SingleFlightTransport(inner, metrics)
+
+        transport.handle_request(httpx.Request("POST", f"{BASE}/issue", json={}))
+        transport.close()
+
+        assert metrics.get_stats() == {"sent": 0, "coalesced": 0}
+        inner.close.assert_called_once()
+
+    def test_copies_drop_wire_encoding_headers(self) -> None:
+        """Test a shared gzip response is handed to waiters already decoded."""
+        body = gzip.compress(b'{"key": "PROJ-1"}')
+        gate = threading.Event()
+        metrics = CoalescingMetrics()
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            gate.wait(5)
+            return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=body)
+
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = handle
+        transport = SingleFlightTransport(inner, metrics)
+        self.release_when_waiting(metrics, 1, gate)
+
+        responses = self.run_concurrently(transport, httpx.Request("GET", f"{BASE}/issue/PROJ-1"), 2)
+
+        assert [r.json() for r in responses] == [{"key": "PROJ-1"}] * 2  # type: ignore[attr-defined]
+
+    def test_read_after_write_is_not_merged(self) -> None:
+        """Test a read starting after a write does not wait on a read sent before it."""
+        gate = threading.Event()
+        started = threading.Event()
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET" and not started.is_set():
+                started.set()
+                gate.wait(5)
+                return httpx.Response(200, json={"summary": "Old"})
+            return httpx.Response(200, json={"summary": "New"}) if request.method == "GET" else httpx.Response(204)
+
+        inner = Mock(spec=httpx.BaseTransport)
+        inner.handle_request.side_effect = handle
+        metrics = CoalescingMetrics()
+        transport = SingleFlightTransport(inner, metrics)
+        read = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+        before = threading.Thread(target=transport.handle_request, args=(read,))
+        before.start()
+        started.wait(5)
+        # Unblocks the first read if the second one wrongly waits on it
+        threading.Timer(1, gate.set).start()
+
+        transport.handle_request(httpx.Request("PUT", f"{BASE}/issue/PROJ-1", json={"fields": {}}))
+        after = transport.handle_request(read)
+        gate.set()
+        before.join(5)
+
+        assert after.json() == {"summary": "New"}
+        assert metrics.get_stats() == {"sent": 2, "coalesced": 0}
+        assert transport._calls == {}
+
+
+class TestAsyncSingleFlightTransport:
+    """Test the asyncio transport."""
+
+    def make_transport(self, handle: AsyncMock) -> AsyncSingleFlightTransport:
+        """Wrap an async transport whose requests are served by ``handle``."""
+        inner = Mock(spec=httpx.AsyncBaseTransport)
+        inner.handle_async_request = handle
+        inner.aclose = AsyncMock()
+        return AsyncSingleFlightTransport(inner, CoalescingMetrics())
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_share_one_call(self) -> None:
+        """Test concurrent coroutines share the leader's response."""
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        mock_handle = AsyncMock(side_effect=handle)
+        transport = self.make_transport(mock_handle)
+        request = httpx.Request("POST", f"{BASE}/search", json={"jql": "project = PROJ"})
+
+        responses = await asyncio.gather(*(transport.handle_async_request(request) for _ in range(3)))
+        await transport.handle_async_request(httpx.Request("POST", f"{BASE}/issue", json={}))
+        await transport.aclose()
+
+        assert mock_handle.await_count == 2
+        assert [r.json() for r in responses] == [{"key": "PROJ-1"}] * 3
+        assert transport._metrics.get_stats() == {"sent": 1, "coalesced": 2}
+        transport._transport.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_waiters_receive_the_leaders_error(self) -> None:
+        """Test a failed shared call raises in every waiter."""
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            raise httpx.ReadTimeout("slow")
+
+        transport = self.make_transport(AsyncMock(side_effect=handle))
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        results = await asyncio.gather(
+            *(transport.handle_async_request(request) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, httpx.ReadTimeout) for r in results)
+        assert transport._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_waiter(self) -> None:
+        """Test a waiter sends its own request when the shared call is cancelled."""
+        started = asyncio.Event()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            if not started.is_set():
+                started.set()
+                await asyncio.sleep(60)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        mock_handle = AsyncMock(side_effect=handle)
+        transport = self.make_transport(mock_handle)
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        leader = asyncio.create_task(transport.handle_async_request(request))
+        await started.wait()
+        follower = asyncio.create_task(transport.handle_async_request(request))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        response = await follower
+        assert response.json() == {"key": "PROJ-1"}
+        assert leader.cancelled()
+        assert mock_handle.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self) -> None:
+        """Test cancelling a waiter leaves the leader's request running."""
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        transport = self.make_transport(AsyncMock(side_effect=handle))
+        request = httpx.Request("GET", f"{BASE}/issue/PROJ-1")
+
+        leader = asyncio.create_task(transport.handle_async_request(request))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(transport.handle_async_request(request))
+        await asyncio.sleep(0)
+        follower.cancel()
+
+        assert (await leader).json() == {"key": "PROJ-1"}
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_is_not_merged(self) -> None:
+        """Test a search starting after a write is sent rather than joining one sent before it."""
+        gate = asyncio.Event()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            if request.method != "POST" or not request.url.path.endswith("/search"):
+                return httpx.Response(201, json={"key": "PROJ-2"})
+            if mock_handle.await_count == 1:
+                await gate.wait()
+                return httpx.Response(200, json={"total": 1})
+            return httpx.Response(200, json={"total": 2})
+
+        mock_handle = AsyncMock(side_effect=handle)
+        transport = self.make_transport(mock_handle)
+        search = httpx.Request("POST", f"{BASE}/search", json={"jql": "project = PROJ"})
+
+        before = asyncio.create_task(transport.handle_async_request(search))
+        await asyncio.sleep(0)
+        await transport.handle_async_request(httpx.Request("POST", f"{BASE}/issue", json={}))
+        after = await asyncio.wait_for(transport.handle_async_request(search), 1)
+        gate.set()
+
+        assert (await before).json() == {"total": 1}
+        assert after.json() == {"total": 2}
+        assert transport._metrics.get_stats() == {"sent": 2, "coalesced": 0}
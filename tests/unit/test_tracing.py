@@ -0,0 +1,232 @@
+"""Unit tests for the tracing hooks and tracing transports"""
+
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from jira_mcp_server import tracing
+from jira_mcp_server.models import FieldSchema, FieldType, FieldValidationError
+from jira_mcp_server.tracing import (
+    AsyncTracingTransport,
+    TracingTransport,
+    configure_tracing,
+    set_tracer,
+    span,
+    traced,
+)
+from jira_mcp_server.validators import FieldValidator
+
+BASE = "https://jira.test.com/rest/api/2"
+
+
+class FakeSpan:
+    """Span that keeps its name, attributes and the exception that ended it."""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]]):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.error: Optional[BaseException] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """Tracer with the OpenTelemetry ``start_as_current_span`` API that records spans."""
+
+    def __init__(self) -> None:
+        self.spans: List[FakeSpan] = []
+        self.active: List[str] = []
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[FakeSpan]:
+        current = FakeSpan(name, attributes)
+        self.spans.append(current)
+        self.active.append(name)
+        try:
+            yield current
+        except Exception as e:
+            current.error = e
+            raise
+        finally:
+            self.active.pop()
+
+
+@pytest.fixture
+def tracer() -> Iterator[FakeTracer]:
+    """Install a recording tracer for the duration of a test."""
+    fake = FakeTracer()
+    set_tracer(fake)
+    yield fake
+    set_tracer(None)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Mock Jira: issues exist, everything else is missing, filters time out."""
+    if request.url.path.endswith("/filter/1"):
+        raise httpx.ReadTimeout("slow", request=request)
+    if "/issue/" in request.url.path:
+        return httpx.Response(200, json={"key": "PROJ-1"})
+    return httpx.Response(404)
+
+
+class TestDisabled:
+    """Test the hooks cost nothing and record nothing by default."""
+
+    def test_span_is_shared_noop(self) -> None:
+        """Test every disabled span is the same inert object."""
+        with span("a", {"k": 1}) as first, span("b") as second:
+            first.set_attribute("k", 2)
+
+        assert first is second
+
+    def test_traced_calls_through(self) -> None:
+        """Test decorated functions keep their result, name and docstring."""
+
+        @traced("add")
+        def add(a: int, b: int) -> int:
+            """Add numbers."""
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.__name__ == "add" and add.__doc__ == "Add numbers."
+
+    @pytest.mark.asyncio
+    async def test_traced_coroutine_calls_through(self) -> None:
+        """Test decorated coroutine functions stay awaitable."""
+
+        @traced("double")
+        async def double(value: int) -> int:
+            return value * 2
+
+        assert await double(4) == 8
+
+
+class TestEnabled:
+    """Test spans are started through the installed tracer."""
+
+    def test_span_attributes(self, tracer: FakeTracer) -> None:
+        """Test spans carry their start attributes and ones set later."""
+        with span("lookup", {"jira.project": "PROJ"}) as current:
+            current.set_attribute("hit", True)
+
+        assert tracer.spans[0].name == "lookup"
+        assert tracer.spans[0].attributes == {"jira.project": "PROJ", "hit": True}
+
+    def test_traced_nests_and_records_errors(self, tracer: FakeTracer) -> None:
+        """Test an inner span is current inside an outer one and sees the error path."""
+
+        @traced("inner")
+        def inner() -> None:
+            assert tracer.active == ["outer", "inner"]
+            raise ValueError("boom")
+
+        @traced("outer")
+        def outer() -> None:
+            inner()
+
+        with pytest.raises(ValueError):
+            outer()
+
+        assert [s.name for s in tracer.spans] == ["outer", "inner"]
+        assert all(isinstance(s.error, ValueError) for s in tracer.spans)
+
+    @pytest.mark.asyncio
+    async def test_traced_coroutine(self, tracer: FakeTracer) -> None:
+        """Test coroutine functions run inside their span."""
+
+        @traced("tool")
+        async def tool() -> List[str]:
+            return list(tracer.active)
+
+        assert await tool() == ["tool"]
+
+    def test_validator_span(self, tracer: FakeTracer) -> None:
+        """Test field validation is traced, including failures."""
+        schema = [FieldSchema(key="summary", name="Summary", type=FieldType.STRING, required=True, custom=False)]
+
+        with pytest.raises(FieldValidationError):
+            FieldValidator().validate_fields({}, schema)
+
+        assert tracer.spans[0].name == "jira.validate_fields"
+        assert tracer.spans[0].error is not None
+
+
+class TestConfigureTracing:
+    """Test enabling tracing through the OpenTelemetry API."""
+
+    def test_enable_and_disable(self) -> None:
+        """Test the OpenTelemetry tracer is installed and removed."""
+        configure_tracing(True)
+        try:
+            assert tracing._tracer is not None
+            with span("probe") as current:
+                current.set_attribute("ok", True)
+        finally:
+            configure_tracing(False)
+
+        assert tracing._tracer is None
+
+    def test_missing_dependency(self) -> None:
+        """Test enabling tracing without opentelemetry-api is a configuration error."""
+        with patch.dict(sys.modules, {"opentelemetry.trace": None}):
+            with pytest.raises(ValueError, match="requires opentelemetry-api"):
+                configure_tracing(True)
+
+        assert tracing._tracer is None
+
+
+class TestTracingTransport:
+    """Test HTTP request spans."""
+
+    def test_request_spans(self, tracer: FakeTracer) -> None:
+        """Test each request gets a span with method, endpoint, URL and status."""
+        client = httpx.Client(transport=TracingTransport(httpx.MockTransport(handler)))
+
+        client.get(f"{BASE}/issue/PROJ-1?expand=names")
+        client.get(f"{BASE}/myself")
+        with pytest.raises(httpx.ReadTimeout):
+            client.get(f"{BASE}/filter/1")
+        client.close()
+
+        ok, missing, failed = tracer.spans
+        assert ok.name == "GET issue"
+        assert ok.attributes == {
+            "http.request.method": "GET",
+            "url.full": f"{BASE}/issue/PROJ-1",
+            "server.address": "jira.test.com",
+            "jira.endpoint": "issue",
+            "http.response.status_code": 200,
+        }
+        assert missing.attributes["error.type"] == "404"
+        assert isinstance(failed.error, httpx.ReadTimeout)
+
+    def test_close_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = httpx.MockTransport(handler)
+        with patch.object(inner, "close") as close:
+            TracingTransport(inner).close()
+        close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_request_spans(self, tracer: FakeTracer) -> None:
+        """Test the async transport records the same spans."""
+        client = httpx.AsyncClient(transport=AsyncTracingTransport(httpx.MockTransport(handler)))
+
+        await client.post(f"{BASE}/issue/PROJ-1/comment", json={"body": "Hi"})
+        await client.aclose()
+
+        assert tracer.spans[0].name == "POST comment"
+        assert tracer.spans[0].attributes["http.response.status_code"] == 200
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_inner_transport(self) -> None:
+        """Test closing is delegated."""
+        inner = httpx.MockTransport(handler)
+        with patch.object(inner, "aclose") as aclose:
+            await AsyncTracingTransport(inner).aclose()
+        aclose.assert_awaited_once()
@@ -1,6 +1,6 @@
 """Unit tests for workflow tools"""
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -8,7 +8,9 @@ from jira_mcp_server.jira_client import JiraClient
 from jira_mcp_server.tools.workflow_tools import (
     initialize_workflow_tools,
     jira_workflow_get_transitions,
+    jira_workflow_get_transitions_async,
     jira_workflow_transition,
+    jira_workflow_transition_async,
 )
 
 
@@ -148,3 +150,85 @@ class TestTransitionIssue:
 
         with pytest.raises(ValueError, match="Transition failed: Invalid transition"):
             jira_workflow_transition(issue_key="PROJ-123", transition_id="99")
+
+
+class TestAsyncWorkflowTools:
+    """Test async workflow tool variants."""
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.workflow_tools._async_client", None)
+    async def test_async_tools_not_initialized(self) -> None:
+        """Test that async variants require an async client."""
+        with pytest.raises(RuntimeError, match="Workflow tools not initialized"):
+            await jira_workflow_get_transitions_async(issue_key="PROJ-123")
+        with pytest.raises(RuntimeError, match="Workflow tools not initialized"):
+            await jira_workflow_transition_async(issue_key="PROJ-123", transition_id="21")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.workflow_tools._async_client", new_callable=AsyncMock)
+    async def test_get_transitions_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async transitions are transformed to the simple format."""
+        mock_async_client.get_transitions.return_value = {
+            "transitions": [
+                {"id": "21", "name": "Start", "to": {"name": "In Progress"}, "fields": {"assignee": {}}},
+            ]
+        }
+
+        result = await jira_workflow_get_transitions_async(issue_key="PROJ-123")
+
+        assert result == {
+            "issue_key": "PROJ-123",
+            "transitions": [
+                {"id": "21", "name": "Start", "to_status": "In Progress", "has_screen": False, "fields": ["assignee"]}
+            ],
+        }
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_workflow_get_transitions_async(issue_key=" ")
+
+        mock_async_client.get_transitions.side_effect = Exception("Issue not found")
+        with pytest.raises(ValueError, match="Get transitions failed: Issue not found"):
+            await jira_workflow_get_transitions_async(issue_key="PROJ-123")
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.workflow_tools._async_client", new_callable=AsyncMock)
+    async def test_transition_async(self, mock_async_client: AsyncMock) -> None:
+        """Test async transition execution and input validation."""
+        result = await jira_workflow_transition_async(
+            issue_key="PROJ-123", transition_id="31", fields={"resolution": {"name": "Done"}}
+        )
+
+        assert result["success"] is True
+        mock_async_client.transition_issue.assert_awaited_once_with(
+            issue_key="PROJ-123", transition_id="31", fields={"resolution": {"name": "Done"}}
+        )
+
+        with pytest.raises(ValueError, match="Issue key cannot be empty"):
+            await jira_workflow_transition_async(issue_key="", transition_id="31")
+        with pytest.raises(ValueError, match="Transition ID cannot be empty"):
+            await jira_workflow_transition_async(issue_key="PROJ-123", transition_id=" ")
+
+        mock_async_client.transition_issue.side_effect = Exception("Invalid transition")
+        with pytest.raises(ValueError, match="Transition failed: Invalid transition"):
+            await jira_workflow_transition_async(issue_key="PROJ-123", transition_id="31")
+
+
+class TestTransitionInvalidatesSearchCache:
+    """Test that transitions invalidate cached search results."""
+
+    @patch("jira_mcp_server.tools.workflow_tools._search_cache")
+    @patch("jira_mcp_server.tools.workflow_tools._client")
+    def test_transition_invalidates(self, mock_client: Mock, mock_search_cache: Mock) -> None:
+        """Test that a successful transition invalidates the issue."""
+        jira_workflow_transition(issue_key="PROJ-123", transition_id="31")
+
+        mock_search_cache.invalidate_all.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @patch("jira_mcp_server.tools.workflow_tools._search_cache")
+    @patch("jira_mcp_server.tools.workflow_tools._async_client", new_callable=AsyncMock)
+    async def test_transition_async_invalidates(self, mock_async_client: AsyncMock, mock_search_cache: Mock) -> None:
+        """Test that a successful async transition invalidates the issue."""
+        await jira_workflow_transition_async(issue_key="PROJ-123", transition_id="31")
+
+        mock_search_cache.invalidate_all.assert_called_once_with()